@@ -107,6 +107,7 @@ setup(
     # additional package data files that goes into the package itself
     package_data = {
             '': ['*.json'],
+            'genie.libs.parser': ['parsers_index/*.json', 'parsers_index.bin'],
     },
 
     # console entry point
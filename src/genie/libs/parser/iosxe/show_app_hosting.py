@@ -1,8 +1,10 @@
 # Metaparser
 from genie.metaparser import MetaParser
-import genie.parsergen as pg
 import re
 
+# import parser utils
+from genie.libs.parser.utils.tabular import FixedWidthTable
+
 
 # ===========================================
 # Schema for 'show app-hosting list'
@@ -25,6 +27,9 @@ class ShowApphostingList(ShowApphostingListSchema):
 
     cli_command = "show app-hosting list"
 
+    table = FixedWidthTable(header_fields=["App id", "State"],
+                            index=[0])
+
     def cli(self, output=None):
         parsed_dict = {}
         if output is None:
@@ -35,10 +40,7 @@ class ShowApphostingList(ShowApphostingListSchema):
         # ---------------------------------------------------------                                                                                                 
         # utd                                      RUNNING   
         if out:
-            out = pg.oper_fill_tabular(device_output=out,
-                                    header_fields=["App id", "State"],
-                                    index=[0])
-            return_dict = out.entries
+            return_dict = self.table.entries(out)
             app_id ={}
             for keys in return_dict.keys() :
                 app_dict={}
@@ -22,6 +22,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.compact import CompactParser
 
 
 # =============================================
@@ -64,7 +65,7 @@ class ShowArpSchema(MetaParser):
     }
 
 
-class ShowArp(ShowArpSchema):
+class ShowArp(CompactParser, ShowArpSchema):
     """ Parser for show arp
                   show arp <WROD>
                   show arp vrf <vrf>
@@ -116,6 +116,10 @@ from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 # Parser
 from genie.libs.parser.iosxe.show_vrf import ShowVrf
 
+# Parser utils
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.stream import StreamParser, iter_lines
+
 
 # ============================================
 # Schema for:
@@ -193,7 +197,7 @@ class ShowBgpSchema(MetaParser):
 #   * 'show ip bgp {address_family} rd {rd}'
 #   * 'show ip bgp {address_family} vrf {vrf}'
 # ============================================
-class ShowBgpSuperParser(ShowBgpSchema):
+class ShowBgpSuperParser(StreamParser, ShowBgpSchema):
 
     ''' Super Parser for:
         * 'show bgp all'
@@ -283,7 +287,7 @@ class ShowBgpSuperParser(ShowBgpSchema):
                         r'( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
                         r'( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
 
-        for line in output.splitlines():
+        for line in iter_lines(output):
             line = line.rstrip()
 
             # For address family: IPv4 Unicast
@@ -901,46 +905,25 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
         * 'show ip bgp {address_family} rd {rd} detail'
     '''
 
-    def cli(self, address_family='', vrf='', rd='', output=None):
-        # Init dictionary
-        ret_dict = {}
-        subdict = ''
-        next_line_update_group = False
-        route_distinguisher = ''
-        new_address_family = ''
-        original_address_family = address_family
-        refresh_epoch_flag = False
-        route_info = ''
-        route_status = ''
-        aggregated_by_as = ''
-        aggregated_by_address = ''
-        imported_path_from = ''
-        imported_safety_path = False
-        refresh_epoch = None
-        cmd_vrf = vrf if vrf else None
-        default_vrf = None
-
+    patterns = Patterns(
         # For address family: IPv4 Unicast
         # For address family: L2VPN E-VPN
-        p1 = re.compile(r'^For +address +family:'
-                        r' +(?P<address_family>[a-zA-Z0-9\-\s]+)$')
-
+        p1=r'^For +address +family:'
+           r' +(?P<address_family>[a-zA-Z0-9\-\s]+)$',
         # Paths: (1 available, best #1, table default)
         # Paths: (1 available, best #1, table VRF1)
         # Paths: (1 available, best #1, no table)
         # Paths: (1 available, best #1, table default, RIB-failure(17))
-        p2 = re.compile(r'^Paths: +\((?P<paths>(?P<available_path>[0-9]+) +available\, '
-                        r'+(no +best +path|best +\#(?P<best_path>[0-9]+))\,?(?: +(table +('
-                        r'?P<vrf_id>\S+?)|no +table))?,?(?: +(.*))?)\)')
-
+        p2=r'^Paths: +\((?P<paths>(?P<available_path>[0-9]+) +available\, '
+           r'+(no +best +path|best +\#(?P<best_path>[0-9]+))\,?(?: +(table +('
+           r'?P<vrf_id>\S+?)|no +table))?,?(?: +(.*))?)\)',
         # Route Distinguisher: 100:100 (default for vrf VRF1)
         # Route Distinguisher: 65535:1 (default for vrf evpn1)
         # Route Distinguisher: 65109:3051
         # Route Distinguisher: 10.100.1.1:3014 (default for vrf vrf1)
-        p2_1 = re.compile(r'^Route +Distinguisher:'
-                          r' +(?P<route_distinguisher>[0-9.\:]+)'
-                          r'(?: +\(default +for +vrf +(?P<vrf_id>(\S+))\))?$')
-
+        p2_1=r'^Route +Distinguisher:'
+             r' +(?P<route_distinguisher>[0-9.\:]+)'
+             r'(?: +\(default +for +vrf +(?P<vrf_id>(\S+))\))?$',
         # BGP routing table entry for 10.4.1.1/32, version 4
         # BGP routing table entry for [100:100]2001:11:11::11/128, version 2
         # BGP routing table entry for 100:100:10.229.11.11/32, version 2
@@ -948,121 +931,102 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
         # BGP routing table entry for 2001:2:2:2::2/128, version 2
         # BGP routing table entry for [5][65535:1][0][24][10.36.3.0]/17, version 3
         # BGP routing table entry for 10.100.1.1:3014:0.0.0.0/0, version 74438
-        p3_1 = re.compile(r'^BGP +routing +table +entry +for +(\[[0-9]+\])?'
-                        r'((?P<route_distinguisher>((\[[0-9]+[\:][0-9]+\])'
-                        r'|[0-9]+])|([0-9.]+[:][0-9]+[:])))?(\[[0-9]+\])?'
-                        r'(\[[0-9]+\])?(?P<router_id>((\[[0-9]+[\.][0-9]+[\.]'
-                        r'[0-9]+[\.][0-9]+\][\/][0-9]+)|([0-9]+[\.][0-9]+[\.]'
-                        r'[0-9]+[\.][0-9]+[\/][0-9]+)|([a-zA-Z0-9]+[\:]'
-                        r'[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][\:][a-zA-Z0-9]+'
-                        r'[\/][0-9]+)|([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                        r'[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
-                        r'([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                        r'[a-zA-Z0-9]+[\:][\:][0-9]+[\/][0-9]+)))\, +version '
-                        r'+(?P<prefix_table_version>[0-9]+)$')
-
+        p3_1=r'^BGP +routing +table +entry +for +(\[[0-9]+\])?'
+             r'((?P<route_distinguisher>((\[[0-9]+[\:][0-9]+\])'
+             r'|[0-9]+])|([0-9.]+[:][0-9]+[:])))?(\[[0-9]+\])?'
+             r'(\[[0-9]+\])?(?P<router_id>((\[[0-9]+[\.][0-9]+[\.]'
+             r'[0-9]+[\.][0-9]+\][\/][0-9]+)|([0-9]+[\.][0-9]+[\.]'
+             r'[0-9]+[\.][0-9]+[\/][0-9]+)|([a-zA-Z0-9]+[\:]'
+             r'[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][\:][a-zA-Z0-9]+'
+             r'[\/][0-9]+)|([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+             r'[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
+             r'([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+             r'[a-zA-Z0-9]+[\:][\:][0-9]+[\/][0-9]+)))\, +version '
+             r'+(?P<prefix_table_version>[0-9]+)$',
         # BGP routing table entry for 65109:3051:VEID-1:Blk-1/136, version 2
-        p3_2 = re.compile(r'^BGP +routing +table +entry +for'
-                          r' +(?:(?P<rd>([0-9\:\[\]]+)))?:(?P<router_id>(\S+)),?'
-                          r' +version +(?P<version>(\d+))$')
-
+        p3_2=r'^BGP +routing +table +entry +for'
+             r' +(?:(?P<rd>([0-9\:\[\]]+)))?:(?P<router_id>(\S+)),?'
+             r' +version +(?P<version>(\d+))$',
         # 10.1.1.2 from 10.1.1.2 (10.1.1.2)
         # 10.16.2.2 (metric 11) (via default) from 10.16.2.2 (10.16.2.2)
         # :: (via vrf VRF1) from 0.0.0.0 (10.1.1.1)
         # 192.168.0.1 (inaccessible) from 192.168.0.9 (192.168.0.9)
         # 172.17.111.1 (via vrf SH_BGP_VRF100) from 172.17.111.1 (10.5.5.5)
-        p4 = re.compile(r'^((?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                        r'(( +\(metric +(?P<next_hop_igp_metric>[0-9]+)\))|'
-                        r'( +\((?P<inaccessible>inaccessible)\)))?'
-                        r'( +\(via +(?P<next_hop_via>[\S\s]+)\))? +'
-                        r'from +(?P<gateway>[a-zA-Z0-9\.\:]+)'
-                        r' +\((?P<originator>[0-9\.]+)\))$')
-
+        p4=r'^((?P<next_hop>[a-zA-Z0-9\.\:]+)'
+           r'(( +\(metric +(?P<next_hop_igp_metric>[0-9]+)\))|'
+           r'( +\((?P<inaccessible>inaccessible)\)))?'
+           r'( +\(via +(?P<next_hop_via>[\S\s]+)\))? +'
+           r'from +(?P<gateway>[a-zA-Z0-9\.\:]+)'
+           r' +\((?P<originator>[0-9\.]+)\))$',
         # Origin incomplete, metric 0, localpref 100, valid, internal
         # Origin incomplete, metric 0, localpref 100, valid, internal, best
         # Origin incomplete, metric 0, localpref 100, weight 32768, valid, sourced, best
         # Origin IGP, localpref 100, valid, external, atomic-aggregate
         # Origin IGP, localpref 100, valid, external, atomic-aggregate, best
-        p5 = re.compile(r'^Origin +(?P<origin>[a-zA-Z]+),(?: +metric '
-                        r'+(?P<metric>[0-9]+),?)?(?: +localpref '
-                        r'+(?P<locprf>[0-9]+),?)?(?: +weight '
-                        r'+(?P<weight>[0-9]+),?)?(?: +(?P<valid>valid?,))?(?: '
-                        r'+(?P<sourced>sourced?,))?(?: +(?P<state>(internal|'
-                        r'external|local)\,?))?(?: '
-                        r'+(?P<aggregate>atomic-aggregate?))?(\,)?(?: '
-                        r'+(?P<best>best))?$')
-
+        p5=r'^Origin +(?P<origin>[a-zA-Z]+),(?: +metric '
+           r'+(?P<metric>[0-9]+),?)?(?: +localpref '
+           r'+(?P<locprf>[0-9]+),?)?(?: +weight '
+           r'+(?P<weight>[0-9]+),?)?(?: +(?P<valid>valid?,))?(?: '
+           r'+(?P<sourced>sourced?,))?(?: +(?P<state>(internal|'
+           r'external|local)\,?))?(?: '
+           r'+(?P<aggregate>atomic-aggregate?))?(\,)?(?: '
+           r'+(?P<best>best))?$',
         # Advertised to update-groups:
-        p6_1 = re.compile(r'^Advertised +to +update-groups *:$')
-
+        p6_1=r'^Advertised +to +update-groups *:$',
         # Not advertised to any peer
-        p6_2 = re.compile(r'^Not +advertised +to +any +peer$')
-
+        p6_2=r'^Not +advertised +to +any +peer$',
         # 3
         # 38         44         45
-        p6_3 = re.compile(r'^(?P<group1>(\d+))'
-                          r'(?: +(?P<group2>(\d+)) +(?P<group3>(\d+)))?$')
-
+        p6_3=r'^(?P<group1>(\d+))'
+             r'(?: +(?P<group2>(\d+)) +(?P<group3>(\d+)))?$',
         # Refresh Epoch 1
-        p7 = re.compile(r'^Refresh +Epoch +(?P<refresh_epoch>[0-9]+)$')
-
+        p7=r'^Refresh +Epoch +(?P<refresh_epoch>[0-9]+)$',
         # Extended Community: RT:65535:1 ENCAP:8 Router MAC:001E.7AFF.FCD2
-        p8 = re.compile(r'^Extended +Community\:'
-                        r' +(?P<ext_community>([a-zA-Z0-9\-\:]+)) +ENCAP *:'
-                        r'(?P<encap>(\d+)) +Router +(?P<router_mac>(\S+))$')
-
+        p8=r'^Extended +Community\:'
+           r' +(?P<ext_community>([a-zA-Z0-9\-\:]+)) +ENCAP *:'
+           r'(?P<encap>(\d+)) +Router +(?P<router_mac>(\S+))$',
         # Extended Community: SoO:65109:999 RT:65109:50
         # Extended Community: RT:0:3051 RT:65109:3051 L2VPN L2:0x0:MTU-1500
         # Extended Community: RT:65109:50 RT:65109:51 , recursive-via-connected
-        p8_2 = re.compile(r'^Extended +Community *:'
-                          r' +(?P<ext_community>([a-zA-Z0-9\-\:\s]+))'
-                          r'(?: *, +(?P<recursive>(recursive-via-connected)))?$')
-
+        p8_2=r'^Extended +Community *:'
+             r' +(?P<ext_community>([a-zA-Z0-9\-\:\s]+))'
+             r'(?: *, +(?P<recursive>(recursive-via-connected)))?$',
         # Community: 62000:1
         # Community: 1:1 65100:101 65100:175 65100:500 65100:601 65151:65000 65351:1
-        p8_3 = re.compile(r'^Community: +(?P<community>[\S+\s]+)$')
-
+        p8_3=r'^Community: +(?P<community>[\S+\s]+)$',
         # AGI version(0), VE Block Size(10) Label Base(16)
-        p8_4 = re.compile(r'^AGI +version\((?P<agi_version>(\d+))\),'
-                          r' +VE +Block +Size\((?P<ve_block_size>(\d+))\)'
-                          r' +Label +Base\((?P<label_base>(\d+))\)$')
-
+        p8_4=r'^AGI +version\((?P<agi_version>(\d+))\),'
+             r' +VE +Block +Size\((?P<ve_block_size>(\d+))\)'
+             r' +Label +Base\((?P<label_base>(\d+))\)$',
         # Originator: 192.168.165.220, Cluster list: 0.0.0.61
-        p8_5 = re.compile(r'^\s*Originator: +(?P<originator>(\S+)),'
-                          r' +Cluster +list: +(?P<cluster_list>(\S+))$')
-
+        p8_5=r'^\s*Originator: +(?P<originator>(\S+)),'
+             r' +Cluster +list: +(?P<cluster_list>(\S+))$',
         # rx pathid: 0, tx pathid: 0
-        p9 = re.compile(r'^rx +pathid\: +(?P<recipient_pathid>[0-9x]+)\,'
-                        r' +tx +pathid\:'
-                        r' +(?P<transfer_pathid>[0-9x]+)$')
-
+        p9=r'^rx +pathid\: +(?P<recipient_pathid>[0-9x]+)\,'
+           r' +tx +pathid\:'
+           r' +(?P<transfer_pathid>[0-9x]+)$',
+        # mpls labels in/out nolabel/64402
+        p18=r'^mpls +labels +in\/out +(?P<in>\w+)\/(?P<out>\w+)$',
         # EVPN ESI: 00000000000000000000, Gateway Address: 0.0.0.0, local vtep: 10.21.33.33, Label 30000
-        p10 = re.compile(r'^EVPN +ESI\: +(?P<evpn_esi>[0-9]+)\,'
-                         r' +Gateway +Address\: +'
-                         r'(?P<gateway_address>[a-zA-Z0-9\.\:]+)\,'
-                         r' +local vtep\: +(?P<local_vtep>[a-zA-Z0-9\.\:]+)'
-                         r'\, +[L|l]abel +(?P<label>[0-9]+)$')
-
+        p10=r'^EVPN +ESI\: +(?P<evpn_esi>[0-9]+)\,'
+            r' +Gateway +Address\: +'
+            r'(?P<gateway_address>[a-zA-Z0-9\.\:]+)\,'
+            r' +local vtep\: +(?P<local_vtep>[a-zA-Z0-9\.\:]+)'
+            r'\, +[L|l]abel +(?P<label>[0-9]+)$',
         # Local vxlan vtep:
-        p11 = re.compile(r'^Local +vxlan +vtep\:$')
-
+        p11=r'^Local +vxlan +vtep\:$',
         # bdi:BDI200
-        p12 = re.compile(r'^bdi\:(?P<bdi>[A-Z0-9]+)$')
-
-        # vrf:evpn1, vni:30000
-        p13 = re.compile(r'^vrf\:(?P<vrf>[a-zA-Z0-9]+)\,'
-                         r' +vni\:(?P<vni>[0-9]+)$')
-
+        p12=r'^bdi\:(?P<bdi>[A-Z0-9]+)$',
         # local router mac:001E.7AFF.FCD2
-        p14 = re.compile(r'^local +router +mac\:'
-                         r'(?P<local_router_mac>[a-zA-Z0-9\.]+)$')
-
+        p14=r'^local +router +mac\:'
+            r'(?P<local_router_mac>[a-zA-Z0-9\.]+)$',
         # encap:8
-        p15 = re.compile(r'^encap\:(?P<encap>[0-9]+)$')
-
+        p15=r'^encap\:(?P<encap>[0-9]+)$',
         # vtep-ip:10.21.33.33
-        p16 = re.compile(r'^vtep-ip\:(?P<vtep_ip>[0-9\.]+)$')
-
+        p16=r'^vtep-ip\:(?P<vtep_ip>[0-9\.]+)$',
+        # vrf:evpn1, vni:30000
+        p13=r'^vrf\:(?P<vrf>[a-zA-Z0-9]+)\,'
+            r' +vni\:(?P<vni>[0-9]+)$',
         # Local
         # 65530
         # Local, imported path from base
@@ -1074,20 +1038,39 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
         # 4210105002 4210105502 4210105001 4210105507 4210105007 4210105220 65000 65151 65501, (aggregated by 65251 10.160.0.61), (received & used)
         # 4210105002 4210105502 4210105001 4210105507 4210105007 4210105220 65000 65151 65501, (aggregated by 65251 2001:db8:4::1), (received & used)
         # 4210105002 4210105502 4210105001 4210105507 4210105007 4210105220 65000 65151 65501, (aggregated by 65251 FE80:CD00:0:CDE:1257:0:211E:729C), (received & used)
-        p17 = re.compile(r'^(?P<route_info>[a-zA-Z0-9\-\.\{\}\s\(\)\/\:\[\]]+)'
-                       r'(\,)?(?: +\(aggregated +by +(?P<aggregated_by>[\w\s\.\:]'
-                       r'+)\)(\,))?(?: +(?P<route_status>[A-Za-z0-9\.\:\/\(\)\s'
-                       r'\[\]\-\&]+))?$')
-        
-        # mpls labels in/out nolabel/64402
-        p18 = re.compile(r'^mpls +labels +in\/out +(?P<in>\w+)\/(?P<out>\w+)$')
+        p17=r'^(?P<route_info>[a-zA-Z0-9\-\.\{\}\s\(\)\/\:\[\]]+)'
+            r'(\,)?(?: +\(aggregated +by +(?P<aggregated_by>[\w\s\.\:]'
+            r'+)\)(\,))?(?: +(?P<route_status>[A-Za-z0-9\.\:\/\(\)\s'
+            r'\[\]\-\&]+))?$')
+
+    def cli(self, address_family='', vrf='', rd='', output=None):
+        # Init dictionary
+        ret_dict = {}
+        subdict = ''
+        next_line_update_group = False
+        route_distinguisher = ''
+        new_address_family = ''
+        original_address_family = address_family
+        refresh_epoch_flag = False
+        route_info = ''
+        route_status = ''
+        aggregated_by_as = ''
+        aggregated_by_address = ''
+        imported_path_from = ''
+        imported_safety_path = False
+        refresh_epoch = None
+        cmd_vrf = vrf if vrf else None
+        default_vrf = None
+
+        # compiled once for all the instances, see Patterns
+        patterns = self.patterns
 
         for line in output.splitlines():
             line = line.strip()
 
             # For address family: IPv4 Unicast
             # For address family: L2VPN E-VPN
-            m = p1.match(line)
+            m = patterns.p1.match(line)
             if m:
                 index = 0
                 address_family = m.groupdict()['address_family'].lower()
@@ -1104,7 +1087,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # Paths: (1 available, best #1, table VRF1)
             # Paths: (1 available, best #1, no table)
             # Paths: (1 available, best #1, table default, RIB-failure(17))
-            m = p2.match(line)
+            m = patterns.p2.match(line)
             if m:
                 group = m.groupdict()
                 original_address_family = address_family.lower()
@@ -1187,7 +1170,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # Route Distinguisher: 100:100 (default for vrf VRF1)
             # Route Distinguisher: 65535:1 (default for vrf evpn1)
             # Route Distinguisher: 10.100.1.1:3014 (default for vrf vrf1)
-            m = p2_1.match(line)
+            m = patterns.p2_1.match(line)
             if m:
                 route_distinguisher = m.groupdict()['route_distinguisher']
                 default_vrf = m.groupdict()['vrf_id']
@@ -1211,7 +1194,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # BGP routing table entry for 2001:2:2:2::2/128, version 2
             # BGP routing table entry for [5][65535:1][0][24][10.36.3.0]/17, version 3
             # BGP routing table entry for 10.100.1.1:3014:0.0.0.0/0, version 74438
-            m = p3_1.match(line)
+            m = patterns.p3_1.match(line)
             if m:
                 update_group = 0
                 index = 0
@@ -1222,7 +1205,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # BGP routing table entry for 65109:3051:VEID-1:Blk-1/136, version 2
-            m = p3_2.match(line)
+            m = patterns.p3_2.match(line)
             if m:
                 update_group = 0
                 index = 0
@@ -1236,7 +1219,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # :: (via vrf VRF1) from 0.0.0.0 (10.1.1.1)
             # 192.168.0.1 (inaccessible) from 192.168.0.9 (192.168.0.9)
             # 172.17.111.1 (via vrf SH_BGP_VRF100) from 172.17.111.1 (10.5.5.5)
-            m = p4.match(line)
+            m = patterns.p4.match(line)
             if m:
                 index += 1
                 group = m.groupdict()
@@ -1291,7 +1274,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # Origin incomplete, metric 0, localpref 100, weight 32768, valid, sourced, best
             # Origin IGP, localpref 100, valid, external, atomic-aggregate
             # Origin IGP, localpref 100, valid, external, atomic-aggregate, best
-            m = p5.match(line)
+            m = patterns.p5.match(line)
             if m:
                 group = m.groupdict()
                 status_codes = ''
@@ -1356,20 +1339,20 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # Advertised to update-groups:
-            m = p6_1.match(line)
+            m = patterns.p6_1.match(line)
             if m:
                 next_line_update_group = True
                 continue
 
             # Not advertised to any peer
-            m = p6_2.match(line)
+            m = patterns.p6_2.match(line)
             if m:
                 next_line_update_group = False
                 continue
 
             # 3
             # # 38         44         45
-            m = p6_3.match(line)
+            m = patterns.p6_3.match(line)
             if m and next_line_update_group:
                 group = m.groupdict()
                 if group['group2'] and group['group3']:
@@ -1384,14 +1367,14 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # Refresh Epoch 1
-            m = p7.match(line)
+            m = patterns.p7.match(line)
             if m:
                 refresh_epoch_flag = True
                 refresh_epoch = int(m.groupdict()['refresh_epoch'])
                 continue
 
             # Extended Community: RT:65535:1 ENCAP:8 Router MAC:001E.7AFF.FCD2
-            m = p8.match(line)
+            m = patterns.p8.match(line)
             if m:
                 group = m.groupdict()
 
@@ -1410,7 +1393,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # Extended Community: SoO:65109:999 RT:65109:50
             # Extended Community: RT:0:3051 RT:65109:3051 L2VPN L2:0x0:MTU-1500
             # Extended Community: RT:65109:50 RT:65109:51 , recursive-via-connected
-            m = p8_2.match(line)
+            m = patterns.p8_2.match(line)
             if m:
                 group = m.groupdict()
                 ext_community = group['ext_community']
@@ -1427,13 +1410,13 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
 
             # Community: 62000:1
             # Community: 1:1 65100:101 65100:175 65100:500 65100:601 65151:65000 65351:1
-            m = p8_3.match(line)
+            m = patterns.p8_3.match(line)
             if m:
                 subdict['community'] = m.groupdict()['community']
                 continue
 
             # AGI version(0), VE Block Size(10) Label Base(16)
-            m = p8_4.match(line)
+            m = patterns.p8_4.match(line)
             if m:
                 group = m.groupdict()
 
@@ -1443,20 +1426,20 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # Originator: 192.168.165.220, Cluster list: 0.0.0.61
-            m = p8_5.match(line)
+            m = patterns.p8_5.match(line)
             if m:
                 subdict['cluster_list'] = m.groupdict()['cluster_list']
                 continue
 
             # rx pathid: 0, tx pathid: 0
-            m = p9.match(line)
+            m = patterns.p9.match(line)
             if m:
                 subdict['recipient_pathid'] = m.groupdict()['recipient_pathid']
                 subdict['transfer_pathid'] = m.groupdict()['transfer_pathid']
                 continue
             
             # mpls labels in/out nolabel/64402
-            m = p18.match(line)
+            m = patterns.p18.match(line)
             if m:
                 group = m.groupdict()
 
@@ -1466,7 +1449,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # EVPN ESI: 00000000000000000000, Gateway Address: 0.0.0.0, local vtep: 10.21.33.33, Label 30000
-            m = p10.match(line)
+            m = patterns.p10.match(line)
             if m:
                 group = m.groupdict()
                 if 'evpn' not in subdict:
@@ -1479,7 +1462,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # Local vxlan vtep:
-            m = p11.match(line)
+            m = patterns.p11.match(line)
             if m:
                 if 'local_vxlan_vtep' not in subdict:
                     subdict['local_vxlan_vtep'] = {}
@@ -1491,8 +1474,8 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # local router mac:001E.7AFF.FCD2
             # encap:8
             # vtep-ip:10.21.33.33
-            m = p12.match(line) or p14.match(line)\
-                or p15.match(line) or p16.match(line)
+            m = patterns.p12.match(line) or patterns.p14.match(line)\
+                or patterns.p15.match(line) or patterns.p16.match(line)
             if m and local_vxlan_vtep:
                 group = m.groupdict()
                 k = list(group)[0]
@@ -1500,7 +1483,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # vrf:evpn1, vni:30000
-            m = p13.match(line)
+            m = patterns.p13.match(line)
             if m and local_vxlan_vtep:
                 subdict['local_vxlan_vtep']['vrf'] = m.groupdict()['vrf']
                 subdict['local_vxlan_vtep']['vni'] = m.groupdict()['vni']
@@ -1516,7 +1499,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # 4210105002 4210105502 4210105001 4210105507 4210105007 4210105220 65000 65151 65501, (aggregated by 65251 10.160.0.61), (received & used)
             # 4210105002 4210105502 4210105001 4210105507 4210105007 4210105220 65000 65151 65501, (aggregated by 65251 2001:db8:4::1), (received & used)
             # 4210105002 4210105502 4210105001 4210105507 4210105007 4210105220 65000 65151 65501, (aggregated by 65251 FE80:CD00:0:CDE:1257:0:211E:729C), (received & used)
-            m = p17.match(line)
+            m = patterns.p17.match(line)
             if m and refresh_epoch_flag or m and m.groupdict()['route_info']:
                 group = m.groupdict()
                 route_info = group['route_info']
@@ -20,6 +20,10 @@ from genie.metaparser.util.schemaengine import Schema, \
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.columnar import ColumnarParser
+from genie.libs.parser.utils.compact import CompactParser
+from genie.libs.parser.utils.records import build_output
+from genie.libs.parser.utils.stream import StreamParser, iter_lines
 
 
 class ShowMacAddressTableSchema(MetaParser):
@@ -54,13 +58,25 @@ class ShowMacAddressTableSchema(MetaParser):
         Optional('total_mac_addresses'): int,
     }
 
-class ShowMacAddressTable(ShowMacAddressTableSchema):
+class ShowMacAddressTable(ColumnarParser, CompactParser, StreamParser,
+                          ShowMacAddressTableSchema):
     """Parser for show mac address-table"""
 
     cli_command = ['show mac address-table',
                    'show mac address-table vlan {vlan}']
 
+    columnar_table = 'mac_table.vlans.*.mac_addresses.*.interfaces.*'
+    columnar_keys = ('vlan', 'mac_address', 'interface')
+
     def cli(self, vlan='', output=None):
+        return build_output(self.iter_records(vlan=vlan, output=output))
+
+    def iter_records(self, vlan='', output=None):
+        """Yield the MAC addresses one at a time, see utils.records
+
+        Each MAC address is yielded once the lines of its interfaces are
+        read, after the record of its vlan.
+        """
         if output is None:
             # get output from device
             if vlan:
@@ -70,8 +86,9 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
         else:
             out = output
 
-        # initial return dictionary
-        ret_dict = mac_dict = {}
+        # MAC address being read, yielded once complete
+        record = last_vlan_path = None
+        mac_dict = {}
         entry_type = entry = learn = age = ''
 
         # Total Mac Addresses for this criterion: 93
@@ -101,13 +118,16 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                         r'+(?P<protocols>[\w\,]+) '
                         r'+(?P<intfs>\S+|[^\s]+\s[^\s]+)$')
         
-        for line in out.splitlines():
+        for line in iter_lines(out):
             line = line.strip()
 
             # Total Mac Addresses for this criterion: 93
             m = p1.match(line)
             if m:
-                ret_dict.update({'total_mac_addresses': int(m.groupdict()['val'])})
+                if record:
+                    yield record
+                    record = None
+                yield ((), {'total_mac_addresses': int(m.groupdict()['val'])})
                 continue
 
             # 10    aaaa.bbff.8888    STATIC      Gi1/0/8 Gi1/0/9
@@ -120,12 +140,14 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                 vlan = int(group['vlan']) if re.search('\d+', group['vlan']) \
                                           else group['vlan'].lower()
                 intfs = group['intfs'].strip()
-                vlan_dict = ret_dict.setdefault('mac_table', {}) \
-                .setdefault('vlans', {}).setdefault(str(vlan), {})
-                vlan_dict['vlan'] = vlan
-                mac_dict = vlan_dict.setdefault('mac_addresses', {}) \
-                                    .setdefault(mac, {})
-                mac_dict.update({'mac_address': mac})
+                if record:
+                    yield record
+                vlan_path = ('mac_table', 'vlans', str(vlan))
+                if vlan_path != last_vlan_path:
+                    yield (vlan_path, {'vlan': vlan})
+                    last_vlan_path = vlan_path
+                mac_dict = {'mac_address': mac}
+                record = (vlan_path + ('mac_addresses', mac), mac_dict)
 
                 if 'drop' in intfs.lower():
                     drop_dict = mac_dict.setdefault('drop', {})
@@ -183,12 +205,14 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                 vlan = int(group['vlan']) if re.search('\d+', group['vlan']) \
                                           else group['vlan'].lower()
                 intfs = group['intfs'].strip()
-                vlan_dict = ret_dict.setdefault('mac_table', {}) \
-                .setdefault('vlans', {}).setdefault(str(vlan), {})
-                vlan_dict['vlan'] = vlan
-                mac_dict = vlan_dict.setdefault('mac_addresses', {}) \
-                                    .setdefault(mac, {})
-                mac_dict.update({'mac_address': mac})
+                if record:
+                    yield record
+                vlan_path = ('mac_table', 'vlans', str(vlan))
+                if vlan_path != last_vlan_path:
+                    yield (vlan_path, {'vlan': vlan})
+                    last_vlan_path = vlan_path
+                mac_dict = {'mac_address': mac}
+                record = (vlan_path + ('mac_addresses', mac), mac_dict)
 
                 if 'drop' in intfs.lower():
                     drop_dict = mac_dict.setdefault('drop', {})
@@ -225,12 +249,14 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                 vlan = int(group['vlan']) if re.search('\d+', group['vlan']) \
                                           else group['vlan'].lower()
                 intfs = group['intfs'].strip()
-                vlan_dict = ret_dict.setdefault('mac_table', {}) \
-                .setdefault('vlans', {}).setdefault(str(vlan), {})
-                vlan_dict['vlan'] = vlan
-                mac_dict = vlan_dict.setdefault('mac_addresses', {}) \
-                                    .setdefault(mac, {})
-                mac_dict.update({'mac_address': mac})
+                if record:
+                    yield record
+                vlan_path = ('mac_table', 'vlans', str(vlan))
+                if vlan_path != last_vlan_path:
+                    yield (vlan_path, {'vlan': vlan})
+                    last_vlan_path = vlan_path
+                mac_dict = {'mac_address': mac}
+                record = (vlan_path + ('mac_addresses', mac), mac_dict)
 
                 if 'drop' in intfs.lower():
                     drop_dict = mac_dict.setdefault('drop', {})
@@ -253,7 +279,8 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
                         intf_dict.update({'protocols': group['protocols'].split(',')})
                 continue
 
-        return ret_dict
+        if record:
+            yield record
 
 
 class ShowMacAddressTableAgingTimeSchema(MetaParser):
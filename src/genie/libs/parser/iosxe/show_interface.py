@@ -20,7 +20,6 @@ import logging
 import pprint
 import re
 import unittest
-from genie import parsergen
 from collections import defaultdict
 
 from pyats.log.utils import banner
@@ -47,6 +46,13 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Use
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.line_dispatch import LineDispatcher
+from genie.libs.parser.utils.tabular import FixedWidthTable
+from genie.libs.parser.utils.blocks import BlockParser
+from genie.libs.parser.utils.projection import ProjectionParser
+from genie.libs.parser.utils.compiled_schema import CompiledSchemaParser
+from genie.libs.parser.utils.columnar import ColumnarParser
 
 logger = logging.getLogger(__name__)
 
@@ -193,7 +199,8 @@ class ShowInterfacesSchema(MetaParser):
     }
 
 
-class ShowInterfaces(ShowInterfacesSchema):
+class ShowInterfaces(ProjectionParser, BlockParser, CompiledSchemaParser,
+                     ShowInterfacesSchema):
     """parser for show interfaces
                   show interfaces <interface>"""
 
@@ -208,65 +215,52 @@ class ShowInterfaces(ShowInterfacesSchema):
         'out_lost_carrier', '(Tunnel.*)', 'input_queue_flushes',
         'reliability']
 
+    # GigabitEthernet1 is up, line protocol is up
+    block_header = re.compile(r'^ *([\w\/\.\-]+) +is +.*,'
+                              r' +line +protocol +is ', re.MULTILINE)
 
-    def cli(self,interface="",output=None):
-        if output is None:
-            if interface:
-                cmd = self.cli_command[1].format(interface=interface)
-            else:
-                cmd = self.cli_command[0]
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
-        # GigabitEthernet1 is up, line protocol is up 
+    patterns = Patterns(
+        guards=True,
+        # GigabitEthernet1 is up, line protocol is up
         # Port-channel12 is up, line protocol is up (connected)
         # Vlan1 is administratively down, line protocol is down , Autostate Enabled
         # Dialer1 is up (spoofing), line protocol is up (spoofing)
-        p1 = re.compile(r'^(?P<interface>[\w\/\.\-]+) +is +(?P<enabled>[\w\s]+)(?: '
-                        r'+\S+)?, +line +protocol +is +(?P<line_protocol>\w+)(?: '
-                        r'*\((?P<attribute>\S+)\)|( +\, +Autostate +(?P<autostate>\S+)))?.*$')
-        p1_1 =  re.compile(r'^(?P<interface>[\w\/\.\-]+) +is'
-                           r' +(?P<enabled>[\w\s]+),'
-                           r' +line +protocol +is +(?P<line_protocol>\w+)'
-                           r'( *, *(?P<attribute>[\w\s]+))?$')
-
+        p1=r'^(?P<interface>[\w\/\.\-]+) +is +(?P<enabled>[\w\s]+)(?: '
+           r'+\S+)?, +line +protocol +is +(?P<line_protocol>\w+)(?: '
+           r'*\((?P<attribute>\S+)\)|( +\, +Autostate +(?P<autostate>\S+)))?.*$',
+        p1_1=r'^(?P<interface>[\w\/\.\-]+) +is'
+             r' +(?P<enabled>[\w\s]+),'
+             r' +line +protocol +is +(?P<line_protocol>\w+)'
+             r'( *, *(?P<attribute>[\w\s]+))?$',
         # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
         # Hardware is Loopback
-        p2 = re.compile(r'^Hardware +is +(?P<type>[a-zA-Z0-9\-\/\s\+]+)'
-                        r'(, *address +is +(?P<mac_address>[a-z0-9\.]+)'
-                        r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\))?$')
-
-        # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS 
-        p2_2 = re.compile(r'Hardware +is +(?P<type>[a-zA-Z0-9\-\/\+ ]+)'
-                          r'(?P<mac_address>.*)(?P<phys_address>.*)')
-
+        p2=r'^Hardware +is +(?P<type>[a-zA-Z0-9\-\/\s\+]+)'
+           r'(, *address +is +(?P<mac_address>[a-z0-9\.]+)'
+           r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\))?$',
+        # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS
+        p2_2=r'Hardware +is +(?P<type>[a-zA-Z0-9\-\/\+ ]+)'
+             r'(?P<mac_address>.*)(?P<phys_address>.*)',
         # Description: desc
         # Description: Pim Register Tunnel (Encap) for RP 10.186.1.1
-        p3 = re.compile(r'^Description: *(?P<description>.*)$')
-
+        p3=r'^Description: *(?P<description>.*)$',
         # Secondary address 10.2.2.2/24
-        p4 = re.compile(r'^Secondary +Address +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
-                        r'\/(?P<prefix_length>[0-9]+))$')
-
+        p4=r'^Secondary +Address +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
+           r'\/(?P<prefix_length>[0-9]+))$',
         # Internet address is 10.4.4.4/24
-        p5 = re.compile(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.x]+)'
-                        r'\/(?P<prefix_length>[0-9]+))$')
-
+        p5=r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.x]+)'
+           r'\/(?P<prefix_length>[0-9]+))$',
         # MTU 1500 bytes, BW 768 Kbit/sec, DLY 3330 usec,
-        # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec, 
+        # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec,
         # MTU 1600 bytes, sub MTU 1600, BW 3584 Kbit/sec, DLY 410 usec,
-        # MTU 1500 bytes, BW 5200 Kbit/sec, RxBW 25000 Kbit/sec, DLY 100 usec, 
-        p6 = re.compile(r'^MTU +(?P<mtu>\d+) +bytes(, +sub +MTU +'
-                        r'(?P<sub_mtu>\d+))?, +BW +(?P<bandwidth>[0-9]+) +Kbit(\/sec)?'
-                        r'(, +RxBW +[0-9]+ +Kbit(\/sec)?)?, +'
-                        r'DLY +(?P<delay>[0-9]+) +usec,$')
-
+        # MTU 1500 bytes, BW 5200 Kbit/sec, RxBW 25000 Kbit/sec, DLY 100 usec,
+        p6=r'^MTU +(?P<mtu>\d+) +bytes(, +sub +MTU +'
+           r'(?P<sub_mtu>\d+))?, +BW +(?P<bandwidth>[0-9]+) +Kbit(\/sec)?'
+           r'(, +RxBW +[0-9]+ +Kbit(\/sec)?)?, +'
+           r'DLY +(?P<delay>[0-9]+) +usec,$',
         # reliability 255/255, txload 1/255, rxload 1/255
-        p7 = re.compile(r'^reliability +(?P<reliability>[\d\/]+),'
-                        r' +txload +(?P<txload>[\d\/]+), +rxload'
-                        r' +(?P<rxload>[\d\/]+)$')
-
+        p7=r'^reliability +(?P<reliability>[\d\/]+),'
+           r' +txload +(?P<txload>[\d\/]+), +rxload'
+           r' +(?P<rxload>[\d\/]+)$',
         # Encapsulation LOOPBACK, loopback not set
         # Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
         # Encapsulation ARPA, medium is broadcast
@@ -274,14 +268,11 @@ class ShowInterfaces(ShowInterfacesSchema):
         # Encapsulation 802.1Q Virtual LAN, Vlan ID  1., loopback not set
         # Encapsulation 802.1Q Virtual LAN, Vlan ID  105.
         # Encapsulation(s): AAL5
-        p8 = re.compile(r'^Encapsulation(\(s\):)? +(?P<encapsulation>[\w\s\.]+)'
-                r'(, +(?P<rest>.*))?$')
-            
+        p8=r'^Encapsulation(\(s\):)? +(?P<encapsulation>[\w\s\.]+)'
+           r'(, +(?P<rest>.*))?$',
         # Keepalive set (10 sec)
-        p10 = re.compile(r'^Keepalive +set +\((?P<keepalive>[0-9]+)'
-                        r' +sec\)$')
-
-
+        p10=r'^Keepalive +set +\((?P<keepalive>[0-9]+)'
+            r' +sec\)$',
         # Auto-duplex, 1000Mb/s, media type is 10/100/1000BaseTX
         # Full-duplex, 1000Mb/s, link type is auto, media type is
         # Full Duplex, 1000Mbps, link type is auto, media type is RJ45
@@ -292,194 +283,250 @@ class ShowInterfaces(ShowInterfacesSchema):
         # auto-duplex, 10 Gb/s, media type is 10G
         # Full Duplex, 10000Mbps, link type is force-up, media type is SFP-LR
         # Full-duplex, 100Gb/s, link type is force-up, media type is QSFP 100G SR4
-        p11 = re.compile(r'^(?P<duplex_mode>\w+)[\-\s]+[d|D]uplex\, '
-                         r'+(?P<port_speed>[\w\s\/]+|[a|A]uto-[S|s]peed|Auto '
-                         r'(S|s)peed)(?:(?:\, +link +type +is '
-                         r'+(?P<link_type>\S+))?(?:\, *(media +type +is| )'
-                         r'*(?P<media_type>[\w\/\- ]+)?)(?: +media +type)?)?$')
-
+        p11=r'^(?P<duplex_mode>\w+)[\-\s]+[d|D]uplex\, '
+            r'+(?P<port_speed>[\w\s\/]+|[a|A]uto-[S|s]peed|Auto '
+            r'(S|s)peed)(?:(?:\, +link +type +is '
+            r'+(?P<link_type>\S+))?(?:\, *(media +type +is| )'
+            r'*(?P<media_type>[\w\/\- ]+)?)(?: +media +type)?)?$',
         # input flow-control is off, output flow-control is unsupported
-        p12 = re.compile(r'^(input|output) +flow-control +is +(?P<receive>\w+), +'
-                          '(output|input) +flow-control +is +(?P<send>\w+)$')
-
+        p12=r'^(input|output) +flow-control +is +(?P<receive>\w+), +'
+            '(output|input) +flow-control +is +(?P<send>\w+)$',
+        # Carrier delay is 10 sec
+        p_cd=r'^Carrier +delay +is +(?P<carrier_delay>\d+).*$',
+        # Asymmetric Carrier-Delay Up Timer is 2 sec
+        # Asymmetric Carrier-Delay Down Timer is 10 sec
+        p_cd_2=r'^Asymmetric +Carrier-Delay +(?P<type>Down|Up)'
+               ' +Timer +is +(?P<carrier_delay>\d+).*$',
         # ARP type: ARPA, ARP Timeout 04:00:00
-        p13 = re.compile(r'^ARP +type: +(?P<arp_type>\w+), +'
-                          'ARP +Timeout +(?P<arp_timeout>[\w\:\.]+)$')
-
+        p13=r'^ARP +type: +(?P<arp_type>\w+), +'
+            'ARP +Timeout +(?P<arp_timeout>[\w\:\.]+)$',
         # Last input never, output 00:01:05, output hang never
-        p14 = re.compile(r'^Last +input +(?P<last_input>[\w\.\:]+), +'
-                          'output +(?P<last_output>[\w\.\:]+), '
-                          'output +hang +(?P<output_hang>[\w\.\:]+)$')
-
+        p14=r'^Last +input +(?P<last_input>[\w\.\:]+), +'
+            'output +(?P<last_output>[\w\.\:]+), '
+            'output +hang +(?P<output_hang>[\w\.\:]+)$',
         # Members in this channel: Gi1/0/2
         # Members in this channel: Fo1/0/2 Fo1/0/4
-        p15 = re.compile(r'^Members +in +this +channel: +'
-                          '(?P<port_channel_member_intfs>[\w\/\.\s\,]+)$')   
-
-        # No. of active members in this channel: 12 
-        p15_1 = re.compile(r'^No\. +of +active +members +in +this +'
-                            'channel: +(?P<active_members>\d+)$')
-
+        p15=r'^Members +in +this +channel: +'
+            '(?P<port_channel_member_intfs>[\w\/\.\s\,]+)$',
+        # No. of active members in this channel: 12
+        p15_1=r'^No\. +of +active +members +in +this +'
+              'channel: +(?P<active_members>\d+)$',
         # Member 2 : GigabitEthernet0/0/10 , Full-duplex, 900Mb/s
-        p15_2 = re.compile(r'^Member +\d+ +: +(?P<interface>\S+) +,'
-                            ' +\S+, +\S+$')
-
+        p15_2=r'^Member +\d+ +: +(?P<interface>\S+) +,'
+              ' +\S+, +\S+$',
         # No. of PF_JUMBO supported members in this channel : 0
-        p15_3 = re.compile(r'^No\. +of +PF_JUMBO +supported +members +'
-                            'in +this +channel +: +(?P<number>\d+)$')
-
+        p15_3=r'^No\. +of +PF_JUMBO +supported +members +'
+              'in +this +channel +: +(?P<number>\d+)$',
         # Last clearing of "show interface" counters 1d02h
-        p16 = re.compile(r'^Last +clearing +of +\"show +interface\" +counters +'
-                          '(?P<last_clear>[\w\:\.]+)$')
-
+        p16=r'^Last +clearing +of +\"show +interface\" +counters +'
+            '(?P<last_clear>[\w\:\.]+)$',
         # Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
-        p17 = re.compile(r'^Input +queue: +(?P<size>\d+)\/(?P<max>\d+)\/'
-                          '(?P<drops>\d+)\/(?P<flushes>\d+) +'
-                          '\(size\/max\/drops\/flushes\); +'
-                          'Total +output +drops: +(?P<output_drop>\d+)$')
-
+        p17=r'^Input +queue: +(?P<size>\d+)\/(?P<max>\d+)\/'
+            '(?P<drops>\d+)\/(?P<flushes>\d+) +'
+            '\(size\/max\/drops\/flushes\); +'
+            'Total +output +drops: +(?P<output_drop>\d+)$',
         # Queueing strategy: fifo
         # Queueing strategy: Class-based queueing
-        p18 = re.compile(r'^Queueing +strategy: +(?P<queue_strategy>\S+).*$')
-
+        p18=r'^Queueing +strategy: +(?P<queue_strategy>\S+).*$',
         # Output queue: 0/0 (size/max)
         # Output queue: 0/1000/64/0 (size/max total/threshold/drops)
-        p19 = re.compile(r'^Output +queue: +(?P<size>\d+)\/(?P<max>\d+)'
-                          '(?:\/(?P<threshold>\d+)\/(?P<drops>\d+))? '
-                          '+\(size\/max(?: +total\/threshold\/drops\))?.*$')
-
+        p19=r'^Output +queue: +(?P<size>\d+)\/(?P<max>\d+)'
+            '(?:\/(?P<threshold>\d+)\/(?P<drops>\d+))? '
+            '+\(size\/max(?: +total\/threshold\/drops\))?.*$',
         # 5 minute input rate 0 bits/sec, 0 packets/sec
-        p20 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                          ' *(?P<unit>(minute|second|minutes|seconds)) *input *rate'
-                          ' *(?P<in_rate>[0-9]+) *bits/sec,'
-                          ' *(?P<in_rate_pkts>[0-9]+) *packets/sec$')
-
+        p20=r'^(?P<load_interval>[0-9\#]+)'
+            ' *(?P<unit>(minute|second|minutes|seconds)) *input *rate'
+            ' *(?P<in_rate>[0-9]+) *bits/sec,'
+            ' *(?P<in_rate_pkts>[0-9]+) *packets/sec$',
         # 5 minute output rate 0 bits/sec, 0 packets/sec
-        p21 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                          ' *(minute|second|minutes|seconds) *output *rate'
-                          ' *(?P<out_rate>[0-9]+) *bits/sec,'
-                          ' *(?P<out_rate_pkts>[0-9]+) *packets/sec$')
-
+        p21=r'^(?P<load_interval>[0-9\#]+)'
+            ' *(minute|second|minutes|seconds) *output *rate'
+            ' *(?P<out_rate>[0-9]+) *bits/sec,'
+            ' *(?P<out_rate_pkts>[0-9]+) *packets/sec$',
         # 0 packets input, 0 bytes, 0 no buffer
         # 13350 packets input, 2513375 bytes
-        p22 = re.compile(r'^(?P<in_pkts>[0-9]+) +packets +input, +(?P<in_octets>[0-9]+) '
-                          '+bytes(?:, +(?P<in_no_buffer>[0-9]+) +no +buffer)?$')
-
+        p22=r'^(?P<in_pkts>[0-9]+) +packets +input, +(?P<in_octets>[0-9]+) '
+            '+bytes(?:, +(?P<in_no_buffer>[0-9]+) +no +buffer)?$',
         # Received 4173 broadcasts (0 IP multicasts)
         # Received 535996 broadcasts (535961 multicasts)
-        p23 = re.compile(r'^Received +(?P<in_broadcast_pkts>\d+) +broadcasts +'
-                          '\((?P<in_multicast_pkts>\d+) *(IP)? *multicasts\)$')
-
+        p23=r'^Received +(?P<in_broadcast_pkts>\d+) +broadcasts +'
+            '\((?P<in_multicast_pkts>\d+) *(IP)? *multicasts\)$',
         # 0 runts, 0 giants, 0 throttles
-        p24 = re.compile(r'^(?P<in_runts>[0-9]+) *runts,'
-                          ' *(?P<in_giants>[0-9]+) *giants,'
-                          ' *(?P<in_throttles>[0-9]+) *throttles$')
-
+        p24=r'^(?P<in_runts>[0-9]+) *runts,'
+            ' *(?P<in_giants>[0-9]+) *giants,'
+            ' *(?P<in_throttles>[0-9]+) *throttles$',
         # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
         # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-        p25 = re.compile(r'^(?P<in_errors>[0-9]+) +input +errors, +'
-                          '(?P<in_crc_errors>[0-9]+) +CRC, +'
-                          '(?P<in_frame>[0-9]+) +frame, +'
-                          '(?P<in_overrun>[0-9]+) +overrun, +'
-                          '(?P<in_ignored>[0-9]+) +ignored'
-                          '(, *(?P<in_abort>[0-9]+) +abort)?$')
-
+        p25=r'^(?P<in_errors>[0-9]+) +input +errors, +'
+            '(?P<in_crc_errors>[0-9]+) +CRC, +'
+            '(?P<in_frame>[0-9]+) +frame, +'
+            '(?P<in_overrun>[0-9]+) +overrun, +'
+            '(?P<in_ignored>[0-9]+) +ignored'
+            '(, *(?P<in_abort>[0-9]+) +abort)?$',
         # 0 watchdog, 535961 multicast, 0 pause input
-        p26 = re.compile(r'^(?P<in_watchdog>[0-9]+) +watchdog, +'
-                          '(?P<in_multicast_pkts>[0-9]+) +multicast, +'
-                          '(?P<in_pause_input>[0-9]+) +pause +input$')
-
+        p26=r'^(?P<in_watchdog>[0-9]+) +watchdog, +'
+            '(?P<in_multicast_pkts>[0-9]+) +multicast, +'
+            '(?P<in_pause_input>[0-9]+) +pause +input$',
         # 0 input packets with dribble condition detected
-        p27 = re.compile(r'^(?P<in_with_dribble>[0-9]+) +input +packets +with +'
-                          'dribble +condition +detected$')
-
+        p27=r'^(?P<in_with_dribble>[0-9]+) +input +packets +with +'
+            'dribble +condition +detected$',
         # 23376 packets output, 3642296 bytes, 0 underruns
         # 13781 packets output, 2169851 bytes
-        p28 = re.compile(r'^(?P<out_pkts>[0-9]+) +packets +output, +(?P<out_octets>[0-9]+) '
-                          '+bytes(?:\, +(?P<out_underruns>[0-9]+) +underruns)?$')
-
+        p28=r'^(?P<out_pkts>[0-9]+) +packets +output, +(?P<out_octets>[0-9]+) '
+            '+bytes(?:\, +(?P<out_underruns>[0-9]+) +underruns)?$',
         # Received 4173 broadcasts (0 IP multicasts)
         # Received 535996 broadcasts (535961 multicasts)
-        p29 = re.compile(r'^Received +(?P<out_broadcast_pkts>\d+) +broadcasts +'
-                          '\((?P<out_multicast_pkts>\d+) *(IP)? *multicasts\)$')
-
+        p29=r'^Received +(?P<out_broadcast_pkts>\d+) +broadcasts +'
+            '\((?P<out_multicast_pkts>\d+) *(IP)? *multicasts\)$',
         # 0 output errors, 0 collisions, 2 interface resets
         # 0 output errors, 0 interface resets
-        p30 = re.compile(r'^(?P<out_errors>[0-9]+) +output +errors,'
-                          '( *(?P<out_collision>[0-9]+) +collisions,)? +'
-                          '(?P<out_interface_resets>[0-9]+) +interface +resets$')
-
+        p30=r'^(?P<out_errors>[0-9]+) +output +errors,'
+            '( *(?P<out_collision>[0-9]+) +collisions,)? +'
+            '(?P<out_interface_resets>[0-9]+) +interface +resets$',
         # 0 unknown protocol drops
-        p31 = re.compile(r'^(?P<out_unknown_protocl_drops>[0-9]+) +'
-                          'unknown +protocol +drops$')
-
+        p31=r'^(?P<out_unknown_protocl_drops>[0-9]+) +'
+            'unknown +protocol +drops$',
         # 0 babbles, 0 late collision, 0 deferred
-        p32 = re.compile(r'^(?P<out_babble>[0-9]+) +babbles, +'
-                          '(?P<out_late_collision>[0-9]+) +late +collision, +'
-                          '(?P<out_deferred>[0-9]+) +deferred$')
-
+        p32=r'^(?P<out_babble>[0-9]+) +babbles, +'
+            '(?P<out_late_collision>[0-9]+) +late +collision, +'
+            '(?P<out_deferred>[0-9]+) +deferred$',
         # 0 lost carrier, 0 no carrier, 0 pause output
         # 0 lost carrier, 0 no carrier
-        p33 = re.compile(r'^(?P<out_lost_carrier>\d+) +lost +carrier, +'
-                r'(?P<out_no_carrier>\d+) +no +carrier(, +(?P<out_pause_output>\d+) +'
-                r'pause +output)?$')
-
+        p33=r'^(?P<out_lost_carrier>\d+) +lost +carrier, +'
+            r'(?P<out_no_carrier>\d+) +no +carrier(, +(?P<out_pause_output>\d+) +'
+            r'pause +output)?$',
         # 0 output buffer failures, 0 output buffers swapped out
-        p34 = re.compile(r'^(?P<out_buffer_failure>[0-9]+) +output +buffer +failures, +'
-                          '(?P<out_buffers_swapped>[0-9]+) +output +buffers +swapped +out$')
-
+        p34=r'^(?P<out_buffer_failure>[0-9]+) +output +buffer +failures, +'
+            '(?P<out_buffers_swapped>[0-9]+) +output +buffers +swapped +out$',
         # Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
         # Interface is unnumbered. Using address of GigabitEthernet0/2.1 (192.168.154.1)
-        p35 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +'
-                          '(?P<unnumbered_intf>[\w\/\.]+) +'
-                          '\((?P<unnumbered_ip>[\w\.\:]+)\)$')
-        
+        p35=r'^Interface +is +unnumbered. +Using +address +of +'
+            '(?P<unnumbered_intf>[\w\/\.]+) +'
+            '\((?P<unnumbered_ip>[\w\.\:]+)\)$',
         # 8 maximum active VCs, 1024 VCs per VP, 1 current VCCs
-        p36 = re.compile(r'^(?P<maximum_active_vcs>\d+) +maximum +active +VCs, +'
-                r'(?P<vcs_per_vp>\d+) +VCs +per +VP, +(?P<current_vccs>\d+) +current +VCCs$')
-        
+        p36=r'^(?P<maximum_active_vcs>\d+) +maximum +active +VCs, +'
+            r'(?P<vcs_per_vp>\d+) +VCs +per +VP, +(?P<current_vccs>\d+) +current +VCCs$',
         # VC Auto Creation Disabled.
-        p37 = re.compile(r'^VC +Auto +Creation +(?P<vc_auto_creation>\S+)\.$')
-
+        p37=r'^VC +Auto +Creation +(?P<vc_auto_creation>\S+)\.$',
         # VC idle disconnect time: 300 seconds
-        p38 = re.compile(r'^VC +idle +disconnect +time: +(?P<vc_idle_disconnect_time>\d+) +'
-                r'seconds$')
-        
+        p38=r'^VC +idle +disconnect +time: +(?P<vc_idle_disconnect_time>\d+) +'
+            r'seconds$',
         # AAL5 CRC errors : 0
-        p39 = re.compile(r'^(?P<key>\S+ +CRC +errors) +: +(?P<val>\d+)$')
-        
+        p39=r'^(?P<key>\S+ +CRC +errors) +: +(?P<val>\d+)$',
         # AAL5 SAR Timeouts : 0
-        p40 = re.compile(r'^(?P<key>\S+ +SAR +Timeouts) +: +(?P<val>\d+)$')
-        
+        p40=r'^(?P<key>\S+ +SAR +Timeouts) +: +(?P<val>\d+)$',
         # AAL5 Oversized SDUs : 0
-        p41 = re.compile(r'^(?P<key>\S+ +Oversized +SDUs) +: +(?P<val>\d+)$')
-
+        p41=r'^(?P<key>\S+ +Oversized +SDUs) +: +(?P<val>\d+)$',
         # LCP Closed
         # LCP Closed, loopback not set
-        p42 = re.compile(r'^LCP\s+(?P<state>\S+)(,\s+loopback\s+(?P<loopback>[\S\s]+))?$')
-
+        p42=r'^LCP\s+(?P<state>\S+)(,\s+loopback\s+(?P<loopback>[\S\s]+))?$',
         # Base PPPoATM vaccess
-        p43 = re.compile(r'^Base PPPoATM +(?P<base_pppoatm>\S+)$')
-
+        p43=r'^Base PPPoATM +(?P<base_pppoatm>\S+)$',
         # Vaccess status 0x44, loopback not set
-        p44 = re.compile(r'^Vaccess\s+status\s+(?P<status>\S+),\s+'
-                r'loopback\s+(?P<loopback>[\S\s]+)$')
-
+        p44=r'^Vaccess\s+status\s+(?P<status>\S+),\s+'
+            r'loopback\s+(?P<loopback>[\S\s]+)$',
         # DTR is pulsed for 5 seconds on reset
-        p45 = re.compile(r'^DTR +is +pulsed +for +(?P<dtr_pulsed>\d+) +'
-                r'seconds +on +reset$')
+        p45=r'^DTR +is +pulsed +for +(?P<dtr_pulsed>\d+) +'
+            r'seconds +on +reset$')
+    dispatcher = LineDispatcher(patterns)
+
+    # fields given by the rules, for parse(fields=[...])
+    rule_fields = {
+        'p2': ['*.type', '*.mac_address', '*.phys_address'],
+        'p2_2': ['*.type', '*.mac_address', '*.phys_address'],
+        'p3': ['*.description'],
+        'p4': ['*.ipv4'],
+        'p5': ['*.ipv4'],
+        'p6': ['*.delay', '*.mtu', '*.sub_mtu', '*.bandwidth'],
+        'p7': ['*.reliability', '*.txload', '*.rxload'],
+        'p8': ['*.encapsulations', '*.medium'],
+        'p10': ['*.keepalive'],
+        'p11': ['*.duplex_mode', '*.port_speed', '*.link_type',
+                '*.auto_negotiate', '*.media_type'],
+        'p12': ['*.flow_control'],
+        'p_cd': ['*.carrier_delay'],
+        'p_cd_2': ['*.carrier_delay_up', '*.carrier_delay_down'],
+        'p13': ['*.arp_type', '*.arp_timeout'],
+        'p14': ['*.last_input', '*.last_output', '*.output_hang'],
+        'p15': ['*.port_channel'],
+        'p15_1': ['*.port_channel'],
+        'p15_2': ['*.port_channel'],
+        'p15_3': ['*.port_channel'],
+        'p16': ['*.counters.last_clear'],
+        'p17': ['*.queues'],
+        'p18': ['*.queues'],
+        'p19': ['*.queues'],
+        # the rules creating the counters of an interface
+        'p20': ['*.counters'],
+        'p21': ['*.counters.rate'],
+        'p22': ['*.counters'],
+        'p23': ['*.counters.in_multicast_pkts',
+                '*.counters.in_broadcast_pkts'],
+        'p24': ['*.counters.in_runts', '*.counters.in_giants',
+                '*.counters.in_throttles'],
+        'p25': ['*.counters.in_errors', '*.counters.in_crc_errors',
+                '*.counters.in_frame', '*.counters.in_overrun',
+                '*.counters.in_ignored', '*.counters.in_abort'],
+        'p26': ['*.counters.in_watchdog', '*.counters.in_multicast_pkts',
+                '*.counters.in_mac_pause_frames'],
+        'p27': ['*.counters.in_with_dribble'],
+        'p28': ['*.counters.out_pkts', '*.counters.out_octets',
+                '*.counters.out_underruns'],
+        'p29': ['*.counters.out_broadcast_pkts',
+                '*.counters.out_multicast_pkts'],
+        'p30': ['*.counters.out_errors', '*.counters.out_interface_resets',
+                '*.counters.out_collision'],
+        'p31': ['*.counters.out_unknown_protocl_drops'],
+        'p32': ['*.counters.out_babble', '*.counters.out_late_collision',
+                '*.counters.out_deferred'],
+        'p33': ['*.counters.out_lost_carrier', '*.counters.out_no_carrier',
+                '*.counters.out_mac_pause_frames'],
+        'p34': ['*.counters.out_buffer_failure',
+                '*.counters.out_buffers_swapped'],
+        'p35': ['*.ipv4'],
+        'p36': ['*.maximum_active_vcs', '*.vcs_per_vp', '*.current_vccs'],
+        'p37': ['*.vc_auto_creation'],
+        'p38': ['*.vc_idle_disconnect_time'],
+        'p39': ['*.aal5_crc_errors'],
+        'p40': ['*.aal5_oversized_sdus'],
+        'p41': ['*.aal5_sar_timeouts'],
+        'p42': ['*.lcp_state', '*.lcp_loopack'],
+        'p43': ['*.base_pppoatm'],
+        'p44': ['*.vaccess_status', '*.vaccess_loopback'],
+        'p45': ['*.dtr_pulsed'],
+    }
+    # the header lines of the interfaces
+    always_rules = ['p1', 'p1_1']
+    # a port-channel gives the keys of its members, an unnumbered
+    # interface the address of another interface
+    cross_block_fields = ['*.port_channel', '*.ipv4']
+
+    def cli(self,interface="",output=None):
+        if output is None:
+            if interface:
+                cmd = self.cli_command[1].format(interface=interface)
+            else:
+                cmd = self.cli_command[0]
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        # only the patterns which can match the line, see LineDispatcher,
+        # and give the wanted fields, see ProjectionParser
+        dispatcher = self.rules(self.dispatcher)
 
         interface_dict = {}
         unnumbered_dict = {}
         for line in out.splitlines():
             line = line.strip()
+            patterns = dispatcher.candidates(line)
             # GigabitEthernet1 is up, line protocol is up 
             # Port-channel12 is up, line protocol is up (connected)
             # Vlan1 is administratively down, line protocol is down , Autostate Enabled
             # Dialer1 is up (spoofing), line protocol is up (spoofing)
 
-            m = p1.match(line)
-            m1 = p1_1.match(line)
+            m = patterns.p1.match(line)
+            m1 = patterns.p1_1.match(line)
             m = m if m else m1
             if m:
                 interface = m.groupdict()['interface']
@@ -519,10 +566,10 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
             # Hardware is Loopback
-            m = p2.match(line)
+            m = patterns.p2.match(line)
 
             # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS 
-            m1 = p2_2.match(line)
+            m1 = patterns.p2_2.match(line)
             m = m if m else m1
             if m:
                 types = m.groupdict()['type']
@@ -536,7 +583,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             # Description: desc
             # Description: Pim Register Tunnel (Encap) for RP 10.186.1.1
-            m = p3.match(line)
+            m = patterns.p3.match(line)
             if m:
                 description = m.groupdict()['description']
 
@@ -544,7 +591,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Secondary address 10.2.2.2/24
-            m = p4.match(line)
+            m = patterns.p4.match(line)
             if m:
                 ip_sec = m.groupdict()['ip']
                 prefix_length_sec = m.groupdict()['prefix_length']
@@ -564,7 +611,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Internet Address is 10.4.4.4/24
-            m = p5.match(line)
+            m = patterns.p5.match(line)
             if m:
                 ip = m.groupdict()['ip']
                 prefix_length = m.groupdict()['prefix_length']
@@ -583,7 +630,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             
             # MTU 1500 bytes, BW 768 Kbit/sec, DLY 3330 usec,
             # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec, 
-            m = p6.match(line)
+            m = patterns.p6.match(line)
             if m:
                 mtu = m.groupdict()['mtu']
                 sub_mtu = m.groupdict().get('sub_mtu', None)
@@ -599,7 +646,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # reliability 255/255, txload 1/255, rxload 1/255
-            m = p7.match(line)
+            m = patterns.p7.match(line)
             if m:
                 reliability = m.groupdict()['reliability']
                 txload = m.groupdict()['txload']
@@ -615,7 +662,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # Encapsulation QinQ Virtual LAN, outer ID  10, inner ID 20
             # Encapsulation 802.1Q Virtual LAN, Vlan ID  1., loopback not set
             # Encapsulation 802.1Q Virtual LAN, Vlan ID  105.
-            m = p8.match(line)
+            m = patterns.p8.match(line)
             if m:
                 encapsulation = m.groupdict()['encapsulation']
                 encapsulation = m.groupdict()['encapsulation'].lower()
@@ -666,7 +713,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Keepalive set (10 sec)
-            m = p10.match(line)
+            m = patterns.p10.match(line)
             if m:
                 keepalive = m.groupdict()['keepalive']
                 if keepalive:
@@ -683,7 +730,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # auto-duplex, 10 Gb/s, media type is 10G
             # Full Duplex, 10000Mbps, link type is force-up, media type is SFP-LR
             # Full-duplex, 100Gb/s, link type is force-up, media type is QSFP 100G SR4
-            m = p11.match(line)
+            m = patterns.p11.match(line)
             if m:
                 duplex_mode = m.groupdict()['duplex_mode'].lower()
                 port_speed = m.groupdict()['port_speed'].lower().replace('-speed', '')
@@ -707,7 +754,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # input flow-control is off, output flow-control is unsupported
-            m = p12.match(line)
+            m = patterns.p12.match(line)
             if m:
                 receive = m.groupdict()['receive'].lower()
                 send = m.groupdict()['send'].lower()
@@ -725,8 +772,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Carrier delay is 10 sec
-            p_cd = re.compile(r'^Carrier +delay +is +(?P<carrier_delay>\d+).*$')
-            m = p_cd.match(line)
+            m = patterns.p_cd.match(line)
             if m:
                 group = m.groupdict()
                 sub_dict = interface_dict.setdefault(interface, {})
@@ -734,9 +780,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Asymmetric Carrier-Delay Up Timer is 2 sec
             # Asymmetric Carrier-Delay Down Timer is 10 sec
-            p_cd_2 = re.compile(r'^Asymmetric +Carrier-Delay +(?P<type>Down|Up)'
-                                 ' +Timer +is +(?P<carrier_delay>\d+).*$')
-            m = p_cd_2.match(line)
+            m = patterns.p_cd_2.match(line)
             if m:
                 group = m.groupdict()
                 tp = group['type'].lower()
@@ -747,7 +791,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                     sub_dict['carrier_delay_down'] = int(group['carrier_delay'])
 
             # ARP type: ARPA, ARP Timeout 04:00:00
-            m = p13.match(line)
+            m = patterns.p13.match(line)
             if m:
                 arp_type = m.groupdict()['arp_type'].lower()
                 arp_timeout = m.groupdict()['arp_timeout']
@@ -756,7 +800,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Last input never, output 00:01:05, output hang never
-            m = p14.match(line)
+            m = patterns.p14.match(line)
             if m:
                 last_input = m.groupdict()['last_input']
                 last_output = m.groupdict()['last_output']
@@ -768,7 +812,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Members in this channel: Gi1/0/2
             # Members in this channel: Fo1/0/2 Fo1/0/4
-            m = p15.match(line)
+            m = patterns.p15.match(line)
             if m:
                 interface_dict[interface]['port_channel']\
                     ['port_channel_member'] = True
@@ -788,7 +832,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # No. of active members in this channel: 12 
-            m = p15_1.match(line)
+            m = patterns.p15_1.match(line)
             if m:
                 group = m.groupdict()
                 active_members = int(group['active_members'])
@@ -799,7 +843,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Member 2 : GigabitEthernet0/0/10 , Full-duplex, 900Mb/s
-            m = p15_2.match(line)
+            m = patterns.p15_2.match(line)
             if m:
                 group = m.groupdict()
                 intf = group['interface']
@@ -813,7 +857,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # No. of PF_JUMBO supported members in this channel : 0
-            m = p15_3.match(line)
+            m = patterns.p15_3.match(line)
             if m:
                 group = m.groupdict()
                 number = int(group['number'])
@@ -822,13 +866,13 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Last clearing of "show interface" counters 1d02h
-            m = p16.match(line)
+            m = patterns.p16.match(line)
             if m:                
                 last_clear = m.groupdict()['last_clear']
                 continue
 
             # Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
-            m = p17.match(line)
+            m = patterns.p17.match(line)
             if m:
                 if 'queues' not in interface_dict[interface]:
                     interface_dict[interface]['queues'] = {}
@@ -847,7 +891,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Queueing strategy: fifo
             # Queueing strategy: Class-based queueing
-            m = p18.match(line)
+            m = patterns.p18.match(line)
             if m:
                 if 'queues' not in interface_dict[interface]:
                     interface_dict[interface]['queues'] = {}
@@ -857,7 +901,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Output queue: 0/0 (size/max)
             # Output queue: 0/1000/64/0 (size/max total/threshold/drops)
-            m = p19.match(line)
+            m = patterns.p19.match(line)
             if m:
                 if 'queues' not in interface_dict[interface]:
                     interface_dict[interface]['queues'] = {}
@@ -873,7 +917,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 5 minute input rate 0 bits/sec, 0 packets/sec
-            m = p20.match(line)
+            m = patterns.p20.match(line)
             if m:
                 load_interval = int(m.groupdict()['load_interval'])
                 in_rate = int(m.groupdict()['in_rate'])
@@ -907,7 +951,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 5 minute output rate 0 bits/sec, 0 packets/sec
-            m = p21.match(line)
+            m = patterns.p21.match(line)
             if m:
                 out_rate = int(m.groupdict()['out_rate'])
                 out_rate_pkts = int(m.groupdict()['out_rate_pkts'])
@@ -919,7 +963,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 packets input, 0 bytes, 0 no buffer
-            m = p22.match(line)
+            m = patterns.p22.match(line)
             if m:
                 if 'counters' not in interface_dict[interface]:
                     interface_dict[interface]['counters'] = {}
@@ -935,7 +979,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Received 4173 broadcasts (0 IP multicasts)
             # Received 535996 broadcasts (535961 multicasts)
-            m = p23.match(line)
+            m = patterns.p23.match(line)
             if m:
                 interface_dict[interface]['counters']['in_multicast_pkts'] = \
                     int(m.groupdict()['in_broadcast_pkts'])
@@ -944,7 +988,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 runts, 0 giants, 0 throttles
-            m = p24.match(line)
+            m = patterns.p24.match(line)
             if m:
                 interface_dict[interface]['counters']['in_runts'] = \
                     int(m.groupdict()['in_runts'])
@@ -956,7 +1000,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
             # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-            m = p25.match(line)
+            m = patterns.p25.match(line)
             if m:
                 interface_dict[interface]['counters']['in_errors'] = \
                     int(m.groupdict()['in_errors'])
@@ -974,7 +1018,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 watchdog, 535961 multicast, 0 pause input
-            m = p26.match(line)
+            m = patterns.p26.match(line)
             if m:
                 interface_dict[interface]['counters']['in_watchdog'] = \
                     int(m.groupdict()['in_watchdog'])
@@ -985,14 +1029,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 input packets with dribble condition detected
-            m = p27.match(line)
+            m = patterns.p27.match(line)
             if m:
                 interface_dict[interface]['counters']['in_with_dribble'] = \
                     int(m.groupdict()['in_with_dribble'])
                 continue
 
             # 23376 packets output, 3642296 bytes, 0 underruns
-            m = p28.match(line)
+            m = patterns.p28.match(line)
             if m:
                 interface_dict[interface]['counters']['out_pkts'] = \
                     int(m.groupdict()['out_pkts'])
@@ -1005,7 +1049,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Received 4173 broadcasts (0 IP multicasts)
             # Received 535996 broadcasts (535961 multicasts)
-            m = p29.match(line)
+            m = patterns.p29.match(line)
             if m:
                 interface_dict[interface]['counters']['out_broadcast_pkts'] = \
                     int(m.groupdict()['out_broadcast_pkts'])
@@ -1015,7 +1059,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # 0 output errors, 0 collisions, 2 interface resets
             # 0 output errors, 0 interface resets
-            m = p30.match(line)
+            m = patterns.p30.match(line)
             if m:
                 interface_dict[interface]['counters']['out_errors'] = \
                     int(m.groupdict()['out_errors'])
@@ -1027,14 +1071,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 unknown protocol drops
-            m = p31.match(line)
+            m = patterns.p31.match(line)
             if m:
                 interface_dict[interface]['counters']['out_unknown_protocl_drops'] = \
                     int(m.groupdict()['out_unknown_protocl_drops'])
                 continue
 
             # 0 babbles, 0 late collision, 0 deferred
-            m = p32.match(line)
+            m = patterns.p32.match(line)
             if m:
                 interface_dict[interface]['counters']['out_babble'] = \
                     int(m.groupdict()['out_babble'])
@@ -1045,7 +1089,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 lost carrier, 0 no carrier, 0 pause output
-            m = p33.match(line)
+            m = patterns.p33.match(line)
             if m:
                 interface_dict[interface]['counters']['out_lost_carrier'] = \
                     int(m.groupdict()['out_lost_carrier'])
@@ -1058,7 +1102,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 output buffer failures, 0 output buffers swapped out
-            m = p34.match(line)
+            m = patterns.p34.match(line)
             if m:
                 interface_dict[interface]['counters']['out_buffer_failure'] = \
                     int(m.groupdict()['out_buffer_failure'])
@@ -1068,7 +1112,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
             # Interface is unnumbered. Using address of GigabitEthernet0/2.1 (192.168.154.1)
-            m = p35.match(line)
+            m = patterns.p35.match(line)
             if m:
                 unnumbered_dict[interface] = {}
                 unnumbered_dict[interface]['unnumbered_intf'] = m.groupdict()['unnumbered_intf']
@@ -1076,7 +1120,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 8 maximum active VCs, 1024 VCs per VP, 1 current VCCs
-            m = p36.match(line)
+            m = patterns.p36.match(line)
             if m:
                 group = m.groupdict()
                 maximum_active_vcs = group['maximum_active_vcs']
@@ -1088,7 +1132,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             
             # VC Auto Creation Disabled.
-            m = p37.match(line)
+            m = patterns.p37.match(line)
             if m:
                 group = m.groupdict()
                 vc_auto_creation = group['vc_auto_creation']
@@ -1096,7 +1140,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # VC idle disconnect time: 300 seconds
-            m = p38.match(line)
+            m = patterns.p38.match(line)
             if m:
                 group = m.groupdict()
                 vc_idle_disconnect_time = group['vc_idle_disconnect_time']
@@ -1104,28 +1148,28 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # AAL5 CRC errors : 0
-            m = p39.match(line)
+            m = patterns.p39.match(line)
             if m:
                 group = m.groupdict()
                 interface_dict[interface].update({'aal5_crc_errors': int(group['val'])})
                 continue
             
             # AAL5 SAR Timeouts : 0
-            m = p40.match(line)
+            m = patterns.p40.match(line)
             if m:
                 group = m.groupdict()
                 interface_dict[interface].update({'aal5_oversized_sdus': int(group['val'])})
                 continue
 
             # AAL5 Oversized SDUs : 0
-            m = p41.match(line)
+            m = patterns.p41.match(line)
             if m:
                 group = m.groupdict()
                 interface_dict[interface].update({'aal5_sar_timeouts': int(group['val'])})
                 continue
 
             # LCP Closed
-            m = p42.match(line)
+            m = patterns.p42.match(line)
             if m:
                 group = m.groupdict()
                 interface_dict[interface].update({'lcp_state': group['state']})
@@ -1135,14 +1179,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Base PPPoATM vaccess
-            m = p43.match(line)
+            m = patterns.p43.match(line)
             if m:
                 group = m.groupdict()
                 interface_dict[interface].update({'base_pppoatm': group['base_pppoatm']})
                 continue
 
             # Vaccess status 0x44, loopback not set
-            m = p44.match(line)
+            m = patterns.p44.match(line)
             if m:
                 group = m.groupdict()
                 interface_dict[interface].update({'vaccess_status': group['status']})
@@ -1150,16 +1194,18 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # DTR is pulsed for 5 seconds on reset
-            m = p45.match(line)
+            m = patterns.p45.match(line)
             if m:
                 group = m.groupdict()
                 interface_dict[interface].update({'dtr_pulsed': group['dtr_pulsed']})
                 continue
 
         # create strucutre for unnumbered interface
-        if not unnumbered_dict:
-            return(interface_dict)
+        self._add_unnumbered(interface_dict, unnumbered_dict)
+        return(interface_dict)
 
+    def _add_unnumbered(self, interface_dict, unnumbered_dict):
+        '''Give the unnumbered interfaces the address they borrow'''
         for intf in unnumbered_dict:
             unnumbered_intf = unnumbered_dict[intf]['unnumbered_intf']
             unnumbered_ip = unnumbered_dict[intf]['unnumbered_ip']
@@ -1177,11 +1223,25 @@ class ShowInterfaces(ShowInterfacesSchema):
                             interface_dict[intf]['ipv4']['unnumbered'] = {}
                             interface_dict[intf]['ipv4']['unnumbered']\
                                 ['interface_ref'] = unnumbered_intf
-        return(interface_dict)
 
+    def merge_blocks(self, parsed, blocks):
+        '''Give the unnumbered interfaces parsed block by block the address
+        they borrow from the block of another interface, see BlockParser'''
+        unnumbered_dict = {}
+        for interface, block in blocks:
+            if interface not in parsed or 'unnumbered' not in block:
+                continue
+            for line in block.splitlines():
+                # Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
+                m = self.patterns.p35.match(line.strip())
+                if m:
+                    unnumbered_dict[interface] = m.groupdict()
+        self._add_unnumbered(parsed, unnumbered_dict)
+        return parsed
 
-# parser using parsergen
-# ----------------------
+
+# parser using a fixed width table
+# ---------------------------------
 class ShowIpInterfaceBriefSchema(MetaParser):
     """Parser for show ip interface brief"""
     schema = {'interface':
@@ -1203,7 +1263,7 @@ class ShowIpInterfaceBriefSchema(MetaParser):
             }
 
 
-class ShowIpInterfaceBrief(ShowIpInterfaceBriefSchema):
+class ShowIpInterfaceBrief(ColumnarParser, ShowIpInterfaceBriefSchema):
     """Parser for:
      show ip interface brief
      parser class implements detail parsing mechanisms for cli and yang output.
@@ -1222,6 +1282,24 @@ class ShowIpInterfaceBrief(ShowIpInterfaceBriefSchema):
 
     cli_command = ['show ip interface brief {interface}','show ip interface brief']
 
+    columnar_table = 'interface.*'
+    columnar_keys = ('interface',)
+
+    table = FixedWidthTable(header_fields=["Interface",
+                                           "IP-Address",
+                                           r"OK\?",
+                                           "Method",
+                                           "Status",
+                                           "Protocol"],
+                            label_fields=["Interface",
+                                          "ip_address",
+                                          "interface_is_ok",
+                                          "method",
+                                          "status",
+                                          "protocol"],
+                            index=[0],
+                            table_terminal_pattern=r"^\n")
+
     def cli(self, interface='',output=None):
         """parsing mechanism: cli
 
@@ -1242,31 +1320,13 @@ class ShowIpInterfaceBrief(ShowIpInterfaceBriefSchema):
             out = output
 
         if out:
-            res = parsergen.oper_fill_tabular(device_output=out,
-                                              device_os='iosxe',
-                                              table_terminal_pattern=r"^\n",
-                                              header_fields=
-                                               [ "Interface",
-                                                 "IP-Address",
-                                                 "OK\?",
-                                                 "Method",
-                                                 "Status",
-                                                 "Protocol" ],
-                                              label_fields=
-                                               [ "Interface",
-                                                 "ip_address",
-                                                 "interface_is_ok",
-                                                 "method",
-                                                 "status",
-                                                 "protocol" ],
-                                              index=[0])
-
-            # Building the schema out of the parsergen output
-            if res.entries:
-                for intf, intf_dict in res.entries.items():
-                    intf = Common.convert_intf_name(intf)
-                    del intf_dict['Interface']
-                    parsed_dict.setdefault('interface', {}).update({intf: intf_dict})
+            entries = self.table.entries(out)
+
+            # Building the schema out of the table entries
+            for intf, intf_dict in entries.items():
+                intf = Common.convert_intf_name(intf)
+                del intf_dict['Interface']
+                parsed_dict.setdefault('interface', {}).update({intf: intf_dict})
 
         return (parsed_dict)
 
@@ -21,6 +21,10 @@ from genie.metaparser.util.schemaengine import (Schema,
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.columnar import ColumnarParser
+from genie.libs.parser.utils.compact import CompactParser
+from genie.libs.parser.utils.records import build_output
+from genie.libs.parser.utils.stream import StreamParser, iter_lines
 
 
 class ShowIpNatTranslationsSchema(MetaParser):
@@ -61,7 +65,8 @@ class ShowIpNatTranslationsSchema(MetaParser):
     }
 
 
-class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
+class ShowIpNatTranslations(ColumnarParser, CompactParser, StreamParser,
+                            ShowIpNatTranslationsSchema):
     """
         * show ip nat translations
         * show ip nat translations verbose
@@ -74,7 +79,18 @@ class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
                    'show ip nat translations vrf {vrf}',
                    'show ip nat translations vrf {vrf} verbose']
 
+    columnar_table = 'vrf.*.index.*'
+    columnar_keys = ('vrf', 'index')
+
     def cli(self, vrf=None, option=None, output=None):
+        return build_output(self.iter_records(vrf=vrf, option=option,
+                                              output=output))
+
+    def iter_records(self, vrf=None, option=None, output=None):
+        """ Yield the translations one at a time, see utils.records
+
+            Each translation is yielded once its details are read.
+        """
         if output is None:
             if option and vrf is None:
                 cmd = self.cli_command[1].format(verbose=option)
@@ -135,16 +151,12 @@ class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
         # Format(H:M:S) Time-left :0:0:-1
         p8 = re.compile(r'^Format\S+ +Time\-left +\:(?P<time_left>\S+)$')
 
-        # initialize variables
-        ret_dict = {}
-        index_dict = {}
-        tmp_dict = {}
-        index = 1
-        m8_index = 1
-        vrf_name = ''
-        vrf_flag = False
+        # translation being read, yielded once complete
+        translation = None
+        index = 0
+        vrf_name = 'default'
 
-        for line in out.splitlines():
+        for line in iter_lines(out):
             line = line.strip()
 
             # udp  10.5.5.1:1025          192.0.2.1:4000 --- ---
@@ -158,155 +170,83 @@ class ShowIpNatTranslations(ShowIpNatTranslationsSchema):
             # any ---                ---                10.1.0.2          10.144.0.2
             m1 = p1.match(line)
             if m1:
-                group = m1.groupdict()
-                if 'vrf' in ret_dict:
-                    if vrf_flag:
-                        protocol_dict = index_dict.setdefault(index, {})
-                        protocol_dict.update(group)
-                        
-                    elif vrf_flag == False and index >= 2:
-                        default_dict = vrf_dict.setdefault('default', {})
-                        index_dict = default_dict.setdefault('index', {})
-                        protocol_dict = index_dict.setdefault(index, {})
-                        protocol_dict.update(group)
-                        
-                        if tmp_dict:
-                            default_dict = vrf_dict.setdefault('default', {})
-                            index_dict = default_dict.setdefault('index', {})
-                            protocol_dict = index_dict.setdefault(index, {})
-                            vrf_dict['default']['index'].update(tmp_dict)
-                            tmp_dict.clear()
-
-                else:
-                    vrf_dict = ret_dict.setdefault('vrf', {})
-
-                    itemp_dict = tmp_dict.setdefault(index, {})
-
-                    itemp_dict.update(group)
-                    
-                    protocol_dict = index_dict.setdefault(index, {})
-                    
+                if translation:
+                    yield (('vrf', vrf_name, 'index', index), translation)
+                translation = m1.groupdict()
                 index += 1
-
                 continue
-            
+
             # create: 02/15/12 11:38:01, use: 02/15/12 11:39:02, timeout: 00:00:00
             # create 04/09/11 10:51:48, use 04/09/11 10:52:31, timeout: 00:01:00
             m2 = p2.match(line)
-            if m2:
-                group = m2.groupdict()
-                if protocol_dict:
-                    details_dict = protocol_dict.setdefault('details', {})
-                    details_dict.update(group)
-                        
-                else:
-                    tmp_details_dict = tmp_dict[1].setdefault('details', {})
-                    tmp_details_dict.update(group)
-
+            if m2 and translation:
+                details_dict = translation.setdefault('details', {})
+                details_dict.update(m2.groupdict())
                 continue
-            
+
             # IOS-XE: 
             # Map-Id(In): 1
             # IOS: 
             # Map-Id(In):1, Mac-Address: 0000.0000.0000 Input-IDB: GigabitEthernet0/3/1
             m3 = p3.match(line)
-            if m3:
+            if m3 and translation:
                 group = m3.groupdict()
+                details_dict = translation.setdefault('details', {})
+                details_dict.update({'map_id_in': int(group['map_id_in'])})
 
-                if protocol_dict:
-                    details_dict.update({'map_id_in': int(group['map_id_in'])})
+                if group['mac_address']:
+                    details_dict.update({'mac_address': group['mac_address']})
 
-                    if group['mac_address']:
-                        details_dict.update({'mac_address': group['mac_address']})
-                    
-                    if group['input_idb']:
-                        details_dict.update({'input_idb': group['input_idb']})
-
-                else:
-                    tmp_details_dict.update(
-                        {'mac_address': group['mac_address']})
-                    tmp_details_dict.update({'input_idb': group['input_idb']})
-                    tmp_details_dict.update(
-                        {'map_id_in': int(group['map_id_in'])})
+                if group['input_idb']:
+                    details_dict.update({'input_idb': group['input_idb']})
 
                 continue
 
             # IOS-XE: 
             # Mac-Address: 0000.0000.0000    Input-IDB: TenGigabitEthernet1/1/0
             m4 = p4.match(line)
-            if m4:
-                group = m4.groupdict()
-
-                if protocol_dict:
-                    details_dict.update(group)
-                else:
-                    tmp_details_dict.update(group)
-
+            if m4 and translation:
+                details_dict = translation.setdefault('details', {})
+                details_dict.update(m4.groupdict())
                 continue
             
             # entry-id: 0x0, use_count:1
             m5 = p5.match(line)
-            if m5:
+            if m5 and translation:
                 group = m5.groupdict()
-                if protocol_dict:
-                    details_dict.update({'entry_id': group['entry_id']})
-                    details_dict.update({'use_count': int(group['use_count'])})
-
-                else:
-                    tmp_details_dict.update({'entry_id': group['entry_id']})
-                    tmp_details_dict.update(
-                        {'use_count': int(group['use_count'])})
-
-                if tmp_dict:
-                    default_dict = vrf_dict.setdefault('default', {})
-                    index_dict = default_dict.setdefault('index', {})
-                    protocol_dict = index_dict.setdefault(index, {})   
-                    vrf_dict['default']['index'].update(tmp_dict)
-                    tmp_dict.clear()
-
+                details_dict = translation.setdefault('details', {})
+                details_dict.update({'entry_id': group['entry_id']})
+                details_dict.update({'use_count': int(group['use_count'])})
                 continue
             
             # Total number of translations: 3
             m6 = p6.match(line)
             if m6:
+                if translation:
+                    yield (('vrf', vrf_name, 'index', index), translation)
+                    translation = None
 
                 anumber = int(m6.groupdict()['number_of_translations'])
-                total_dict = ret_dict.setdefault('vrf', {})
-                total_dict.update({'number_of_translations': anumber})
-
+                yield (('vrf',), {'number_of_translations': anumber})
                 continue
 
             # Group_id:0   vrf: genie
             m7 = p7.match(line)
-            if m7:
+            if m7 and translation:
                 group = m7.groupdict()
+                # the translations following go to the same vrf
                 vrf_name = group['vrf_name']
-                if tmp_dict:
-                    vrf_name_dict = vrf_dict.setdefault(group['vrf_name'], {})
-                    index_dict = vrf_name_dict.setdefault('index', {})
-                    tmp_dict[1].update({'group_id': int(group['group_id'])})
-                    vrf_flag = True
-
-                else:
-                    protocol_dict.update({'group_id': int(group['group_id'])})
-                
+                translation.update({'group_id': int(group['group_id'])})
                 continue
 
             # Format(H:M:S) Time-left :0:0:-1
             m8 = p8.match(line)
-            if m8:
-                time_left = m8.groupdict()['time_left']
-                if tmp_dict:
-                    m8_dict = vrf_name_dict.setdefault('index', {})
-                    tmp_dict[1].update({'time_left': time_left})
-                    vrf_dict[vrf_name]['index'].update(tmp_dict)
-                    tmp_dict.clear()
-                else:
-                    protocol_dict.update({'time_left': time_left})
-
+            if m8 and translation:
+                translation.update({'time_left': m8.groupdict()['time_left']})
                 continue
 
-        return ret_dict
+        if translation:
+            yield (('vrf', vrf_name, 'index', index), translation)
 
 
 class ShowIpNatStatisticsSchema(MetaParser):
@@ -7,12 +7,14 @@
 
 
 
-from genie import parsergen
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Or, Optional
 from genie.metaparser.util.schemaengine import Schema
 import re
 
+# import parser utils
+from genie.libs.parser.utils.tabular import FixedWidthTable
+
 # ==============================
 # Schema for 'show ip sla summary'
 # ==============================
@@ -48,6 +50,11 @@ class ShowIpSlaSummary(ShowIpSlaSummarySchema):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+    # the Last Run column wraps: '21 seconds ag' then 'o'
+    table = FixedWidthTable(header_fields=[['ID','Type','Destination','Stats','Return','Last'],['','','','','Code','Run']],
+                            label_fields=['id','type','destination','rtt_stats_mseconds','return_code','last_run_seconds_ago'],
+                            wrapped=True)
+
     def cli(self):
         """parsing mechanism: cli
 
@@ -71,9 +78,7 @@ class ShowIpSlaSummary(ShowIpSlaSummarySchema):
         #*2           dns         11.121.2.123      -           Timeout     7 seconds ago
 
         if out:
-            headers = [['ID','Type','Destination','Stats','Return','Last'],['','','','','Code','Run']]
-            result = parsergen.oper_fill_tabular(device_output = out, header_fields=headers, label_fields = ['id','type','destination','rtt_stats_mseconds','return_code','last_run_seconds_ago'])
-            struct_output = result.entries
+            struct_output = self.table.entries(out)
             if struct_output:
                 for id, id_dict in struct_output.items():
                     if id:
@@ -122,8 +127,8 @@ class ShowIpSlaSummary(ShowIpSlaSummarySchema):
                         
                         parsed_dict.setdefault('id',{}).update({probe_id: id_dict})
                     else:
-                        # This else clause is added to mitigate the limitation that sometimes the cli output line for this command
-                        # may include just the letter 'o' as it would be cut from the Last Run column due to width limitation.
+                        # The letter 'o' cut from the Last Run column due to width limitation is joined to its row by the
+                        # table, a row without ID left is skipped.
                         pass
 
         return parsed_dict
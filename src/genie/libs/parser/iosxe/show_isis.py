@@ -16,6 +16,10 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# Parser utils
+from genie.libs.parser.utils.blocks import BlockParser
+from genie.libs.parser.utils.compiled_schema import CompiledSchemaParser
+
 
 class ShowIsisNeighborsSchema(MetaParser):
     """Schema for show isis neighbors"""
@@ -329,12 +333,16 @@ class ShowIsisDatabaseDetailSchema(MetaParser):
         }
     }
 
-class ShowIsisDatabaseDetail(ShowIsisDatabaseDetailSchema):
+class ShowIsisDatabaseDetail(BlockParser, CompiledSchemaParser,
+                             ShowIsisDatabaseDetailSchema):
     """Parser for show isis database detail"""
 
     cli_command = 'show isis database detail'
     exclude = ['lsp_holdtime' , 'lsp_checksum', 'lsp_sequence_num']
 
+    # Tag VRF1:
+    block_header = re.compile(r'^ *Tag +(\w+):$', re.MULTILINE)
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
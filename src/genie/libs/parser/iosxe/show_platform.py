@@ -34,11 +34,7 @@ from xml.dom import minidom
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use
 from genie.libs.parser.utils.common import Common
-# genie.parsergen
-try:
-    import genie.parsergen
-except (ImportError, OSError):
-    pass
+from genie.libs.parser.utils.tabular import FixedWidthTable
 
 # pyATS
 from pyats.utils.exceptions import SchemaTypeError
@@ -304,6 +300,48 @@ class ShowVersion(ShowVersionSchema):
     cli_command = 'show version'
     exclude = ['system_restarted_at', 'uptime_this_cp', 'uptime']
 
+    # table2 for C3850
+    switch_table = FixedWidthTable(right_justified=True,
+                                   header_fields=["Switch",
+                                                  "Ports",
+                                                  "Model             ",
+                                                  'SW Version       ',
+                                                  "SW Image              ",
+                                                  "Mode   "],
+                                   label_fields=["switch_num",
+                                                 "ports",
+                                                 "model",
+                                                 "sw_ver",
+                                                 'sw_image',
+                                                 'mode'],
+                                   index=[0, ],
+                                   table_terminal_pattern=r"(^\n|^\s*$)")
+
+    # table2 for IOS
+    ios_switch_table = FixedWidthTable(right_justified=True,
+                                       header_fields=["Switch",
+                                                      "Ports",
+                                                      "Model             ",
+                                                      'SW Version       ',
+                                                      "SW Image              "],
+                                       label_fields=["switch_num",
+                                                     "ports",
+                                                     "model",
+                                                     "sw_ver",
+                                                     'sw_image'],
+                                       index=[0, ],
+                                       table_terminal_pattern=r"(^\n|^\s*$)")
+
+    # license table for Cat3850
+    license_table = FixedWidthTable(right_justified=True,
+                                    header_fields=["Current            ",
+                                                   "Type            ",
+                                                   "Next reboot  "],
+                                    label_fields=["license_level",
+                                                  "license_type",
+                                                  "next_reload_license_level"],
+                                    table_terminal_pattern=r"(^\n|^\s*$)")
+
     def cli(self, output=None):
         """parsing mechanism: cli
 
@@ -1210,63 +1248,20 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
         # table2 for C3850
-        tmp2 = genie.parsergen.oper_fill_tabular(right_justified=True,
-                                                 header_fields=["Switch",
-                                                                "Ports",
-                                                                "Model             ",
-                                                                'SW Version       ',
-                                                                "SW Image              ",
-                                                                "Mode   "],
-                                                 label_fields=["switch_num",
-                                                               "ports",
-                                                               "model",
-                                                               "sw_ver",
-                                                               'sw_image',
-                                                               'mode'],
-                                                 index=[0, ],
-                                                 table_terminal_pattern=r"(^\n|^\s*$)",
-                                                 device_output=out,
-                                                 device_os='iosxe')
-
-        if not tmp2.entries:
+        switches = self.switch_table.entries(out)
+        if not switches:
             # table2 for IOS
-            tmp2 = genie.parsergen.oper_fill_tabular(right_justified=True,
-                                                     header_fields=["Switch",
-                                                                    "Ports",
-                                                                    "Model             ",
-                                                                    'SW Version       ',
-                                                                    "SW Image              "],
-                                                     label_fields=["switch_num",
-                                                                   "ports",
-                                                                   "model",
-                                                                   "sw_ver",
-                                                                   'sw_image'],
-                                                     index=[0, ],
-                                                     table_terminal_pattern=r"(^\n|^\s*$)",
-                                                     device_output=out,
-                                                     device_os='ios')
+            switches = self.ios_switch_table.entries(out)
         # switch_number
         # license table for Cat3850
-        tmp = genie.parsergen.oper_fill_tabular(right_justified=True,
-                                                header_fields=["Current            ",
-                                                               "Type            ",
-                                                               "Next reboot  "],
-                                                label_fields=["license_level",
-                                                              "license_type",
-                                                              "next_reload_license_level"],
-                                                table_terminal_pattern=r"(^\n|^\s*$)",
-                                                device_output=out,
-                                                device_os='iosxe')
-
-        if tmp.entries:
-            res = tmp
-            for key in res.entries.keys():
-                for k, v in res.entries[key].items():
-                    version_dict['version'][k] = v
-
-        if tmp2.entries:
-            res2 = tmp2
-            for key in res2.entries.keys():
+        licenses = self.license_table.entries(out)
+
+        for key in licenses.keys():
+            for k, v in licenses[key].items():
+                version_dict['version'][k] = v
+
+        if switches:
+            for key in switches.keys():
                 if 'switch_num' not in version_dict['version']:
                     version_dict['version']['switch_num'] = {}
                 if '*' in key:
@@ -1276,7 +1271,7 @@ class ShowVersion(ShowVersionSchema):
                     if m:
                         if switch_no not in version_dict['version']['switch_num']:
                             version_dict['version']['switch_num'][switch_no] = {}
-                        for k, v in res2.entries[key].items():
+                        for k, v in switches[key].items():
                             if 'switch_num' != k:
                                 version_dict['version']['switch_num'][switch_no][k] = v
 
@@ -1287,7 +1282,7 @@ class ShowVersion(ShowVersionSchema):
                         version_dict['version']['switch_num'][switch_no].\
                             update(active_dict) if active_dict else None
                 else:
-                    for k, v in res2.entries[key].items():
+                    for k, v in switches[key].items():
                         if key not in version_dict['version']['switch_num']:
                             version_dict['version']['switch_num'][key] = {}
                         if 'switch_num' != k:
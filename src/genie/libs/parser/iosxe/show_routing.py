@@ -8,6 +8,10 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional
 
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.scanner import LineScanner
+from genie.libs.parser.utils.stream import StreamParser, iter_lines
+
 
 # ====================================================
 #  distributor class for show ip route
@@ -176,7 +180,7 @@ class ShowIpRouteSchema(MetaParser):
 # ====================================================
 #  parser for show ip route
 # ====================================================
-class ShowIpRoute(ShowIpRouteSchema):
+class ShowIpRoute(StreamParser, ShowIpRouteSchema):
     """Parser for :
         show ip route
         show ip route vrf <vrf>"""
@@ -186,6 +190,71 @@ class ShowIpRoute(ShowIpRouteSchema):
     exclude = ['updated']
     IP_VER='ipv4'
 
+    patterns = Patterns(
+        # Routing Table: VRF1
+        # Routing Table: VRF-infra
+        p1=r'^Routing Table: +(?P<vrf>[\w?-]+)$',
+        # 10.1.0.0/32 is subnetted, 1 subnets
+        # 10.0.0.0/8 is variably subnetted, 5 subnets, 2 masks
+        p2=r'^(?P<subnetted_ip>[\d\/\.]+) +is +(variably )?subnetted, '
+           r'+(?P<number_of_subnets>[\d]+) +subnets(, +(?P<number_of_masks>[\d]+) +masks)?$',
+        # C        10.4.1.1 is directly connected, Loopback0
+        # S        10.16.2.2 [1/0] via 10.186.2.2, GigabitEthernet0/1
+        # O        10.2.3.0/24 [110/2] via 10.186.2.2, 06:46:59, GigabitEthernet0/1
+        p3=r'^(?P<code>[\w\*]+) +(?P<code1>[\w]+)? +(?P<network>[0-9\.\:\/]+)?( '
+           r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?( *('
+           r'via +)?(?P<next_hop>[\d\.]+))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$',
+        # L        FF00::/8 [0/0]
+        p3_1=r'^(?P<code>[\w\*]+) +(?P<code1>[\w]+)? +(?P<network>[\w\.\:\/]+)?( '
+             r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?( *('
+             r'via +)?(?P<next_hop>[\d\.]+))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$',
+        #    [110/2] via 10.1.2.2, 06:46:59, GigabitEthernet0/0
+        p4=r'^\[(?P<route_preference>[\d\/]+)\] +via +(?P<next_hop>[\d\.]+)?,?'
+           r'( +(?P<date>[0-9][\w\:]+),?)?( +(?P<interface>[\S]+))?$',
+        #       is directly connected, GigabitEthernet0/2
+        p5=r'^is +directly +connected,( +\[(?P<route_preference>[\d\/]+)\] '
+           r'+via +(?P<next_hop>[\d\.]+)?,)?( +(?P<date>[0-9][\w\:]+),)?'
+           r'( +(?P<interface>[\S]+))?$',
+        #      via 10.4.1.1%default, indirectly connected
+        #      via Null0, receive
+        p6=r'^via( +(?P<next_hop>[\w]+[.:][\w\:\.\%]+),?)?'
+           r'( +(?P<interface>[\w\.\/\-\_]+))?,?( +receive)?'
+           r'( +directly connected)?( +indirectly connected)?$',
+        # Routing entry for 10.151.0.0/24, 1 known subnets
+        p100=r'^Routing +entry +for +'
+             '(?P<entry>(?P<ip>[\w\:\.]+)\/(?P<mask>\d+))'
+             '(, +(?P<net>[\w\s]+))?$',
+        # Known via "eigrp 1", distance 130, metric 10880, type internal
+        p200=r'^Known +via +\"(?P<known_via>[\w\s]+)\", +'
+             'distance +(?P<distance>\d+), +'
+             'metric +(?P<metric>\d+)'
+             '(, +type +(?P<type>[\w\-\s]+)(?P<connected>, connected)?)?$',
+        # Redistributing via eigrp 1
+        p300=r'^Redistributing +via +(?P<redist_via>\w+) *'
+             '(?P<redist_via_tag>\d+)?$',
+        # Last update from 192.168.151.2 on Vlan101, 2w3d ago
+        p400=r'^Last +update +from +(?P<from>[\w\.]+) +'
+             'on +(?P<interface>[\w\.\/\-]+), +'
+             '(?P<age>[\w\.\:]+) +ago$',
+        # * 192.168.151.2, from 192.168.151.2, 2w3d ago, via Vlan101
+        p500=r'^\*? *(?P<nexthop>[\w\.]+)(, +'
+             'from +(?P<from>[\w\.]+), +'
+             '(?P<age>[\w\.\:]+) +ago, +'
+             'via +(?P<interface>[\w\.\/\-]+))?$',
+        # Route metric is 10880, traffic share count is 1
+        p600=r'^Route +metric +is +(?P<metric>\d+), +'
+             'traffic +share +count +is +(?P<share_count>\d+)$',
+        # Total delay is 20 microseconds, minimum bandwidth is 1000000 Kbit
+        p700=r'^Total +delay +is +(?P<total_delay>\d+) +microseconds, '
+             '+minimum +bandwidth +is +(?P<minimum_bandwidth>\d+) +Kbit$',
+        # Reliability 255/255, minimum MTU 1500 bytes
+        p800=r'^Reliability +(?P<reliability>[\d\/]+), +minimum +MTU +(?P<minimum_mtu>\d+) +bytes$',
+        # Loading 1/255, Hops 1
+        p900=r'^Loading +(?P<loading>[\d\/]+), Hops +(?P<hops>\d+)$')
+    # all the patterns in one expression, see LineScanner
+    scanner = LineScanner(patterns, exclude=['p3_1'])
+    scanner_ipv6 = LineScanner(patterns, exclude=['p3'])
+
     def cli(self, vrf=None, protocol=None, output=None):
 
         if output is None:
@@ -223,58 +292,33 @@ class ShowIpRoute(ShowIpRouteSchema):
 
         result_dict = {}
 
-        # initial regexp pattern
-        p100 = re.compile(r'^Routing +entry +for +'
-                        '(?P<entry>(?P<ip>[\w\:\.]+)\/(?P<mask>\d+))'
-                        '(, +(?P<net>[\w\s]+))?$')
-        p200 = re.compile(r'^Known +via +\"(?P<known_via>[\w\s]+)\", +'
-                        'distance +(?P<distance>\d+), +'
-                        'metric +(?P<metric>\d+)'
-                        '(, +type +(?P<type>[\w\-\s]+)(?P<connected>, connected)?)?$')
-        p300 = re.compile(r'^Redistributing +via +(?P<redist_via>\w+) *'
-                        '(?P<redist_via_tag>\d+)?$')
-        p400 = re.compile(r'^Last +update +from +(?P<from>[\w\.]+) +'
-                        'on +(?P<interface>[\w\.\/\-]+), +'
-                        '(?P<age>[\w\.\:]+) +ago$')
-        p500 = re.compile(r'^\*? *(?P<nexthop>[\w\.]+)(, +'
-                        'from +(?P<from>[\w\.]+), +'
-                        '(?P<age>[\w\.\:]+) +ago, +'
-                        'via +(?P<interface>[\w\.\/\-]+))?$')
-        p600 = re.compile(r'^Route +metric +is +(?P<metric>\d+), +'
-                        'traffic +share +count +is +(?P<share_count>\d+)$')
-
-        p600 = re.compile(r'^Route +metric +is +(?P<metric>\d+), +'
-                          'traffic +share +count +is +(?P<share_count>\d+)$')
-        p700 = re.compile(r'^Total +delay +is +(?P<total_delay>\d+) +microseconds, '
-                          '+minimum +bandwidth +is +(?P<minimum_bandwidth>\d+) +Kbit$')
-        p800 = re.compile(r'^Reliability +(?P<reliability>[\d\/]+), +minimum +MTU +(?P<minimum_mtu>\d+) +bytes$')
-        p900 = re.compile(r'^Loading +(?P<loading>[\d\/]+), Hops +(?P<hops>\d+)$')
+        if self.IP_VER == 'ipv4':
+            scanner, p3 = self.scanner, 'p3'
+        else:
+            scanner, p3 = self.scanner_ipv6, 'p3_1'
 
         # initial variables
         ret_dict = {}
         index = 0
 
-        for line in out.splitlines():
+        for line in iter_lines(out):
             if line:
                 line = line.strip()
             else:
                 continue
 
             next_hop = interface = updated = metrics = route_preference = ""
+            name, m = scanner.match(line)
+
             # Routing Table: VRF1
             # Routing Table: VRF-infra
-            p1 = re.compile(r'^Routing Table: +(?P<vrf>[\w?-]+)$')
-            m = p1.match(line)
-            if m:
+            if name == 'p1':
                 vrf = m.groupdict()['vrf']
                 continue
 
             # 10.1.0.0/32 is subnetted, 1 subnets
             # 10.0.0.0/8 is variably subnetted, 5 subnets, 2 masks
-            p2 = re.compile(r'^(?P<subnetted_ip>[\d\/\.]+) +is +(variably )?subnetted, '
-                            r'+(?P<number_of_subnets>[\d]+) +subnets(, +(?P<number_of_masks>[\d]+) +masks)?$')
-            m = p2.match(line)
-            if m:
+            if name == 'p2':
                 # if you see the issue by "show ip route", it means that active is True.
                 # it means all routes in the output should be active=True
                 active = True
@@ -297,19 +341,7 @@ class ShowIpRoute(ShowIpRouteSchema):
             # D        192.168.205.1
             # S*       0.0.0.0/0 [1/0] via 10.50.15.1
             # L        FF00::/8 [0/0]
-            if self.IP_VER == 'ipv4':
-                p3 = re.compile(
-                    r'^(?P<code>[\w\*]+) +(?P<code1>[\w]+)? +(?P<network>[0-9\.\:\/]+)?( '
-                    r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?( *('
-                    r'via +)?(?P<next_hop>[\d\.]+))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$')
-            else:
-                p3 = re.compile(
-                    r'^(?P<code>[\w\*]+) +(?P<code1>[\w]+)? +(?P<network>[\w\.\:\/]+)?( '
-                    r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?( *('
-                    r'via +)?(?P<next_hop>[\d\.]+))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$')
-
-            m = p3.match(line)
-            if m:
+            if name == p3:
                 active = True
                 if m.groupdict()['code']:
                     source_protocol_codes = m.groupdict()['code'].strip()
@@ -383,10 +415,7 @@ class ShowIpRoute(ShowIpRouteSchema):
                 continue
 
             #    [110/2] via 10.1.2.2, 06:46:59, GigabitEthernet0/0
-            p4 = re.compile(r'^\[(?P<route_preference>[\d\/]+)\] +via +(?P<next_hop>[\d\.]+)?,?'
-                            r'( +(?P<date>[0-9][\w\:]+),?)?( +(?P<interface>[\S]+))?$')
-            m = p4.match(line)
-            if m:
+            if name == 'p4':
                 routepreference = m.groupdict()['route_preference']
                 if routepreference and '/' in routepreference:
                     route_preference = routepreference.split('/')[0]
@@ -434,11 +463,7 @@ class ShowIpRoute(ShowIpRouteSchema):
                 continue
 
             #       is directly connected, GigabitEthernet0/2
-            p5 = re.compile(r'^is +directly +connected,( +\[(?P<route_preference>[\d\/]+)\] '
-                            r'+via +(?P<next_hop>[\d\.]+)?,)?( +(?P<date>[0-9][\w\:]+),)?'
-                            r'( +(?P<interface>[\S]+))?$')
-            m = p5.match(line)
-            if m:
+            if name == 'p5':
 
                 if m.groupdict()['route_preference']:
                     routepreference = m.groupdict()['route_preference']
@@ -488,11 +513,7 @@ class ShowIpRoute(ShowIpRouteSchema):
             #      via 2001:DB8:4:6::6
             #      via 2001:DB8:20:4:6::6%VRF2
             #      via Null0, receive
-            p6 = re.compile(r'^via( +(?P<next_hop>[\w]+[.:][\w\:\.\%]+),?)?'
-                            r'( +(?P<interface>[\w\.\/\-\_]+))?,?( +receive)?'
-                            r'( +directly connected)?( +indirectly connected)?$')
-            m = p6.match(line)
-            if m:
+            if name == 'p6':
                 vrf_val = ''
                 tmp_next_hop = m.groupdict()['next_hop']
                 if tmp_next_hop:
@@ -536,8 +557,7 @@ class ShowIpRoute(ShowIpRouteSchema):
             # Routing entry for 10.151.0.0/24, 1 known subnets
             # Routing entry for 0.0.0.0/0, supernet
             # Routing entry for 192.168.154.0/24
-            m = p100.match(line)
-            if m:
+            if name == 'p100':
                 group = m.groupdict()
                 entry_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {}).setdefault('address_family',
                                                                                               {}).setdefault(af, {})
@@ -549,8 +569,7 @@ class ShowIpRoute(ShowIpRouteSchema):
 
             # Known via "eigrp 1", distance 130, metric 10880, type internal
             # Known via "rip", distance 120, metric 2
-            m = p200.match(line)
-            if m:
+            if name == 'p200':
                 group = m.groupdict()
                 route_dict.update({'distance': int(group['distance'])})
                 route_dict.update({'metric': int(group['metric'])})
@@ -560,16 +579,14 @@ class ShowIpRoute(ShowIpRouteSchema):
 
             # Redistributing via rip
             # Redistributing via eigrp 1
-            m = p300.match(line)
-            if m:
+            if name == 'p300':
                 group = m.groupdict()
                 route_dict.update({k: v for k, v in group.items() if v})
                 continue
 
             # Last update from 192.168.151.2 on Vlan101, 2w3d ago
             # Last update from 192.168.246.2 on Vlan103, 00:00:12 ago
-            m = p400.match(line)
-            if m:
+            if name == 'p400':
                 group = m.groupdict()
                 update_dict = route_dict.setdefault('update', {})
                 update_dict.update({k: v for k, v in group.items() if v})
@@ -577,8 +594,7 @@ class ShowIpRoute(ShowIpRouteSchema):
 
             # * 192.168.151.2, from 192.168.151.2, 2w3d ago, via Vlan101
             # * 10.69.1.2
-            m = p500.match(line)
-            if m:
+            if name == 'p500':
                 group = m.groupdict()
                 index += 1
                 path_dict = route_dict.setdefault('next_hop',{}).setdefault('next_hop_list', {}).setdefault(index, {})
@@ -590,28 +606,24 @@ class ShowIpRoute(ShowIpRouteSchema):
                 continue
 
             # Route metric is 10880, traffic share count is 1
-            m = p600.match(line)
-            if m:
+            if name == 'p600':
                 group = m.groupdict()
                 path_dict.update({k: v for k, v in group.items() if v})
 
             # Total delay is 20 microseconds, minimum bandwidth is 1000000 Kbit
-            m = p700.match(line)
-            if m:
+            if name == 'p700':
                 group = m.groupdict()
                 path_dict.update({k: v for k, v in group.items() if v})
                 continue
 
             # Reliability 255/255, minimum MTU 1500 bytes
-            m = p800.match(line)
-            if m:
+            if name == 'p800':
                 group = m.groupdict()
                 path_dict.update({k: v for k, v in group.items() if v})
                 continue
 
             # Loading 1/255, Hops 1
-            m = p900.match(line)
-            if m:
+            if name == 'p900':
                 group = m.groupdict()
                 path_dict.update({k: v for k, v in group.items() if v})
                 continue
@@ -2,9 +2,9 @@
 
 """
 import re
-import genie.parsergen as pg
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.tabular import FixedWidthTable
 
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
@@ -124,6 +124,14 @@ class ShowUsers(ShowUsersSchema):
 
     cli_command = 'show users'
 
+    line_table = FixedWidthTable(index=[1],
+                                 header_fields=[' ', ' Line', 'User', r'Host\(s\)', 'Idle', '  Location'],
+                                 label_fields=['busy', 'line', 'user', 'host', 'idle', 'location'],
+                                 table_terminal_pattern=r'Interface\s+User\s+Mode\s+Idle\s+Peer\s+Address')
+
+    interface_table = FixedWidthTable(index=[0,1],
+                                      header_fields=['Interface', 'User', 'Mode', 'Idle', 'Peer Address'])
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -133,17 +141,11 @@ class ShowUsers(ShowUsersSchema):
         # initial return dictionary
         ret_dict = {}
 
-        pg_result = pg.oper_fill_tabular(device_output=out, device_os='iosxe',
-                                         index=[1],
-                                         header_fields=[' ', ' Line', 'User', 'Host\(s\)', 'Idle', '  Location'],
-                                         label_fields=['busy', 'line', 'user', 'host', 'idle', 'location'],
-                                         table_terminal_pattern='Interface\s+User\s+Mode\s+Idle\s+Peer\s+Address')
-
         # returns a dictionary
-        pg_entries = pg_result.entries
+        line_entries = self.line_table.entries(out)
         line_dict = {}
 
-        # ============= iosxe pg_entries ================
+        # ============= iosxe line_entries ================
         # {'2 vty 0': {'busy': '',
         #      'host': 'idle',
         #      'idle': '00:35:32',
@@ -157,7 +159,7 @@ class ShowUsers(ShowUsersSchema):
         #              'location': '10.0.0.3',
         #              'user': 'testuser'}}
 
-        # ============= ios pg_entries ================
+        # ============= ios line_entries ================
         # {'*  0 con 0': {'busy': '',
         #         'host': 'idle',
         #         'idle': '01:58',
@@ -171,9 +173,9 @@ class ShowUsers(ShowUsersSchema):
         #               'location': '1212321',
         #               'user': ''}}
 
-        for k in pg_entries.keys():
+        for k in line_entries.keys():
 
-            curr_dict = pg_entries[k]
+            curr_dict = line_entries[k]
 
             # ----------------------------
             # Check keys and assign values
@@ -218,12 +220,7 @@ class ShowUsers(ShowUsersSchema):
         # unknown      NETCONF(ONEP)      com.cisco.ne 00:00:49
         # unknown      a(ONEP)            com.cisco.sy 00:00:49
 
-        interface_result = pg.oper_fill_tabular(device_output=out,
-                                                device_os='iosxe',
-                                                index=[0,1],
-                                                header_fields=['Interface', 'User', 'Mode', 'Idle', 'Peer Address'])
-
-        interface_entries = interface_result.entries
+        interface_entries = self.interface_table.entries(out)
 
         # ========= interface_entries =====================
         # {'unknown': {'NETCONF(ONEP)': {'Idle': '00:00:49',
@@ -23,6 +23,7 @@ from genie.metaparser.util.schemaengine import Schema, \
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.blocks import BlockParser
 
 
 class ShowSpanningTreeSummarySchema(MetaParser):
@@ -287,7 +288,7 @@ class ShowSpanningTreeDetailSchema(MetaParser):
     }
 
 
-class ShowSpanningTreeDetail(ShowSpanningTreeDetailSchema):
+class ShowSpanningTreeDetail(BlockParser, ShowSpanningTreeDetailSchema):
     """Parser for show spanning-tree detail"""
     MODE_NAME_MAP = {'mstp': 'mstp',
                      'ieee': 'pvst',
@@ -300,6 +301,10 @@ class ShowSpanningTreeDetail(ShowSpanningTreeDetailSchema):
                      'rstp': 'vlan_id'}
     cli_command = 'show spanning-tree detail'
 
+    # VLAN0001 is executing the rstp compatible Spanning Tree protocol
+    block_header = re.compile(r'^ *((?:MST|VLAN)?\w+) +is +executing +the ',
+                              re.MULTILINE)
+
     def cli(self, output=None):
         if output is None:
             # get output from device
@@ -3,6 +3,9 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Optional
 
+# Parser utils
+from genie.libs.parser.utils.columnar import ColumnarParser
+
 
 
 # ==========================================
@@ -1525,11 +1528,16 @@ class ShowWirelessClientSummarySchema(MetaParser):
 # Parser for:
 #  * 'show wireless client summary'
 # =================================
-class ShowWirelessClientSummary(ShowWirelessClientSummarySchema):
+class ShowWirelessClientSummary(ColumnarParser,
+                                ShowWirelessClientSummarySchema):
     """Parser for show wireless client summary"""
 
     cli_command = 'show wireless client summary'
 
+    # included and excluded clients
+    columnar_table = 'wireless_client_summary.*.*'
+    columnar_keys = ('clients', 'index')
+
     def cli(self, output=None):
         if output is None:
             output = self.device.execute(self.cli_command)
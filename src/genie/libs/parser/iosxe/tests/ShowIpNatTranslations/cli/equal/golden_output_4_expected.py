@@ -0,0 +1,16 @@
+expected_output = {
+    "vrf": {
+        "default": {
+            "index": {
+                1: {
+                    "inside_global": "10.5.5.1:1025",
+                    "inside_local": "192.0.2.1:4000",
+                    "outside_global": "198.51.100.1:80",
+                    "outside_local": "198.51.100.1:80",
+                    "protocol": "tcp",
+                },
+            }
+        },
+        "number_of_translations": 1,
+    }
+}
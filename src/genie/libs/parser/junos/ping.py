@@ -14,7 +14,10 @@ import re
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import (Any, 
-        Optional, Use, SchemaTypeError, Schema)
+        Optional, Use, SchemaTypeError)
+
+# Parser utils
+from genie.libs.parser.utils.validators import list_of
 
 class PingSchema(MetaParser):
     """
@@ -47,25 +50,16 @@ class PingSchema(MetaParser):
             }
         }
     """
-    def validate_ping_result_list(value):
-        # Pass ping result list of dict in value
-        if not isinstance(value, list):
-            raise SchemaTypeError('ping result is not a list')
-        # Create Arp Entry Schema
-        ping_result_schema = Schema({
-                    'bytes': int,
-                    'from': str,
-                    Optional('icmp-seq'): int,
-                    Optional('hlim'): int,
-                    Optional('ttl'): int,
-                    Optional('time'): str,
-                    Optional('message'): str,
-                    Optional('mtu'): str,
-                })
-        # Validate each dictionary in list
-        for item in value:
-            ping_result_schema.validate(item)
-        return value
+    validate_ping_result_list = list_of({
+        'bytes': int,
+        'from': str,
+        Optional('icmp-seq'): int,
+        Optional('hlim'): int,
+        Optional('ttl'): int,
+        Optional('time'): str,
+        Optional('message'): str,
+        Optional('mtu'): str,
+    }, 'ping result is not a list', error=SchemaTypeError)
     
     # Main Schema
     schema = {
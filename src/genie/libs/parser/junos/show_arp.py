@@ -9,9 +9,11 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
-from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any, 
-        Optional, Use, Schema)
+        Optional, Use)
+
+# Parser utils
+from genie.libs.parser.utils.validators import list_of
 
 class ShowArpSchema(MetaParser):
     """ Schema for:
@@ -33,22 +35,13 @@ class ShowArpSchema(MetaParser):
         }
     }"""
 
-    def validate_arp_table_entry_list(value):
-        # Pass arp-entry list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('arp-table-entry is not a list')
-        # Create Arp Entry Schema
-        entry_schema = Schema({
-            "arp-table-entry-flags": str,
-            "hostname": str,
-            "interface-name": str,
-            "ip-address": str,
-            "mac-address": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            entry_schema.validate(item)
-        return value
+    validate_arp_table_entry_list = list_of({
+        "arp-table-entry-flags": str,
+        "hostname": str,
+        "interface-name": str,
+        "ip-address": str,
+        "mac-address": str
+    }, 'arp-table-entry is not a list')
     
     # Main Schema
     schema = {
@@ -140,21 +133,12 @@ class ShowArpNoResolveSchema(MetaParser):
         }
     }"""
 
-    def validate_arp_table_entry_list(value):
-        # Pass arp-entry list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('arp-table-entry is not a list')
-        # Create Arp Entry Schema
-        entry_schema = Schema({
-            "arp-table-entry-flags": str,
-            "interface-name": str,
-            "ip-address": str,
-            "mac-address": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            entry_schema.validate(item)
-        return value
+    validate_arp_table_entry_list = list_of({
+        "arp-table-entry-flags": str,
+        "interface-name": str,
+        "ip-address": str,
+        "mac-address": str
+    }, 'arp-table-entry is not a list')
     
     # Main Schema
     schema = {
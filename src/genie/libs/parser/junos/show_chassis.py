@@ -19,9 +19,11 @@ Parser for the following show commands:
 import re
 
 from genie.metaparser import MetaParser
-from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any,
-        Optional, Use, Schema, Or)
+        Optional, Use, Or)
+
+# Parser utils
+from genie.libs.parser.utils.validators import list_of
 
 class ShowChassisFpcDetailSchema(MetaParser):
 
@@ -264,18 +266,10 @@ class ShowChassisFirmwareSchema(MetaParser):
     }
 } """
 
-    def validate_chassis_firmware_list(value):
-        # Pass firmware list as value
-        if not isinstance(value, list):
-            raise SchemaError('firmware is not a list')
-        chassis_firmware_schema = Schema({
-            "firmware-version": str,
-                        "type": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            chassis_firmware_schema.validate(item)
-        return value
+    validate_chassis_firmware_list = list_of({
+        "firmware-version": str,
+                    "type": str
+    }, 'firmware is not a list')
 
     schema = {
         "firmware-information": {
@@ -409,45 +403,26 @@ class ShowChassisHardwareSchema(MetaParser):
     }
 }"""
 
-    def validate_inner_chassis_hardware_list(value):
-        # Pass firmware list as value
-        if not isinstance(value, list):
-            raise SchemaError('inner chassis hardware is not a list')
-        chassis_inner_hardware_schema = Schema(
-                        {
-                            Optional("chassis-sub-sub-module"): {
-                                "description": str,
-                                "name": str,
-                                "part-number": str,
-                                "serial-number": str
-                            },
-                            Optional("description"): str,
-                            "name": str,
-                            Optional("part-number"): str,
-                            Optional("serial-number"): str,
-                            Optional("version"): str
-                        }
-                    
-        )
-        # Validate each dictionary in list
-        for item in value:
-            chassis_inner_hardware_schema.validate(item)
-        return value
-
-
-    def validate_chassis_hardware_list(value):
-        # Pass firmware list as value
-        if not isinstance(value, list):
-            raise SchemaError('chassis hardware is not a list')
-        chassis_hardware_schema = Schema({
-            Optional("chassis-sub-module"): Use(ShowChassisHardware.validate_inner_chassis_hardware_list),
-            Optional("description"): str,
-            "name": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            chassis_hardware_schema.validate(item)
-        return value
+    validate_inner_chassis_hardware_list = list_of({
+        Optional("chassis-sub-sub-module"): {
+            "description": str,
+            "name": str,
+            "part-number": str,
+            "serial-number": str
+        },
+        Optional("description"): str,
+        "name": str,
+        Optional("part-number"): str,
+        Optional("serial-number"): str,
+        Optional("version"): str
+    }, 'inner chassis hardware is not a list')
+
+
+    validate_chassis_hardware_list = list_of({
+        Optional("chassis-sub-module"): Use(validate_inner_chassis_hardware_list),
+        Optional("description"): str,
+        "name": str
+    }, 'chassis hardware is not a list')
 
     schema = {
     Optional("@xmlns:junos"): str,
@@ -653,53 +628,34 @@ class ShowChassisHardwareDetailSchema(MetaParser):
     }
 }"""
 
-    def validate_inner_chassis_hardware_detail_list(value):
-        # Pass firmware list as value
-        if not isinstance(value, list):
-            raise SchemaError('inner chassis module is not a list')
-        chassis_inner_hardware_schema = Schema(
-                        {
-                            Optional("chassis-sub-sub-module"): {
-                                "description": str,
-                                "name": str,
-                                "part-number": str,
-                                "serial-number": str
-                            },
-                            Optional("description"): str,
-                            "name": str,
-                            Optional("part-number"): str,
-                            Optional("serial-number"): str,
-                            Optional("version"): str
-                        }
-                    
-        )
-        # Validate each dictionary in list
-        for item in value:
-            chassis_inner_hardware_schema.validate(item)
-        return value
-
-
-    def validate_chassis_hardware_detail_list(value):
-        # Pass firmware list as value
-        if not isinstance(value, list):
-            raise SchemaError('chassis module is not a list')
-        chassis_hardware_detail_schema = Schema({
-            Optional("chassis-re-disk-module"): {
-                        "description": str,
-                        "disk-size": str,
-                        "model": str,
-                        "name": str,
-                        "serial-number": str
-                    },
-            Optional("chassis-sub-module"): Use(ShowChassisHardwareDetail.validate_inner_chassis_hardware_detail_list),
-            Optional("description"): str,
+    validate_inner_chassis_hardware_detail_list = list_of({
+        Optional("chassis-sub-sub-module"): {
+            "description": str,
             "name": str,
-            Optional("serial-number"): str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            chassis_hardware_detail_schema.validate(item)
-        return value
+            "part-number": str,
+            "serial-number": str
+        },
+        Optional("description"): str,
+        "name": str,
+        Optional("part-number"): str,
+        Optional("serial-number"): str,
+        Optional("version"): str
+    }, 'inner chassis module is not a list')
+
+
+    validate_chassis_hardware_detail_list = list_of({
+        Optional("chassis-re-disk-module"): {
+                    "description": str,
+                    "disk-size": str,
+                    "model": str,
+                    "name": str,
+                    "serial-number": str
+                },
+        Optional("chassis-sub-module"): Use(validate_inner_chassis_hardware_detail_list),
+        Optional("description"): str,
+        "name": str,
+        Optional("serial-number"): str
+    }, 'chassis module is not a list')
 
     schema = {
     Optional("@xmlns:junos"): str,
@@ -956,81 +912,62 @@ class ShowChassisHardwareExtensiveSchema(MetaParser):
     }
 }"""
 
-    def validate_inner_chassis_hardware_detail_list(value):
-        # Pass firmware list as value
-        if not isinstance(value, list):
-            raise SchemaError('inner chassis module is not a list')
-        chassis_inner_hardware_schema = Schema(
-                        {
-                            Optional("chassis-sub-sub-module"): {
-                                "description": str,
-                                "name": str,
-                                "part-number": str,
-                                "serial-number": str
-                            },
-                            Optional("description"): str,
-                            Optional("i2c-information"): {
-                            "assembly-flags": str,
-                            "assembly-identifier": str,
-                            "assembly-version": str,
-                            "board-information-record": str,
-                            "eeprom-version": str,
-                            Optional("i2c-data"): list,
-                            Optional("i2c-identifier"): Or(str, None),
-                            "i2c-version": Or(str, None),
-                            "jedec-code": str,
-                            "manufacture-date": str,
-                            "part-number": Or(str, None),
-                            Optional("serial-number"): Or(str,None)
-                        },
-                            "name": str,
-                            Optional("part-number"): str,
-                            Optional("serial-number"): str,
-                            Optional("version"): str
-                        }
-                    
-        )
-        # Validate each dictionary in list
-        for item in value:
-            chassis_inner_hardware_schema.validate(item)
-        return value
-
-
-    def validate_chassis_hardware_extensive_list(value):
-        # Pass firmware list as value
-        if not isinstance(value, list):
-            raise SchemaError('chassis module is not a list')
-        chassis_hardware_detail_schema = Schema({
-            Optional("chassis-re-disk-module"): {
-                        "description": str,
-                        "disk-size": str,
-                        "model": str,
-                        "name": str,
-                        "serial-number": str
-                    },
-            Optional("chassis-sub-module"): Use(ShowChassisHardwareExtensive.validate_inner_chassis_hardware_detail_list),
+    validate_inner_chassis_hardware_detail_list = list_of({
+            Optional("chassis-sub-sub-module"): {
+                "description": str,
+                "name": str,
+                "part-number": str,
+                "serial-number": str
+            },
             Optional("description"): str,
             Optional("i2c-information"): {
-                "assembly-flags": str,
-                "assembly-identifier": str,
-                "assembly-version": str,
-                "board-information-record": str,
-                "eeprom-version": str,
-                Optional("i2c-data"): list,
-                Optional("i2c-identifier"): Or(str, None),
-                "i2c-version": Or(str, None),
-                "jedec-code": str,
-                "manufacture-date": str,
-                "part-number": Or(str, None),
-                Optional("serial-number"): Or(str,None)
-            },
+            "assembly-flags": str,
+            "assembly-identifier": str,
+            "assembly-version": str,
+            "board-information-record": str,
+            "eeprom-version": str,
+            Optional("i2c-data"): list,
+            Optional("i2c-identifier"): Or(str, None),
+            "i2c-version": Or(str, None),
+            "jedec-code": str,
+            "manufacture-date": str,
+            "part-number": Or(str, None),
+            Optional("serial-number"): Or(str,None)
+        },
             "name": str,
-            Optional("serial-number"): str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            chassis_hardware_detail_schema.validate(item)
-        return value
+            Optional("part-number"): str,
+            Optional("serial-number"): str,
+            Optional("version"): str
+    }, 'inner chassis module is not a list')
+
+
+    validate_chassis_hardware_extensive_list = list_of({
+        Optional("chassis-re-disk-module"): {
+                    "description": str,
+                    "disk-size": str,
+                    "model": str,
+                    "name": str,
+                    "serial-number": str
+                },
+        Optional("chassis-sub-module"): Use(validate_inner_chassis_hardware_detail_list),
+        Optional("description"): str,
+        Optional("i2c-information"): {
+            "assembly-flags": str,
+            "assembly-identifier": str,
+            "assembly-version": str,
+            "board-information-record": str,
+            "eeprom-version": str,
+            Optional("i2c-data"): list,
+            Optional("i2c-identifier"): Or(str, None),
+            "i2c-version": Or(str, None),
+            "jedec-code": str,
+            "manufacture-date": str,
+            "part-number": Or(str, None),
+            Optional("serial-number"): Or(str,None)
+        },
+        "name": str,
+        Optional("serial-number"): str
+    }, 'chassis module is not a list')
 
     schema = {
     Optional("@xmlns:junos"): str,
@@ -1496,31 +1433,23 @@ class ShowChassisFpcSchema(MetaParser):
     """
     
 
-    def validate_chassis_fpc_list(value):
-        # Pass firmware list as value
-        if not isinstance(value, list):
-            raise SchemaError('fpc is not a list')
-        chassis_fpc_schema = Schema({
-                Optional("cpu-15min-avg"): str,
-                Optional("cpu-1min-avg"): str,
-                Optional("cpu-5min-avg"): str,
-                Optional("cpu-interrupt"): str,
-                Optional("cpu-total"): str,
-                Optional("memory-buffer-utilization"): str,
-                Optional("memory-dram-size"): str,
-                Optional("memory-heap-utilization"): str,
-                Optional("comment"): str,
-                "slot": str,
-                "state": str,
-                Optional("temperature"): {
-                    "#text": str,
-                    Optional("@junos:celsius"): str
-                }
-        })
-        # Validate each dictionary in list
-        for item in value:
-            chassis_fpc_schema.validate(item)
-        return value
+    validate_chassis_fpc_list = list_of({
+        Optional("cpu-15min-avg"): str,
+        Optional("cpu-1min-avg"): str,
+        Optional("cpu-5min-avg"): str,
+        Optional("cpu-interrupt"): str,
+        Optional("cpu-total"): str,
+        Optional("memory-buffer-utilization"): str,
+        Optional("memory-dram-size"): str,
+        Optional("memory-heap-utilization"): str,
+        Optional("comment"): str,
+        "slot": str,
+        "state": str,
+        Optional("temperature"): {
+            "#text": str,
+            Optional("@junos:celsius"): str
+        }
+    }, 'fpc is not a list')
 
     schema = {
     Optional("@xmlns:junos"): str,
@@ -1673,68 +1602,60 @@ class ShowChassisRoutingEngineSchema(MetaParser):
     }
 
 
-    def validate_chassis_routing_list(value):
-        # Pass firmware list as value
-        if not isinstance(value, list):
-            raise SchemaError('routing engine is not a list')
-        chassis_routing_schema = Schema({
-                Optional("cpu-background"): str,
-                Optional("cpu-background-5sec"): str,
-                Optional("cpu-background-1min"): str,
-                Optional("cpu-background-5min"): str,
-                Optional("cpu-background-15min"): str,
-                Optional("cpu-idle"): str,
-                Optional("cpu-idle-5sec"): str,
-                Optional("cpu-idle-1min"): str,
-                Optional("cpu-idle-5min"): str,
-                Optional("cpu-idle-15min"): str,
-                Optional("cpu-interrupt"): str,
-                Optional("cpu-interrupt-5sec"): str,
-                Optional("cpu-interrupt-1min"): str,
-                Optional("cpu-interrupt-5min"): str,
-                Optional("cpu-interrupt-15min"): str,
-                Optional("cpu-system"): str,
-                Optional("cpu-system-5sec"): str,
-                Optional("cpu-system-1min"): str,
-                Optional("cpu-system-5min"): str,
-                Optional("cpu-system-15min"): str,
-                Optional("cpu-temperature"):{
-                    "#text": str
-                },
-                Optional("cpu-user"): str,
-                Optional("cpu-user-5sec"): str,
-                Optional("cpu-user-1min"): str,
-                Optional("cpu-user-5min"): str,
-                Optional("cpu-user-15min"): str,
-                "last-reboot-reason": str,
-                "load-average-fifteen": str,
-                "load-average-five": str,
-                "load-average-one": str,
-                "mastership-priority": str,
-                "mastership-state": str,
-                "memory-buffer-utilization": str,
-                "memory-dram-size": str,
-                "memory-installed-size": str,
-                "model": str,
-                Optional("serial-number"): str,
-                "slot": str,
-                "start-time": {
-                    "#text": str,
-                    Optional("@junos:seconds"): str
-                },
-                Optional("status"): str,
-                Optional("temperature"):{
-                    "#text": str
-                },
-                "up-time": {
-                    "#text": str,
-                    Optional("@junos:seconds"): str
-                    }
-            })
-        # Validate each dictionary in list
-        for item in value:
-            chassis_routing_schema.validate(item)
-        return value
+    validate_chassis_routing_list = list_of({
+        Optional("cpu-background"): str,
+        Optional("cpu-background-5sec"): str,
+        Optional("cpu-background-1min"): str,
+        Optional("cpu-background-5min"): str,
+        Optional("cpu-background-15min"): str,
+        Optional("cpu-idle"): str,
+        Optional("cpu-idle-5sec"): str,
+        Optional("cpu-idle-1min"): str,
+        Optional("cpu-idle-5min"): str,
+        Optional("cpu-idle-15min"): str,
+        Optional("cpu-interrupt"): str,
+        Optional("cpu-interrupt-5sec"): str,
+        Optional("cpu-interrupt-1min"): str,
+        Optional("cpu-interrupt-5min"): str,
+        Optional("cpu-interrupt-15min"): str,
+        Optional("cpu-system"): str,
+        Optional("cpu-system-5sec"): str,
+        Optional("cpu-system-1min"): str,
+        Optional("cpu-system-5min"): str,
+        Optional("cpu-system-15min"): str,
+        Optional("cpu-temperature"):{
+            "#text": str
+        },
+        Optional("cpu-user"): str,
+        Optional("cpu-user-5sec"): str,
+        Optional("cpu-user-1min"): str,
+        Optional("cpu-user-5min"): str,
+        Optional("cpu-user-15min"): str,
+        "last-reboot-reason": str,
+        "load-average-fifteen": str,
+        "load-average-five": str,
+        "load-average-one": str,
+        "mastership-priority": str,
+        "mastership-state": str,
+        "memory-buffer-utilization": str,
+        "memory-dram-size": str,
+        "memory-installed-size": str,
+        "model": str,
+        Optional("serial-number"): str,
+        "slot": str,
+        "start-time": {
+            "#text": str,
+            Optional("@junos:seconds"): str
+        },
+        Optional("status"): str,
+        Optional("temperature"):{
+            "#text": str
+        },
+        "up-time": {
+            "#text": str,
+            Optional("@junos:seconds"): str
+            }
+    }, 'routing engine is not a list')
 
     schema = {
     Optional("@xmlns:junos"): str,
@@ -10,8 +10,10 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
-from pyats.utils.exceptions import SchemaError
-from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema
+from genie.metaparser.util.schemaengine import Any, Optional, Use
+
+# Parser utils
+from genie.libs.parser.utils.validators import list_of
 
 
 class ShowConfigurationProtocolsMplsLabelSwitchedPathSchema(MetaParser):
@@ -125,18 +127,10 @@ class ShowConfigurationProtocolsMplsPathSchema(MetaParser):
         show configuration protocols mpls path {path}
     """
 
-    def validate_path_list_schema(value):
-        if not isinstance(value, list):
-            raise SchemaError('path list schema is not a list')
-    
-        path_list_schema = Schema({
-            'name': str,
-            'type': str,
-        })
-    
-        for item in value:
-            path_list_schema.validate(item)
-        return value
+    validate_path_list_schema = list_of({
+        'name': str,
+        'type': str,
+    }, 'path list schema is not a list')
 
     schema = {
         "configuration": {
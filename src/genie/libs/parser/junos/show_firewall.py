@@ -10,9 +10,11 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
-from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any, 
-        Optional, Use, Schema, Or)
+        Optional, Use, Or)
+
+# Parser utils
+from genie.libs.parser.utils.validators import list_of
 
 class ShowFirewallSchema(MetaParser):
 
@@ -42,40 +44,23 @@ class ShowFirewallSchema(MetaParser):
     }
 }"""
 
-    def validate_counter_list(value):
-        # Pass firmware list as value
-        if not isinstance(value, list):
-            raise SchemaError('counter is not a list')
-        counter_inner_schema = Schema(
-                        {
-                            "byte-count": str,
-                            "counter-name": str,
-                            "packet-count": str
-                        
-                        }
-                    
-        )
-        # Validate each dictionary in list
-        for item in value:
-            counter_inner_schema.validate(item)
-        return value
+    validate_counter_list = list_of({
+        "byte-count": str,
+        "counter-name": str,
+        "packet-count": str
+
+    }, 'counter is not a list')
 
     
-    def validate_filter_information_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('filter-information is not a list')
-        filter_schema = Schema({
-                Optional("counter"): Use(ShowFirewall.validate_counter_list),
-                "filter-name": str,
-                Optional("policer"): {
-                    "byte-count": str,
-                    "packet-count": str,
-                    "policer-name": str
-                }
-        })
-        for item in value:
-            filter_schema.validate(item)
-        return value
+    validate_filter_information_list = list_of({
+        Optional("counter"): Use(validate_counter_list),
+        "filter-name": str,
+        Optional("policer"): {
+            "byte-count": str,
+            "packet-count": str,
+            "policer-name": str
+        }
+    }, 'filter-information is not a list')
     schema = {
         Optional("@xmlns:junos"): str,
         "firewall-information": {
@@ -256,21 +241,15 @@ class ShowFirewallLogSchema(MetaParser):
     }
 }"""
 
-    def validate_log_information_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('log-information is not a list')
-        log_schema = Schema({
-                "action-name": str,
-                "destination-address": str,
-                "filter-name": str,
-                "interface-name": str,
-                "protocol-name": str,
-                "source-address": str,
-                "time": str
-        })
-        for item in value:
-            log_schema.validate(item)
-        return value
+    validate_log_information_list = list_of({
+        "action-name": str,
+        "destination-address": str,
+        "filter-name": str,
+        "interface-name": str,
+        "protocol-name": str,
+        "source-address": str,
+        "time": str
+    }, 'log-information is not a list')
 
     schema = {
     "firewall-log-information": {
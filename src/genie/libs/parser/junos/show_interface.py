@@ -15,11 +15,11 @@ import re
 
 # metaparser
 from genie.metaparser import MetaParser
-from pyats.utils.exceptions import SchemaError
-from genie.metaparser.util.schemaengine import Schema, Any, Optional, Use, Or
+from genie.metaparser.util.schemaengine import Any, Optional, Use, Or
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.validators import list_of
 
 
 # =======================================================
@@ -192,20 +192,12 @@ class ShowInterfacesDescriptionsSchema(MetaParser):
     """ Schema for:
             * show interfaces descriptions
     """
-    def validate_physical_interface_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('physical-interface is not a list')
-        entry_schema = Schema(
-            {
-                "admin-status": str,
-                "description": str,
-                "name": str,
-                "oper-status": str
-            }
-        )
-        for item in value:
-            entry_schema.validate(item)
-        return value
+    validate_physical_interface_list = list_of({
+        "admin-status": str,
+        "description": str,
+        "name": str,
+        "oper-status": str
+    }, 'physical-interface is not a list')
 
     schema = {
         "interface-information": {
@@ -405,323 +397,77 @@ class ShowInterfacesSchema(MetaParser):
     #     }
     # }
 
-    def verify_physical_interface_list(value):
-        # Pass physical-interface list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('physical interface is not a list')
-        def verify_logical_interface_list(value):
-            # Pass address-family list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('logical-interface is not a list')
-
-            def verify_address_family_list(value):
-                # Pass address-family list of dict in value
-                if not isinstance(value, list):
-                    raise SchemaError('address-family is not a list')
-
-                def verify_interface_address_list(value):
-                    # Pass physical-interface list of dict in value
-                    if not isinstance(value, list) and not isinstance(value, dict):
-                        raise SchemaError('interface-address is not a list/dict')
-
-                    interface_address_schema = Schema({
-                        Optional("ifa-broadcast"): str,
-                        Optional("ifa-destination"): str,
-                        "ifa-flags": {
-                            Optional("ifaf-current-preferred"): bool,
-                            Optional("ifaf-current-primary"): bool,
-                            Optional("ifaf-is-primary"): bool,
-                            Optional("ifaf-is-preferred"): bool,
-                            Optional("ifaf-kernel"): bool,
-                            Optional("ifaf-preferred"): bool,
-                            Optional("ifaf-primary"): bool,
-                            Optional("ifaf-is-default"): bool,
-                            Optional("ifaf-none"): bool,
-                            Optional("ifaf-dest-route-down"): bool,
-                        },
-                        Optional("ifa-local"): str
-                    })
-
-                    # Validate each dictionary in list
-                    if isinstance(value, dict):
-                        value = [value]
-                    for item in value:
-                        interface_address_schema.validate(item)
-                    return value
-
-                af_schema = Schema({
-                    Optional("address-family-flags"): {
-                        Optional("ifff-is-primary"): bool,
-                        Optional("ifff-no-redirects"): bool,
-                        Optional("ifff-none"): bool,
-                        Optional("ifff-sendbcast-pkt-to-re"): bool,
-                        Optional("internal-flags"): bool,
-                        Optional("ifff-primary"): bool,
-                        Optional("ifff-receive-ttl-exceeded"): bool,
-                        Optional("ifff-receive-options"): bool,
-                        Optional("ifff-encapsulation"): str,
-                    },
-                    "address-family-name": str,
-                    Optional("interface-address"): Use(verify_interface_address_list),
-                    Optional("intf-curr-cnt"): str,
-                    Optional("intf-dropcnt"): str,
-                    Optional("intf-unresolved-cnt"): str,
-                    Optional("generation"): str,
-                    Optional("route-table"): str,
-                    Optional("max-local-cache"): str,
-                    Optional("maximum-labels"): str,
-                    "mtu": str,
-                    Optional("new-hold-limit"): str
-                })
-                # Validate each dictionary in list
-                for item in value:
-                    af_schema.validate(item)
-                return value
-
-            l_i_schema = Schema({
-                Optional("address-family"): Use(verify_address_family_list),
-                Optional("encapsulation"): str,
-                Optional("filter-information"): str,
-                "if-config-flags": {
-                    "iff-snmp-traps": bool,
-                    "iff-up": bool,
-                    Optional("internal-flags"): str
-                },
-                "local-index": str,
-                Optional("logical-interface-bandwidth"): str,
-                "name": str,
-                Optional("policer-overhead"): str,
-                Optional("snmp-index"): str,
-                Optional("traffic-statistics"): {
-                    Optional("@junos:style"): str,
-                    "input-packets": str,
-                    Optional("input-bytes"): str,
-                    "output-packets": str,
-                    Optional("output-bytes"): str,
-                    Optional("ipv6-transit-statistics"): {
-                        "input-bytes": str,
-                        "input-packets": str,
-                        "output-bytes": str,
-                        "output-packets": str,
-                    },
-                },
-                Optional("transit-traffic-statistics"): {
-                        "input-bps": str,
-                        "input-bytes": str,
-                        "input-packets": str,
-                        "input-pps": str,
-                        Optional("ipv6-transit-statistics"): {
-                            Optional("input-bps"): str,
-                            "input-bytes": str,
-                            "input-packets": str,
-                            Optional("input-pps"): str,
-                            Optional("output-bps"): str,
-                            "output-bytes": str,
-                            "output-packets": str,
-                            Optional("output-pps"): str
-                        },
-                        "output-bps": str,
-                        "output-bytes": str,
-                        "output-packets": str,
-                        "output-pps": str
-                    }
-            })
-            # Validate each dictionary in list
-            for item in value:
-                l_i_schema.validate(item)
-            return value
-
-        def verify_queue_list(value):
-            # Pass address-family list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('queue is not a list')
-            
-            queue_schema = Schema({
-                "queue-counters-queued-packets": str,
-                "queue-counters-total-drop-packets": str,
-                "queue-counters-trans-packets": str,
-                "queue-number": str
-            })
-            # Validate each dictionary in list
-            for item in value:
-                queue_schema.validate(item)
-            return value
-
-        # Create physical-interface Schema
-        physical_interface_schema = Schema({
-            Optional("active-alarms"): {
-                Optional("interface-alarms"): {
-                    Optional("alarm-not-present"): bool,
-                    Optional("ethernet-alarm-link-down"): bool,
-                }
-            },
-            Optional("active-defects"): {
-                Optional("interface-alarms"): {
-                    Optional("alarm-not-present"): bool,
-                    Optional("ethernet-alarm-link-down"): bool
-                }
-            },
-            Optional("admin-status"): {
-                Optional("#text"): str,
-                Optional("@junos:format"): str
-            },
-            Optional("bpdu-error"): str,
-            Optional("clocking"): str,
-            Optional("current-physical-address"): str,
-            Optional("description"): str,
-            Optional("eth-switch-error"): str,
-            Optional("ethernet-fec-mode"): {
-                Optional("@junos:style"): str,
-                "enabled_fec_mode": str
-            },
-            Optional("ethernet-fec-statistics"): {
-                Optional("@junos:style"): str,
-                "fec_ccw_count": str,
-                "fec_ccw_error_rate": str,
-                "fec_nccw_count": str,
-                "fec_nccw_error_rate": str
-            },
-            Optional("ethernet-pcs-statistics"): {
-                Optional("@junos:style"): str,
-                "bit-error-seconds": str,
-                "errored-blocks-seconds": str
-            },
-            Optional("hardware-physical-address"): str,
-            Optional("if-config-flags"): {
-                Optional("internal-flags"): str,
-                "iff-snmp-traps": bool,
-                Optional("iff-hardware-down"): bool,
-            },
-            Optional("if-auto-negotiation"): str,
-            "if-device-flags": {
-                "ifdf-present": bool,
-                "ifdf-running": bool,
-                Optional("ifdf-loopback"): bool,
-                Optional("ifdf-down"): bool,
-            },
-            Optional("if-flow-control"): str,
-            Optional("if-media-flags"): {
-                "ifmf-none": bool
-            },
-            Optional("if-remote-fault"): str,
-            Optional("if-type"): str,
-            Optional("ifd-specific-config-flags"): {
-                Optional("internal-flags"): str
-            },
-            Optional("interface-flapped"): {
-                "#text": str,
-                Optional("@junos:seconds"): str
-            },
-            Optional("interface-transmit-statistics"): str,
-            Optional("l2pt-error"): str,
-            Optional("ld-pdu-error"): str,
-            Optional("link-level-type"): str,
-            Optional("link-type"): str,
-            Optional("link-mode"): str,
-            Optional("local-index"): str,
-            Optional("logical-interface"): Use(verify_logical_interface_list),
-            Optional("loopback"): str,
-            Optional("lsi-traffic-statistics"): {
-                Optional("@junos:style"): str,
-                "input-bps": str,
+    verify_interface_address_list = list_of({
+        Optional("ifa-broadcast"): str,
+        Optional("ifa-destination"): str,
+        "ifa-flags": {
+            Optional("ifaf-current-preferred"): bool,
+            Optional("ifaf-current-primary"): bool,
+            Optional("ifaf-is-primary"): bool,
+            Optional("ifaf-is-preferred"): bool,
+            Optional("ifaf-kernel"): bool,
+            Optional("ifaf-preferred"): bool,
+            Optional("ifaf-primary"): bool,
+            Optional("ifaf-is-default"): bool,
+            Optional("ifaf-none"): bool,
+            Optional("ifaf-dest-route-down"): bool,
+        },
+        Optional("ifa-local"): str
+    }, 'interface-address is not a list/dict', single=True)
+
+    verify_address_family_list = list_of({
+        Optional("address-family-flags"): {
+            Optional("ifff-is-primary"): bool,
+            Optional("ifff-no-redirects"): bool,
+            Optional("ifff-none"): bool,
+            Optional("ifff-sendbcast-pkt-to-re"): bool,
+            Optional("internal-flags"): bool,
+            Optional("ifff-primary"): bool,
+            Optional("ifff-receive-ttl-exceeded"): bool,
+            Optional("ifff-receive-options"): bool,
+            Optional("ifff-encapsulation"): str,
+        },
+        "address-family-name": str,
+        Optional("interface-address"): Use(verify_interface_address_list),
+        Optional("intf-curr-cnt"): str,
+        Optional("intf-dropcnt"): str,
+        Optional("intf-unresolved-cnt"): str,
+        Optional("generation"): str,
+        Optional("route-table"): str,
+        Optional("max-local-cache"): str,
+        Optional("maximum-labels"): str,
+        "mtu": str,
+        Optional("new-hold-limit"): str
+    }, 'address-family is not a list')
+
+    verify_logical_interface_list = list_of({
+        Optional("address-family"): Use(verify_address_family_list),
+        Optional("encapsulation"): str,
+        Optional("filter-information"): str,
+        "if-config-flags": {
+            "iff-snmp-traps": bool,
+            "iff-up": bool,
+            Optional("internal-flags"): str
+        },
+        "local-index": str,
+        Optional("logical-interface-bandwidth"): str,
+        "name": str,
+        Optional("policer-overhead"): str,
+        Optional("snmp-index"): str,
+        Optional("traffic-statistics"): {
+            Optional("@junos:style"): str,
+            "input-packets": str,
+            Optional("input-bytes"): str,
+            "output-packets": str,
+            Optional("output-bytes"): str,
+            Optional("ipv6-transit-statistics"): {
                 "input-bytes": str,
                 "input-packets": str,
-                "input-pps": str
-            },
-            Optional("mru"): str,
-            Optional("mtu"): str,
-            "name": str,
-            Optional("oper-status"): str,
-            Optional("pad-to-minimum-frame-size"): str,
-            Optional("physical-interface-cos-information"): {
-                "physical-interface-cos-hw-max-queues": str,
-                "physical-interface-cos-use-max-queues": str
-            },
-            Optional("snmp-index"): str,
-            Optional("sonet-mode"): str,
-            Optional("source-filtering"): str,
-            Optional("speed"): str,
-            Optional("stp-traffic-statistics"): {
-                Optional("@junos:style"): str,
-                Optional("stp-input-bytes-dropped"): str,
-                Optional("stp-input-packets-dropped"): str,
-                Optional("stp-output-bytes-dropped"): str,
-                Optional("stp-output-packets-dropped"): str
-            },
-            Optional("traffic-statistics"): {
-                Optional("@junos:style"): str,
-                Optional("input-bps"): str,
-                Optional("output-bytes"): str,
-                Optional("input-bytes"): str,
-                Optional("input-packets"): str,
-                Optional("input-pps"): str,
-                Optional("output-bps"): str,
-                Optional("output-packets"): str,
-                Optional("output-pps"): str,
-                Optional("ipv6-transit-statistics"): {
-                    Optional("input-bps"): str,
-                    Optional("input-bytes"): str,
-                    Optional("input-packets"): str,
-                    Optional("input-pps"): str,
-                    Optional("output-bps"): str,
-                    Optional("output-bytes"): str,
-                    Optional("output-packets"): str,
-                    Optional("output-pps"): str
-                },
-            },
-            Optional("output-error-list"): {
-                Optional("aged-packets"): str,
-                Optional("carrier-transitions"): str,
-                Optional("hs-link-crc-errors"): str,
-                Optional("mtu-errors"): str,
-                Optional("output-collisions"): str,
-                Optional("output-drops"): str,
-                Optional("output-errors"): str,
-                Optional("output-fifo-errors"): str,
-                Optional("output-resource-errors"): str
-            },
-            Optional("ethernet-mac-statistics"): {
-                    Optional("@junos:style"): str,
-                    "input-broadcasts": str,
-                    "input-bytes": str,
-                    "input-code-violations": str,
-                    "input-crc-errors": str,
-                    "input-fifo-errors": str,
-                    "input-fragment-frames": str,
-                    "input-jabber-frames": str,
-                    "input-mac-control-frames": str,
-                    "input-mac-pause-frames": str,
-                    "input-multicasts": str,
-                    "input-oversized-frames": str,
-                    "input-packets": str,
-                    Optional("input-total-errors"): str,
-                    "input-unicasts": str,
-                    "input-vlan-tagged-frames": str,
-                    "output-broadcasts": str,
-                    "output-bytes": str,
-                    "output-crc-errors": str,
-                    "output-fifo-errors": str,
-                    "output-mac-control-frames": str,
-                    "output-mac-pause-frames": str,
-                    "output-multicasts": str,
-                    "output-packets": str,
-                    Optional("output-total-errors"): str,
-                    "output-unicasts": str
-            },
-            Optional("input-error-list"): {
-                    Optional("framing-errors"): str,
-                    Optional("input-discards"): str,
-                    Optional("input-drops"): str,
-                    Optional("input-errors"): str,
-                    Optional("input-fifo-errors"): str,
-                    Optional("input-giants"): str,
-                    Optional("input-l2-channel-errors"): str,
-                    Optional("input-l2-mismatch-timeouts"): str,
-                    Optional("input-l3-incompletes"): str,
-                    Optional("input-resource-errors"): str,
-                    Optional("input-runts"): str
+                "output-bytes": str,
+                "output-packets": str,
             },
-            Optional("transit-traffic-statistics"): {
+        },
+        Optional("transit-traffic-statistics"): {
                 "input-bps": str,
                 "input-bytes": str,
                 "input-packets": str,
@@ -740,20 +486,218 @@ class ShowInterfacesSchema(MetaParser):
                 "output-bytes": str,
                 "output-packets": str,
                 "output-pps": str
+            }
+    }, 'logical-interface is not a list')
+
+    verify_queue_list = list_of({
+        "queue-counters-queued-packets": str,
+        "queue-counters-total-drop-packets": str,
+        "queue-counters-trans-packets": str,
+        "queue-number": str
+    }, 'queue is not a list')
+
+    verify_physical_interface_list = list_of({
+        Optional("active-alarms"): {
+            Optional("interface-alarms"): {
+                Optional("alarm-not-present"): bool,
+                Optional("ethernet-alarm-link-down"): bool,
+            }
+        },
+        Optional("active-defects"): {
+            Optional("interface-alarms"): {
+                Optional("alarm-not-present"): bool,
+                Optional("ethernet-alarm-link-down"): bool
+            }
+        },
+        Optional("admin-status"): {
+            Optional("#text"): str,
+            Optional("@junos:format"): str
+        },
+        Optional("bpdu-error"): str,
+        Optional("clocking"): str,
+        Optional("current-physical-address"): str,
+        Optional("description"): str,
+        Optional("eth-switch-error"): str,
+        Optional("ethernet-fec-mode"): {
+            Optional("@junos:style"): str,
+            "enabled_fec_mode": str
+        },
+        Optional("ethernet-fec-statistics"): {
+            Optional("@junos:style"): str,
+            "fec_ccw_count": str,
+            "fec_ccw_error_rate": str,
+            "fec_nccw_count": str,
+            "fec_nccw_error_rate": str
+        },
+        Optional("ethernet-pcs-statistics"): {
+            Optional("@junos:style"): str,
+            "bit-error-seconds": str,
+            "errored-blocks-seconds": str
+        },
+        Optional("hardware-physical-address"): str,
+        Optional("if-config-flags"): {
+            Optional("internal-flags"): str,
+            "iff-snmp-traps": bool,
+            Optional("iff-hardware-down"): bool,
+        },
+        Optional("if-auto-negotiation"): str,
+        "if-device-flags": {
+            "ifdf-present": bool,
+            "ifdf-running": bool,
+            Optional("ifdf-loopback"): bool,
+            Optional("ifdf-down"): bool,
+        },
+        Optional("if-flow-control"): str,
+        Optional("if-media-flags"): {
+            "ifmf-none": bool
+        },
+        Optional("if-remote-fault"): str,
+        Optional("if-type"): str,
+        Optional("ifd-specific-config-flags"): {
+            Optional("internal-flags"): str
+        },
+        Optional("interface-flapped"): {
+            "#text": str,
+            Optional("@junos:seconds"): str
+        },
+        Optional("interface-transmit-statistics"): str,
+        Optional("l2pt-error"): str,
+        Optional("ld-pdu-error"): str,
+        Optional("link-level-type"): str,
+        Optional("link-type"): str,
+        Optional("link-mode"): str,
+        Optional("local-index"): str,
+        Optional("logical-interface"): Use(verify_logical_interface_list),
+        Optional("loopback"): str,
+        Optional("lsi-traffic-statistics"): {
+            Optional("@junos:style"): str,
+            "input-bps": str,
+            "input-bytes": str,
+            "input-packets": str,
+            "input-pps": str
+        },
+        Optional("mru"): str,
+        Optional("mtu"): str,
+        "name": str,
+        Optional("oper-status"): str,
+        Optional("pad-to-minimum-frame-size"): str,
+        Optional("physical-interface-cos-information"): {
+            "physical-interface-cos-hw-max-queues": str,
+            "physical-interface-cos-use-max-queues": str
+        },
+        Optional("snmp-index"): str,
+        Optional("sonet-mode"): str,
+        Optional("source-filtering"): str,
+        Optional("speed"): str,
+        Optional("stp-traffic-statistics"): {
+            Optional("@junos:style"): str,
+            Optional("stp-input-bytes-dropped"): str,
+            Optional("stp-input-packets-dropped"): str,
+            Optional("stp-output-bytes-dropped"): str,
+            Optional("stp-output-packets-dropped"): str
+        },
+        Optional("traffic-statistics"): {
+            Optional("@junos:style"): str,
+            Optional("input-bps"): str,
+            Optional("output-bytes"): str,
+            Optional("input-bytes"): str,
+            Optional("input-packets"): str,
+            Optional("input-pps"): str,
+            Optional("output-bps"): str,
+            Optional("output-packets"): str,
+            Optional("output-pps"): str,
+            Optional("ipv6-transit-statistics"): {
+                Optional("input-bps"): str,
+                Optional("input-bytes"): str,
+                Optional("input-packets"): str,
+                Optional("input-pps"): str,
+                Optional("output-bps"): str,
+                Optional("output-bytes"): str,
+                Optional("output-packets"): str,
+                Optional("output-pps"): str
             },
-            Optional("queue-counters"): {
+        },
+        Optional("output-error-list"): {
+            Optional("aged-packets"): str,
+            Optional("carrier-transitions"): str,
+            Optional("hs-link-crc-errors"): str,
+            Optional("mtu-errors"): str,
+            Optional("output-collisions"): str,
+            Optional("output-drops"): str,
+            Optional("output-errors"): str,
+            Optional("output-fifo-errors"): str,
+            Optional("output-resource-errors"): str
+        },
+        Optional("ethernet-mac-statistics"): {
                 Optional("@junos:style"): str,
-                "interface-cos-short-summary": {
-                    "intf-cos-num-queues-in-use": str,
-                    "intf-cos-num-queues-supported": str,
-                },
-                "queue": Use(verify_queue_list)
+                "input-broadcasts": str,
+                "input-bytes": str,
+                "input-code-violations": str,
+                "input-crc-errors": str,
+                "input-fifo-errors": str,
+                "input-fragment-frames": str,
+                "input-jabber-frames": str,
+                "input-mac-control-frames": str,
+                "input-mac-pause-frames": str,
+                "input-multicasts": str,
+                "input-oversized-frames": str,
+                "input-packets": str,
+                Optional("input-total-errors"): str,
+                "input-unicasts": str,
+                "input-vlan-tagged-frames": str,
+                "output-broadcasts": str,
+                "output-bytes": str,
+                "output-crc-errors": str,
+                "output-fifo-errors": str,
+                "output-mac-control-frames": str,
+                "output-mac-pause-frames": str,
+                "output-multicasts": str,
+                "output-packets": str,
+                Optional("output-total-errors"): str,
+                "output-unicasts": str
+        },
+        Optional("input-error-list"): {
+                Optional("framing-errors"): str,
+                Optional("input-discards"): str,
+                Optional("input-drops"): str,
+                Optional("input-errors"): str,
+                Optional("input-fifo-errors"): str,
+                Optional("input-giants"): str,
+                Optional("input-l2-channel-errors"): str,
+                Optional("input-l2-mismatch-timeouts"): str,
+                Optional("input-l3-incompletes"): str,
+                Optional("input-resource-errors"): str,
+                Optional("input-runts"): str
+        },
+        Optional("transit-traffic-statistics"): {
+            "input-bps": str,
+            "input-bytes": str,
+            "input-packets": str,
+            "input-pps": str,
+            Optional("ipv6-transit-statistics"): {
+                Optional("input-bps"): str,
+                "input-bytes": str,
+                "input-packets": str,
+                Optional("input-pps"): str,
+                Optional("output-bps"): str,
+                "output-bytes": str,
+                "output-packets": str,
+                Optional("output-pps"): str
             },
-        })
-        # Validate each dictionary in list
-        for item in value:
-            physical_interface_schema.validate(item)
-        return value
+            "output-bps": str,
+            "output-bytes": str,
+            "output-packets": str,
+            "output-pps": str
+        },
+        Optional("queue-counters"): {
+            Optional("@junos:style"): str,
+            "interface-cos-short-summary": {
+                "intf-cos-num-queues-in-use": str,
+                "intf-cos-num-queues-supported": str,
+            },
+            "queue": Use(verify_queue_list)
+        },
+    }, 'physical interface is not a list')
     
     schema = {
         Optional("@xmlns:junos"): str,
@@ -1817,147 +1761,110 @@ class ShowInterfacesStatisticsSchema(MetaParser):
 
     
 
-    def validate_physical_interface_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('physical-interface is not a list')
-
-        def validate_logical_interface_list(value):
-            if not isinstance(value, list):
-                raise SchemaError('logical-interface is not a list')
-
-            def validate_address_family_list(value):
-                if not isinstance(value, list):
-                    raise SchemaError('address-family is not a list')
-
-                def validate_interface_address_list(value):
-                    if not isinstance(value, list):
-                        raise SchemaError('interface-address is not a list')
-
-                    interface_address_schema = Schema ({
-                            "ifa-flags": {
-                                Optional("ifaf-current-preferred"): bool,
-                                Optional("ifaf-current-primary"): bool,
-                                Optional("ifaf-current-default"): bool,
-                            },
-                            Optional("ifa-destination"): str,
-                            Optional("ifa-local"): str,
-                            Optional("ifa-broadcast"): str,
-                        })
-
-                    for item in value:
-                        interface_address_schema.validate(item)
-                    return value
-
-                address_family_schema = Schema({
-                        "address-family-name": str,
-                        "mtu": str,
-                        Optional("address-family-flags"): {
-                            Optional("ifff-is-primary"): bool,
-                            Optional("ifff-sendbcast-pkt-to-re"): bool,
-                        },
-                        Optional("interface-address"): Use(validate_interface_address_list),
-                    })
-
-                for item in value:
-                    address_family_schema.validate(item)
-                return value
-                    
-
-            logical_interface_schema = Schema (
-                {
-                        "name": str,
-                        Optional("local-index"): str,
-                        Optional("snmp-index"): str,
-                        Optional("if-config-flags"): {
-                            "iff-snmp-traps": bool,
-                            "internal-flags": str,
-                        },
-                        Optional("encapsulation"): str,
-                        "traffic-statistics": {
-                            "input-packets": str,
-                            "output-packets": str,
-                        },
-                        Optional("filter-information"): str,
-                        Optional("logical-interface-zone-name"): str,
-                        Optional("allowed-host-inbound-traffic"): {
-                            Optional("inbound-dhcp"): bool,
-                            Optional("inbound-http"): bool,
-                            Optional("inbound-https"): bool,
-                            Optional("inbound-ssh"): bool,
-                            Optional("inbound-telnet"): bool,
-                        },
-                        Optional("address-family"): Use(validate_address_family_list),
-                    }
-            )
-
-            for item in value:
-                logical_interface_schema.validate(item)
-            return value
-
-        physical_interface_schema = Schema(
-            {
-                "name": str,
-                "admin-status": str,
-                "oper-status": str,
-                "local-index": str,
-                "snmp-index": str,
-                Optional("link-level-type"): str,
-                Optional("mtu"): str,
-                Optional("source-filtering"): str,
-                Optional("link-mode"): str,
-                Optional("speed"): str,
-                Optional("bpdu-error"): str,
-                Optional("l2pt-error"): str,
-                Optional("loopback"): str,
-                Optional("if-flow-control"): str,
-                Optional("if-auto-negotiation"): str,
-                Optional("if-remote-fault"): str,
-                Optional("if-device-flags"): {
-                    Optional("ifdf-present"): bool,
-                    Optional("ifdf-running"): bool,
-                    Optional("ifdf-none"): bool,
-                },
-                Optional("if-config-flags"): {
-                    Optional("iff-snmp-traps"): bool,
-                    Optional("internal-flags"): str,
-                },
-                Optional("if-media-flags"): {
-                    Optional("ifmf-none"): bool,
-                },
-                Optional("physical-interface-cos-information"): {
-                    "physical-interface-cos-hw-max-queues": str,
-                    "physical-interface-cos-use-max-queues": str,
-                },
-                Optional("current-physical-address"): str,
-                Optional("hardware-physical-address"): str,
-                Optional("interface-flapped"): str,
-                Optional("statistics-cleared"): str,
-                Optional("traffic-statistics"): {
-                    "input-bps": str,
-                    "input-pps": str,
-                    "output-bps": str,
-                    "output-pps": str,
-                },
-                Optional("input-error-count"): str,
-                Optional("output-error-count"): str,
-                Optional("active-alarms"): {
-                    "interface-alarms": {
-                        Optional("alarm-not-present"): bool,
-                    },
-                },
-                Optional("active-defects"): {
-                    "interface-alarms": {
-                        Optional("alarm-not-present"): bool,
-                    },
-                },
-                Optional("interface-transmit-statistics"): str,
-                Optional("logical-interface"): Use(validate_logical_interface_list)
-            }
-        )
-
-        for item in value:
-            physical_interface_schema.validate(item)
-        return value
+    validate_interface_address_list = list_of({
+        "ifa-flags": {
+            Optional("ifaf-current-preferred"): bool,
+            Optional("ifaf-current-primary"): bool,
+            Optional("ifaf-current-default"): bool,
+        },
+        Optional("ifa-destination"): str,
+        Optional("ifa-local"): str,
+        Optional("ifa-broadcast"): str,
+    }, 'interface-address is not a list')
+
+    validate_address_family_list = list_of({
+        "address-family-name": str,
+        "mtu": str,
+        Optional("address-family-flags"): {
+            Optional("ifff-is-primary"): bool,
+            Optional("ifff-sendbcast-pkt-to-re"): bool,
+        },
+        Optional("interface-address"): Use(validate_interface_address_list),
+    }, 'address-family is not a list')
+
+    validate_logical_interface_list = list_of({
+        "name": str,
+        Optional("local-index"): str,
+        Optional("snmp-index"): str,
+        Optional("if-config-flags"): {
+            "iff-snmp-traps": bool,
+            "internal-flags": str,
+        },
+        Optional("encapsulation"): str,
+        "traffic-statistics": {
+            "input-packets": str,
+            "output-packets": str,
+        },
+        Optional("filter-information"): str,
+        Optional("logical-interface-zone-name"): str,
+        Optional("allowed-host-inbound-traffic"): {
+            Optional("inbound-dhcp"): bool,
+            Optional("inbound-http"): bool,
+            Optional("inbound-https"): bool,
+            Optional("inbound-ssh"): bool,
+            Optional("inbound-telnet"): bool,
+        },
+        Optional("address-family"): Use(validate_address_family_list),
+    }, 'logical-interface is not a list')
+
+    validate_physical_interface_list = list_of({
+        "name": str,
+        "admin-status": str,
+        "oper-status": str,
+        "local-index": str,
+        "snmp-index": str,
+        Optional("link-level-type"): str,
+        Optional("mtu"): str,
+        Optional("source-filtering"): str,
+        Optional("link-mode"): str,
+        Optional("speed"): str,
+        Optional("bpdu-error"): str,
+        Optional("l2pt-error"): str,
+        Optional("loopback"): str,
+        Optional("if-flow-control"): str,
+        Optional("if-auto-negotiation"): str,
+        Optional("if-remote-fault"): str,
+        Optional("if-device-flags"): {
+            Optional("ifdf-present"): bool,
+            Optional("ifdf-running"): bool,
+            Optional("ifdf-none"): bool,
+        },
+        Optional("if-config-flags"): {
+            Optional("iff-snmp-traps"): bool,
+            Optional("internal-flags"): str,
+        },
+        Optional("if-media-flags"): {
+            Optional("ifmf-none"): bool,
+        },
+        Optional("physical-interface-cos-information"): {
+            "physical-interface-cos-hw-max-queues": str,
+            "physical-interface-cos-use-max-queues": str,
+        },
+        Optional("current-physical-address"): str,
+        Optional("hardware-physical-address"): str,
+        Optional("interface-flapped"): str,
+        Optional("statistics-cleared"): str,
+        Optional("traffic-statistics"): {
+            "input-bps": str,
+            "input-pps": str,
+            "output-bps": str,
+            "output-pps": str,
+        },
+        Optional("input-error-count"): str,
+        Optional("output-error-count"): str,
+        Optional("active-alarms"): {
+            "interface-alarms": {
+                Optional("alarm-not-present"): bool,
+            },
+        },
+        Optional("active-defects"): {
+            "interface-alarms": {
+                Optional("alarm-not-present"): bool,
+            },
+        },
+        Optional("interface-transmit-statistics"): str,
+        Optional("logical-interface"): Use(validate_logical_interface_list)
+    }, 'physical-interface is not a list')
 
     schema = {
         "interface-information": {
@@ -2388,52 +2295,27 @@ class ShowInterfacesPolicersInterfaceSchema(MetaParser):
     }
 }'''
 
-    def validate_policer_information_list(value):
-        # Pass ospf3-interface list as value
-        if not isinstance(value, list):
-            raise SchemaError('policer-information is not a list')
-        policer_information_schema = Schema({
-            "policer-family": str,
-            "policer-input": str,
-            Optional("policer-output"): Or(str,None)
-        })
-        # Validate each dictionary in list
-        for item in value:
-            policer_information_schema.validate(item)
-        return value
-
-
-    def validate_logical_interface_list(value):
-        # Pass ospf3-interface list as value
-        if not isinstance(value, list):
-            raise SchemaError('logical-interface is not a list')
-        logical_interface_schema = Schema({
-            "admin-status": str,
-            "name": str,
-            "oper-status": str,
-            "policer-information": Use(ShowInterfacesPolicersInterface.validate_policer_information_list)
-        })
-        # Validate each dictionary in list
-        for item in value:
-            logical_interface_schema.validate(item)
-        return value
-
-
-    def validate_physical_interface_list(value):
-        # Pass ospf3-interface list as value
-        if not isinstance(value, list):
-            raise SchemaError('physical-interface is not a list')
-        physical_interface_schema = Schema({
-            "admin-status": str,
-            "logical-interface": Use(ShowInterfacesPolicersInterface.validate_logical_interface_list),
-            "name": str,
-            "oper-status": str
-        })
-        # Validate each dictionary in list
+    validate_policer_information_list = list_of({
+        "policer-family": str,
+        "policer-input": str,
+        Optional("policer-output"): Or(str,None)
+    }, 'policer-information is not a list')
+
 
-        for item in value:
-            physical_interface_schema.validate(item)
-        return value
+    validate_logical_interface_list = list_of({
+        "admin-status": str,
+        "name": str,
+        "oper-status": str,
+        "policer-information": Use(validate_policer_information_list)
+    }, 'logical-interface is not a list')
+
+
+    validate_physical_interface_list = list_of({
+        "admin-status": str,
+        "logical-interface": Use(validate_logical_interface_list),
+        "name": str,
+        "oper-status": str
+    }, 'physical-interface is not a list')
 
     schema = {
     Optional("@xmlns:junos"): str,
@@ -2542,52 +2424,44 @@ class ShowInterfacesQueueSchema(MetaParser):
     Schema for:
         * show interfaces queue {interface}
     """
-    def validate_queue(value):
-        if not isinstance(value, list):
-            raise SchemaError('queue is not a list')
-        queue_schema = Schema(
-            {
-                "forwarding-class-name": str,
-                "queue-counters-queued-bytes": str,
-                "queue-counters-queued-bytes-rate": str,
-                "queue-counters-queued-packets": str,
-                "queue-counters-queued-packets-rate": str,
-                "queue-counters-red-bytes": str,
-                "queue-counters-red-bytes-high": str,
-                "queue-counters-red-bytes-low": str,
-                "queue-counters-red-bytes-medium-high": str,
-                "queue-counters-red-bytes-medium-low": str,
-                "queue-counters-red-bytes-rate": str,
-                "queue-counters-red-bytes-rate-high": str,
-                "queue-counters-red-bytes-rate-low": str,
-                "queue-counters-red-bytes-rate-medium-high": str,
-                "queue-counters-red-bytes-rate-medium-low": str,
-                "queue-counters-red-packets": str,
-                "queue-counters-red-packets-high": str,
-                "queue-counters-red-packets-low": str,
-                "queue-counters-red-packets-medium-high": str,
-                "queue-counters-red-packets-medium-low": str,
-                "queue-counters-red-packets-rate": str,
-                "queue-counters-red-packets-rate-high": str,
-                "queue-counters-red-packets-rate-low": str,
-                "queue-counters-red-packets-rate-medium-high": str,
-                "queue-counters-red-packets-rate-medium-low": str,
-                "queue-counters-tail-drop-packets": str,
-                "queue-counters-tail-drop-packets-rate": str,
-                Optional("queue-counters-rl-drop-packets"): str,
-                Optional("queue-counters-rl-drop-packets-rate"): str,
-                Optional("queue-counters-rl-drop-bytes"): str,
-                Optional("queue-counters-rl-drop-bytes-rate"): str,
-                "queue-counters-trans-bytes": str,
-                "queue-counters-trans-bytes-rate": str,
-                "queue-counters-trans-packets": str,
-                "queue-counters-trans-packets-rate": str,
-                "queue-number": str
-            }
-        )
-        for item in value:
-            queue_schema.validate(item)
-        return value
+    validate_queue = list_of({
+        "forwarding-class-name": str,
+        "queue-counters-queued-bytes": str,
+        "queue-counters-queued-bytes-rate": str,
+        "queue-counters-queued-packets": str,
+        "queue-counters-queued-packets-rate": str,
+        "queue-counters-red-bytes": str,
+        "queue-counters-red-bytes-high": str,
+        "queue-counters-red-bytes-low": str,
+        "queue-counters-red-bytes-medium-high": str,
+        "queue-counters-red-bytes-medium-low": str,
+        "queue-counters-red-bytes-rate": str,
+        "queue-counters-red-bytes-rate-high": str,
+        "queue-counters-red-bytes-rate-low": str,
+        "queue-counters-red-bytes-rate-medium-high": str,
+        "queue-counters-red-bytes-rate-medium-low": str,
+        "queue-counters-red-packets": str,
+        "queue-counters-red-packets-high": str,
+        "queue-counters-red-packets-low": str,
+        "queue-counters-red-packets-medium-high": str,
+        "queue-counters-red-packets-medium-low": str,
+        "queue-counters-red-packets-rate": str,
+        "queue-counters-red-packets-rate-high": str,
+        "queue-counters-red-packets-rate-low": str,
+        "queue-counters-red-packets-rate-medium-high": str,
+        "queue-counters-red-packets-rate-medium-low": str,
+        "queue-counters-tail-drop-packets": str,
+        "queue-counters-tail-drop-packets-rate": str,
+        Optional("queue-counters-rl-drop-packets"): str,
+        Optional("queue-counters-rl-drop-packets-rate"): str,
+        Optional("queue-counters-rl-drop-bytes"): str,
+        Optional("queue-counters-rl-drop-bytes-rate"): str,
+        "queue-counters-trans-bytes": str,
+        "queue-counters-trans-bytes-rate": str,
+        "queue-counters-trans-packets": str,
+        "queue-counters-trans-packets-rate": str,
+        "queue-number": str
+    }, 'queue is not a list')
 
     schema = {
         "interface-information": {
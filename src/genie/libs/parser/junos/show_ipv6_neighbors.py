@@ -8,9 +8,11 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
-from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any, 
-        Optional, Use, Schema)
+        Optional, Use)
+
+# Parser utils
+from genie.libs.parser.utils.validators import list_of
 
 class ShowIpv6NeighborsSchema(MetaParser):
     """ Schema for:
@@ -36,24 +38,15 @@ class ShowIpv6NeighborsSchema(MetaParser):
     }
 }"""
 
-    def validate_ipv6_entry_list(value):
-        # Pass arp-entry list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('ipv6-entry is not a list')
-        # Create Arp Entry Schema
-        entry_schema = Schema({
-            "ipv6-nd-expire": str,
-            "ipv6-nd-interface-name": str,
-            "ipv6-nd-isrouter": str,
-            "ipv6-nd-issecure": str,
-            "ipv6-nd-neighbor-address": str,
-            "ipv6-nd-neighbor-l2-address": str,
-            "ipv6-nd-state": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            entry_schema.validate(item)
-        return value
+    validate_ipv6_entry_list = list_of({
+        "ipv6-nd-expire": str,
+        "ipv6-nd-interface-name": str,
+        "ipv6-nd-isrouter": str,
+        "ipv6-nd-issecure": str,
+        "ipv6-nd-neighbor-address": str,
+        "ipv6-nd-neighbor-l2-address": str,
+        "ipv6-nd-state": str
+    }, 'ipv6-entry is not a list')
     
     # Main Schema
     schema = {
@@ -8,9 +8,11 @@ JunOs parsers for the following show commands:
 import re
 
 from genie.metaparser import MetaParser
-from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any,
-        Optional, Use, Schema)
+        Optional, Use)
+
+# Parser utils
+from genie.libs.parser.utils.validators import list_of
 
 class ShowKrtStateSchema(MetaParser):
 
@@ -276,18 +278,10 @@ class ShowKrtQueueSchema(MetaParser):
     }'''
 
     # Sub Schema
-    def validate_krt_queue_list(value):
-        # Pass ospf3-interface list as value
-        if not isinstance(value, list):
-            raise SchemaError('ospf-interface is not a list')
-        krt_queue_schema = Schema({
-                "krtq-queue-length": str,
-                "krtq-type": str
-            })
-        # Validate each dictionary in list
-        for item in value:
-            krt_queue_schema.validate(item)
-        return value
+    validate_krt_queue_list = list_of({
+        "krtq-queue-length": str,
+        "krtq-type": str
+    }, 'ospf-interface is not a list')
 
     # Main Schema
     schema = {
@@ -9,48 +9,36 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
-from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any,
-        Optional, Use, Schema)
+        Optional, Use)
+
+# Parser utils
+from genie.libs.parser.utils.validators import list_of
 
 
 class ShowLacpInterfacesInterfaceSchema(MetaParser):
     """ Schema for:
             * show lacp interfaces {interface}
     """
-    def validate_lag_lacp_state_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('lag-lacp-state is not a list')
-        entry_schema = Schema({
-            "lacp-activity": str,
-            "lacp-aggregation": str,
-            "lacp-collecting": str,
-            "lacp-defaulted": str,
-            "lacp-distributing": str,
-            "lacp-expired": str,
-            "lacp-role": str,
-            "lacp-synchronization": str,
-            "lacp-timeout": str,
-            "name": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            entry_schema.validate(item)
-        return value
-
-    def validate_lag_lacp_protocol_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('lag-lacp-protocol is not a list')
-        entry_schema = Schema({
-                "lacp-mux-state": str,
-                "lacp-receive-state": str,
-                "lacp-transmit-state": str,
-                "name": str
-            })
-        # Validate each dictionary in list
-        for item in value:
-            entry_schema.validate(item)
-        return value
+    validate_lag_lacp_state_list = list_of({
+        "lacp-activity": str,
+        "lacp-aggregation": str,
+        "lacp-collecting": str,
+        "lacp-defaulted": str,
+        "lacp-distributing": str,
+        "lacp-expired": str,
+        "lacp-role": str,
+        "lacp-synchronization": str,
+        "lacp-timeout": str,
+        "name": str
+    }, 'lag-lacp-state is not a list')
+
+    validate_lag_lacp_protocol_list = list_of({
+        "lacp-mux-state": str,
+        "lacp-receive-state": str,
+        "lacp-transmit-state": str,
+        "name": str
+    }, 'lag-lacp-protocol is not a list')
 
     schema = {
         "lacp-interface-information-list": {
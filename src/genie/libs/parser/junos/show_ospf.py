@@ -37,9 +37,10 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
-from pyats.utils.exceptions import SchemaError
-from genie.metaparser.util.schemaengine import (Any, Optional, Use,
-                                                Schema, Or)
+from genie.metaparser.util.schemaengine import (Any, Optional, Use, Or)
+
+# Parser utils
+from genie.libs.parser.utils.validators import list_of
 
 
 class ShowOspfInterfaceBriefSchema(MetaParser):
@@ -411,20 +412,14 @@ class ShowOspfNeighborSchema(MetaParser):
         }
     }
     '''
-    def validate_neighbor_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-neighbor is not a list')
-        neighbor_schema = Schema({
-            'neighbor-address': str,
-            'interface-name': str,
-            'ospf-neighbor-state': str,
-            'neighbor-id': str,
-            'neighbor-priority': str,
-            'activity-timer': str
-        })
-        for item in value:
-            neighbor_schema.validate(item)
-        return value
+    validate_neighbor_list = list_of({
+        'neighbor-address': str,
+        'interface-name': str,
+        'ospf-neighbor-state': str,
+        'neighbor-id': str,
+        'neighbor-priority': str,
+        'activity-timer': str
+    }, 'ospf-neighbor is not a list')
 
     schema = {
         'ospf-neighbor-information': {
@@ -526,20 +521,14 @@ class ShowOspfNeighborInstanceAllSchema(MetaParser):
     }
     '''
 
-    def validate_neighbor_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-neighbor is not a list')
-        neighbor_schema = Schema({
-            'neighbor-address': str,
-            'interface-name': str,
-            'ospf-neighbor-state': str,
-            'neighbor-id': str,
-            'neighbor-priority': str,
-            'activity-timer': str
-        })
-        for item in value:
-            neighbor_schema.validate(item)
-        return value
+    validate_neighbor_list = list_of({
+        'neighbor-address': str,
+        'interface-name': str,
+        'ospf-neighbor-state': str,
+        'neighbor-id': str,
+        'neighbor-priority': str,
+        'activity-timer': str
+    }, 'ospf-neighbor is not a list')
 
     schema = {
         'ospf-neighbor-information-all': {
@@ -635,23 +624,17 @@ class ShowOspfDatabaseSchema(MetaParser):
     }
 }
     '''
-    def validate_neighbor_database_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-neighbor is not a list')
-        neighbor_schema = Schema({
-            "advertising-router": str,
-            "age": str,
-            "checksum": str,
-            "lsa-id": str,
-            "lsa-length": str,
-            "lsa-type": str,
-            "options": str,
-            Optional('our-entry'): bool,
-            "sequence-number": str
-        })
-        for item in value:
-            neighbor_schema.validate(item)
-        return value
+    validate_neighbor_database_list = list_of({
+        "advertising-router": str,
+        "age": str,
+        "checksum": str,
+        "lsa-id": str,
+        "lsa-length": str,
+        "lsa-type": str,
+        "options": str,
+        Optional('our-entry'): bool,
+        "sequence-number": str
+    }, 'ospf-neighbor is not a list')
 
     schema = {
         'ospf-database-information': {
@@ -748,19 +731,13 @@ class ShowOspfDatabaseSummarySchema(MetaParser):
         ]
     }
     '''
-    def validate_neighbor_database_summary_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-database-summary is not a list')
-        neighbor_schema = Schema({
-            Optional("@external-heading"): str,
-            Optional("ospf-area"): Or(list, str),
-            Optional("ospf-intf"): list,
-            Optional("ospf-lsa-count"): Or(list, str),
-            Optional("ospf-lsa-type"): Or(list, str)
-        })
-        for item in value:
-            neighbor_schema.validate(item)
-        return value
+    validate_neighbor_database_summary_list = list_of({
+        Optional("@external-heading"): str,
+        Optional("ospf-area"): Or(list, str),
+        Optional("ospf-intf"): list,
+        Optional("ospf-lsa-count"): Or(list, str),
+        Optional("ospf-lsa-type"): Or(list, str)
+    }, 'ospf-database-summary is not a list')
 
     schema = {
         'ospf-database-information': {
@@ -942,58 +919,52 @@ class ShowOspfDatabaseExternalExtensiveSchema(MetaParser):
         ]
     }
 } """
-    def validate_neighbor_database_external_extensive_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-database is not a list')
-        neighbor_schema = Schema({
-            Optional("@external-heading"): str,
-            Optional("@heading"): str,
-            "advertising-router": str,
-            "age": str,
-            "checksum": str,
-            "lsa-id": str,
-            "lsa-length": str,
-            "lsa-type": str,
-            "options": str,
-            "ospf-database-extensive": {
-                "aging-timer": {
-                    "#text": str,
-                    Optional("@junos:seconds"): str
-                },
-                "expiration-time": {
-                    "#text": str,
-                    Optional("@junos:seconds"): str
-                },
-                "installation-time": {
-                    "#text": str,
-                    Optional("@junos:seconds"): str
-                },
-                "lsa-change-count": str,
-                "lsa-changed-time": {
-                    "#text": str,
-                    Optional("@junos:seconds"): str
-                },
-                "send-time": {
-                    "#text": str,
-                    Optional("@junos:seconds"): str
-                }
+    validate_neighbor_database_external_extensive_list = list_of({
+        Optional("@external-heading"): str,
+        Optional("@heading"): str,
+        "advertising-router": str,
+        "age": str,
+        "checksum": str,
+        "lsa-id": str,
+        "lsa-length": str,
+        "lsa-type": str,
+        "options": str,
+        "ospf-database-extensive": {
+            "aging-timer": {
+                "#text": str,
+                Optional("@junos:seconds"): str
             },
-            "ospf-external-lsa": {
-                "address-mask": str,
-                "ospf-external-lsa-topology": {
-                    "forward-address": str,
-                    "ospf-topology-id": str,
-                    "ospf-topology-metric": str,
-                    "ospf-topology-name": str,
-                    "tag": str,
-                    "type-value": str
-                }
+            "expiration-time": {
+                "#text": str,
+                Optional("@junos:seconds"): str
             },
-            "sequence-number": str
-        })
-        for item in value:
-            neighbor_schema.validate(item)
-        return value
+            "installation-time": {
+                "#text": str,
+                Optional("@junos:seconds"): str
+            },
+            "lsa-change-count": str,
+            "lsa-changed-time": {
+                "#text": str,
+                Optional("@junos:seconds"): str
+            },
+            "send-time": {
+                "#text": str,
+                Optional("@junos:seconds"): str
+            }
+        },
+        "ospf-external-lsa": {
+            "address-mask": str,
+            "ospf-external-lsa-topology": {
+                "forward-address": str,
+                "ospf-topology-id": str,
+                "ospf-topology-metric": str,
+                "ospf-topology-name": str,
+                "tag": str,
+                "type-value": str
+            }
+        },
+        "sequence-number": str
+    }, 'ospf-database is not a list')
 
     schema = {
         Optional("@xmlns:junos"): str,
@@ -1682,117 +1653,92 @@ class ShowOspfDatabaseAdvertisingRouterSelfDetailSchema(MetaParser):
             ]
         }
     }'''
-    def validate_ospf_database(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-database is not a list')
-
-        def validate_ospf_link(value):
-            if not isinstance(value, list):
-                raise SchemaError('ospf-link is not a list')
-            ospf_link_schema = Schema({
-                "link-data": str,
-                "link-id": str,
-                "link-type-name": str,
-                "link-type-value": str,
-                "metric": str,
-                "ospf-topology-count": str
-            })
-            for item in value:
-                ospf_link_schema.validate(item)
-            return value
-
-        def validate_ospf_lsa_topology_link(value):
-            if not isinstance(value, list):
-                raise SchemaError('ospf-lsa-topology-link is not a list')
-            ospf_lsa_topology_ink_schema = Schema({
-                "link-type-name":
-                str,
-                "ospf-lsa-topology-link-metric":
-                str,
-                "ospf-lsa-topology-link-node-id":
+    validate_ospf_link = list_of({
+        "link-data": str,
+        "link-id": str,
+        "link-type-name": str,
+        "link-type-value": str,
+        "metric": str,
+        "ospf-topology-count": str
+    }, 'ospf-link is not a list')
+
+    validate_ospf_lsa_topology_link = list_of({
+        "link-type-name":
+        str,
+        "ospf-lsa-topology-link-metric":
+        str,
+        "ospf-lsa-topology-link-node-id":
+        str,
+        "ospf-lsa-topology-link-state":
+        str
+    }, 'ospf-lsa-topology-link is not a list')
+
+    validate_ospf_lsa_topology_list = list_of({
+        "link-type-name": str,
+        "ospf-lsa-topology-link-metric": str,
+        "ospf-lsa-topology-link-node-id": str,
+        "ospf-lsa-topology-link-state": str
+    }, 'ospf-lsa is not a list')
+
+    validate_ospf_database = list_of({
+        "advertising-router": str,
+        "age": str,
+        "checksum": str,
+        "lsa-id": str,
+        Optional("our-entry"): bool,
+        "lsa-length": str,
+        "lsa-type": str,
+        "options": str,
+        Optional("ospf-router-lsa"): {
+            "bits": str,
+            "link-count": str,
+            "ospf-link": Use(validate_ospf_link),
+            Optional("ospf-lsa-topology"): {
+                "ospf-lsa-topology-link":
+                Use(validate_ospf_lsa_topology_link),
+                "ospf-topology-id": str,
+                "ospf-topology-name": str
+            }
+        },
+        Optional("ospf-opaque-area-lsa"): {
+            "tlv-block": {
+                "formatted-tlv-data": str,
+                "tlv-length": str,
+                "tlv-type-name": str,
+                "tlv-type-value": str
+            },
+            Optional("te-subtlv"): {
+                "formatted-tlv-data": list,
+                "tlv-length": list,
+                "tlv-type-name": list,
+                "tlv-type-value": list
+            }
+        },
+        Optional("ospf-external-lsa"): {
+            "address-mask": str,
+            "ospf-external-lsa-topology": {
+                "forward-address": str,
+                "ospf-topology-id": str,
+                "ospf-topology-metric": str,
+                "ospf-topology-name": str,
+                "tag": str,
+                "type-value": str
+            }
+        },
+        Optional("ospf-network-lsa"): {
+            "address-mask": str,
+            "attached-router": list,
+            "ospf-lsa-topology": {
+                "ospf-lsa-topology-link":
+                Use(validate_ospf_lsa_topology_list),
+                "ospf-topology-id":
                 str,
-                "ospf-lsa-topology-link-state":
+                "ospf-topology-name":
                 str
-            })
-            for item in value:
-                ospf_lsa_topology_ink_schema.validate(item)
-            return value
-
-        def validate_ospf_lsa_topology_list(value):
-            if not isinstance(value, list):
-                raise SchemaError('ospf-lsa is not a list')
-            ospf_lsa_schema = Schema({
-                "link-type-name": str,
-                "ospf-lsa-topology-link-metric": str,
-                "ospf-lsa-topology-link-node-id": str,
-                "ospf-lsa-topology-link-state": str
-            })
-            for item in value:
-                ospf_lsa_schema.validate(item)
-            return value
-
-        ospf_database_schema = Schema({
-            "advertising-router": str,
-            "age": str,
-            "checksum": str,
-            "lsa-id": str,
-            Optional("our-entry"): bool,
-            "lsa-length": str,
-            "lsa-type": str,
-            "options": str,
-            Optional("ospf-router-lsa"): {
-                "bits": str,
-                "link-count": str,
-                "ospf-link": Use(validate_ospf_link),
-                Optional("ospf-lsa-topology"): {
-                    "ospf-lsa-topology-link":
-                    Use(validate_ospf_lsa_topology_link),
-                    "ospf-topology-id": str,
-                    "ospf-topology-name": str
-                }
-            },
-            Optional("ospf-opaque-area-lsa"): {
-                "tlv-block": {
-                    "formatted-tlv-data": str,
-                    "tlv-length": str,
-                    "tlv-type-name": str,
-                    "tlv-type-value": str
-                },
-                Optional("te-subtlv"): {
-                    "formatted-tlv-data": list,
-                    "tlv-length": list,
-                    "tlv-type-name": list,
-                    "tlv-type-value": list
-                }
-            },
-            Optional("ospf-external-lsa"): {
-                "address-mask": str,
-                "ospf-external-lsa-topology": {
-                    "forward-address": str,
-                    "ospf-topology-id": str,
-                    "ospf-topology-metric": str,
-                    "ospf-topology-name": str,
-                    "tag": str,
-                    "type-value": str
-                }
-            },
-            Optional("ospf-network-lsa"): {
-                "address-mask": str,
-                "attached-router": list,
-                "ospf-lsa-topology": {
-                    "ospf-lsa-topology-link":
-                    Use(validate_ospf_lsa_topology_list),
-                    "ospf-topology-id":
-                    str,
-                    "ospf-topology-name":
-                    str
-                }
-            },
-            "sequence-number": str
-        })
-        for item in value:
-            ospf_database_schema.validate(item)
-        return value
+            }
+        },
+        "sequence-number": str
+    }, 'ospf-database is not a list')
 
     schema = {
         "ospf-database-information": {
@@ -2361,132 +2307,113 @@ class ShowOspfDatabaseExtensiveSchema(MetaParser):
             ]
         }
     }'''
-    def validate_ospf_database(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-database is not a list')
-
-        def validate_ospf_link(value):
-            if not isinstance(value, list):
-                raise SchemaError('ospf-link is not a list')
-            ospf_link_schema = Schema({
-                "link-data": str,
-                "link-id": str,
-                "link-type-name": str,
-                "link-type-value": str,
-                "metric": str,
-                "ospf-topology-count": str
-            })
-            for item in value:
-                ospf_link_schema.validate(item)
-            return value
-
-        def validate_ospf_lsa_topology_link(value):
-            if not isinstance(value, list):
-                raise SchemaError('ospf-lsa-topology-link is not a list')
-            ospf_lsa_topology_ink_schema = Schema({
-                "link-type-name":
-                str,
-                "ospf-lsa-topology-link-metric":
-                str,
-                "ospf-lsa-topology-link-node-id":
-                str,
-                "ospf-lsa-topology-link-state":
-                str
-            })
-            for item in value:
-                ospf_lsa_topology_ink_schema.validate(item)
-            return value
-
-        ospf_database_schema = Schema({
-            "advertising-router": str,
-            "age": str,
-            "checksum": str,
-            "lsa-id": str,
-            Optional("our-entry"): bool,
-            "lsa-length": str,
-            "lsa-type": str,
-            "options": str,
-            Optional("ospf-network-lsa"): {
-                "address-mask": str,
-                "attached-router": list,
-                "ospf-lsa-topology": {
-                    "ospf-lsa-topology-link":
-                    Use(validate_ospf_lsa_topology_link),
-                    "ospf-topology-id": str,
-                    "ospf-topology-name": str
-                }
+    validate_ospf_link = list_of({
+        "link-data": str,
+        "link-id": str,
+        "link-type-name": str,
+        "link-type-value": str,
+        "metric": str,
+        "ospf-topology-count": str
+    }, 'ospf-link is not a list')
+
+    validate_ospf_lsa_topology_link = list_of({
+        "link-type-name":
+        str,
+        "ospf-lsa-topology-link-metric":
+        str,
+        "ospf-lsa-topology-link-node-id":
+        str,
+        "ospf-lsa-topology-link-state":
+        str
+    }, 'ospf-lsa-topology-link is not a list')
+
+    validate_ospf_database = list_of({
+        "advertising-router": str,
+        "age": str,
+        "checksum": str,
+        "lsa-id": str,
+        Optional("our-entry"): bool,
+        "lsa-length": str,
+        "lsa-type": str,
+        "options": str,
+        Optional("ospf-network-lsa"): {
+            "address-mask": str,
+            "attached-router": list,
+            "ospf-lsa-topology": {
+                "ospf-lsa-topology-link":
+                Use(validate_ospf_lsa_topology_link),
+                "ospf-topology-id": str,
+                "ospf-topology-name": str
+            }
+        },
+        "ospf-database-extensive": {
+            "aging-timer": {
+                "#text": str
             },
-            "ospf-database-extensive": {
-                "aging-timer": {
-                    "#text": str
-                },
-                Optional("expiration-time"): {
-                    "#text": str
-                },
-                Optional("installation-time"): {
-                    "#text": str
-                },
-                Optional("generation-timer"): {
-                    "#text": str
-                },
-                Optional("lsa-change-count"): str,
-                Optional("lsa-changed-time"): {
-                    "#text": str
-                },
-                Optional("send-time"): {
-                    Optional("#text"): str
-                },
-                Optional("database-entry-state"): str
+            Optional("expiration-time"): {
+                "#text": str
             },
-            Optional("ospf-router-lsa"): {
-                "bits": str,
-                "link-count": str,
-                "ospf-link": Use(validate_ospf_link),
-                Optional("ospf-lsa-topology"): {
-                    "ospf-lsa-topology-link":
-                    Use(validate_ospf_lsa_topology_link),
-                    "ospf-topology-id": str,
-                    "ospf-topology-name": str
-                }
+            Optional("installation-time"): {
+                "#text": str
             },
-            Optional("ospf-opaque-area-lsa"): {
-                "tlv-block": {
-                    "formatted-tlv-data": str,
-                    "tlv-length": str,
-                    "tlv-type-name": str,
-                    "tlv-type-value": str
-                },
-                Optional("te-subtlv"): {
-                    "formatted-tlv-data": list,
-                    "tlv-length": list,
-                    "tlv-type-name": list,
-                    "tlv-type-value": list
-                }
+            Optional("generation-timer"): {
+                "#text": str
             },
-            Optional("ospf-external-lsa"): {
-                "address-mask": str,
-                "ospf-external-lsa-topology": {
-                    "forward-address": str,
-                    "ospf-topology-id": str,
-                    "ospf-topology-metric": str,
-                    "ospf-topology-name": str,
-                    "tag": str,
-                    "type-value": str
-                }
+            Optional("lsa-change-count"): str,
+            Optional("lsa-changed-time"): {
+                "#text": str
             },
-            Optional("ospf-summary-lsa"): {
-                "address-mask": str,
-                "ospf-summary-lsa-topology": {
-                    "ospf-topology-name": str,
-                    "ospf-topology-id": str,
-                    "ospf-topology-metric": str,
-                }
+            Optional("send-time"): {
+                Optional("#text"): str
             },
-            "sequence-number": str
-        })
-        for item in value:
-            ospf_database_schema.validate(item)
-        return value
+            Optional("database-entry-state"): str
+        },
+        Optional("ospf-router-lsa"): {
+            "bits": str,
+            "link-count": str,
+            "ospf-link": Use(validate_ospf_link),
+            Optional("ospf-lsa-topology"): {
+                "ospf-lsa-topology-link":
+                Use(validate_ospf_lsa_topology_link),
+                "ospf-topology-id": str,
+                "ospf-topology-name": str
+            }
+        },
+        Optional("ospf-opaque-area-lsa"): {
+            "tlv-block": {
+                "formatted-tlv-data": str,
+                "tlv-length": str,
+                "tlv-type-name": str,
+                "tlv-type-value": str
+            },
+            Optional("te-subtlv"): {
+                "formatted-tlv-data": list,
+                "tlv-length": list,
+                "tlv-type-name": list,
+                "tlv-type-value": list
+            }
+        },
+        Optional("ospf-external-lsa"): {
+            "address-mask": str,
+            "ospf-external-lsa-topology": {
+                "forward-address": str,
+                "ospf-topology-id": str,
+                "ospf-topology-metric": str,
+                "ospf-topology-name": str,
+                "tag": str,
+                "type-value": str
+            }
+        },
+        Optional("ospf-summary-lsa"): {
+            "address-mask": str,
+            "ospf-summary-lsa-topology": {
+                "ospf-topology-name": str,
+                "ospf-topology-id": str,
+                "ospf-topology-metric": str,
+            }
+        },
+        "sequence-number": str
+    }, 'ospf-database is not a list')
 
     schema = {
         "ospf-database-information": {
@@ -3412,52 +3339,39 @@ class ShowOspfNeighborExtensiveSchema(MetaParser):
     """ Schema for:
             * show ospf neighbor extensive
     """
-    def validate_ospf_neighbor_list(value):
-        def validate_adjacency_labels_list(value):
-            if not isinstance(value, list):
-                raise SchemaError('adjacency labels is not a list')
-            adjacency_labels_schema = Schema(
-                {
-                    'label': str,
-                    'flags': str,
-                    'adj-sid-type': str
-                }, )
-            for item in value:
-                adjacency_labels_schema.validate(item)
-            return value
-
-        if not isinstance(value, list):
-            raise SchemaError('ospf-neighbor is not a list')
-        ospf_lsa_topology_ink_schema = Schema({
-            "activity-timer": str,
-            Optional("adj-sid-list"): {
-                'spring-adjacency-labels': Use(validate_adjacency_labels_list)
-            },
-            "bdr-address": str,
-            "dr-address": str,
-            "interface-name": str,
-            "neighbor-address": str,
-            Optional("neighbor-adjacency-time"): {
-                "#text": str
-            },
-            "neighbor-id": str,
-            "neighbor-priority": str,
-            Optional("neighbor-up-time"): {
-                "#text": str,
-                Optional("junos:seconds"): str,
-            },
-            "options": str,
-            "ospf-area": str,
-            "ospf-neighbor-state": str,
-            Optional("ospf-neighbor-topology"): {
-                "ospf-neighbor-topology-state": str,
-                "ospf-topology-id": str,
-                "ospf-topology-name": str
-            }
-        })
-        for item in value:
-            ospf_lsa_topology_ink_schema.validate(item)
-        return value
+    validate_adjacency_labels_list = list_of({
+        'label': str,
+        'flags': str,
+        'adj-sid-type': str
+    }, 'adjacency labels is not a list')
+
+    validate_ospf_neighbor_list = list_of({
+        "activity-timer": str,
+        Optional("adj-sid-list"): {
+            'spring-adjacency-labels': Use(validate_adjacency_labels_list)
+        },
+        "bdr-address": str,
+        "dr-address": str,
+        "interface-name": str,
+        "neighbor-address": str,
+        Optional("neighbor-adjacency-time"): {
+            "#text": str
+        },
+        "neighbor-id": str,
+        "neighbor-priority": str,
+        Optional("neighbor-up-time"): {
+            "#text": str,
+            Optional("junos:seconds"): str,
+        },
+        "options": str,
+        "ospf-area": str,
+        "ospf-neighbor-state": str,
+        Optional("ospf-neighbor-topology"): {
+            "ospf-neighbor-topology-state": str,
+            "ospf-topology-id": str,
+            "ospf-topology-name": str
+        }
+    }, 'ospf-neighbor is not a list')
 
     schema = {
         "ospf-neighbor-information": {
@@ -3590,45 +3504,39 @@ class ShowOspfInterfaceExtensiveSchema(MetaParser):
     """ Schema for:
             * show ospf interface extensive
     """
-    def validate_ospf_interface_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-interface is not a list')
-        neighbor_schema = Schema({
-            "address-mask": str,
-            "adj-count": str,
-            "authentication-type": str,
-            "bdr-id": str,
-            "dead-interval": str,
-            "dr-id": str,
-            "hello-interval": str,
-            "interface-address": str,
-            "interface-cost": str,
-            "interface-name": str,
-            "interface-type": str,
-            "mtu": str,
-            "neighbor-count": str,
-            "ospf-area": str,
-            "ospf-interface-protection-type": str,
-            "ospf-interface-state": str,
-            Optional("ospf-interface-tilfa-prot-fate"): str,
-            Optional("ospf-interface-tilfa-prot-link"): str,
-            Optional("ospf-interface-tilfa-prot-node"): str,
-            Optional("ospf-interface-tilfa-prot-srlg"): str,
-            Optional("passive"): str,
-            Optional("dr-address"): str,
-            Optional("router-priority"): str,
-            "ospf-interface-topology": {
-                "ospf-topology-id": str,
-                "ospf-topology-metric": str,
-                "ospf-topology-name": str,
-                Optional("ospf-topology-passive"): bool,
-            },
-            "ospf-stub-type": str,
-            "retransmit-interval": str
-        })
-        for item in value:
-            neighbor_schema.validate(item)
-        return value
+    validate_ospf_interface_list = list_of({
+        "address-mask": str,
+        "adj-count": str,
+        "authentication-type": str,
+        "bdr-id": str,
+        "dead-interval": str,
+        "dr-id": str,
+        "hello-interval": str,
+        "interface-address": str,
+        "interface-cost": str,
+        "interface-name": str,
+        "interface-type": str,
+        "mtu": str,
+        "neighbor-count": str,
+        "ospf-area": str,
+        "ospf-interface-protection-type": str,
+        "ospf-interface-state": str,
+        Optional("ospf-interface-tilfa-prot-fate"): str,
+        Optional("ospf-interface-tilfa-prot-link"): str,
+        Optional("ospf-interface-tilfa-prot-node"): str,
+        Optional("ospf-interface-tilfa-prot-srlg"): str,
+        Optional("passive"): str,
+        Optional("dr-address"): str,
+        Optional("router-priority"): str,
+        "ospf-interface-topology": {
+            "ospf-topology-id": str,
+            "ospf-topology-metric": str,
+            "ospf-topology-name": str,
+            Optional("ospf-topology-passive"): bool,
+        },
+        "ospf-stub-type": str,
+        "retransmit-interval": str
+    }, 'ospf-interface is not a list')
 
     schema = {
         "ospf-interface-information": {
@@ -3881,43 +3789,31 @@ class ShowOspfRouteBriefSchema(MetaParser):
         }
     }
     """
-    def validate_ospf_route_entry_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-route-entry is not a list')
-        ospf_route_schema = Schema({
-            "address-prefix": str,
-            "interface-cost": str,
-            "next-hop-type": str,
-            "ospf-next-hop": {
-                Optional("next-hop-address"): {
-                    "interface-address": str
-                },
-                "next-hop-name": {
-                    "interface-name": str
-                }
+    validate_ospf_route_entry_list = list_of({
+        "address-prefix": str,
+        "interface-cost": str,
+        "next-hop-type": str,
+        "ospf-next-hop": {
+            Optional("next-hop-address"): {
+                "interface-address": str
             },
-            "route-path-type": str,
-            "route-type": str,
-            Optional("ospf-backup-next-hop"): {
-                "ospf-backup-next-hop-type": str,
-                "ospf-backup-next-hop-address": str,
-                "ospf-backup-next-hop-interface": str
+            "next-hop-name": {
+                "interface-name": str
             }
-        })
-        for item in value:
-            ospf_route_schema.validate(item)
-        return value
-
-    def validate_ospf_route_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-route is not a list')
-        ospf_route_schema = Schema({
-            "ospf-route-entry":
-            Use(ShowOspfRouteBriefSchema.validate_ospf_route_entry_list)
-        })
-        for item in value:
-            ospf_route_schema.validate(item)
-        return value
+        },
+        "route-path-type": str,
+        "route-type": str,
+        Optional("ospf-backup-next-hop"): {
+            "ospf-backup-next-hop-type": str,
+            "ospf-backup-next-hop-address": str,
+            "ospf-backup-next-hop-interface": str
+        }
+    }, 'ospf-route-entry is not a list')
+
+    validate_ospf_route_list = list_of({
+        "ospf-route-entry":
+        Use(validate_ospf_route_entry_list)
+    }, 'ospf-route is not a list')
 
     schema = {
         "ospf-route-information": {
@@ -4074,18 +3970,12 @@ class ShowOspfDatabaseNetworkLsaidDetailSchema(MetaParser):
             }
         }
     } """
-    def validate_ospf_lsa_topology_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-lsa is not a list')
-        ospf_lsa_schema = Schema({
-            "link-type-name": str,
-            "ospf-lsa-topology-link-metric": str,
-            "ospf-lsa-topology-link-node-id": str,
-            "ospf-lsa-topology-link-state": str
-        })
-        for item in value:
-            ospf_lsa_schema.validate(item)
-        return value
+    validate_ospf_lsa_topology_list = list_of({
+        "link-type-name": str,
+        "ospf-lsa-topology-link-metric": str,
+        "ospf-lsa-topology-link-node-id": str,
+        "ospf-lsa-topology-link-state": str
+    }, 'ospf-lsa is not a list')
 
     schema = {
         Optional("@xmlns:junos"): str,
@@ -4314,32 +4204,26 @@ class ShowOspfRouteNetworkExtensiveSchema(MetaParser):
 }
     '''
 
-    def validate_ospf_route_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-route is not a list')
-        ospf_route_schema = Schema({
-            "ospf-route-entry": {
-                "address-prefix": str,
-                "interface-cost": str,
-                "next-hop-type": str,
-                "ospf-area": str,
-                "ospf-next-hop": {
-                    Optional("next-hop-address"): {
-                        Optional("interface-address"): str
-                    },
-                    "next-hop-name": {
-                        "interface-name": str
-                    }
+    validate_ospf_route_list = list_of({
+        "ospf-route-entry": {
+            "address-prefix": str,
+            "interface-cost": str,
+            "next-hop-type": str,
+            "ospf-area": str,
+            "ospf-next-hop": {
+                Optional("next-hop-address"): {
+                    Optional("interface-address"): str
                 },
-                "route-origin": str,
-                "route-path-type": str,
-                "route-priority": str,
-                "route-type": str
-            }
-        })
-        for item in value:
-            ospf_route_schema.validate(item)
-        return value
+                "next-hop-name": {
+                    "interface-name": str
+                }
+            },
+            "route-origin": str,
+            "route-path-type": str,
+            "route-priority": str,
+            "route-type": str
+        }
+    }, 'ospf-route is not a list')
 
     schema = {
         "ospf-route-information": {
@@ -4466,27 +4350,18 @@ class ShowOspfDatabaseOpaqueAreaSchema(MetaParser):
     }
     """
     
-    def validate_ospf_database_entry(ospf_db_list):
-        ''' Validates each entry in ospf-database '''
-        if not isinstance(ospf_db_list, list):
-            raise SchemaError('ospf-database is not a list')
-        
-        ospf_db_entry_schema = Schema({
-            Optional("@heading"): str,
-                "advertising-router": str,
-                "age": str,
-                "checksum": str,
-                "lsa-id": str,
-                "lsa-length": str,
-                "lsa-type": str,
-                "options": str,
-                Optional("our-entry"): bool,
-                "sequence-number": str
-        })
-
-        for entry in ospf_db_list:
-            ospf_db_entry_schema.validate(entry)    
-        return ospf_db_list
+    validate_ospf_database_entry = list_of({
+        Optional("@heading"): str,
+            "advertising-router": str,
+            "age": str,
+            "checksum": str,
+            "lsa-id": str,
+            "lsa-length": str,
+            "lsa-type": str,
+            "options": str,
+            Optional("our-entry"): bool,
+            "sequence-number": str
+    }, 'ospf-database is not a list')
 
     schema = {
         "ospf-database-information": {
@@ -11,9 +11,10 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
-from pyats.utils.exceptions import SchemaError
-from genie.metaparser.util.schemaengine import (Any, Optional, Use,
-                                                Schema)
+from genie.metaparser.util.schemaengine import (Any, Optional, Use)
+
+# Parser utils
+from genie.libs.parser.utils.validators import list_of
 
 
 class ShowPfeStatisticsTrafficSchema(MetaParser):
@@ -841,14 +842,9 @@ class ShowPfeRouteSummarySchema(MetaParser):
     """ Schema for:
             * show pfe route summary
     """
-    def validate_route_table_data(value):
-        if not isinstance(value, list):
-            raise SchemaError('validate_route_table_data is not a list')
-        entry_schema = Schema({'index': str, 'routes': str, 'size': str})
-        # Validate each dictionary in list
-        for item in value:
-            entry_schema.validate(item)
-        return value
+    validate_route_table_data = list_of(
+        {'index': str, 'routes': str, 'size': str},
+        'validate_route_table_data is not a list')
 
     schema = {
         'slot': {
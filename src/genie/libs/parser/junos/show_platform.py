@@ -11,9 +11,12 @@ import re
 
 # Genie
 from genie.metaparser import MetaParser
-from genie.metaparser.util.schemaengine import Schema, Any, \
+from genie.metaparser.util.schemaengine import Any, \
                     Optional, Use
 
+# Parser utils
+from genie.libs.parser.utils.validators import list_of
+
 
 # ===========================
 # Schema for:
@@ -137,19 +140,10 @@ class ShowVersionSchema(MetaParser):
             }
     """
 
-    def validate_package_info_list(value):
-        if not isinstance(value, list):
-            raise Exception('package infomation is not a list')
-        package_info_schema = Schema(
-            {
-                "comment": str,
-                "name": str,
-            }
-        )
-
-        for item in value:
-            package_info_schema.validate(item)
-        return value
+    validate_package_info_list = list_of({
+        "comment": str,
+        "name": str,
+    }, 'package infomation is not a list', error=Exception)
 
     # main schema
     schema = {
@@ -257,30 +251,21 @@ class ShowVersion(ShowVersionSchema):
 # ===================================
 class FileListDetailSchema(MetaParser):
 
-    def validate_file_information_list(value):
-        # Pass file-information of dict in value
-        if not isinstance(value, list):
-            raise Exception('file-information is not a list')
-        # Create protocols Schema
-        file_information_schema = Schema({
-            "file-date": {
-                Optional("#text"): str,
-                Optional("@junos:format"): str
-            },
-            "file-group": str,
-            "file-links": str,
-            "file-name": str,
-            "file-owner": str,
-            "file-permissions": {
-                Optional("#text"): str,
-                Optional("@junos:format"): str
-            },
-            "file-size": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            file_information_schema.validate(item)
-        return value
+    validate_file_information_list = list_of({
+        "file-date": {
+            Optional("#text"): str,
+            Optional("@junos:format"): str
+        },
+        "file-group": str,
+        "file-links": str,
+        "file-name": str,
+        "file-owner": str,
+        "file-permissions": {
+            Optional("#text"): str,
+            Optional("@junos:format"): str
+        },
+        "file-size": str
+    }, 'file-information is not a list', error=Exception)
 
     schema = {
         Optional("@xmlns:junos"): str,
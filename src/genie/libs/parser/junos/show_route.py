@@ -27,8 +27,15 @@ import re
 
 # Metaparser
 from genie.metaparser import MetaParser
-from pyats.utils.exceptions import SchemaError
-from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema
+from genie.metaparser.util.schemaengine import Any, Optional, Use
+
+# Parser utils
+from genie.libs.parser.utils.compact import CompactParser
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.records import Position, build_output
+from genie.libs.parser.utils.stream import StreamParser, iter_lines
+from genie.libs.parser.utils.validators import list_of
+
 '''
 Schema for:
     * show route table {table}
@@ -243,82 +250,52 @@ class ShowRouteSchema(MetaParser):
             }
         }
     """
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        
-        def validate_rt_list(value):
-            # Pass rt list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('rt list is not a list')
-            
-            def validate_nh_list(value):
-                # Pass nh list of dict in value
-                if not isinstance(value, list):
-                    raise SchemaError('nh list is not a list')
-                # Create nh-list Entry Schema
-                nh_schema = Schema({
-                            Optional("mpls-label"): str,
-                            Optional("selected-next-hop"): str,
-                            Optional("nh-local-interface"): str,
-                            Optional("nh-table"): str,
-                            Optional("to"): str,
-                            Optional("via"): str
-                        })
-                # Validate each dictionary in list
-                for item in value:
-                    nh_schema.validate(item)
-                return value
-
-            # Create rt-list Entry Schema
-            rt_schema = Schema({
-                    Optional("@junos:style"): str,
-                    Optional("rt-destination"): str,
-                    "rt-entry": {
-                        Optional("active-tag"): str,
-                        "age": {
-                            "#text": str,
-                            Optional("@junos:seconds"): str
-                        },
-                        Optional('as-path'): str,
-                        Optional("current-active"): str,
-                        Optional("last-active"): str,
-                        Optional("learned-from"): str,
-                        Optional("local-preference"): str,
-                        Optional("peer-id"): str,
-                        Optional("med"): str,
-                        Optional("metric"): str,
-                        Optional("metric2"): str,
-                        Optional("nh"): Use(validate_nh_list),
-                        Optional('nh-type'): str,
-                        "preference": str,
-                        Optional("preference2"): str,
-                        "protocol-name": str,
-                        Optional('rt-tag'): str,
-                        Optional("validation-state"): str
-                    }
-                })
-            # Validate each dictionary in list
-            for item in value:
-                rt_schema.validate(item)
-            return value
-
-
-        # Create RouteEntry Schema
-        route_entry_schema = Schema({
-                "active-route-count": str,
-                "destination-count": str,
-                "hidden-route-count": str,
-                "holddown-route-count": str,
-                Optional("rt"): Use(validate_rt_list),
-                "table-name": str,
-                "total-route-count": str
-            })
-        # Validate each dictionary in list
-        for item in value:
-            route_entry_schema.validate(item)
-        return value
+    validate_nh_list = list_of({
+        Optional("mpls-label"): str,
+        Optional("selected-next-hop"): str,
+        Optional("nh-local-interface"): str,
+        Optional("nh-table"): str,
+        Optional("to"): str,
+        Optional("via"): str
+    }, 'nh list is not a list')
+
+    validate_rt_list = list_of({
+        Optional("@junos:style"): str,
+        Optional("rt-destination"): str,
+        "rt-entry": {
+            Optional("active-tag"): str,
+            "age": {
+                "#text": str,
+                Optional("@junos:seconds"): str
+            },
+            Optional('as-path'): str,
+            Optional("current-active"): str,
+            Optional("last-active"): str,
+            Optional("learned-from"): str,
+            Optional("local-preference"): str,
+            Optional("peer-id"): str,
+            Optional("med"): str,
+            Optional("metric"): str,
+            Optional("metric2"): str,
+            Optional("nh"): Use(validate_nh_list),
+            Optional('nh-type'): str,
+            "preference": str,
+            Optional("preference2"): str,
+            "protocol-name": str,
+            Optional('rt-tag'): str,
+            Optional("validation-state"): str
+        }
+    }, 'rt list is not a list')
+
+    validate_route_table_list = list_of({
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        Optional("rt"): Use(validate_rt_list),
+        "table-name": str,
+        "total-route-count": str
+    }, 'route-table is not a list')
 
     # Main Schema
     schema = {
@@ -329,7 +306,7 @@ class ShowRouteSchema(MetaParser):
         }
     }
 
-class ShowRoute(ShowRouteSchema):
+class ShowRoute(CompactParser, StreamParser, ShowRouteSchema):
     """ Parser for:
             * show route
             * show route {ip_address}
@@ -344,7 +321,56 @@ class ShowRoute(ShowRouteSchema):
                     'show route protocol {protocol} {ip_address}',
                     'show route protocol {protocol} table {table}']
 
+    patterns = Patterns(
+        guards=True,
+        # inet.0: 932 destinations, 1618 routes (932 active, 0 holddown, 0 hidden)
+        p1=r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
+           r'destinations, +(?P<total_route_count>\d+) +routes +'
+           r'\((?P<active_route_count>\d+) +active, +(?P<holddown>\d+) +'
+           r'holddown, +(?P<hidden>\d+) +hidden\)$',
+        # 10.220.0.0/16      *[BGP/170] 3w3d 03:12:24, MED 12003, localpref 120, from 10.169.14.240
+        # 10.169.14.240/32  *[Static/5] 5w2d 15:42:25
+        # *[OSPF3/10] 3w1d 17:03:23, metric 5
+        # 0.0.0.0/0          *[OSPF/150/10] 3w3d 03:24:58, metric 101, tag 0
+        # 167963             *[LDP/9] 1w6d 20:41:01, metric 1, metric2 100, tag 65000500
+        # 10.16.2.2/32         *[Static/5] 00:00:02
+        p2=r'^((?P<rt_destination>\S+) +)?(?P<active_tag>[\*\+\-])?'
+           r'\[(?P<protocol>[\w\-]+)\/(?P<preference>\d+)'
+           r'(\/(?P<preference2>\d+))?\] +(?P<text>\S+( +\S+)?)'
+           r'(, +metric +(?P<metric>\d+))?(, +metric2 +(?P<metric2>\d+))?'
+           r'(, +tag +(?P<rt_tag>\d+))?(, +MED +(?P<med>\w+))?'
+           r'(, +localpref +(?P<local_preference>\d+))?'
+           r'(, +from +(?P<learned_from>\S+))?$',
+        # MultiRecv
+        p2_1=r'^(?P<nh_type>MultiRecv)$',
+        # >  to 10.169.14.121 via ge-0/0/1.0
+        p3=r'^(\> +)?(to +(?P<to>\S+) +)?via +(?P<via>\S+)'
+           r'(, +(?P<mpls_label>[\S\s]+))?$',
+        # Local via fxp0.0
+        p3_1=r'^Local +via +(?P<nh_local_interface>\S+)$',
+        # AS path: (65151 65000) I, validation-state: unverified
+        # AS path: I
+        # AS path: 3 4 I, validation-state: unverified
+        p4=r'AS +path:(?P<as_path>([()\d\s]+ )?\w)'
+           r'(, validation-state: +(?P<validation_state>\S+))?$',
+        # to table inet.0
+        p5=r'^to +table +(?P<nh_table>\S+)$',
+        # 2001:db8:eb18:ca45::1/128
+        pIP=r'^(?P<rt_destination>[\w:\/]+)$')
+
     def cli(self, protocol=None, ip_address=None, table=None, output=None):
+        return build_output(self.iter_records(protocol=protocol,
+                                              ip_address=ip_address,
+                                              table=table, output=output))
+
+    def iter_records(self, protocol=None, ip_address=None, table=None,
+                     output=None):
+        """ Yield the route tables and the routes one at a time, see
+            utils.records
+
+            Each route is yielded once its next hops are read, after the
+            record of its table.
+        """
         if not output:
             if protocol and table:
                 cmd = self.cli_command[4].format(
@@ -371,58 +397,23 @@ class ShowRoute(ShowRouteSchema):
         else:
             out = output
 
-        ret_dict = {}
+        # route being read, yielded once complete
+        record = None
+        table_path = None
         rt_destination = None
 
+        # compiled once for all the instances, see Patterns
+        patterns = self.patterns
 
-        # inet.0: 932 destinations, 1618 routes (932 active, 0 holddown, 0 hidden)
-        p1 = re.compile(r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
-                r'destinations, +(?P<total_route_count>\d+) +routes +'
-                r'\((?P<active_route_count>\d+) +active, +(?P<holddown>\d+) +'
-                r'holddown, +(?P<hidden>\d+) +hidden\)$')
-        
-        # 10.220.0.0/16      *[BGP/170] 3w3d 03:12:24, MED 12003, localpref 120, from 10.169.14.240
-        # 10.169.14.240/32  *[Static/5] 5w2d 15:42:25
-        # *[OSPF3/10] 3w1d 17:03:23, metric 5
-        # 0.0.0.0/0          *[OSPF/150/10] 3w3d 03:24:58, metric 101, tag 0
-        # 167963             *[LDP/9] 1w6d 20:41:01, metric 1, metric2 100, tag 65000500
-        # 10.16.2.2/32         *[Static/5] 00:00:02
-        p2 = re.compile(r'^((?P<rt_destination>\S+) +)?(?P<active_tag>[\*\+\-])?'
-                        r'\[(?P<protocol>[\w\-]+)\/(?P<preference>\d+)'
-                        r'(\/(?P<preference2>\d+))?\] +(?P<text>\S+( +\S+)?)'
-                        r'(, +metric +(?P<metric>\d+))?(, +metric2 +(?P<metric2>\d+))?'
-                        r'(, +tag +(?P<rt_tag>\d+))?(, +MED +(?P<med>\w+))?'
-                        r'(, +localpref +(?P<local_preference>\d+))?'
-                        r'(, +from +(?P<learned_from>\S+))?$')
-
-        # MultiRecv
-        p2_1 = re.compile(r'^(?P<nh_type>MultiRecv)$')
-        
-        # >  to 10.169.14.121 via ge-0/0/1.0
-        p3 = re.compile(r'^(\> +)?(to +(?P<to>\S+) +)?via +(?P<via>\S+)'
-                        r'(, +(?P<mpls_label>[\S\s]+))?$')
-        
-        # Local via fxp0.0
-        p3_1 = re.compile(r'^Local +via +(?P<nh_local_interface>\S+)$')
-
-        # AS path: (65151 65000) I, validation-state: unverified
-        # AS path: I
-        # AS path: 3 4 I, validation-state: unverified
-        p4 = re.compile(r'AS +path:(?P<as_path>([()\d\s]+ )?\w)'
-                        r'(, validation-state: +(?P<validation_state>\S+))?$')
-        
-        # to table inet.0
-        p5 = re.compile(r'^to +table +(?P<nh_table>\S+)$')
-
-        # 2001:db8:eb18:ca45::1/128
-        pIP = re.compile(r'^(?P<rt_destination>[\w:\/]+)$')
-
-        for line in out.splitlines():
+        for line in iter_lines(out):
             line = line.strip()
 
             # inet.0: 932 destinations, 1618 routes (932 active, 0 holddown, 0 hidden)
-            m = p1.match(line)
+            m = patterns.p1.match(line)
             if m:
+                if record:
+                    yield record
+                    record = None
                 group = m.groupdict()
                 table_name = group['table_name']
                 destination_count = group['destination_count']
@@ -430,8 +421,10 @@ class ShowRoute(ShowRouteSchema):
                 active_route_count = group['active_route_count']
                 holddown = group['holddown']
                 hidden = group['hidden']
-                route_information_dict = ret_dict.setdefault('route-information', {})
-                route_table_list = route_information_dict.setdefault('route-table', [])
+                table_index = 0 if table_path is None else table_path[-1] + 1
+                table_path = ('route-information', 'route-table',
+                              Position(table_index))
+                rt_count = 0
                 route_table_dict = {}
                 route_table_dict.update({'active-route-count': active_route_count})
                 route_table_dict.update({'destination-count': destination_count})
@@ -439,13 +432,15 @@ class ShowRoute(ShowRouteSchema):
                 route_table_dict.update({'holddown-route-count': holddown})
                 route_table_dict.update({'table-name': table_name})
                 route_table_dict.update({'total-route-count': total_route_count})
-                route_table_list.append(route_table_dict)
+                yield (table_path, route_table_dict)
                 continue
             
             # 10.169.14.240/32  *[Static/5] 5w2d 15:42:25
             # *[OSPF3/10] 3w1d 17:03:23, metric 5
-            m = p2.match(line) 
-            if m:
+            m = patterns.p2.match(line) 
+            if m and table_path:
+                if record:
+                    yield record
                 group = m.groupdict()
                 if not rt_destination:
                     rt_destination = group['rt_destination']
@@ -460,9 +455,9 @@ class ShowRoute(ShowRouteSchema):
                 learned_from = group['learned_from']
                 local_preference = group['local_preference']
                 med = group['med']
-                rt_list = route_table_dict.setdefault('rt', [])
                 rt_dict = {}
-                rt_list.append(rt_dict)
+                record = (table_path + ('rt', Position(rt_count)), rt_dict)
+                rt_count += 1
                 rt_entry_dict = {}
                 if active_tag:
                     rt_entry_dict.update({'active-tag': active_tag})
@@ -490,14 +485,14 @@ class ShowRoute(ShowRouteSchema):
                 rt_destination = None
                 continue
             
-            m = p2_1.match(line)
+            m = patterns.p2_1.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({'nh-type': group['nh_type']})
                 continue
 
             # >  to 10.169.14.121 via ge-0/0/1.0
-            m = p3.match(line)
+            m = patterns.p3.match(line)
             if m:
                 group = m.groupdict()
                 nh_list = rt_entry_dict.setdefault('nh', [])
@@ -507,7 +502,7 @@ class ShowRoute(ShowRouteSchema):
                 continue
 
             # Local via fxp0.0
-            m = p3_1.match(line)
+            m = patterns.p3_1.match(line)
             if m:
                 group = m.groupdict()
                 nh_list = rt_entry_dict.setdefault('nh', [])
@@ -518,14 +513,14 @@ class ShowRoute(ShowRouteSchema):
             
             # AS path: (65151 65000) I, validation-state: unverified
             # AS path: I
-            m = p4.match(line)
+            m = patterns.p4.match(line)
             if m:
                 group = m.groupdict()
                 rt_entry_dict.update({k.replace('_', '-'):v for k, v in group.items() if v is not None})
                 continue
             
             # to table inet.0
-            m = p5.match(line)
+            m = patterns.p5.match(line)
             if m:
                 group = m.groupdict()
                 nh_list = rt_entry_dict.setdefault('nh', [])
@@ -535,12 +530,14 @@ class ShowRoute(ShowRouteSchema):
                 continue
 
             # 2001:db8:eb18:ca45::1/128
-            m = pIP.match(line)
+            m = patterns.pIP.match(line)
             if m:
                 group = m.groupdict()
                 rt_destination = group['rt_destination']
                 continue
-        return ret_dict
+
+        if record:
+            yield record
 
 class ShowRouteProtocolNoMore(ShowRoute):
     """ Parser for:
@@ -548,6 +545,11 @@ class ShowRouteProtocolNoMore(ShowRoute):
     """
     cli_command = 'show route protocol {protocol} {ip_address} | no-more'
     def cli(self, protocol, ip_address, output=None):
+        return build_output(self.iter_records(protocol=protocol,
+                                              ip_address=ip_address,
+                                              output=output))
+
+    def iter_records(self, protocol, ip_address, output=None):
         if not output:
             cmd = self.cli_command.format(
                     protocol=protocol,
@@ -556,7 +558,7 @@ class ShowRouteProtocolNoMore(ShowRoute):
         else:
             out = output
         
-        return super().cli(protocol=protocol,
+        return super().iter_records(protocol=protocol,
             ip_address=ip_address, output=out)
 
 class ShowRouteProtocolExtensiveSchema(MetaParser):
@@ -654,181 +656,128 @@ class ShowRouteProtocolExtensiveSchema(MetaParser):
             }
         }
     """
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        
-        def validate_rt_list(value):
-            # Pass rt list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('rt is not a list')
-            def validate_rt_entry_list(value):
-                if isinstance(value, dict):
-                    value = [value]
-                if not isinstance(value, list):
-                    raise SchemaError('rt-entry is not a list')
-                def validate_nh_list(value):
-                    # Pass nh list of dict in value
-                    if not isinstance(value, list):
-                        raise SchemaError('nh is not a list')
-                    nh_schema = Schema({
-                        Optional("@junos:indent"): str,
-                        Optional("label-element"): str,
-                        Optional("label-element-childcount"): str,
-                        Optional("label-element-lspid"): str,
-                        Optional("label-element-parent"): str,
-                        Optional("label-element-refcount"): str,
-                        Optional("label-ttl-action"): str,
-                        Optional("load-balance-label"): str,
-                        Optional("mpls-label"): str,
-                        Optional("nh-string"): str,
-                        Optional("selected-next-hop"): str,
-                        Optional("session"): str,
-                        Optional("to"): str,
-                        Optional("via"): str,
-                        Optional("weight"): str
-                    })
-                    # Validate each dictionary in list
-                    for item in value:
-                        nh_schema.validate(item)
-                    return value
-                def validate_protocol_nh_list(value):
-                    # Pass nh list of dict in value
-                    if isinstance(value, dict):
-                        value = [value]
-                    if not isinstance(value, list):
-                        raise SchemaError('protocol-nh is not a list')
-                    def validate_nh_list(value):
-                        # Pass nh list of dict in value
-                        if isinstance(value, dict):
-                            value = [value]
-                        if not isinstance(value, list):
-                            raise SchemaError('nh is not a list')
-                        nh_schema = Schema({
-                            Optional("@junos:indent"): str,
-                            Optional("label-element"): str,
-                            Optional("label-element-childcount"): str,
-                            Optional("label-element-lspid"): str,
-                            Optional("label-element-parent"): str,
-                            Optional("label-element-refcount"): str,
-                            Optional("label-ttl-action"): str,
-                            Optional("load-balance-label"): str,
-                            Optional("mpls-label"): str,
-                            Optional("nh-string"): str,
-                            Optional("selected-next-hop"): str,
-                            Optional("session"): str,
-                            Optional("to"): str,
-                            Optional("via"): str,
-                            Optional("weight"): str
-                        })
-                        # Validate each dictionary in list
-                        for item in value:
-                            nh_schema.validate(item)
-                        return value
-                    protocol_nh_schema = Schema({
-                        Optional("@junos:indent"): str,
-                        Optional("forwarding-nh-count"): str,
-                        "indirect-nh": str,
-                        Optional("label-ttl-action"): str,
-                        Optional("load-balance-label"): str,
-                        Optional("metric"): str,
-                        Optional("mpls-label"): str,
-                        Optional("nh"): Use(validate_nh_list),
-                        Optional("nh-index"): str,
-                        Optional("nh-type"): str,
-                        Optional("output"): str,
-                        "to": str
-                    })
-                    # Validate each dictionary in list
-                    for item in value:
-                        protocol_nh_schema.validate(item)
-                    return value
-                rt_entry_schema = Schema({
-                    Optional("accepted"): str,
-                    Optional("active-tag"): str,
-                    Optional("age"): {
-                        "#text": str,
-                        Optional("@junos:seconds"): str
-                    },
-                    Optional("announce-bits"): str,
-                    Optional("announce-tasks"): str,
-                    Optional("as-path"): str,
-                    Optional("cluster-list"): str,
-                    Optional("bgp-rt-flag"): str,
-                    Optional("bgp-path-attributes"): {
-                        "attr-as-path-effective": {
-                            "aspath-effective-string": str,
-                            "attr-value": str
-                        }
-                    },
-                    Optional("current-active"): str,
-                    Optional("inactive-reason"): str,
-                    Optional("last-active"): str,
-                    Optional("local-as"): str,
-                    Optional("local-preference"): str,
-                    Optional("peer-as"): str,
-                    Optional("metric"): str,
-                    Optional("metric2"): str,
-                    Optional("nh"): Use(validate_nh_list),
-                    Optional("nh-address"): str,
-                    Optional("nh-index"): str,
-                    Optional("nh-kernel-id"): str,
-                    Optional("nh-reference-count"): str,
-                    Optional("gateway"): str,
-                    Optional("nh-type"): str,
-                    Optional("preference"): str,
-                    Optional("preference2"): str,
-                    Optional("protocol-name"): str,
-                    Optional("protocol-nh"): Use(validate_protocol_nh_list),
-                    Optional("rt-entry-state"): str,
-                    Optional("rt-ospf-area"): str,
-                    Optional("rt-tag"): str,
-                    Optional("peer-id"): str,
-                    Optional("task-name"): str,
-                    Optional("validation-state"): str
-                })
-                # Validate each dictionary in list
-                for item in value:
-                    rt_entry_schema.validate(item)
-                return value
-
-            # Create rt Schema
-            rt_schema = Schema({
-                Optional("@junos:style"): str,
-                "rt-announced-count": str,
-                "rt-destination": str,
-                Optional("rt-entry"): Use(validate_rt_entry_list),
-                "rt-entry-count": {
-                    "#text": str,
-                    Optional("@junos:format"): str
-                },
-                Optional("rt-prefix-length"): str,
-                Optional("rt-state"): str,
-                Optional("tsi"): {
-                    "#text": str,
-                    Optional("@junos:indent"): str
-                }
-            })
-            # Validate each dictionary in list
-            for item in value:
-                rt_schema.validate(item)
-            return value
-
-        # Create Route Table Schema
-        route_table_schema = Schema({
-            "active-route-count": str,
-            "destination-count": str,
-            "hidden-route-count": str,
-            "holddown-route-count": str,
-            Optional("rt"): Use(validate_rt_list),
-            "table-name": str,
-            "total-route-count": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            route_table_schema.validate(item)
-        return value
+    validate_nh_list = list_of({
+        Optional("@junos:indent"): str,
+        Optional("label-element"): str,
+        Optional("label-element-childcount"): str,
+        Optional("label-element-lspid"): str,
+        Optional("label-element-parent"): str,
+        Optional("label-element-refcount"): str,
+        Optional("label-ttl-action"): str,
+        Optional("load-balance-label"): str,
+        Optional("mpls-label"): str,
+        Optional("nh-string"): str,
+        Optional("selected-next-hop"): str,
+        Optional("session"): str,
+        Optional("to"): str,
+        Optional("via"): str,
+        Optional("weight"): str
+    }, 'nh is not a list')
+
+    validate_protocol_nh_nh_list = list_of({
+        Optional("@junos:indent"): str,
+        Optional("label-element"): str,
+        Optional("label-element-childcount"): str,
+        Optional("label-element-lspid"): str,
+        Optional("label-element-parent"): str,
+        Optional("label-element-refcount"): str,
+        Optional("label-ttl-action"): str,
+        Optional("load-balance-label"): str,
+        Optional("mpls-label"): str,
+        Optional("nh-string"): str,
+        Optional("selected-next-hop"): str,
+        Optional("session"): str,
+        Optional("to"): str,
+        Optional("via"): str,
+        Optional("weight"): str
+    }, 'nh is not a list', single=True)
+
+    validate_protocol_nh_list = list_of({
+        Optional("@junos:indent"): str,
+        Optional("forwarding-nh-count"): str,
+        "indirect-nh": str,
+        Optional("label-ttl-action"): str,
+        Optional("load-balance-label"): str,
+        Optional("metric"): str,
+        Optional("mpls-label"): str,
+        Optional("nh"): Use(validate_protocol_nh_nh_list),
+        Optional("nh-index"): str,
+        Optional("nh-type"): str,
+        Optional("output"): str,
+        "to": str
+    }, 'protocol-nh is not a list', single=True)
+
+    validate_rt_entry_list = list_of({
+        Optional("accepted"): str,
+        Optional("active-tag"): str,
+        Optional("age"): {
+            "#text": str,
+            Optional("@junos:seconds"): str
+        },
+        Optional("announce-bits"): str,
+        Optional("announce-tasks"): str,
+        Optional("as-path"): str,
+        Optional("cluster-list"): str,
+        Optional("bgp-rt-flag"): str,
+        Optional("bgp-path-attributes"): {
+            "attr-as-path-effective": {
+                "aspath-effective-string": str,
+                "attr-value": str
+            }
+        },
+        Optional("current-active"): str,
+        Optional("inactive-reason"): str,
+        Optional("last-active"): str,
+        Optional("local-as"): str,
+        Optional("local-preference"): str,
+        Optional("peer-as"): str,
+        Optional("metric"): str,
+        Optional("metric2"): str,
+        Optional("nh"): Use(validate_nh_list),
+        Optional("nh-address"): str,
+        Optional("nh-index"): str,
+        Optional("nh-kernel-id"): str,
+        Optional("nh-reference-count"): str,
+        Optional("gateway"): str,
+        Optional("nh-type"): str,
+        Optional("preference"): str,
+        Optional("preference2"): str,
+        Optional("protocol-name"): str,
+        Optional("protocol-nh"): Use(validate_protocol_nh_list),
+        Optional("rt-entry-state"): str,
+        Optional("rt-ospf-area"): str,
+        Optional("rt-tag"): str,
+        Optional("peer-id"): str,
+        Optional("task-name"): str,
+        Optional("validation-state"): str
+    }, 'rt-entry is not a list', single=True)
+
+    validate_rt_list = list_of({
+        Optional("@junos:style"): str,
+        "rt-announced-count": str,
+        "rt-destination": str,
+        Optional("rt-entry"): Use(validate_rt_entry_list),
+        "rt-entry-count": {
+            "#text": str,
+            Optional("@junos:format"): str
+        },
+        Optional("rt-prefix-length"): str,
+        Optional("rt-state"): str,
+        Optional("tsi"): {
+            "#text": str,
+            Optional("@junos:indent"): str
+        }
+    }, 'rt is not a list')
+
+    validate_route_table_list = list_of({
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        Optional("rt"): Use(validate_rt_list),
+        "table-name": str,
+        "total-route-count": str
+    }, 'route-table is not a list')
 
     # Main Schema
     schema = {
@@ -839,7 +788,7 @@ class ShowRouteProtocolExtensiveSchema(MetaParser):
         }
     }
 
-class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
+class ShowRouteProtocolExtensive(StreamParser, ShowRouteProtocolExtensiveSchema):
     """ Parser for:
             * show route protocol {protocol} extensive
             * show route protocol {protocol} table {table} extensive
@@ -1050,7 +999,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
         # Router ID: 10.16.2.2
         p37 = re.compile(r'^Router +ID: +(?P<peer_id>\S+)$')
 
-        for line in out.splitlines():
+        for line in iter_lines(out):
             line = line.strip()
             # inet.0: 929 destinations, 1615 routes (929 active, 0 holddown, 0 hidden)
             m = p1.match(line)
@@ -1530,34 +1479,17 @@ class ShowRouteForwardingTableSummarySchema(MetaParser):
     #     }
     # }
 
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        def validate_route_table_summary_list(value):
-            # Pass route-table-summary list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('route-table-summary is not a list')
-            # Create route-table-summary Schema
-            route_table_summary_schema = Schema({
-                "route-count": str,
-                "route-table-type": str
-            })
-            # Validate each dictionary in list
-            for item in value:
-                route_table_summary_schema.validate(item)
-            return value
-        # Create route-table-summary Schema
-        route_table_schema = Schema({
-            "address-family": str,
-            Optional("enabled-protocols"): str,
-            "route-table-summary": Use(validate_route_table_summary_list),
-            "table-name": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            route_table_schema.validate(item)
-        return value
+    validate_route_table_summary_list = list_of({
+        "route-count": str,
+        "route-table-type": str
+    }, 'route-table-summary is not a list')
+
+    validate_route_table_list = list_of({
+        "address-family": str,
+        Optional("enabled-protocols"): str,
+        "route-table-summary": Use(validate_route_table_summary_list),
+        "table-name": str
+    }, 'route-table is not a list')
     
     schema = {
         Optional("@xmlns:junos"): str,
@@ -1671,49 +1603,30 @@ class ShowRouteReceiveProtocolSchema(MetaParser):
         }
     """
 
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        
-        def validate_rt_list(value):
-            # Pass rt list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('rt is not a list')
-            # Create rt entry Schema
-            rt_entry_schema = Schema({
-                Optional("@junos:style"): str,
-                "rt-destination": str,
-                "rt-entry": {
-                    Optional("active-tag"): str,
-                    "as-path": str,
-                    Optional("local-preference"): str,
-                    Optional("med"): str,
-                    "nh": {
-                        "to": str
-                    },
-                    "protocol-name": str
-                }
-            })
-            # Validate each dictionary in list
-            for item in value:
-                rt_entry_schema.validate(item)
-            return value
-
-        # Create route-table entry Schema
-        route_table_schema = Schema({
-            "active-route-count": str,
-            "destination-count": str,
-            "hidden-route-count": str,
-            "holddown-route-count": str,
-            Optional("rt"): Use(validate_rt_list),
-            "table-name": str,
-            "total-route-count": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            route_table_schema.validate(item)
-        return value
+    validate_rt_list = list_of({
+        Optional("@junos:style"): str,
+        "rt-destination": str,
+        "rt-entry": {
+            Optional("active-tag"): str,
+            "as-path": str,
+            Optional("local-preference"): str,
+            Optional("med"): str,
+            "nh": {
+                "to": str
+            },
+            "protocol-name": str
+        }
+    }, 'rt is not a list')
+
+    validate_route_table_list = list_of({
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        Optional("rt"): Use(validate_rt_list),
+        "table-name": str,
+        "total-route-count": str
+    }, 'route-table is not a list')
     
     # Main Schema
     schema = {
@@ -1869,30 +1782,21 @@ class ShowRouteAdvertisingProtocolSchema(MetaParser):
         }
     """
 
-    def validate_rt_list(value):
-        # Pass rt list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('rt is not a list')
-        # Create rt entry Schema
-        entry_schema = Schema({
-            Optional("@junos:style"): str,
-            "rt-destination": str,
-            "rt-entry": {
-                Optional("active-tag"): str,
-                "as-path": str,
-                "bgp-metric-flags": str,
-                Optional("local-preference"): str,
-                Optional("med"): str,
-                "nh": {
-                    "to": str
-                },
-                "protocol-name": str
-            }
-        })
-        # Validate each dictionary in list
-        for item in value:
-            entry_schema.validate(item)
-        return value
+    validate_rt_list = list_of({
+        Optional("@junos:style"): str,
+        "rt-destination": str,
+        "rt-entry": {
+            Optional("active-tag"): str,
+            "as-path": str,
+            "bgp-metric-flags": str,
+            Optional("local-preference"): str,
+            Optional("med"): str,
+            "nh": {
+                "to": str
+            },
+            "protocol-name": str
+        }
+    }, 'rt is not a list')
     
     # Main schema
     schema = {
@@ -2054,38 +1958,21 @@ class ShowRouteSummarySchema(MetaParser):
     #     }
     # }
 
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        def validate_protocols_list(value):
-            # Pass protocols list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('protocols is not a list')
-            # Create protocols Schema
-            protocols_schema = Schema({
-                "active-route-count": str,
-                "protocol-name": str,
-                "protocol-route-count": str
-            })
-            # Validate each dictionary in list
-            for item in value:
-                protocols_schema.validate(item)
-            return value
-        # Create route-table Schema
-        route_table_schema = Schema({
-            "active-route-count": str,
-            "destination-count": str,
-            "hidden-route-count": str,
-            "holddown-route-count": str,
-            "protocols": Use(validate_protocols_list),
-            "table-name": str,
-            "total-route-count": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            route_table_schema.validate(item)
-        return value
+    validate_protocols_list = list_of({
+        "active-route-count": str,
+        "protocol-name": str,
+        "protocol-route-count": str
+    }, 'protocols is not a list')
+
+    validate_route_table_list = list_of({
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        "protocols": Use(validate_protocols_list),
+        "table-name": str,
+        "total-route-count": str
+    }, 'route-table is not a list')
 
     # Main Schema
     schema = {
@@ -2203,45 +2090,26 @@ class ShowRouteInstanceDetailSchema(MetaParser):
     #     }
     # }
 
-    def validate_instance_core_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('instance-core is not a list')
-        def validate_instance_rib_list(value):
-            if not isinstance(value, list):
-                raise SchemaError('instance-rib is not a list')
-            instance_rib_schema = Schema({
-                        "irib-active-count": str,
-                        "irib-hidden-count": str,
-                        "irib-holddown-count": str,
-                        "irib-name": str,
-                        "irib-route-count": str
-                    })
-            # Validate each dictionary in list
-            for item in value:
-                instance_rib_schema.validate(item)
-            return value
-        def validate_interface_name_list(value):
-            if not isinstance(value, list):
-                raise SchemaError('interface-name is not a list')
-            instance_rib_schema = Schema({
-                    "interface-name": str
-                })
-            # Validate each dictionary in list
-            for item in value:
-                instance_rib_schema.validate(item)
-            return value
-        instance_core_schema = Schema({
-            Optional("instance-interface"): Use(validate_interface_name_list),
-            "instance-name": str,
-            Optional("instance-rib"): Use(validate_instance_rib_list),
-            Optional("instance-state"): str,
-            Optional("instance-type"): str,
-            Optional("router-id"): str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            instance_core_schema.validate(item)
-        return value
+    validate_instance_rib_list = list_of({
+        "irib-active-count": str,
+        "irib-hidden-count": str,
+        "irib-holddown-count": str,
+        "irib-name": str,
+        "irib-route-count": str
+    }, 'instance-rib is not a list')
+
+    validate_interface_name_list = list_of({
+        "interface-name": str
+    }, 'interface-name is not a list')
+
+    validate_instance_core_list = list_of({
+        Optional("instance-interface"): Use(validate_interface_name_list),
+        "instance-name": str,
+        Optional("instance-rib"): Use(validate_instance_rib_list),
+        Optional("instance-state"): str,
+        Optional("instance-type"): str,
+        Optional("router-id"): str
+    }, 'instance-core is not a list')
     
     schema = {
         Optional("@xmlns:junos"): str,
@@ -2387,43 +2255,35 @@ class ShowRouteAdvertisingProtocolDetailSchema(MetaParser):
     #     },
     # }
 
-    def validate_rt_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('protocol information is not a list')
-
-        entry_schema = Schema({
-            Optional("@junos:style"): str,
-            "table-name": str,
-            "destination-count": str,
-            "total-route-count": str,
-            "active-route-count": str,
-            "holddown-route-count": str,
-            "hidden-route-count": str,
-            "rt-entry": {
-                Optional('active-tag'): str,
-                "rt-destination": str,
-                "rt-prefix-length": str,
-                "rt-entry-count": str,
-                "rt-announced-count": str,
-                Optional('route-label'): str,
-                Optional("bgp-group"): {
-                    "bgp-group-name": str,
-                    "bgp-group-type": str,
-                },
-                "nh": {
-                    "to": str,
-                },
-                Optional("med"): str,
-                Optional("local-preference"): str,
-                'as-path': str,
-                Optional("communities"): str,
-                Optional("flags"): str,
-            }
-        })
-
-        for item in value:
-            entry_schema.validate(item)
-        return value
+    validate_rt_list = list_of({
+        Optional("@junos:style"): str,
+        "table-name": str,
+        "destination-count": str,
+        "total-route-count": str,
+        "active-route-count": str,
+        "holddown-route-count": str,
+        "hidden-route-count": str,
+        "rt-entry": {
+            Optional('active-tag'): str,
+            "rt-destination": str,
+            "rt-prefix-length": str,
+            "rt-entry-count": str,
+            "rt-announced-count": str,
+            Optional('route-label'): str,
+            Optional("bgp-group"): {
+                "bgp-group-name": str,
+                "bgp-group-type": str,
+            },
+            "nh": {
+                "to": str,
+            },
+            Optional("med"): str,
+            Optional("local-preference"): str,
+            'as-path': str,
+            Optional("communities"): str,
+            Optional("flags"): str,
+        }
+    }, 'protocol information is not a list')
 
     # Main schema
     schema = {
@@ -2580,43 +2440,26 @@ class ShowRouteForwardingTableLabelSchema(MetaParser):
     """
 
 
-    def validate_rt_table_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('Route table is not a list')
-
-        def validate_rt_entry_list(value):
-            if not isinstance(value, list):
-                raise SchemaError('Route entry is not a list')
-
-            rt_entry = Schema({
-                                "rt-destination": str,
-                                "destination-type": str,
-                                "route-reference-count": str,
-                                "nh":{
-                                    Optional("to"): str,
-                                    "nh-type": str,
-                                    "nh-index": str,
-                                    "nh-reference-count": str,
-                                    Optional("nh-lb-label"): str,
-                                    Optional("via"): str,
-                                }
-                            })
-            
-            for item in value:
-                rt_entry.validate(item)
-            return value
-
-
-        rt_table = Schema({
-                        "table-name": str,
-                        "address-family": str,
-                        Optional("enabled-protocols"): str,
-                        "rt-entry": Use(validate_rt_entry_list)
-                    })
+    validate_rt_entry_list = list_of({
+        "rt-destination": str,
+        "destination-type": str,
+        "route-reference-count": str,
+        "nh":{
+            Optional("to"): str,
+            "nh-type": str,
+            "nh-index": str,
+            "nh-reference-count": str,
+            Optional("nh-lb-label"): str,
+            Optional("via"): str,
+        }
+    }, 'Route entry is not a list')
 
-        for item in value:
-            rt_table.validate(item)
-        return value
+    validate_rt_table_list = list_of({
+        "table-name": str,
+        "address-family": str,
+        Optional("enabled-protocols"): str,
+        "rt-entry": Use(validate_rt_entry_list)
+    }, 'Route table is not a list')
 
     # Main schema
     schema = {
@@ -2715,56 +2558,32 @@ class ShowRouteTableLabelSwitchedNameSchema(MetaParser):
         * show route table {table} label-switched-path {name}
     """
 
-    def validate_rt_schema(value):
-        if not isinstance(value, list):
-            raise SchemaError('rt schema is not a list')
-
-        def validate_rt_entry_schema(value):
-            if not isinstance(value, list):
-                raise SchemaError('rt entry schema is not a list')
+    validate_nh_schema = list_of({
+        Optional("selected-next-hop"): bool,
+        "to": str,
+        "via": str,
+        "lsp-name": str,
+    }, 'nh schema is not a list')
+
+    validate_rt_entry_schema = list_of({
+        Optional("active-tag"): str,
+        Optional("current-active"): str,
+        Optional("last-active"): str,
+        "protocol-name": str,
+        "preference": str,
+        "preference2": str,
+        "age": {
+            '#text': str,
+            Optional('@junos:seconds'): str,
+        },
+        "metric": str,
+        "nh": Use(validate_nh_schema)
+    }, 'rt entry schema is not a list')
 
-            def validate_nh_schema(value):
-                if not isinstance(value, list):
-                    raise SchemaError('nh schema is not a list')
-            
-                nh_schema = Schema({
-                            Optional("selected-next-hop"): bool,
-                            "to": str,
-                            "via": str,
-                            "lsp-name": str,
-                        })
-            
-                for item in value:
-                    nh_schema.validate(item)
-                return value
-        
-            rt_entry_schema = Schema({
-                        Optional("active-tag"): str,
-                        Optional("current-active"): str,
-                        Optional("last-active"): str,
-                        "protocol-name": str,
-                        "preference": str,
-                        "preference2": str,
-                        "age": {
-                            '#text': str,
-                            Optional('@junos:seconds'): str,
-                        },
-                        "metric": str,
-                        "nh": Use(validate_nh_schema)
-                    })
-        
-            for item in value:
-                rt_entry_schema.validate(item)
-            return value
-    
-        rt_schema = Schema({
-                    "rt-destination": str,
-                    "rt-entry": Use(validate_rt_entry_schema)
-                })
-    
-        for item in value:
-            rt_schema.validate(item)
-        return value
+    validate_rt_schema = list_of({
+        "rt-destination": str,
+        "rt-entry": Use(validate_rt_entry_schema)
+    }, 'rt schema is not a list')
 
     schema = {
             "route-information": {
@@ -3252,49 +3071,39 @@ class ShowRouteReceiveProtocolExtensiveSchema(MetaParser):
     """ Schema for:
             * 'show route receive-protocol bgp {peer_address} {target_address} extensive'
     """
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        
-        # Create Route Table Schema
-        route_table_schema = Schema({
-            "active-route-count": str,
-            "destination-count": str,
-            "hidden-route-count": str,
-            "holddown-route-count": str,
-            Optional("rt"): {
-                    Optional("@junos:style"): str,
-                    "rt-announced-count": str,
-                    "rt-destination": str,
-                    Optional("active-tag"): str,
-                    Optional("rt-entry"): {
-                        Optional("as-path"): str,
-                        Optional("bgp-rt-flag"): str,
-                        Optional("bgp-path-attributes"): {
-                            "attr-as-path-effective": {
-                                "aspath-effective-string": str,
-                                "attr-value": str
-                            }
-                        },
-                        Optional("local-preference"): str,
-                        Optional("nh"): {
-                            'to': str,
+    validate_route_table_list = list_of({
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        Optional("rt"): {
+                Optional("@junos:style"): str,
+                "rt-announced-count": str,
+                "rt-destination": str,
+                Optional("active-tag"): str,
+                Optional("rt-entry"): {
+                    Optional("as-path"): str,
+                    Optional("bgp-rt-flag"): str,
+                    Optional("bgp-path-attributes"): {
+                        "attr-as-path-effective": {
+                            "aspath-effective-string": str,
+                            "attr-value": str
                         }
                     },
-                    "rt-entry-count": {
-                        "#text": str,
-                    },
-                    Optional("rt-prefix-length"): str,
-                    Optional("rt-state"): str,
+                    Optional("local-preference"): str,
+                    Optional("nh"): {
+                        'to': str,
+                    }
+                },
+                "rt-entry-count": {
+                    "#text": str,
                 },
-            "table-name": str,
-            "total-route-count": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            route_table_schema.validate(item)
-        return value
+                Optional("rt-prefix-length"): str,
+                Optional("rt-state"): str,
+            },
+        "table-name": str,
+        "total-route-count": str
+    }, 'route-table is not a list')
 
     # Main Schema
     schema = {
@@ -3428,59 +3237,39 @@ class ShowRouteReceiveProtocolPeerAddressExtensiveSchema(MetaParser):
     """ Schema for:
             * 'show route receive-protocol bgp {peer_address} extensive'
     """
-    def validate_route_table_list(value):
-        # Pass route-table list of dict in value
-        if not isinstance(value, list):
-            raise SchemaError('route-table is not a list')
-        
-        def validate_rt_list(value): 
-            # Pass rt list of dict in value
-            if not isinstance(value, list):
-                raise SchemaError('rt is not a list')
-            # Create rt entry Schema
-            rt_entry_schema = Schema(
-                    {Optional("@junos:style"): str,
-                    Optional("active-tag"): str,
-                    "rt-announced-count": str,
-                    "rt-destination": str,
-                    Optional("rt-entry"): {
-                        Optional("as-path"): str,
-                        Optional("bgp-rt-flag"): str,
-                        Optional("bgp-path-attributes"): {
-                            "attr-as-path-effective": {
-                                "aspath-effective-string": str,
-                                "attr-value": str
-                            }
-                        },
-                        Optional("local-preference"): str,
-                        Optional("nh"): {
-                            'to': str,
-                        }
-                    },
-                    "rt-entry-count": {
-                        "#text": str,
-                    },
-                    Optional("rt-prefix-length"): str,
-                    Optional("rt-state"): str,}
-            )
-            # Validate each dictionary in list
-            for item in value:
-                rt_entry_schema.validate(item)
-            return value
-        # Create Route Table Schema
-        route_table_schema = Schema({
-            "active-route-count": str,
-            "destination-count": str,
-            "hidden-route-count": str,
-            "holddown-route-count": str,
-            Optional("rt"): Use(validate_rt_list),
-            "table-name": str,
-            "total-route-count": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            route_table_schema.validate(item)
-        return value
+    validate_rt_list = list_of({Optional("@junos:style"): str,
+        Optional("active-tag"): str,
+        "rt-announced-count": str,
+        "rt-destination": str,
+        Optional("rt-entry"): {
+            Optional("as-path"): str,
+            Optional("bgp-rt-flag"): str,
+            Optional("bgp-path-attributes"): {
+                "attr-as-path-effective": {
+                    "aspath-effective-string": str,
+                    "attr-value": str
+                }
+            },
+            Optional("local-preference"): str,
+            Optional("nh"): {
+                'to': str,
+            }
+        },
+        "rt-entry-count": {
+            "#text": str,
+        },
+        Optional("rt-prefix-length"): str,
+        Optional("rt-state"): str,}, 'rt is not a list')
+
+    validate_route_table_list = list_of({
+        "active-route-count": str,
+        "destination-count": str,
+        "hidden-route-count": str,
+        "holddown-route-count": str,
+        Optional("rt"): Use(validate_rt_list),
+        "table-name": str,
+        "total-route-count": str
+    }, 'route-table is not a list')
 
     # Main Schema
     schema = {
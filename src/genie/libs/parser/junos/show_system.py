@@ -21,8 +21,10 @@ import re
 
 # metaparser
 from genie.metaparser import MetaParser
-from pyats.utils.exceptions import SchemaError
-from genie.metaparser.util.schemaengine import Schema, Any, Optional, Use
+from genie.metaparser.util.schemaengine import Any, Optional, Use
+
+# Parser utils
+from genie.libs.parser.utils.validators import list_of
 
 
 class ShowSystemBuffersSchema(MetaParser):
@@ -341,26 +343,20 @@ class ShowSystemUsersSchema(MetaParser):
         }
     }
 } """
-    def validate_system_user_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('ospf-neighbor is not a list')
-        neighbor_schema = Schema({
-            "command": str,
-            "from": str,
-            "idle-time": {
-                "#text": str,
-                Optional("@junos:seconds"): str
-            },
-            "login-time": {
-                "#text": str,
-                Optional("@junos:seconds"): str
-            },
-            "tty": str,
-            "user": str
-        })
-        for item in value:
-            neighbor_schema.validate(item)
-        return value
+    validate_system_user_list = list_of({
+        "command": str,
+        "from": str,
+        "idle-time": {
+            "#text": str,
+            Optional("@junos:seconds"): str
+        },
+        "login-time": {
+            "#text": str,
+            Optional("@junos:seconds"): str
+        },
+        "tty": str,
+        "user": str
+    }, 'ospf-neighbor is not a list')
 
     schema = {
         Optional("@xmlns:junos"): str,
@@ -496,22 +492,14 @@ class ShowSystemCommitSchema(MetaParser):
     """
 
     # Sub Schema commit-history
-    def validate_commit_history_list(value):
-        # Pass commit-history list as value
-        if not isinstance(value, list):
-            raise SchemaError('commit-history is not a list')
-        commit_history_schema = Schema({
-            "client": str,
-            "date-time": {
-                "#text": str
-            },
-            "sequence-number": str,
-            "user": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            commit_history_schema.validate(item)
-        return value
+    validate_commit_history_list = list_of({
+        "client": str,
+        "date-time": {
+            "#text": str
+        },
+        "sequence-number": str,
+        "user": str
+    }, 'commit-history is not a list')
 
     schema = {
         "commit-information": {
@@ -596,22 +584,14 @@ class ShowSystemQueuesSchema(MetaParser):
     """
 
     # Sub Schema interface-queue
-    def validate_interface_queue_list(value):
-        # Pass interface-queue list as value
-        if not isinstance(value, list):
-            raise SchemaError('commit-history is not a list')
-        interface_queue_schema = Schema({
-            "max-octets-allowed": str,
-            "max-packets-allowed": str,
-            "name": str,
-            "number-of-queue-drops": str,
-            "octets-in-queue": str,
-            "packets-in-queue": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            interface_queue_schema.validate(item)
-        return value
+    validate_interface_queue_list = list_of({
+        "max-octets-allowed": str,
+        "max-packets-allowed": str,
+        "name": str,
+        "number-of-queue-drops": str,
+        "octets-in-queue": str,
+        "packets-in-queue": str
+    }, 'commit-history is not a list')
 
     schema = {
         "queues-statistics": {
@@ -726,29 +706,21 @@ class ShowSystemStorageSchema(MetaParser):
     """
 
     # Sub Schema filesystem
-    def validate_filesystem_list(value):
-        # Pass filesystem list as value
-        if not isinstance(value, list):
-            raise SchemaError('filesystem is not a list')
-        filesystem_schema = Schema({
-            "available-blocks": {
-                "junos:format": str
-            },
-            "filesystem-name": str,
-            "mounted-on": str,
-            "total-blocks": {
-                Optional("#text"): str,
-                "junos:format": str
-            },
-            "used-blocks": {
-                "junos:format": str
-            },
-            "used-percent": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            filesystem_schema.validate(item)
-        return value
+    validate_filesystem_list = list_of({
+        "available-blocks": {
+            "junos:format": str
+        },
+        "filesystem-name": str,
+        "mounted-on": str,
+        "total-blocks": {
+            Optional("#text"): str,
+            "junos:format": str
+        },
+        "used-blocks": {
+            "junos:format": str
+        },
+        "used-percent": str
+    }, 'filesystem is not a list')
 
     schema = {
         "system-storage-information": {
@@ -856,29 +828,21 @@ class ShowSystemCoreDumpsSchema(MetaParser):
     '''
 
     # Sub Schema file-information
-    def validate_file_information_list(value):
-        # Pass file-information list as value
-        if not isinstance(value, list):
-            raise SchemaError('ospf-interface is not a list')
-        file_information_schema = Schema({
-            "file-date": {
-                Optional("#text"): str,
-                "@junos:format": str
-            },
-            "file-group": str,
-            "file-links": str,
-            "file-name": str,
-            "file-owner": str,
-            "file-permissions": {
-                Optional("#text"): str,
-                "@junos:format": str
-            },
-            "file-size": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            file_information_schema.validate(item)
-        return value
+    validate_file_information_list = list_of({
+        "file-date": {
+            Optional("#text"): str,
+            "@junos:format": str
+        },
+        "file-group": str,
+        "file-links": str,
+        "file-name": str,
+        "file-owner": str,
+        "file-permissions": {
+            Optional("#text"): str,
+            "@junos:format": str
+        },
+        "file-size": str
+    }, 'ospf-interface is not a list')
 
     schema = {
         "directory-list": {
@@ -1927,878 +1891,859 @@ class ShowSystemStatisticsSchema(MetaParser):
         ]
     }
     """
-    def statistics_list(value):
-        if not isinstance(value, list):
-            raise SchemaError("statistics is not a list")
-
-        def icmp_histogram_list(value):
-            if not isinstance(value, list):
-                raise SchemaError("icmp-histogram is not a list")
-            icmp_histogram_schema = Schema({
-                "destination-unreachable": str,
-                "icmp-echo": str,
-                "icmp-echo-reply": str,
-                "time-exceeded": str,
-                "type-of-histogram": str,
-            })
-            for item in value:
-                icmp_histogram_schema.validate(item)
-            return value
-
-        def ip6_header_type(value):
-            if not isinstance(value, list):
-                raise SchemaError("statistics is not a list")
-            ip6_header_type_schema = Schema({
-                "globals":
-                str,
-                "header-for-source-address-selection":
-                str,
-                Optional("link-locals"):
-                str,
-            })
-            for item in value:
-                ip6_header_type_schema.validate(item)
-            return value
-
-        statistics_schema = Schema({
-            Optional("ah"): {
-                "bytes-in": str,
-                "bytes-out": str,
-                "crypto-processing-failure": str,
-                "packets-blocked-due-to-policy": str,
-                "packets-dropped-as-bad-authentication-detected": str,
-                "packets-dropped-as-larger-than-ip-maxpacket": str,
-                "packets-dropped-as-protocol-unsupported": str,
-                "packets-dropped-due-to-bad-authentication-length": str,
-                "packets-dropped-due-to-bad-kcr": str,
-                "packets-dropped-due-to-invalid-tdb": str,
-                "packets-dropped-due-to-no-tdb": str,
-                "packets-dropped-due-to-no-transform": str,
-                "packets-dropped-due-to-queue-full": str,
-                "packets-in": str,
-                "packets-out": str,
-                "packets-shorter-than-header-shows": str,
-                "possible-replay-packets-detected": str,
-                "replay-counter-wrap": str,
-                "tunnel-sanity-check-failures": str,
-            },
-            Optional("arp"): {
-                "arp-iri-cnt":
-                str,
-                "arp-iri-drop":
-                str,
-                "arp-iri-max":
-                str,
-                "arp-mgt-cnt":
-                str,
-                "arp-mgt-drop":
-                str,
-                "arp-mgt-max":
-                str,
-                "arp-packets-are-dropped-as-driver-call-failed":
-                str,
-                "arp-packets-are-dropped-as-nexthop-allocation-failed":
-                str,
-                "arp-packets-are-dropped-as-source-is-not-validated":
-                str,
-                "arp-packets-are-dropped-from-peer-vrrp":
-                str,
-                "arp-packets-are-rejected-as-target-ip-arp-resolve-is-in-progress":
-                str,
-                "arp-packets-received-from-peer-vrrp-router-and-discarded":
-                str,
-                "arp-packets-rejected-as-family-is-configured-with-deny-arp":
-                str,
-                "arp-probe-for-proxy-address-reachable-from-the-incoming-interface":
-                str,
-                "arp-public-cnt":
-                str,
-                "arp-public-drop":
-                str,
-                "arp-public-max":
-                str,
-                "arp-replies-are-rejected-as-source-and-destination-is-same":
-                str,
-                "arp-replies-received":
-                str,
-                "arp-replies-sent":
-                str,
-                "arp-request-discarded-for-vrrp-source-address":
-                str,
-                "arp-requests-received":
-                str,
-                "arp-requests-sent":
-                str,
-                "arp-response-packets-are-rejected-on-mace-icl-interface":
-                str,
-                "arp-system-drop":
-                str,
-                "arp-system-max":
-                str,
-                "datagrams-for-an-address-not-on-the-interface":
-                str,
-                "datagrams-for-non-ip-protocol":
-                str,
-                "datagrams-received":
-                str,
-                "datagrams-which-were-not-for-me":
-                str,
-                "datagrams-with-a-broadcast-source-address":
-                str,
-                "datagrams-with-bad-hardware-address-length":
-                str,
-                "datagrams-with-bad-protocol-address-length":
-                str,
-                "datagrams-with-bogus-interface":
-                str,
-                "datagrams-with-incorrect-length":
-                str,
-                "datagrams-with-multicast-source-address":
-                str,
-                "datagrams-with-multicast-target-address":
-                str,
-                "datagrams-with-my-own-hardware-address":
-                str,
-                "datagrams-with-source-address-duplicate-to-mine":
-                str,
-                "datagrams-with-unsupported-opcode":
-                str,
-                "grat-arp-packets-are-ignored-as-mac-address-is-not-changed":
-                str,
-                "new-requests-on-unnumbered-interfaces":
-                str,
-                "packets-discarded-waiting-for-resolution":
-                str,
-                "packets-sent-after-waiting-for-resolution":
-                str,
-                "proxy-arp-request-discarded-as-source-ip-is-a-proxy-target":
-                str,
-                "proxy-requests-not-proxied":
-                str,
-                "received-proxy-requests":
-                str,
-                "replies-from-unnumbered-interface-with-non-subnetted-donor":
-                str,
-                "replies-from-unnumbered-interfaces":
-                str,
-                "requests-dropped-due-to-interface-deletion":
-                str,
-                "requests-dropped-during-retry":
-                str,
-                "requests-dropped-on-entry":
-                str,
-                "requests-for-memory-denied":
-                str,
-                "requests-on-unnumbered-interface-with-non-subnetted-donor":
-                str,
-                "requests-on-unnumbered-interfaces":
-                str,
-                "resolution-request-dropped":
-                str,
-                "resolution-request-received":
-                str,
-                "restricted-proxy-requests":
-                str,
-                "restricted-proxy-requests-not-proxied":
-                str,
-                "self-arp-request-packet-received-on-irb-interface":
-                str,
-                "unrestricted-proxy-requests":
-                str,
-            },
-            Optional("clnl"): {
-                "address-fields-were-not-reasonable": str,
-                "bad-version-packets": str,
-                "er-pdu-generation-failure": str,
-                "error-pdu-rate-drops": str,
-                "forwarded-packets": str,
-                "fragmentation-prohibited": str,
-                "fragments-discarded": str,
-                "fragments-sent": str,
-                "fragments-timed-out": str,
-                "mcopy-failure": str,
-                "no-free-memory-in-socket-buffer": str,
-                "non-forwarded-packets": str,
-                "output-packets-discarded": str,
-                "packets-delivered": str,
-                "packets-destined-to-dead-nexthop": str,
-                "packets-discarded-due-to-no-route": str,
-                "packets-fragmented": str,
-                "packets-reconstructed": str,
-                "packets-with-bad-checksum": str,
-                "packets-with-bad-header-length": str,
-                "packets-with-bogus-sdl-size": str,
-                "sbappend-failure": str,
-                "segment-information-forgotten": str,
-                "send-packets-discarded": str,
-                "too-small-packets": str,
-                "total-clnl-packets-received": str,
-                "total-packets-sent": str,
-                "unknown-or-unsupported-protocol-packets": str,
-            },
-            Optional("esis"): {
-                "iso-family-not-configured": str,
-                "mcopy-failure": str,
-                "no-free-memory-in-socket-buffer": str,
-                "pdus-received-with-bad-checksum": str,
-                "pdus-received-with-bad-type-field": str,
-                "pdus-received-with-bad-version-number": str,
-                "pdus-with-bad-header-length": str,
-                "pdus-with-bogus-sdl-size": str,
-                "pdus-with-unknown-or-unsupport-protocol": str,
-                "sbappend-failure": str,
-                "send-packets-discarded": str,
-                "short-pdus-received": str,
-                "total-esis-packets-received": str,
-                "total-packets-consumed-by-protocol": str,
+    icmp_histogram_list = list_of({
+        "destination-unreachable": str,
+        "icmp-echo": str,
+        "icmp-echo-reply": str,
+        "time-exceeded": str,
+        "type-of-histogram": str,
+    }, 'icmp-histogram is not a list')
+
+    ip6_header_type = list_of({
+        "globals":
+        str,
+        "header-for-source-address-selection":
+        str,
+        Optional("link-locals"):
+        str,
+    }, 'statistics is not a list')
+
+    statistics_list = list_of({
+        Optional("ah"): {
+            "bytes-in": str,
+            "bytes-out": str,
+            "crypto-processing-failure": str,
+            "packets-blocked-due-to-policy": str,
+            "packets-dropped-as-bad-authentication-detected": str,
+            "packets-dropped-as-larger-than-ip-maxpacket": str,
+            "packets-dropped-as-protocol-unsupported": str,
+            "packets-dropped-due-to-bad-authentication-length": str,
+            "packets-dropped-due-to-bad-kcr": str,
+            "packets-dropped-due-to-invalid-tdb": str,
+            "packets-dropped-due-to-no-tdb": str,
+            "packets-dropped-due-to-no-transform": str,
+            "packets-dropped-due-to-queue-full": str,
+            "packets-in": str,
+            "packets-out": str,
+            "packets-shorter-than-header-shows": str,
+            "possible-replay-packets-detected": str,
+            "replay-counter-wrap": str,
+            "tunnel-sanity-check-failures": str,
+        },
+        Optional("arp"): {
+            "arp-iri-cnt":
+            str,
+            "arp-iri-drop":
+            str,
+            "arp-iri-max":
+            str,
+            "arp-mgt-cnt":
+            str,
+            "arp-mgt-drop":
+            str,
+            "arp-mgt-max":
+            str,
+            "arp-packets-are-dropped-as-driver-call-failed":
+            str,
+            "arp-packets-are-dropped-as-nexthop-allocation-failed":
+            str,
+            "arp-packets-are-dropped-as-source-is-not-validated":
+            str,
+            "arp-packets-are-dropped-from-peer-vrrp":
+            str,
+            "arp-packets-are-rejected-as-target-ip-arp-resolve-is-in-progress":
+            str,
+            "arp-packets-received-from-peer-vrrp-router-and-discarded":
+            str,
+            "arp-packets-rejected-as-family-is-configured-with-deny-arp":
+            str,
+            "arp-probe-for-proxy-address-reachable-from-the-incoming-interface":
+            str,
+            "arp-public-cnt":
+            str,
+            "arp-public-drop":
+            str,
+            "arp-public-max":
+            str,
+            "arp-replies-are-rejected-as-source-and-destination-is-same":
+            str,
+            "arp-replies-received":
+            str,
+            "arp-replies-sent":
+            str,
+            "arp-request-discarded-for-vrrp-source-address":
+            str,
+            "arp-requests-received":
+            str,
+            "arp-requests-sent":
+            str,
+            "arp-response-packets-are-rejected-on-mace-icl-interface":
+            str,
+            "arp-system-drop":
+            str,
+            "arp-system-max":
+            str,
+            "datagrams-for-an-address-not-on-the-interface":
+            str,
+            "datagrams-for-non-ip-protocol":
+            str,
+            "datagrams-received":
+            str,
+            "datagrams-which-were-not-for-me":
+            str,
+            "datagrams-with-a-broadcast-source-address":
+            str,
+            "datagrams-with-bad-hardware-address-length":
+            str,
+            "datagrams-with-bad-protocol-address-length":
+            str,
+            "datagrams-with-bogus-interface":
+            str,
+            "datagrams-with-incorrect-length":
+            str,
+            "datagrams-with-multicast-source-address":
+            str,
+            "datagrams-with-multicast-target-address":
+            str,
+            "datagrams-with-my-own-hardware-address":
+            str,
+            "datagrams-with-source-address-duplicate-to-mine":
+            str,
+            "datagrams-with-unsupported-opcode":
+            str,
+            "grat-arp-packets-are-ignored-as-mac-address-is-not-changed":
+            str,
+            "new-requests-on-unnumbered-interfaces":
+            str,
+            "packets-discarded-waiting-for-resolution":
+            str,
+            "packets-sent-after-waiting-for-resolution":
+            str,
+            "proxy-arp-request-discarded-as-source-ip-is-a-proxy-target":
+            str,
+            "proxy-requests-not-proxied":
+            str,
+            "received-proxy-requests":
+            str,
+            "replies-from-unnumbered-interface-with-non-subnetted-donor":
+            str,
+            "replies-from-unnumbered-interfaces":
+            str,
+            "requests-dropped-due-to-interface-deletion":
+            str,
+            "requests-dropped-during-retry":
+            str,
+            "requests-dropped-on-entry":
+            str,
+            "requests-for-memory-denied":
+            str,
+            "requests-on-unnumbered-interface-with-non-subnetted-donor":
+            str,
+            "requests-on-unnumbered-interfaces":
+            str,
+            "resolution-request-dropped":
+            str,
+            "resolution-request-received":
+            str,
+            "restricted-proxy-requests":
+            str,
+            "restricted-proxy-requests-not-proxied":
+            str,
+            "self-arp-request-packet-received-on-irb-interface":
+            str,
+            "unrestricted-proxy-requests":
+            str,
+        },
+        Optional("clnl"): {
+            "address-fields-were-not-reasonable": str,
+            "bad-version-packets": str,
+            "er-pdu-generation-failure": str,
+            "error-pdu-rate-drops": str,
+            "forwarded-packets": str,
+            "fragmentation-prohibited": str,
+            "fragments-discarded": str,
+            "fragments-sent": str,
+            "fragments-timed-out": str,
+            "mcopy-failure": str,
+            "no-free-memory-in-socket-buffer": str,
+            "non-forwarded-packets": str,
+            "output-packets-discarded": str,
+            "packets-delivered": str,
+            "packets-destined-to-dead-nexthop": str,
+            "packets-discarded-due-to-no-route": str,
+            "packets-fragmented": str,
+            "packets-reconstructed": str,
+            "packets-with-bad-checksum": str,
+            "packets-with-bad-header-length": str,
+            "packets-with-bogus-sdl-size": str,
+            "sbappend-failure": str,
+            "segment-information-forgotten": str,
+            "send-packets-discarded": str,
+            "too-small-packets": str,
+            "total-clnl-packets-received": str,
+            "total-packets-sent": str,
+            "unknown-or-unsupported-protocol-packets": str,
+        },
+        Optional("esis"): {
+            "iso-family-not-configured": str,
+            "mcopy-failure": str,
+            "no-free-memory-in-socket-buffer": str,
+            "pdus-received-with-bad-checksum": str,
+            "pdus-received-with-bad-type-field": str,
+            "pdus-received-with-bad-version-number": str,
+            "pdus-with-bad-header-length": str,
+            "pdus-with-bogus-sdl-size": str,
+            "pdus-with-unknown-or-unsupport-protocol": str,
+            "sbappend-failure": str,
+            "send-packets-discarded": str,
+            "short-pdus-received": str,
+            "total-esis-packets-received": str,
+            "total-packets-consumed-by-protocol": str,
+        },
+        Optional("esp"): {
+            "esp-bytes-in": str,
+            "esp-bytes-out": str,
+            "esp-crypto-processing-failure": str,
+            "esp-packets-blocked-due-to-policy": str,
+            "esp-packets-dropped-as-bad-authentication-detected": str,
+            "esp-packets-dropped-as-bad-encryption-detected": str,
+            "esp-packets-dropped-as-bad-ilen": str,
+            "esp-packets-dropped-as-invalid-tdb": str,
+            "esp-packets-dropped-as-larger-than-ip-maxpacket": str,
+            "esp-packets-dropped-as-protocol-not-supported": str,
+            "esp-packets-dropped-due-to-bad-kcr": str,
+            "esp-packets-dropped-due-to-no-tdb": str,
+            "esp-packets-dropped-due-to-no-transform": str,
+            "esp-packets-dropped-due-to-queue-full": str,
+            "esp-packets-in": str,
+            "esp-packets-out": str,
+            "esp-packets-shorter-than-header-shows": str,
+            "esp-possible-replay-packets-detected": str,
+            "esp-replay-counter-wrap": str,
+            "esp-tunnel-sanity-check-failures": str,
+        },
+        Optional("ethoamcfm"): {
+            "flood-requests-dropped": str,
+            "flood-requests-forwarded-to-pfe": str,
+            "input-packets-drop-bad-interface-state": str,
+            "output-packets-drop-bad-interface-state": str,
+            "packets-sent": str,
+            "received-packets-forwarded": str,
+            "total-packets-received": str,
+            "total-packets-transmitted": str,
+        },
+        Optional("ethoamlfm"): {
+            "input-packets-drop-bad-interface-state": str,
+            "output-packets-drop-bad-interface-state": str,
+            "packets-sent": str,
+            "received-packets-forwarded": str,
+            "total-packets-received": str,
+            "total-packets-transmitted": str,
+        },
+        Optional("icmp"): {
+            "calls-to-icmp-error":
+            str,
+            "drops-due-to-rate-limit":
+            str,
+            "echo-drops-with-broadcast-or-multicast-destinaton-address":
+            str,
+            "errors-not-generated-because-old-message-was-icmp":
+            str,
+            "histogram":
+            Use(icmp_histogram_list),
+            "message-responses-generated":
+            str,
+            "messages-less-than-the-minimum-length":
+            str,
+            "messages-with-bad-checksum":
+            str,
+            "messages-with-bad-code-fields":
+            str,
+            "messages-with-bad-length":
+            str,
+            "messages-with-bad-source-address":
+            str,
+            "timestamp-drops-with-broadcast-or-multicast-destination-address":
+            str,
+        },
+        Optional("icmp6"): {
+            "address-unreachable": str,
+            "administratively-prohibited": str,
+            "bad-checksums": str,
+            "beyond-scope": str,
+            "calls-to-icmp6-error": str,
+            "erroneous-header-field": str,
+            "errors-not-generated-because-old-message-was-icmp-error": str,
+            "errors-not-generated-because-rate-limitation": str,
+            "histogram-of-error-messages-to-be-generated": str,
+            "icmp6-message-responses-generated": str,
+            "icmp6-messages-with-bad-code-fields": str,
+            "icmp6-messages-with-bad-length": str,
+            "input-histogram": {
+                "histogram-type": str,
+                "neighbor-advertisement": str,
+                "neighbor-solicitation": str,
+                "router-advertisement-icmp6-packets": str,
+                "router-solicitation-icmp6-packets": str,
+                "time-exceeded-icmp6-packets": str,
+                "unreachable-icmp6-packets": str,
             },
-            Optional("esp"): {
-                "esp-bytes-in": str,
-                "esp-bytes-out": str,
-                "esp-crypto-processing-failure": str,
-                "esp-packets-blocked-due-to-policy": str,
-                "esp-packets-dropped-as-bad-authentication-detected": str,
-                "esp-packets-dropped-as-bad-encryption-detected": str,
-                "esp-packets-dropped-as-bad-ilen": str,
-                "esp-packets-dropped-as-invalid-tdb": str,
-                "esp-packets-dropped-as-larger-than-ip-maxpacket": str,
-                "esp-packets-dropped-as-protocol-not-supported": str,
-                "esp-packets-dropped-due-to-bad-kcr": str,
-                "esp-packets-dropped-due-to-no-tdb": str,
-                "esp-packets-dropped-due-to-no-transform": str,
-                "esp-packets-dropped-due-to-queue-full": str,
-                "esp-packets-in": str,
-                "esp-packets-out": str,
-                "esp-packets-shorter-than-header-shows": str,
-                "esp-possible-replay-packets-detected": str,
-                "esp-replay-counter-wrap": str,
-                "esp-tunnel-sanity-check-failures": str,
+            "messages-less-than-minimum-length": str,
+            "messages-with-too-many-nd-options": str,
+            "nd-iri-cnt": str,
+            "nd-iri-drop": str,
+            "nd-iri-max": str,
+            "nd-mgt-cnt": str,
+            "nd-mgt-drop": str,
+            "nd-mgt-max": str,
+            "nd-public-cnt": str,
+            "nd-public-drop": str,
+            "nd-public-max": str,
+            "nd-system-drop": str,
+            "nd-system-max": str,
+            "nd6-dad-proxy-conflicts": str,
+            "nd6-dad-proxy-eqmac-drop": str,
+            "nd6-dad-proxy-nomac-drop": str,
+            "nd6-dad-proxy-requests": str,
+            "nd6-dad-proxy-resolve-cnt": str,
+            "nd6-dup-proxy-responses": str,
+            "nd6-ndp-proxy-requests": str,
+            "nd6-ndp-proxy-resolve-cnt": str,
+            "nd6-ndp-proxy-responses": str,
+            "nd6-requests-dropped-during-retry": str,
+            "nd6-requests-dropped-on-entry": str,
+            "no-route": str,
+            "output-histogram": {
+                "histogram-type": str,
+                "neighbor-advertisement": str,
+                "neighbor-solicitation": str,
+                "unreachable-icmp6-packets": str,
             },
-            Optional("ethoamcfm"): {
-                "flood-requests-dropped": str,
-                "flood-requests-forwarded-to-pfe": str,
-                "input-packets-drop-bad-interface-state": str,
-                "output-packets-drop-bad-interface-state": str,
-                "packets-sent": str,
-                "received-packets-forwarded": str,
-                "total-packets-received": str,
-                "total-packets-transmitted": str,
-            },
-            Optional("ethoamlfm"): {
-                "input-packets-drop-bad-interface-state": str,
-                "output-packets-drop-bad-interface-state": str,
-                "packets-sent": str,
-                "received-packets-forwarded": str,
-                "total-packets-received": str,
-                "total-packets-transmitted": str,
-            },
-            Optional("icmp"): {
-                "calls-to-icmp-error":
-                str,
-                "drops-due-to-rate-limit":
-                str,
-                "echo-drops-with-broadcast-or-multicast-destinaton-address":
-                str,
-                "errors-not-generated-because-old-message-was-icmp":
-                str,
-                "histogram":
-                Use(icmp_histogram_list),
-                "message-responses-generated":
-                str,
-                "messages-less-than-the-minimum-length":
-                str,
-                "messages-with-bad-checksum":
-                str,
-                "messages-with-bad-code-fields":
-                str,
-                "messages-with-bad-length":
-                str,
-                "messages-with-bad-source-address":
-                str,
-                "timestamp-drops-with-broadcast-or-multicast-destination-address":
-                str,
-            },
-            Optional("icmp6"): {
-                "address-unreachable": str,
-                "administratively-prohibited": str,
-                "bad-checksums": str,
-                "beyond-scope": str,
-                "calls-to-icmp6-error": str,
-                "erroneous-header-field": str,
-                "errors-not-generated-because-old-message-was-icmp-error": str,
-                "errors-not-generated-because-rate-limitation": str,
-                "histogram-of-error-messages-to-be-generated": str,
-                "icmp6-message-responses-generated": str,
-                "icmp6-messages-with-bad-code-fields": str,
-                "icmp6-messages-with-bad-length": str,
-                "input-histogram": {
-                    "histogram-type": str,
-                    "neighbor-advertisement": str,
-                    "neighbor-solicitation": str,
-                    "router-advertisement-icmp6-packets": str,
-                    "router-solicitation-icmp6-packets": str,
-                    "time-exceeded-icmp6-packets": str,
-                    "unreachable-icmp6-packets": str,
-                },
-                "messages-less-than-minimum-length": str,
-                "messages-with-too-many-nd-options": str,
-                "nd-iri-cnt": str,
-                "nd-iri-drop": str,
-                "nd-iri-max": str,
-                "nd-mgt-cnt": str,
-                "nd-mgt-drop": str,
-                "nd-mgt-max": str,
-                "nd-public-cnt": str,
-                "nd-public-drop": str,
-                "nd-public-max": str,
-                "nd-system-drop": str,
-                "nd-system-max": str,
-                "nd6-dad-proxy-conflicts": str,
-                "nd6-dad-proxy-eqmac-drop": str,
-                "nd6-dad-proxy-nomac-drop": str,
-                "nd6-dad-proxy-requests": str,
-                "nd6-dad-proxy-resolve-cnt": str,
-                "nd6-dup-proxy-responses": str,
-                "nd6-ndp-proxy-requests": str,
-                "nd6-ndp-proxy-resolve-cnt": str,
-                "nd6-ndp-proxy-responses": str,
-                "nd6-requests-dropped-during-retry": str,
-                "nd6-requests-dropped-on-entry": str,
-                "no-route": str,
-                "output-histogram": {
-                    "histogram-type": str,
-                    "neighbor-advertisement": str,
-                    "neighbor-solicitation": str,
-                    "unreachable-icmp6-packets": str,
-                },
-                Optional("packet-too-big"): str,
-                "port-unreachable": str,
-                "protocol-name": str,
-                Optional("redirect"): str,
-                "time-exceed-reassembly": str,
-                "time-exceed-transit": str,
-                "unknown": str,
-                "unrecognized-next-header": str,
-                "unrecognized-option": str,
-            },
-            Optional("igmp"): {
-                "membership-queries-received": str,
-                "membership-queries-received-with-invalid-fields": str,
-                "membership-reports-received": str,
-                "membership-reports-received-for-groups-to-which-we-belong":
-                str,
-                "membership-reports-received-with-invalid-fields": str,
-                "membership-reports-sent": str,
-                "messages-received": str,
-                "messages-received-with-bad-checksum": str,
-                "messages-received-with-too-few-bytes": str,
-            },
-            Optional("ip"): {
-                "bad-header-checksums": str,
-                "datagrams-that-can-not-be-fragmented": str,
-                "fragments-created": str,
-                "fragments-dropped-after-timeout": str,
-                "fragments-dropped-due-to-outofspace-or-dup": str,
-                "fragments-dropped-due-to-queueoverflow": str,
-                "fragments-received": str,
-                "incoming-rawip-packets-dropped-no-socket-buffer": str,
-                "incoming-ttpoip-packets-dropped": str,
-                "incoming-ttpoip-packets-received": str,
-                "incoming-virtual-node-packets-delivered": str,
-                "loose-source-and-record-route-options": str,
-                "multicast-packets-dropped": str,
-                "option-packets-dropped-due-to-rate-limit": str,
-                "outgoing-ttpoip-packets-dropped": str,
-                "outgoing-ttpoip-packets-sent": str,
-                "output-datagrams-fragmented": str,
-                "output-packets-discarded-due-to-no-route": str,
-                "output-packets-dropped-due-to-no-bufs": str,
-                "packets-destined-to-dead-next-hop": str,
-                "packets-dropped": str,
-                "packets-for-this-host": str,
-                "packets-for-unknown-or-unsupported-protocol": str,
-                "packets-forwarded": str,
-                "packets-not-forwardable": str,
-                "packets-reassembled-ok": str,
-                "packets-received": str,
-                "packets-sent-from-this-host": str,
-                "packets-sent-with-fabricated-ip-header": str,
-                "packets-used-first-nexthop-in-ecmp-unilist": str,
-                "packets-with-bad-options": str,
-                "packets-with-data-length-less-than-headerlength": str,
-                "packets-with-data-size-less-than-datalength": str,
-                "packets-with-header-length-less-than-data-size": str,
-                "packets-with-incorrect-version-number": str,
-                "packets-with-options-handled-without-error": str,
-                "packets-with-size-smaller-than-minimum": str,
-                "record-route-options": str,
-                "redirects-sent": str,
-                "router-alert-options": str,
-                "strict-source-and-record-route-options": str,
-                "timestamp-and-address-options": str,
-                "timestamp-and-prespecified-address-options": str,
-                "timestamp-options": str,
-                "transit-re-packets-dropped-on-mgmt-interface": str,
-            },
-            Optional("ip6"): {
-                "total-packets-received": str,
-                "duplicate-or-out-of-space-fragments-dropped": str,
-                "failures-of-source-address-selection": str,
-                "forward-cache-hit": str,
-                "forward-cache-miss": str,
-                "fragments-that-exceeded-limit": str,
-                "header-type": Use(ip6_header_type),
+            Optional("packet-too-big"): str,
+            "port-unreachable": str,
+            "protocol-name": str,
+            Optional("redirect"): str,
+            "time-exceed-reassembly": str,
+            "time-exceed-transit": str,
+            "unknown": str,
+            "unrecognized-next-header": str,
+            "unrecognized-option": str,
+        },
+        Optional("igmp"): {
+            "membership-queries-received": str,
+            "membership-queries-received-with-invalid-fields": str,
+            "membership-reports-received": str,
+            "membership-reports-received-for-groups-to-which-we-belong":
+            str,
+            "membership-reports-received-with-invalid-fields": str,
+            "membership-reports-sent": str,
+            "messages-received": str,
+            "messages-received-with-bad-checksum": str,
+            "messages-received-with-too-few-bytes": str,
+        },
+        Optional("ip"): {
+            "bad-header-checksums": str,
+            "datagrams-that-can-not-be-fragmented": str,
+            "fragments-created": str,
+            "fragments-dropped-after-timeout": str,
+            "fragments-dropped-due-to-outofspace-or-dup": str,
+            "fragments-dropped-due-to-queueoverflow": str,
+            "fragments-received": str,
+            "incoming-rawip-packets-dropped-no-socket-buffer": str,
+            "incoming-ttpoip-packets-dropped": str,
+            "incoming-ttpoip-packets-received": str,
+            "incoming-virtual-node-packets-delivered": str,
+            "loose-source-and-record-route-options": str,
+            "multicast-packets-dropped": str,
+            "option-packets-dropped-due-to-rate-limit": str,
+            "outgoing-ttpoip-packets-dropped": str,
+            "outgoing-ttpoip-packets-sent": str,
+            "output-datagrams-fragmented": str,
+            "output-packets-discarded-due-to-no-route": str,
+            "output-packets-dropped-due-to-no-bufs": str,
+            "packets-destined-to-dead-next-hop": str,
+            "packets-dropped": str,
+            "packets-for-this-host": str,
+            "packets-for-unknown-or-unsupported-protocol": str,
+            "packets-forwarded": str,
+            "packets-not-forwardable": str,
+            "packets-reassembled-ok": str,
+            "packets-received": str,
+            "packets-sent-from-this-host": str,
+            "packets-sent-with-fabricated-ip-header": str,
+            "packets-used-first-nexthop-in-ecmp-unilist": str,
+            "packets-with-bad-options": str,
+            "packets-with-data-length-less-than-headerlength": str,
+            "packets-with-data-size-less-than-datalength": str,
+            "packets-with-header-length-less-than-data-size": str,
+            "packets-with-incorrect-version-number": str,
+            "packets-with-options-handled-without-error": str,
+            "packets-with-size-smaller-than-minimum": str,
+            "record-route-options": str,
+            "redirects-sent": str,
+            "router-alert-options": str,
+            "strict-source-and-record-route-options": str,
+            "timestamp-and-address-options": str,
+            "timestamp-and-prespecified-address-options": str,
+            "timestamp-options": str,
+            "transit-re-packets-dropped-on-mgmt-interface": str,
+        },
+        Optional("ip6"): {
+            "total-packets-received": str,
+            "duplicate-or-out-of-space-fragments-dropped": str,
+            "failures-of-source-address-selection": str,
+            "forward-cache-hit": str,
+            "forward-cache-miss": str,
+            "fragments-that-exceeded-limit": str,
+            "header-type": Use(ip6_header_type),
+            "histogram": str,
+            "ip6-datagrams-that-can-not-be-fragmented": str,
+            "ip6-fragments-created": str,
+            "ip6-fragments-dropped-after-timeout": str,
+            "ip6-fragments-received": str,
+            "ip6-option-packets-dropped-due-to-rate-limit": str,
+            "ip6-output-datagrams-fragmented": str,
+            "ip6-output-packets-discarded-due-to-no-route": str,
+            "ip6-output-packets-dropped-due-to-no-bufs": str,
+            "ip6-packets-destined-to-dead-next-hop": str,
+            "ip6-packets-dropped": str,
+            "ip6-packets-for-this-host": str,
+            "ip6-packets-forwarded": str,
+            "ip6-packets-not-forwardable": str,
+            "ip6-packets-reassembled-ok": str,
+            "ip6-packets-sent-from-this-host": str,
+            "ip6-packets-sent-with-fabricated-ip-header": str,
+            "ip6-packets-with-bad-options": str,
+            "ip6-packets-with-incorrect-version-number": str,
+            "ip6-packets-with-size-smaller-than-minimum": str,
+            "ip6-redirects-sent": str,
+            "ip6nh-icmp6": str,
+            "ip6nh-ospf": str,
+            "ip6nh-tcp": str,
+            "ip6nh-udp": str,
+            "multicast-packets-which-we-do-not-join": str,
+            "packets-discarded-due-to-too-may-headers": str,
+            "packets-dropped-due-to-bad-protocol": str,
+            "packets-that-violated-scope-rules": str,
+            "packets-whose-headers-are-not-continuous": str,
+            "packets-with-datasize-less-than-data-length": str,
+            "transit-re-packet-dropped-on-mgmt-interface": str,
+            "tunneling-packets-that-can-not-find-gif": str,
+        },
+        Optional("ipcomp"): {
+            "ipcomp-bytes-in": str,
+            "ipcomp-bytes-out": str,
+            "ipcomp-crypto-processing-failure": str,
+            "ipcomp-packets-blocked-due-to-policy": str,
+            "ipcomp-packets-dropped-as-invalid-tdb": str,
+            "ipcomp-packets-dropped-as-larger-than-ip-maxpacket": str,
+            "ipcomp-packets-dropped-as-protocol-not-supported": str,
+            "ipcomp-packets-dropped-due-to-bad-kcr": str,
+            "ipcomp-packets-dropped-due-to-no-tdb": str,
+            "ipcomp-packets-dropped-due-to-no-transform": str,
+            "ipcomp-packets-dropped-due-to-queue-full": str,
+            "ipcomp-packets-in": str,
+            "ipcomp-packets-out": str,
+            "ipcomp-packets-shorter-than-header-shows": str,
+            "ipcomp-replay-counter-wrap": str,
+            "packets-sent-uncompressed-threshold": str,
+            "packets-sent-uncompressed-useless": str,
+        },
+        Optional("ipsec"): {
+            "cluster-coalesced-during-clone": str,
+            "cluster-copied-during-clone": str,
+            "inbound-packets-violated-process-security-policy": str,
+            "invalid-outbound-packets": str,
+            "mbuf-coalesced-during-clone": str,
+            "mbuf-inserted-during-makespace": str,
+            "outbound-packets-failed-due-to-insufficient-memory": str,
+            "outbound-packets-violated-process-security-policy": str,
+            "outbound-packets-with-bundled-sa": str,
+            "outbound-packets-with-no-route": str,
+            "outbound-packets-with-no-sa-available": str,
+        },
+        Optional("ipsec6"): {
+            "cluster-coalesced-during-clone": str,
+            "cluster-copied-during-clone": str,
+            "inbound-packets-violated-process-security-policy": str,
+            "invalid-outbound-packets": str,
+            "mbuf-coalesced-during-clone": str,
+            "mbuf-inserted-during-makespace": str,
+            "outbound-packets-failed-due-to-insufficient-memory": str,
+            "outbound-packets-violated-process-security-policy": str,
+            "outbound-packets-with-bundled-sa": str,
+            "outbound-packets-with-no-route": str,
+            "outbound-packets-with-no-sa-available": str,
+        },
+        Optional("mpls"): {
+            "after-tagging-packets-can-not-fit-link-mtu": str,
+            "lsp-ping-packets": str,
+            "packets-dropped-at-mpls-socket-send": str,
+            "packets-dropped-at-p2mp-cnh-output": str,
+            "packets-dropped-due-to-ifl-down": str,
+            "packets-forwarded-at-mpls-socket-send": str,
+            "packets-with-header-too-small": str,
+            "packets-with-ipv4-explicit-null-checksum-errors": str,
+            "packets-with-ipv4-explicit-null-tag": str,
+            "packets-with-router-alert-tag": str,
+            "packets-with-tag-encoding-error": str,
+            "packets-with-ttl-expired": str,
+            "total-mpls-packets-received": str,
+            "packets-discarded-due-to-no-route": str,
+            "packets-dropped": str,
+            "packets-forwarded": str,
+            "packets-used-first-nexthop-in-ecmp-unilist": str,
+        },
+        Optional("pfkey"): {
+            "bytes-sent-from-userland": str,
+            "bytes-sent-to-userland": str,
+            "incoming-messages-with-memory-allocation-failure": str,
+            "input-histogram": {
+                "add": str,
+                "dump": str,
+                "reserved": str,
                 "histogram": str,
-                "ip6-datagrams-that-can-not-be-fragmented": str,
-                "ip6-fragments-created": str,
-                "ip6-fragments-dropped-after-timeout": str,
-                "ip6-fragments-received": str,
-                "ip6-option-packets-dropped-due-to-rate-limit": str,
-                "ip6-output-datagrams-fragmented": str,
-                "ip6-output-packets-discarded-due-to-no-route": str,
-                "ip6-output-packets-dropped-due-to-no-bufs": str,
-                "ip6-packets-destined-to-dead-next-hop": str,
-                "ip6-packets-dropped": str,
-                "ip6-packets-for-this-host": str,
-                "ip6-packets-forwarded": str,
-                "ip6-packets-not-forwardable": str,
-                "ip6-packets-reassembled-ok": str,
-                "ip6-packets-sent-from-this-host": str,
-                "ip6-packets-sent-with-fabricated-ip-header": str,
-                "ip6-packets-with-bad-options": str,
-                "ip6-packets-with-incorrect-version-number": str,
-                "ip6-packets-with-size-smaller-than-minimum": str,
-                "ip6-redirects-sent": str,
-                "ip6nh-icmp6": str,
-                "ip6nh-ospf": str,
-                "ip6nh-tcp": str,
-                "ip6nh-udp": str,
-                "multicast-packets-which-we-do-not-join": str,
-                "packets-discarded-due-to-too-may-headers": str,
-                "packets-dropped-due-to-bad-protocol": str,
-                "packets-that-violated-scope-rules": str,
-                "packets-whose-headers-are-not-continuous": str,
-                "packets-with-datasize-less-than-data-length": str,
-                "transit-re-packet-dropped-on-mgmt-interface": str,
-                "tunneling-packets-that-can-not-find-gif": str,
-            },
-            Optional("ipcomp"): {
-                "ipcomp-bytes-in": str,
-                "ipcomp-bytes-out": str,
-                "ipcomp-crypto-processing-failure": str,
-                "ipcomp-packets-blocked-due-to-policy": str,
-                "ipcomp-packets-dropped-as-invalid-tdb": str,
-                "ipcomp-packets-dropped-as-larger-than-ip-maxpacket": str,
-                "ipcomp-packets-dropped-as-protocol-not-supported": str,
-                "ipcomp-packets-dropped-due-to-bad-kcr": str,
-                "ipcomp-packets-dropped-due-to-no-tdb": str,
-                "ipcomp-packets-dropped-due-to-no-transform": str,
-                "ipcomp-packets-dropped-due-to-queue-full": str,
-                "ipcomp-packets-in": str,
-                "ipcomp-packets-out": str,
-                "ipcomp-packets-shorter-than-header-shows": str,
-                "ipcomp-replay-counter-wrap": str,
-                "packets-sent-uncompressed-threshold": str,
-                "packets-sent-uncompressed-useless": str,
-            },
-            Optional("ipsec"): {
-                "cluster-coalesced-during-clone": str,
-                "cluster-copied-during-clone": str,
-                "inbound-packets-violated-process-security-policy": str,
-                "invalid-outbound-packets": str,
-                "mbuf-coalesced-during-clone": str,
-                "mbuf-inserted-during-makespace": str,
-                "outbound-packets-failed-due-to-insufficient-memory": str,
-                "outbound-packets-violated-process-security-policy": str,
-                "outbound-packets-with-bundled-sa": str,
-                "outbound-packets-with-no-route": str,
-                "outbound-packets-with-no-sa-available": str,
-            },
-            Optional("ipsec6"): {
-                "cluster-coalesced-during-clone": str,
-                "cluster-copied-during-clone": str,
-                "inbound-packets-violated-process-security-policy": str,
-                "invalid-outbound-packets": str,
-                "mbuf-coalesced-during-clone": str,
-                "mbuf-inserted-during-makespace": str,
-                "outbound-packets-failed-due-to-insufficient-memory": str,
-                "outbound-packets-violated-process-security-policy": str,
-                "outbound-packets-with-bundled-sa": str,
-                "outbound-packets-with-no-route": str,
-                "outbound-packets-with-no-sa-available": str,
             },
-            Optional("mpls"): {
-                "after-tagging-packets-can-not-fit-link-mtu": str,
-                "lsp-ping-packets": str,
-                "packets-dropped-at-mpls-socket-send": str,
-                "packets-dropped-at-p2mp-cnh-output": str,
-                "packets-dropped-due-to-ifl-down": str,
-                "packets-forwarded-at-mpls-socket-send": str,
-                "packets-with-header-too-small": str,
-                "packets-with-ipv4-explicit-null-checksum-errors": str,
-                "packets-with-ipv4-explicit-null-tag": str,
-                "packets-with-router-alert-tag": str,
-                "packets-with-tag-encoding-error": str,
-                "packets-with-ttl-expired": str,
-                "total-mpls-packets-received": str,
-                "packets-discarded-due-to-no-route": str,
-                "packets-dropped": str,
-                "packets-forwarded": str,
-                "packets-used-first-nexthop-in-ecmp-unilist": str,
-            },
-            Optional("pfkey"): {
-                "bytes-sent-from-userland": str,
-                "bytes-sent-to-userland": str,
-                "incoming-messages-with-memory-allocation-failure": str,
-                "input-histogram": {
-                    "add": str,
-                    "dump": str,
-                    "reserved": str,
-                    "histogram": str,
-                },
-                "messages-too-short": str,
-                "messages-toward-all-sockets": str,
-                "messages-toward-registered-sockets": str,
-                "messages-toward-single-socket": str,
-                "messages-with-duplicate-extension": str,
-                "messages-with-invalid-address-extension": str,
-                "messages-with-invalid-extension-type": str,
-                "messages-with-invalid-length-field": str,
-                "messages-with-invalid-message-type-field": str,
-                "messages-with-invalid-sa-type": str,
-                "messages-with-invalid-version-field": str,
-                "outgoing-messages-with-memory-allocation-failure": str,
-                "output-histogram": {
-                    "add": str,
-                    "dump": str,
-                    "histogram": str,
-                    "reserved": str,
-                },
-                "requests-sent-from-userland": str,
-                "requests-sent-to-userland": str,
-            },
-            Optional("raw-interface"): {
-                "dialer-packets-received": str,
-                "dialer-packets-transmitted": str,
-                "faboam-packets-dropped": str,
-                "faboam-packets-received": str,
-                "faboam-packets-transmitted": str,
-                "fibre-channel-packets-dropped": str,
-                "fibre-channel-packets-received": str,
-                "fibre-channel-packets-transmitted": str,
-                "fip-packets-dropped": str,
-                "fip-packets-received": str,
-                "fip-packets-transmitted": str,
-                "igmpl2-packets-received": str,
-                "igmpl2-packets-transmitted": str,
-                "input-drops-due-to-bogus-protocol": str,
-                "input-drops-due-to-no-mbufs-available": str,
-                "input-drops-due-to-no-socket": str,
-                "input-drops-due-to-no-space-in-socket": str,
-                "isdn-packets-received": str,
-                "isdn-packets-transmitted": str,
-                "lacp-packets-dropped": str,
-                "lacp-packets-received": str,
-                "lacp-packets-transmitted": str,
-                "mldl2-packets-received": str,
-                "mldl2-packets-transmitted": str,
-                "mpu-packets-received": str,
-                "mpu-packets-transmitted": str,
-                "output-drops-due-to-transmit-error": str,
-                "ppoe-packets-transmitted": str,
-                "ppp-packets-received-from-jppd": str,
-                "ppp-packets-received-from-pppd": str,
-                "ppp-packets-transmitted-to-jppd": str,
-                "ppp-packets-transmitted-to-pppd": str,
-                "pppoe-packets-received": str,
-                "raw-packets-transmitted": str,
-                "stp-packets-dropped": str,
-                "stp-packets-received": str,
-                "stp-packets-transmitted": str,
-                "vccp-packets-dropped": str,
-                "vccp-packets-received": str,
-                "vccp-packets-transmitted": str,
-            },
-            Optional("rdp"): {
-                "acks-received": str,
-                "acks-sent": str,
-                "closes": str,
-                "connects": str,
-                "input-packets": str,
-                "keepalives-received": str,
-                "keepalives-sent": str,
-                "output-packets": str,
-                "packets-discarded-due-to-bad-sequence-number": str,
-                "packets-discarded-for-bad-checksum": str,
-                "packets-dropped-due-to-full-socket-buffers": str,
-                "packets-dropped-full-repl-sock-buf": str,
-                "refused-connections": str,
-                "retransmits": str,
-            },
-            Optional("tcp"): {
-                "aborted": str,
-                "packets-received": str,
-                "packets-sent": str,
-                "ack-header-predictions": str,
-                "acks-bytes": str,
-                "acks-sent-in-response-but-not-exact-rsts": str,
-                "acks-sent-in-response-to-syns-on-established-connections":
-                str,
-                "attempts": str,
-                "bad-connection-attempts": str,
-                "badack": str,
-                "bucket-overflow": str,
-                "byte-retransmits": str,
-                "bytes": str,
-                "cache-overflow": str,
-                "completed": str,
-                "connection-accepts": str,
-                "connection-requests": str,
-                "connections-closed": str,
-                "connections-dropped-by-persist-timeout": str,
-                "connections-dropped-by-retransmit-timeout": str,
-                "connections-established": str,
-                "connections-updated-rtt-on-close": str,
-                "connections-updated-ssthresh-on-close": str,
-                "connections-updated-variance-on-close": str,
-                "cookies-received": str,
-                "cookies-sent": str,
-                "data-packet-header-predictions": str,
-                "data-packets-bytes": str,
-                "dropped": str,
-                "drops": str,
-                "duplicate-in-bytes": str,
-                "dupsyn": str,
-                "embryonic-connections-dropped": str,
-                "icmp-packets-ignored": str,
-                "in-sequence-bytes": str,
-                "keepalive-connections-dropped": str,
-                "keepalive-probes-sent": str,
-                "keepalive-timeouts": str,
-                "listen-queue-overflows": str,
-                "out-of-order-in-bytes": str,
-                "out-of-sequence-segment-drops": str,
-                "outgoing-segments-dropped": str,
-                "packets-received-after-close": str,
-                "packets-received-in-sequence": str,
-                "persist-timeouts": str,
-                "rcv-packets-dropped": str,
-                "rcv-packets-dropped-due-to-bad-address": str,
-                "received-acks": str,
-                "received-acks-for-unsent-data": str,
-                "received-completely-duplicate-packet": str,
-                "received-discarded-because-packet-too-short": str,
-                "received-discarded-for-bad-checksum": str,
-                "received-discarded-for-bad-header-offset": str,
-                "received-duplicate-acks": str,
-                "received-old-duplicate-packets": str,
-                "received-out-of-order-packets": str,
-                "received-packets-of-data-after-window": str,
-                "received-packets-with-some-dupliacte-data": str,
-                "received-window-probes": str,
-                "received-window-update-packets": str,
-                "reset": str,
-                "retransmit-timeouts": str,
-                "retransmitted": str,
-                "retransmitted-bytes": str,
-                "rst-packets": str,
-                "sack-opitions-sent": str,
-                "sack-options-received": str,
-                "sack-recovery-episodes": str,
-                "sack-scoreboard-overflow": str,
-                "segment-retransmits": str,
-                "segments-updated-rtt": str,
-                "send-packets-dropped": str,
-                "sent-ack-only-packets": str,
-                "sent-control-packets": str,
-                "sent-data-packets": str,
-                "sent-data-packets-retransmitted": str,
-                "sent-packets-delayed": str,
-                "sent-resends-by-mtu-discovery": str,
-                "sent-urg-only-packets": str,
-                "sent-window-probe-packets": str,
-                "sent-window-update-packets": str,
-                "some-duplicate-in-bytes": str,
-                "stale": str,
-                "syncache-entries-added": str,
-                "unreach": str,
-                "zone-failures": str,
-            },
-            Optional("tnp"): {
-                "broadcast-packets-received": str,
-                "broadcast-packets-sent": str,
-                "control-packets-received": str,
-                "control-packets-sent": str,
-                "fragment-reassembly-queue-flushes": str,
-                "fragmented-packets-received": str,
-                "fragmented-packets-sent": str,
-                "hello-packets-received": str,
-                "hello-packets-sent": str,
-                "input-packets-discarded-with-no-protocol": str,
-                "packets-of-version-unspecified-received": str,
-                "packets-of-version-unspecified-sent": str,
-                "packets-of-version1-received": str,
-                "packets-of-version1-sent": str,
-                "packets-of-version2-received": str,
-                "packets-of-version2-sent": str,
-                "packets-of-version3-received": str,
-                "packets-of-version3-sent": str,
-                "packets-sent-with-unknown-protocol": str,
-                "packets-with-tnp-src-address-collision-received": str,
-                "rdp-packets-received": str,
-                "rdp-packets-sent": str,
-                "received-fragments-dropped": str,
-                "received-hello-packets-dropped": str,
-                "sent-fragments-dropped": str,
-                "sent-hello-packets-dropped": str,
-                "tunnel-packets-received": str,
-                "tunnel-packets-sent": str,
-                "udp-packets-received": str,
-                "udp-packets-sent": str,
-                "unicast-packets-received": str,
-                "unicast-packets-sent": str,
-            },
-            Optional("ttp"): {
-                "arp-l3-packets-received": str,
-                "clnp-l3-packets-received": str,
-                "cyclotron-cycle-l3-packets-received": str,
-                "cyclotron-send-l3-packets-received": str,
-                "input-packets-could-not-get-buffer": str,
-                "input-packets-for-which-route-lookup-is-bypassed": str,
-                "input-packets-tlv-dropped": str,
-                "input-packets-with-bad-af": str,
-                "input-packets-with-bad-tlv-header": str,
-                "input-packets-with-bad-tlv-type": str,
-                "input-packets-with-bad-type": str,
-                "input-packets-with-discard-type": str,
-                "input-packets-with-too-many-tlvs": str,
-                "input-packets-with-ttp-tlv-p2mp-nbr-nhid-type": str,
-                "input-packets-with-unknown-p2mp-nbr-nhid": str,
-                "input-packets-with-vxlan-bfd-pkts": str,
-                "ipv4-l3-packets-received": str,
-                "ipv4-to-mpls-l3-packets-received": str,
-                "ipv6-l3-packets-received": str,
-                "l2-packets-received": str,
-                "l3-packets-dropped": str,
-                "l3-packets-sent-could-not-get-buffer": str,
-                "mpls-l3-packets-received": str,
-                "mpls-to-ipv4-l3-packets-received": str,
-                "null-l3-packets-received": str,
-                "openflow-packets-received": str,
-                "packets-received-from-unknown-ifl": str,
-                "packets-received-while-unconnected": str,
-                "packets-sent-could-not-find-neighbor": str,
-                "packets-sent-could-not-get-buffer": str,
-                "packets-sent-when-host_unreachable": str,
-                "packets-sent-when-transmit-disabled": str,
-                "packets-sent-while-interface-down": str,
-                "packets-sent-while-unconnected": str,
-                "packets-sent-with-bad-af": str,
-                "packets-sent-with-bad-ifl": str,
-                "tnp-l3-packets-received": str,
-                "ttp-packets-sent": str,
-                "unknown-l3-packets-received": str,
-                "vpls-l3-packets-received": str,
-            },
-            Optional("tudp"): {
-                "broadcast-or-multicast-datagrams-dropped-due-to-no-socket":
-                str,
-                "datagrams-dropped-due-to-full-socket-buffers": str,
-                "datagrams-dropped-due-to-no-socket": str,
-                "datagrams-output": str,
-                "datagrams-with-bad-checksum": str,
-                "datagrams-with-bad-data-length-field": str,
-                "datagrams-with-incomplete-header": str,
-                "delivered": str,
-                "datagrams-received": str,
-            },
-            Optional("udp"): {
-                "broadcast-or-multicast-datagrams-dropped-due-to-no-socket":
-                str,
-                "datagrams-delivered": str,
-                "datagrams-dropped-due-to-full-socket-buffers": str,
-                "datagrams-dropped-due-to-no-socket": str,
-                "datagrams-not-for-hashed-pcb": str,
-                "datagrams-output": str,
-                "datagrams-received": str,
-                "datagrams-with-bad-checksum": str,
-                "datagrams-with-bad-datalength-field": str,
-                "datagrams-with-incomplete-header": str,
-            },
-            Optional("bridge"): {
-                "aging-acks-from-pfe": str,
-                "aging-non-acks-from-pfe": str,
-                "aging-requests-over-max-rate": str,
-                "aging-requests-timed-out-waiting-on-fes": str,
-                "bogus-address-in-aging-requests": str,
-                "errors-finding-peer-fes": str,
-                "learning-requests-over-capacity": str,
-                "learning-requests-while-learning-disabled-on-interface": str,
-                "mac-route-aging-requests": str,
-                "mac-route-learning-requests": str,
-                "mac-routes-aged": str,
-                "mac-routes-learned": str,
-                "mac-routes-moved": str,
-                "packets-dropped-due-to-no-l3-route-table": str,
-                "packets-dropped-due-to-no-local-ifl": str,
-                "packets-dropped-due-to-no-socket": str,
-                "packets-for-this-host": str,
-                "packets-punted": str,
-                "packets-received": str,
-                "packets-with-incorrect-version-number": str,
-                "packets-with-no-auxiliary-table": str,
-                "packets-with-no-ce-facing-entry": str,
-                "packets-with-no-core-facing-entry": str,
-                "packets-with-no-family": str,
-                "packets-with-no-logical-interface": str,
-                "packets-with-no-route-table": str,
-                "packets-with-size-smaller-than-minimum": str,
-                "requests-involving-multiple-peer-fes": str,
-                "requests-to-age-static-route": str,
-                "requests-to-learn-an-existing-route": str,
-                "requests-to-move-static-route": str,
-                "requests-to-re-ageout-aged-route": str,
-                "unsupported-platform": str,
-            },
-            Optional("vpls"): {
-                "aging-acks-from-pfe": str,
-                "aging-non-acks-from-pfe": str,
-                "aging-requests-over-max-rate": str,
-                "aging-requests-timed-out-waiting-on-fes": str,
-                "bogus-address-in-aging-requests": str,
-                "errors-finding-peer-fes": str,
-                "learning-requests-over-capacity": str,
-                "learning-requests-while-learning-disabled-on-interface": str,
-                "mac-route-aging-requests": str,
-                "mac-route-learning-requests": str,
-                "mac-routes-aged": str,
-                "mac-routes-learned": str,
-                "mac-routes-moved": str,
-                "packets-dropped-due-to-no-l3-route-table": str,
-                "packets-dropped-due-to-no-local-ifl": str,
-                "packets-dropped-due-to-no-socket": str,
-                "packets-for-this-host": str,
-                "packets-punted": str,
-                "packets-received": str,
-                "packets-with-incorrect-version-number": str,
-                "packets-with-no-auxiliary-table": str,
-                "packets-with-no-ce-facing-entry": str,
-                "packets-with-no-core-facing-entry": str,
-                "packets-with-no-family": str,
-                "packets-with-no-logical-interface": str,
-                "packets-with-no-route-table": str,
-                "packets-with-size-smaller-than-minimum": str,
-                "requests-involving-multiple-peer-fes": str,
-                "requests-to-age-static-route": str,
-                "requests-to-learn-an-existing-route": str,
-                "requests-to-move-static-route": str,
-                "requests-to-re-ageout-aged-route": str,
-                "unsupported-platform": str,
+            "messages-too-short": str,
+            "messages-toward-all-sockets": str,
+            "messages-toward-registered-sockets": str,
+            "messages-toward-single-socket": str,
+            "messages-with-duplicate-extension": str,
+            "messages-with-invalid-address-extension": str,
+            "messages-with-invalid-extension-type": str,
+            "messages-with-invalid-length-field": str,
+            "messages-with-invalid-message-type-field": str,
+            "messages-with-invalid-sa-type": str,
+            "messages-with-invalid-version-field": str,
+            "outgoing-messages-with-memory-allocation-failure": str,
+            "output-histogram": {
+                "add": str,
+                "dump": str,
+                "histogram": str,
+                "reserved": str,
             },
-        })
-        for item in value:
-            statistics_schema.validate(item)
-        return value
+            "requests-sent-from-userland": str,
+            "requests-sent-to-userland": str,
+        },
+        Optional("raw-interface"): {
+            "dialer-packets-received": str,
+            "dialer-packets-transmitted": str,
+            "faboam-packets-dropped": str,
+            "faboam-packets-received": str,
+            "faboam-packets-transmitted": str,
+            "fibre-channel-packets-dropped": str,
+            "fibre-channel-packets-received": str,
+            "fibre-channel-packets-transmitted": str,
+            "fip-packets-dropped": str,
+            "fip-packets-received": str,
+            "fip-packets-transmitted": str,
+            "igmpl2-packets-received": str,
+            "igmpl2-packets-transmitted": str,
+            "input-drops-due-to-bogus-protocol": str,
+            "input-drops-due-to-no-mbufs-available": str,
+            "input-drops-due-to-no-socket": str,
+            "input-drops-due-to-no-space-in-socket": str,
+            "isdn-packets-received": str,
+            "isdn-packets-transmitted": str,
+            "lacp-packets-dropped": str,
+            "lacp-packets-received": str,
+            "lacp-packets-transmitted": str,
+            "mldl2-packets-received": str,
+            "mldl2-packets-transmitted": str,
+            "mpu-packets-received": str,
+            "mpu-packets-transmitted": str,
+            "output-drops-due-to-transmit-error": str,
+            "ppoe-packets-transmitted": str,
+            "ppp-packets-received-from-jppd": str,
+            "ppp-packets-received-from-pppd": str,
+            "ppp-packets-transmitted-to-jppd": str,
+            "ppp-packets-transmitted-to-pppd": str,
+            "pppoe-packets-received": str,
+            "raw-packets-transmitted": str,
+            "stp-packets-dropped": str,
+            "stp-packets-received": str,
+            "stp-packets-transmitted": str,
+            "vccp-packets-dropped": str,
+            "vccp-packets-received": str,
+            "vccp-packets-transmitted": str,
+        },
+        Optional("rdp"): {
+            "acks-received": str,
+            "acks-sent": str,
+            "closes": str,
+            "connects": str,
+            "input-packets": str,
+            "keepalives-received": str,
+            "keepalives-sent": str,
+            "output-packets": str,
+            "packets-discarded-due-to-bad-sequence-number": str,
+            "packets-discarded-for-bad-checksum": str,
+            "packets-dropped-due-to-full-socket-buffers": str,
+            "packets-dropped-full-repl-sock-buf": str,
+            "refused-connections": str,
+            "retransmits": str,
+        },
+        Optional("tcp"): {
+            "aborted": str,
+            "packets-received": str,
+            "packets-sent": str,
+            "ack-header-predictions": str,
+            "acks-bytes": str,
+            "acks-sent-in-response-but-not-exact-rsts": str,
+            "acks-sent-in-response-to-syns-on-established-connections":
+            str,
+            "attempts": str,
+            "bad-connection-attempts": str,
+            "badack": str,
+            "bucket-overflow": str,
+            "byte-retransmits": str,
+            "bytes": str,
+            "cache-overflow": str,
+            "completed": str,
+            "connection-accepts": str,
+            "connection-requests": str,
+            "connections-closed": str,
+            "connections-dropped-by-persist-timeout": str,
+            "connections-dropped-by-retransmit-timeout": str,
+            "connections-established": str,
+            "connections-updated-rtt-on-close": str,
+            "connections-updated-ssthresh-on-close": str,
+            "connections-updated-variance-on-close": str,
+            "cookies-received": str,
+            "cookies-sent": str,
+            "data-packet-header-predictions": str,
+            "data-packets-bytes": str,
+            "dropped": str,
+            "drops": str,
+            "duplicate-in-bytes": str,
+            "dupsyn": str,
+            "embryonic-connections-dropped": str,
+            "icmp-packets-ignored": str,
+            "in-sequence-bytes": str,
+            "keepalive-connections-dropped": str,
+            "keepalive-probes-sent": str,
+            "keepalive-timeouts": str,
+            "listen-queue-overflows": str,
+            "out-of-order-in-bytes": str,
+            "out-of-sequence-segment-drops": str,
+            "outgoing-segments-dropped": str,
+            "packets-received-after-close": str,
+            "packets-received-in-sequence": str,
+            "persist-timeouts": str,
+            "rcv-packets-dropped": str,
+            "rcv-packets-dropped-due-to-bad-address": str,
+            "received-acks": str,
+            "received-acks-for-unsent-data": str,
+            "received-completely-duplicate-packet": str,
+            "received-discarded-because-packet-too-short": str,
+            "received-discarded-for-bad-checksum": str,
+            "received-discarded-for-bad-header-offset": str,
+            "received-duplicate-acks": str,
+            "received-old-duplicate-packets": str,
+            "received-out-of-order-packets": str,
+            "received-packets-of-data-after-window": str,
+            "received-packets-with-some-dupliacte-data": str,
+            "received-window-probes": str,
+            "received-window-update-packets": str,
+            "reset": str,
+            "retransmit-timeouts": str,
+            "retransmitted": str,
+            "retransmitted-bytes": str,
+            "rst-packets": str,
+            "sack-opitions-sent": str,
+            "sack-options-received": str,
+            "sack-recovery-episodes": str,
+            "sack-scoreboard-overflow": str,
+            "segment-retransmits": str,
+            "segments-updated-rtt": str,
+            "send-packets-dropped": str,
+            "sent-ack-only-packets": str,
+            "sent-control-packets": str,
+            "sent-data-packets": str,
+            "sent-data-packets-retransmitted": str,
+            "sent-packets-delayed": str,
+            "sent-resends-by-mtu-discovery": str,
+            "sent-urg-only-packets": str,
+            "sent-window-probe-packets": str,
+            "sent-window-update-packets": str,
+            "some-duplicate-in-bytes": str,
+            "stale": str,
+            "syncache-entries-added": str,
+            "unreach": str,
+            "zone-failures": str,
+        },
+        Optional("tnp"): {
+            "broadcast-packets-received": str,
+            "broadcast-packets-sent": str,
+            "control-packets-received": str,
+            "control-packets-sent": str,
+            "fragment-reassembly-queue-flushes": str,
+            "fragmented-packets-received": str,
+            "fragmented-packets-sent": str,
+            "hello-packets-received": str,
+            "hello-packets-sent": str,
+            "input-packets-discarded-with-no-protocol": str,
+            "packets-of-version-unspecified-received": str,
+            "packets-of-version-unspecified-sent": str,
+            "packets-of-version1-received": str,
+            "packets-of-version1-sent": str,
+            "packets-of-version2-received": str,
+            "packets-of-version2-sent": str,
+            "packets-of-version3-received": str,
+            "packets-of-version3-sent": str,
+            "packets-sent-with-unknown-protocol": str,
+            "packets-with-tnp-src-address-collision-received": str,
+            "rdp-packets-received": str,
+            "rdp-packets-sent": str,
+            "received-fragments-dropped": str,
+            "received-hello-packets-dropped": str,
+            "sent-fragments-dropped": str,
+            "sent-hello-packets-dropped": str,
+            "tunnel-packets-received": str,
+            "tunnel-packets-sent": str,
+            "udp-packets-received": str,
+            "udp-packets-sent": str,
+            "unicast-packets-received": str,
+            "unicast-packets-sent": str,
+        },
+        Optional("ttp"): {
+            "arp-l3-packets-received": str,
+            "clnp-l3-packets-received": str,
+            "cyclotron-cycle-l3-packets-received": str,
+            "cyclotron-send-l3-packets-received": str,
+            "input-packets-could-not-get-buffer": str,
+            "input-packets-for-which-route-lookup-is-bypassed": str,
+            "input-packets-tlv-dropped": str,
+            "input-packets-with-bad-af": str,
+            "input-packets-with-bad-tlv-header": str,
+            "input-packets-with-bad-tlv-type": str,
+            "input-packets-with-bad-type": str,
+            "input-packets-with-discard-type": str,
+            "input-packets-with-too-many-tlvs": str,
+            "input-packets-with-ttp-tlv-p2mp-nbr-nhid-type": str,
+            "input-packets-with-unknown-p2mp-nbr-nhid": str,
+            "input-packets-with-vxlan-bfd-pkts": str,
+            "ipv4-l3-packets-received": str,
+            "ipv4-to-mpls-l3-packets-received": str,
+            "ipv6-l3-packets-received": str,
+            "l2-packets-received": str,
+            "l3-packets-dropped": str,
+            "l3-packets-sent-could-not-get-buffer": str,
+            "mpls-l3-packets-received": str,
+            "mpls-to-ipv4-l3-packets-received": str,
+            "null-l3-packets-received": str,
+            "openflow-packets-received": str,
+            "packets-received-from-unknown-ifl": str,
+            "packets-received-while-unconnected": str,
+            "packets-sent-could-not-find-neighbor": str,
+            "packets-sent-could-not-get-buffer": str,
+            "packets-sent-when-host_unreachable": str,
+            "packets-sent-when-transmit-disabled": str,
+            "packets-sent-while-interface-down": str,
+            "packets-sent-while-unconnected": str,
+            "packets-sent-with-bad-af": str,
+            "packets-sent-with-bad-ifl": str,
+            "tnp-l3-packets-received": str,
+            "ttp-packets-sent": str,
+            "unknown-l3-packets-received": str,
+            "vpls-l3-packets-received": str,
+        },
+        Optional("tudp"): {
+            "broadcast-or-multicast-datagrams-dropped-due-to-no-socket":
+            str,
+            "datagrams-dropped-due-to-full-socket-buffers": str,
+            "datagrams-dropped-due-to-no-socket": str,
+            "datagrams-output": str,
+            "datagrams-with-bad-checksum": str,
+            "datagrams-with-bad-data-length-field": str,
+            "datagrams-with-incomplete-header": str,
+            "delivered": str,
+            "datagrams-received": str,
+        },
+        Optional("udp"): {
+            "broadcast-or-multicast-datagrams-dropped-due-to-no-socket":
+            str,
+            "datagrams-delivered": str,
+            "datagrams-dropped-due-to-full-socket-buffers": str,
+            "datagrams-dropped-due-to-no-socket": str,
+            "datagrams-not-for-hashed-pcb": str,
+            "datagrams-output": str,
+            "datagrams-received": str,
+            "datagrams-with-bad-checksum": str,
+            "datagrams-with-bad-datalength-field": str,
+            "datagrams-with-incomplete-header": str,
+        },
+        Optional("bridge"): {
+            "aging-acks-from-pfe": str,
+            "aging-non-acks-from-pfe": str,
+            "aging-requests-over-max-rate": str,
+            "aging-requests-timed-out-waiting-on-fes": str,
+            "bogus-address-in-aging-requests": str,
+            "errors-finding-peer-fes": str,
+            "learning-requests-over-capacity": str,
+            "learning-requests-while-learning-disabled-on-interface": str,
+            "mac-route-aging-requests": str,
+            "mac-route-learning-requests": str,
+            "mac-routes-aged": str,
+            "mac-routes-learned": str,
+            "mac-routes-moved": str,
+            "packets-dropped-due-to-no-l3-route-table": str,
+            "packets-dropped-due-to-no-local-ifl": str,
+            "packets-dropped-due-to-no-socket": str,
+            "packets-for-this-host": str,
+            "packets-punted": str,
+            "packets-received": str,
+            "packets-with-incorrect-version-number": str,
+            "packets-with-no-auxiliary-table": str,
+            "packets-with-no-ce-facing-entry": str,
+            "packets-with-no-core-facing-entry": str,
+            "packets-with-no-family": str,
+            "packets-with-no-logical-interface": str,
+            "packets-with-no-route-table": str,
+            "packets-with-size-smaller-than-minimum": str,
+            "requests-involving-multiple-peer-fes": str,
+            "requests-to-age-static-route": str,
+            "requests-to-learn-an-existing-route": str,
+            "requests-to-move-static-route": str,
+            "requests-to-re-ageout-aged-route": str,
+            "unsupported-platform": str,
+        },
+        Optional("vpls"): {
+            "aging-acks-from-pfe": str,
+            "aging-non-acks-from-pfe": str,
+            "aging-requests-over-max-rate": str,
+            "aging-requests-timed-out-waiting-on-fes": str,
+            "bogus-address-in-aging-requests": str,
+            "errors-finding-peer-fes": str,
+            "learning-requests-over-capacity": str,
+            "learning-requests-while-learning-disabled-on-interface": str,
+            "mac-route-aging-requests": str,
+            "mac-route-learning-requests": str,
+            "mac-routes-aged": str,
+            "mac-routes-learned": str,
+            "mac-routes-moved": str,
+            "packets-dropped-due-to-no-l3-route-table": str,
+            "packets-dropped-due-to-no-local-ifl": str,
+            "packets-dropped-due-to-no-socket": str,
+            "packets-for-this-host": str,
+            "packets-punted": str,
+            "packets-received": str,
+            "packets-with-incorrect-version-number": str,
+            "packets-with-no-auxiliary-table": str,
+            "packets-with-no-ce-facing-entry": str,
+            "packets-with-no-core-facing-entry": str,
+            "packets-with-no-family": str,
+            "packets-with-no-logical-interface": str,
+            "packets-with-no-route-table": str,
+            "packets-with-size-smaller-than-minimum": str,
+            "requests-involving-multiple-peer-fes": str,
+            "requests-to-age-static-route": str,
+            "requests-to-learn-an-existing-route": str,
+            "requests-to-move-static-route": str,
+            "requests-to-re-ageout-aged-route": str,
+            "unsupported-platform": str,
+        },
+    }, 'statistics is not a list')
 
     schema = {"statistics": Use(statistics_list)}
 
@@ -5015,20 +4960,14 @@ class ShowSystemConnectionsSchema(MetaParser):
             ]
         }
     } """
-    def validate_system_connections_list(value):
-        if not isinstance(value, list):
-            raise SchemaError('connections-table is not a list')
-        connections_schema = Schema({
-            "proto": str,
-            "recv-q": str,
-            "send-q": str,
-            "local-address": str,
-            "foreign-address": str,
-            "state": str,
-        })
-        for item in value:
-            connections_schema.validate(item)
-        return value
+    validate_system_connections_list = list_of({
+        "proto": str,
+        "recv-q": str,
+        "send-q": str,
+        "local-address": str,
+        "foreign-address": str,
+        "state": str,
+    }, 'connections-table is not a list')
 
     schema = {
         "output": {
@@ -11,8 +11,10 @@ import re
 
 # metaparser
 from genie.metaparser import MetaParser
-from pyats.utils.exceptions import SchemaError
-from genie.metaparser.util.schemaengine import Schema, Any, Optional, Use
+from genie.metaparser.util.schemaengine import Any, Optional, Use
+
+# Parser utils
+from genie.libs.parser.utils.validators import list_of
 
 
 class ShowTedDatabaseExtensiveSchema(MetaParser):
@@ -386,23 +388,14 @@ class ShowTedDatabaseIpAddressSchema(MetaParser):
     }
     """
     # Subschema ted link
-    def validate_ted_link(val):
-        ''' Validates each value in ted link '''
-        if not isinstance(val, list):
-            raise SchemaError('ted link is not a list')
-        
-        ted_link_schema = Schema({
-            "ted-link-local-address": str,
-            "ted-link-local-ifindex": str,
-            "ted-link-protocol": str,
-            "ted-link-remote-address": str,
-            "ted-link-remote-ifindex": str,
-            "ted-link-to": str
-        })
-
-        for item in val:
-            ted_link_schema.validate(item)
-        return val
+    validate_ted_link = list_of({
+        "ted-link-local-address": str,
+        "ted-link-local-ifindex": str,
+        "ted-link-protocol": str,
+        "ted-link-remote-address": str,
+        "ted-link-remote-ifindex": str,
+        "ted-link-to": str
+    }, 'ted link is not a list')
     
     schema = {
         "ted-database-information": {
@@ -9,9 +9,11 @@ JunOs parsers for the following show commands:
 import re
 
 from genie.metaparser import MetaParser
-from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any,
-        Optional, Use, Schema)
+        Optional, Use)
+
+# Parser utils
+from genie.libs.parser.utils.validators import list_of
 
 class ShowVersionDetailSchema(MetaParser):
 
@@ -48,39 +50,23 @@ class ShowVersionDetailSchema(MetaParser):
     }
 } """
 
-    def validate_version_information_list(value):
-        # Pass ospf3-interface list as value
-        if not isinstance(value, list):
-            raise SchemaError('version_information is not a list')
-        version_information_schema = Schema({
-            "build-date": str,
-            Optional("build-number"): str,
-            "builder": str,
-            "component": str,
-            Optional("major"): str,
-            Optional("minor"): str,
-            "release": str,
-            Optional("release-category"): str,
-            Optional("spin"): str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            version_information_schema.validate(item)
-        return value
-
-
-    def validate_package_information_list(value):
-        # Pass ospf3-interface list as value
-        if not isinstance(value, list):
-            raise SchemaError('package_information is not a list')
-        package_information_schema = Schema({
-            "comment": str,
-            "name": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            package_information_schema.validate(item)
-        return value
+    validate_version_information_list = list_of({
+        "build-date": str,
+        Optional("build-number"): str,
+        "builder": str,
+        "component": str,
+        Optional("major"): str,
+        Optional("minor"): str,
+        "release": str,
+        Optional("release-category"): str,
+        Optional("spin"): str
+    }, 'version_information is not a list')
+
+
+    validate_package_information_list = list_of({
+        "comment": str,
+        "name": str
+    }, 'package_information is not a list')
 
         # Main Schema
     schema = {
@@ -342,18 +328,10 @@ class ShowVersionInvokeOnAllRoutingEnginesSchema(MetaParser):
     }
 } """
 
-    def validate_package_information_list(value):
-        # Pass ospf3-interface list as value
-        if not isinstance(value, list):
-            raise SchemaError('package_information is not a list')
-        package_information_schema = Schema({
-            "comment": str,
-            "name": str
-        })
-        # Validate each dictionary in list
-        for item in value:
-            package_information_schema.validate(item)
-        return value
+    validate_package_information_list = list_of({
+        "comment": str,
+        "name": str
+    }, 'package_information is not a list')
 
         # Main Schema
     schema = {
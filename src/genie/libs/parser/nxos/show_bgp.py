@@ -63,6 +63,10 @@ from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.records import build_output
+from genie.libs.parser.utils.stream import StreamParser, iter_lines
+from genie.libs.parser.utils.compiled_schema import CompiledSchemaParser
+from genie.libs.parser.utils.columnar import ColumnarParser
 
 
 # =====================================
@@ -1722,7 +1726,7 @@ class ShowBgpVrfAllAllSchema(MetaParser):
 # =================================
 # Parser for 'show bgp vrf all all'
 # =================================
-class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
+class ShowBgpVrfAllAll(StreamParser, ShowBgpVrfAllAllSchema):
     """Parser for show bgp vrf <vrf>> <address_family>"""
 
     cli_command = 'show bgp vrf {vrf} {address_family}'
@@ -1734,18 +1738,37 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
       'weight']
 
     def cli(self, vrf='all', address_family='all', output=None):
+        return build_output(self.iter_records(vrf=vrf,
+                                              address_family=address_family,
+                                              output=output))
+
+    @staticmethod
+    def _sorted_paths(record):
+        '''Prefix record with its paths ordered by next hop'''
+        prefix_dict = record[1]
+        if len(prefix_dict['index']) > 1:
+            sorted_list = sorted(prefix_dict['index'].values(),
+                                 key=lambda x: x['next_hop'])
+            prefix_dict['index'] = dict(enumerate(sorted_list, start=1))
+        return record
+
+    def iter_records(self, vrf='all', address_family='all', output=None):
+        """Yield the prefixes one at a time, see utils.records
+
+        Each prefix is yielded with all its paths, once the next prefix or
+        address family starts. The address families are yielded as records
+        of their own.
+        """
         if output is None:
             out = self.device.execute(self.cli_command.format(vrf=vrf,
                                                               address_family=address_family))
         else:
             out = output
 
-        # Init dictionary
-        parsed_dict = {}
-        af_dict = {}
-        prefix_dict = {}
-
         # Init vars
+        # address family and prefix being read, see utils.records
+        af_path = None
+        prefix_record = None
         index = 1
         data_on_nextline = False
         bgp_table_version = local_router_id = ''
@@ -1793,7 +1816,7 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
                                 ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
                                 ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
 
-        for line in out.splitlines():
+        for line in iter_lines(out):
             line = line.rstrip()
             # Network            Next Hop            Metric     LocPrf     Weight Path
             m = p.match(line)
@@ -1807,18 +1830,17 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
                 vrf_name = str(m.groupdict()['vrf_name'])
                 address_family = str(m.groupdict()['address_family']).lower()
                 original_address_family = address_family
-                if 'vrf' not in parsed_dict:
-                    parsed_dict['vrf'] = {}
-                if vrf_name not in parsed_dict['vrf']:
-                    parsed_dict['vrf'][vrf_name] = {}
-                if 'address_family' not in parsed_dict['vrf'][vrf_name]:
-                    parsed_dict['vrf'][vrf_name]['address_family'] = {}
-                if address_family not in parsed_dict['vrf'][vrf_name]\
-                    ['address_family']:
-                    parsed_dict['vrf'][vrf_name]['address_family'][address_family] = {}
+                if prefix_record:
+                    yield self._sorted_paths(prefix_record)
+                    prefix_record = None
 
-                # Set af_dict
-                af_dict = parsed_dict['vrf'][vrf_name]['address_family'][address_family]
+                # Set af_path
+                af_path = ('vrf', vrf_name, 'address_family', address_family)
+                yield (af_path, {})
+                continue
+
+            if af_path is None:
+                # not in any table yet
                 continue
 
             # BGP table version is 35, local router ID is 10.229.11.11
@@ -1827,8 +1849,9 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
             if m:
                 bgp_table_version = int(m.groupdict()['bgp_table_version'])
                 local_router_id = str(m.groupdict()['local_router_id'])
-                af_dict['bgp_table_version'] = bgp_table_version
-                af_dict['local_router_id'] = local_router_id
+                yield (af_path, {
+                    'bgp_table_version': bgp_table_version,
+                    'local_router_id': local_router_id})
                 continue
 
             #                     2001:db8:400:13b1:21a:1ff:fe00:161/128
@@ -1844,8 +1867,11 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
                         index += 1
 
                     # Init dict
-                    index_dict = af_dict.setdefault('prefixes', {}).setdefault(prefix, {})\
-                      .setdefault('index', {}).setdefault(index, {})
+                    if prefix_record is None:
+                        prefix_dict = {'index': {}}
+                        prefix_record = (af_path + ('prefixes', prefix),
+                                         prefix_dict)
+                    index_dict = prefix_dict['index'].setdefault(index, {})
 
                     # Set keys
                     index_dict['next_hop'] = next_hop
@@ -1873,47 +1899,47 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
                 status_codes = str(m.groupdict()['status_codes'])
                 path_type = str(m.groupdict()['path_type'])
                 prefix = str(m.groupdict()['prefix'])
+                if prefix_record:
+                    yield self._sorted_paths(prefix_record)
+                    prefix_record = None
                 if status_codes == 'None' or path_type == 'None' or prefix == 'None':
                     continue
                 # Init dict
-                if 'prefixes' not in af_dict:
-                    af_dict['prefixes'] = {}
-                if prefix not in af_dict['prefixes']:
-                    af_dict['prefixes'][prefix] = {}
-                if 'index' not in af_dict['prefixes'][prefix]:
-                    af_dict['prefixes'][prefix]['index'] = {}
-                if index not in af_dict['prefixes'][prefix]['index']:
-                    af_dict['prefixes'][prefix]['index'][index] = {}
+                prefix_dict = {'index': {}}
+                prefix_record = (af_path + ('prefixes', prefix), prefix_dict)
+                path_dict = prefix_dict['index'].setdefault(index, {})
 
                 # Set keys
-                af_dict['prefixes'][prefix]['index'][index]['status_codes'] = status_codes
-                af_dict['prefixes'][prefix]['index'][index]['path_type'] = path_type
+                path_dict['status_codes'] = status_codes
+                path_dict['path_type'] = path_type
                 if 'next_hop' in m.groupdict():
-                    af_dict['prefixes'][prefix]['index'][index]['next_hop'] = str(m.groupdict()['next_hop'])
+                    path_dict['next_hop'] = str(m.groupdict()['next_hop'])
                 if 'metric' in m.groupdict():
-                    af_dict['prefixes'][prefix]['index'][index]['metric'] = int(m.groupdict()['metric'])
+                    path_dict['metric'] = int(m.groupdict()['metric'])
                 if 'localprf' in m.groupdict():
-                    af_dict['prefixes'][prefix]['index'][index]['localprf'] = int(m.groupdict()['localprf'])
+                    path_dict['localprf'] = int(m.groupdict()['localprf'])
                 if 'weight' in m.groupdict():
-                    af_dict['prefixes'][prefix]['index'][index]['weight'] = int(m.groupdict()['weight'])
+                    path_dict['weight'] = int(m.groupdict()['weight'])
                 if 'path' in m.groupdict():
-                    af_dict['prefixes'][prefix]['index'][index]['path'] = m.groupdict()['path'].strip()
+                    path_dict['path'] = m.groupdict()['path'].strip()
                 if 'origin_codes' in m.groupdict():                
-                    af_dict['prefixes'][prefix]['index'][index]['origin_codes'] = str(m.groupdict()['origin_codes'])
+                    path_dict['origin_codes'] = str(m.groupdict()['origin_codes'])
                 
                 # Check if aggregate_address_ipv4_address
                 if 'a' in path_type:
                     address, mask = prefix.split("/")
                     if ':' in prefix:
-                        af_dict['v6_aggregate_address_ipv6_address'] = prefix
-                        af_dict['v6_aggregate_address_as_set'] = True
-                        af_dict['v6_aggregate_address_summary_only'] = True
+                        yield (af_path, {
+                            'v6_aggregate_address_ipv6_address': prefix,
+                            'v6_aggregate_address_as_set': True,
+                            'v6_aggregate_address_summary_only': True})
                         continue
                     else:
-                        af_dict['aggregate_address_ipv4_address'] = address
-                        af_dict['aggregate_address_ipv4_mask'] = mask
-                        af_dict['aggregate_address_as_set'] = True
-                        af_dict['aggregate_address_summary_only'] = True
+                        yield (af_path, {
+                            'aggregate_address_ipv4_address': address,
+                            'aggregate_address_ipv4_mask': mask,
+                            'aggregate_address_as_set': True,
+                            'aggregate_address_summary_only': True})
                         continue
                 continue
 
@@ -1942,23 +1968,20 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
                     index += 1
 
                 # Init dict
-                if 'prefixes' not in af_dict:
-                    af_dict['prefixes'] = {}
-                if prefix not in af_dict['prefixes']:
-                    af_dict['prefixes'][prefix] = {}
-                if 'index' not in af_dict['prefixes'][prefix]:
-                    af_dict['prefixes'][prefix]['index'] = {}
-                if index not in af_dict['prefixes'][prefix]['index']:
-                    af_dict['prefixes'][prefix]['index'][index] = {}
+                if prefix_record is None:
+                    prefix_dict = {'index': {}}
+                    prefix_record = (af_path + ('prefixes', prefix),
+                                     prefix_dict)
+                path_dict = prefix_dict['index'].setdefault(index, {})
 
                 # Set keys
-                af_dict['prefixes'][prefix]['index'][index]['next_hop'] = next_hop
-                af_dict['prefixes'][prefix]['index'][index]['origin_codes'] = origin_codes
+                path_dict['next_hop'] = next_hop
+                path_dict['origin_codes'] = origin_codes
 
                 try:
                     # Set values of status_codes and path_type from prefix line
-                    af_dict['prefixes'][prefix]['index'][index]['status_codes'] = status_codes
-                    af_dict['prefixes'][prefix]['index'][index]['path_type'] = path_type
+                    path_dict['status_codes'] = status_codes
+                    path_dict['path_type'] = path_type
                 except Exception:
                     pass
 
@@ -1988,27 +2011,27 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
                                  ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                 if m1:
-                    af_dict['prefixes'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
-                    af_dict['prefixes'][prefix]['index'][index]['localprf'] = int(m1.groupdict()['localprf'])
-                    af_dict['prefixes'][prefix]['index'][index]['weight'] = int(m1.groupdict()['weight'])
+                    path_dict['metric'] = int(m1.groupdict()['metric'])
+                    path_dict['localprf'] = int(m1.groupdict()['localprf'])
+                    path_dict['weight'] = int(m1.groupdict()['weight'])
                     # Set path
                     if m1.groupdict()['path']:
-                        af_dict['prefixes'][prefix]['index'][index]['path'] = m1.groupdict()['path'].strip()
+                        path_dict['path'] = m1.groupdict()['path'].strip()
                         continue
                 elif m2:
-                    af_dict['prefixes'][prefix]['index'][index]['weight'] = int(m2.groupdict()['weight'])
+                    path_dict['weight'] = int(m2.groupdict()['weight'])
                     # Set metric or localprf
                     if len(m2.groupdict()['space']) > 10:
-                        af_dict['prefixes'][prefix]['index'][index]['metric'] = int(m2.groupdict()['value'])
+                        path_dict['metric'] = int(m2.groupdict()['value'])
                     else:
-                        af_dict['prefixes'][prefix]['index'][index]['localprf'] = int(m2.groupdict()['value'])
+                        path_dict['localprf'] = int(m2.groupdict()['value'])
                     # Set path
                     if m2.groupdict()['path']:
-                        af_dict['prefixes'][prefix]['index'][index]['path'] = m2.groupdict()['path'].strip()
+                        path_dict['path'] = m2.groupdict()['path'].strip()
                         continue
                 elif m3:
-                    af_dict['prefixes'][prefix]['index'][index]['weight'] = int(m3.groupdict()['weight'])
-                    af_dict['prefixes'][prefix]['index'][index]['path'] = m3.groupdict()['path'].strip()
+                    path_dict['weight'] = int(m3.groupdict()['weight'])
+                    path_dict['path'] = m3.groupdict()['path'].strip()
                     continue
                 continue
 
@@ -2020,31 +2043,25 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
             if m:
                 route_distinguisher = str(m.groupdict()['route_distinguisher'])
                 new_address_family = original_address_family + ' RD ' + route_distinguisher
-                
-                # Init dict
-                if 'address_family' not in parsed_dict['vrf'][vrf_name]:
-                    parsed_dict['vrf'][vrf_name]['address_family'] = {}
-                if new_address_family not in parsed_dict['vrf'][vrf_name]['address_family']:
-                    parsed_dict['vrf'][vrf_name]['address_family'][new_address_family] = {}
-                
-                # Set keys
-                parsed_dict['vrf'][vrf_name]['address_family'][new_address_family]['bgp_table_version'] = bgp_table_version
-                parsed_dict['vrf'][vrf_name]['address_family'][new_address_family]['local_router_id'] = local_router_id
-                parsed_dict['vrf'][vrf_name]['address_family'][new_address_family]['route_distinguisher'] = route_distinguisher
+                if prefix_record:
+                    yield self._sorted_paths(prefix_record)
+                    prefix_record = None
 
+                # Set keys
+                rd_dict = {}
+                rd_dict['bgp_table_version'] = bgp_table_version
+                rd_dict['local_router_id'] = local_router_id
+                rd_dict['route_distinguisher'] = route_distinguisher
 
                 if m.groupdict()['default_vrf']:
-                    parsed_dict['vrf'][vrf_name]['address_family']\
-                        [new_address_family]['default_vrf'] = \
-                            str(m.groupdict()['default_vrf'])
+                    rd_dict['default_vrf'] = str(m.groupdict()['default_vrf'])
                 elif m.groupdict()['default_vrf1']:
-                    parsed_dict['vrf'][vrf_name]['address_family']\
-                        [new_address_family]['default_vrf'] = \
-                            str(m.groupdict()['default_vrf1'])
+                    rd_dict['default_vrf'] = str(m.groupdict()['default_vrf1'])
 
-                # Reset address_family key and af_dict for use in other regex
+                # Reset address_family key and af_path for use in other regex
                 address_family = new_address_family
-                af_dict = parsed_dict['vrf'][vrf_name]['address_family'][address_family]
+                af_path = ('vrf', vrf_name, 'address_family', address_family)
+                yield (af_path, rd_dict)
                 continue
 
             # Network            Next Hop            Metric     LocPrf     Weight Path
@@ -2072,26 +2089,21 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
                 status_codes = str(m.groupdict()['status_codes'])
                 path_type = str(m.groupdict()['path_type'])
                 prefix = str(m.groupdict()['prefix'])
+                if prefix_record:
+                    yield self._sorted_paths(prefix_record)
                 next_hop = str(m.groupdict()['next_hop'])
                 origin_codes = str(m.groupdict()['origin_codes'])
 
                 # Init dict
-                if 'prefixes' not in af_dict:
-                    af_dict['prefixes'] = {}
-                if prefix not in af_dict['prefixes']:
-                    af_dict['prefixes'][prefix] = {}
-                if 'index' not in af_dict['prefixes'][prefix]:
-                    af_dict['prefixes'][prefix]['index'] = {}
-                if index not in af_dict['prefixes'][prefix]['index']:
-                    af_dict['prefixes'][prefix]['index'][index] = {}
-                if index not in af_dict['prefixes'][prefix]['index']:
-                    af_dict['prefixes'][prefix]['index'][index] = {}
+                prefix_dict = {'index': {}}
+                prefix_record = (af_path + ('prefixes', prefix), prefix_dict)
+                path_dict = prefix_dict['index'].setdefault(index, {})
 
                 # Set keys
-                af_dict['prefixes'][prefix]['index'][index]['status_codes'] = status_codes
-                af_dict['prefixes'][prefix]['index'][index]['path_type'] = path_type
-                af_dict['prefixes'][prefix]['index'][index]['next_hop'] = next_hop
-                af_dict['prefixes'][prefix]['index'][index]['origin_codes'] = origin_codes
+                path_dict['status_codes'] = status_codes
+                path_dict['path_type'] = path_type
+                path_dict['next_hop'] = next_hop
+                path_dict['origin_codes'] = origin_codes
 
                 # Parse numbers
                 numbers = m.groupdict()['numbers']
@@ -2119,69 +2131,48 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
                                  ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
 
                 if m1:
-                    af_dict['prefixes'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
-                    af_dict['prefixes'][prefix]['index'][index]['localprf'] = int(m1.groupdict()['localprf'])
-                    af_dict['prefixes'][prefix]['index'][index]['weight'] = int(m1.groupdict()['weight'])
+                    path_dict['metric'] = int(m1.groupdict()['metric'])
+                    path_dict['localprf'] = int(m1.groupdict()['localprf'])
+                    path_dict['weight'] = int(m1.groupdict()['weight'])
                     # Set path
                     if m1.groupdict()['path']:
-                        af_dict['prefixes'][prefix]['index'][index]['path'] = m1.groupdict()['path'].strip()
+                        path_dict['path'] = m1.groupdict()['path'].strip()
                 elif m2:
-                    af_dict['prefixes'][prefix]['index'][index]['weight'] = int(m2.groupdict()['weight'])
+                    path_dict['weight'] = int(m2.groupdict()['weight'])
                     # Set metric or localprf
                     if len(m2.groupdict()['space']) > 10:
-                        af_dict['prefixes'][prefix]['index'][index]['metric'] = int(m2.groupdict()['value'])
+                        path_dict['metric'] = int(m2.groupdict()['value'])
                     else:
-                        af_dict['prefixes'][prefix]['index'][index]['localprf'] = int(m2.groupdict()['value'])
+                        path_dict['localprf'] = int(m2.groupdict()['value'])
                     # Set path
                     if m2.groupdict()['path']:
-                        af_dict['prefixes'][prefix]['index'][index]['path'] = m2.groupdict()['path'].strip()
+                        path_dict['path'] = m2.groupdict()['path'].strip()
                 elif m3:
-                    af_dict['prefixes'][prefix]['index'][index]['weight'] = int(m3.groupdict()['weight'])
-                    af_dict['prefixes'][prefix]['index'][index]['path'] = m3.groupdict()['path'].strip()
+                    path_dict['weight'] = int(m3.groupdict()['weight'])
+                    path_dict['path'] = m3.groupdict()['path'].strip()
 
                 # Check if aggregate_address_ipv4_address
                 if 'a' in path_type:
                     address, mask = prefix.split("/")
                     if ':' in prefix:
-                        af_dict['v6_aggregate_address_ipv6_address'] = prefix
-                        af_dict['v6_aggregate_address_as_set'] = True
-                        af_dict['v6_aggregate_address_summary_only'] = True
+                        yield (af_path, {
+                            'v6_aggregate_address_ipv6_address': prefix,
+                            'v6_aggregate_address_as_set': True,
+                            'v6_aggregate_address_summary_only': True})
                         continue
                     else:
-                        af_dict['aggregate_address_ipv4_address'] = address
-                        af_dict['aggregate_address_ipv4_mask'] = mask
-                        af_dict['aggregate_address_as_set'] = True
-                        af_dict['aggregate_address_summary_only'] = True
+                        yield (af_path, {
+                            'aggregate_address_ipv4_address': address,
+                            'aggregate_address_ipv4_mask': mask,
+                            'aggregate_address_as_set': True,
+                            'aggregate_address_summary_only': True})
                         continue
                 continue
 
-        # order the af prefixes index
-        # return dict when parsed dictionary is empty
-        if 'vrf' not in parsed_dict:
-            return parsed_dict
-
-        for vrf_name in parsed_dict['vrf']:
-            if 'address_family' not in parsed_dict['vrf'][vrf_name]:
-                continue
-            for af in parsed_dict['vrf'][vrf_name]['address_family']:
-                af_dict = parsed_dict['vrf'][vrf_name]['address_family'][af]
-                if 'prefixes' in af_dict:
-                    for prefixes in af_dict['prefixes']:
-                        if len(af_dict['prefixes'][prefixes]['index'].keys()) > 1:                            
-                            ind = 1
-                            nexthop_dict = {}
-                            sorted_list = sorted(af_dict['prefixes'][prefixes]['index'].items(),
-                                               key = lambda x:x[1]['next_hop'])
-                            for i, j in enumerate(sorted_list):
-                                nexthop_dict[ind] = af_dict['prefixes'][prefixes]['index'][j[0]]
-                                ind += 1
-                            del(af_dict['prefixes'][prefixes]['index'])
-                            af_dict['prefixes'][prefixes]['index'] = nexthop_dict
-
-        return parsed_dict
+        if prefix_record:
+            yield self._sorted_paths(prefix_record)
 
 
-# ==============================================
 # Schema for 'show bgp vrf <vrf> all neighbors'
 # ==============================================
 class ShowBgpVrfAllNeighborsSchema(MetaParser):
@@ -2336,7 +2327,7 @@ class ShowBgpVrfAllNeighborsSchema(MetaParser):
 # ==============================================
 # Parser for 'show bgp vrf <vrf> all neighbors'
 # ==============================================
-class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
+class ShowBgpVrfAllNeighbors(CompiledSchemaParser, ShowBgpVrfAllNeighborsSchema):
     """Parser for:
         show bgp vrf <vrf> all neighbors
         parser class - implements detail parsing mechanisms for cli and yang output.
@@ -3518,13 +3509,16 @@ class ShowBgpVrfAllAllSummarySchema(MetaParser):
 # =========================================
 # Parser for 'show bgp vrf <WORD> all summary'
 # =========================================
-class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
+class ShowBgpVrfAllAllSummary(ColumnarParser, ShowBgpVrfAllAllSummarySchema):
     """Parser for show bgp vrf <WORD> all summary"""
 
     cli_command = [ 'show bgp vrf all all summary',
                     'show bgp vrf {vrf} all summary',
                     'show bgp vrf {vrf} {address_family} summary']
 
+    columnar_table = 'vrf.*.neighbor.*.address_family.*'
+    columnar_keys = ('vrf', 'neighbor', 'address_family')
+
     xml_command = 'show bgp vrf {vrf} all summary | xml'
     exclude = [
       'tbl_ver',
@@ -24,6 +24,8 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
                                          
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.line_dispatch import LineDispatcher
 
 
 # ===========================
@@ -187,16 +189,7 @@ class ShowInterface(ShowInterfaceSchema):
       'in_crc_errors',
       'reliability']
 
-    def cli(self, interface="", output=None):
-        if output is None:
-            if interface:
-                cmd = self.cli_command[1].format(interface=interface)
-            else:
-                cmd = self.cli_command[0]
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
+    patterns = Patterns(
         # Ethernet2/1.10 is down (Administratively down)
         # Vlan1 is down (Administratively down), line protocol is down, autostate enabled
         # Vlan200 is down (VLAN/BD is down), line protocol is down, autostate enabled
@@ -207,254 +200,214 @@ class ShowInterface(ShowInterfaceSchema):
         # Ethernet1/3 is down (XCVR not inserted)
         # Ethernet1/2 is down (SFP validation failed)
         # Ethernet1/4 is down (SFP not inserted)
-        p1 = re.compile(r'^(?P<interface>\S+)\s*is\s*(?P<link_state>(down|up))?'
-                        r'(administratively\s+(?P<admin_1>(down|up)))?\s*'
-                        r'(\(Administratively\s*(?P<admin_2>(down|up))\))?'
-                        r'(\(VLAN\/BD\s+is+\s+(down|up)\))?'
-                        r'(,\s*line\s+protocol\s+is\s+(?P<line_protocol>\w+))?'
-                        r'(,\s+autostate\s+(?P<autostate>\S+))?'
-                        r'(\(Link\s+not\s+connected\))?'
-                        r'(\(SFP\s+validation\s+failed\))?'
-                        r'(\(SFP\s+not\s+inserted\))?'
-                        r'(\(suspended\(.*\)\))?'
-                        r'(\(\S+ErrDisabled\))?'
-                        r'(\(XCVR\s+not\s+inserted\))?'
-                        r'(\(.*ACK.*\))?$')
-
+        p1=r'^(?P<interface>\S+)\s*is\s*(?P<link_state>(down|up))?'
+           r'(administratively\s+(?P<admin_1>(down|up)))?\s*'
+           r'(\(Administratively\s*(?P<admin_2>(down|up))\))?'
+           r'(\(VLAN\/BD\s+is+\s+(down|up)\))?'
+           r'(,\s*line\s+protocol\s+is\s+(?P<line_protocol>\w+))?'
+           r'(,\s+autostate\s+(?P<autostate>\S+))?'
+           r'(\(Link\s+not\s+connected\))?'
+           r'(\(SFP\s+validation\s+failed\))?'
+           r'(\(SFP\s+not\s+inserted\))?'
+           r'(\(suspended\(.*\)\))?'
+           r'(\(\S+ErrDisabled\))?'
+           r'(\(XCVR\s+not\s+inserted\))?'
+           r'(\(.*ACK.*\))?$',
         # admin state is up
         # admin state is up,
         # admin state is up, Dedicated Interface
         # admin state is up, Dedicated Interface, [parent interface is Ethernet2/1]
-        p2 = re.compile(r'^admin +state +is'
-                        r' +(?P<admin_state>([a-zA-Z0-9\/\.]+))(?:,)?'
-                        r'(?: +(?P<dedicated_intf>(Dedicated Interface)))?'
-                        r'(?:, +\[parent +interface +is'
-                        r' +(?P<parent_intf>(\S+))\])?$')
-
+        p2=r'^admin +state +is'
+           r' +(?P<admin_state>([a-zA-Z0-9\/\.]+))(?:,)?'
+           r'(?: +(?P<dedicated_intf>(Dedicated Interface)))?'
+           r'(?:, +\[parent +interface +is'
+           r' +(?P<parent_intf>(\S+))\])?$',
         # Dedicated Interface
-        p2_1 = re.compile(r'^Dedicated Interface$')
-
+        p2_1=r'^Dedicated Interface$',
         # Belongs to Po1
-        p2_2 = re.compile(r'^Belongs *to *(?P<port_channel_int>[a-zA-Z0-9]+)$')
-
+        p2_2=r'^Belongs *to *(?P<port_channel_int>[a-zA-Z0-9]+)$',
         # Hardware: Ethernet, address: 5254.00ff.9c38 (bia 5254.00ff.9c38)
-        p3 = re.compile(r'^Hardware: *(?P<types>[a-zA-Z0-9\/\s]+),'
-                        r' *address: *(?P<mac_address>[a-z0-9\.]+)'
-                        r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\)$')
-
+        p3=r'^Hardware: *(?P<types>[a-zA-Z0-9\/\s]+),'
+           r' *address: *(?P<mac_address>[a-z0-9\.]+)'
+           r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\)$',
         #Description: desc
-        p4 = re.compile(r'^Description: *(?P<description>.*)$')
-
+        p4=r'^Description: *(?P<description>.*)$',
         #Internet Address is 10.4.4.4/24 secondary tag 10
-        p5 = re.compile(r'^Internet *Address *is *(?P<ip>[0-9\.]+)'
-                        r'\/(?P<prefix_length>[0-9]+)'
-                        r'(?: *(?P<secondary>(secondary)))?(?: *tag'
-                        r' *(?P<route_tag>[0-9]+))?$')
-
+        p5=r'^Internet *Address *is *(?P<ip>[0-9\.]+)'
+           r'\/(?P<prefix_length>[0-9]+)'
+           r'(?: *(?P<secondary>(secondary)))?(?: *tag'
+           r' *(?P<route_tag>[0-9]+))?$',
         # MTU 1600 bytes, BW 768 Kbit, DLY 3330 usec
         # MTU 1500 bytes, BW 1000000 Kbit, DLY 10 usec,
         # MTU 1500 bytes, BW 1000000 Kbit
         # MTU 600 bytes, BW 10000000 Kbit , DLY 10 usec
-        p6 = re.compile(r'^MTU *(?P<mtu>[0-9]+) *bytes, *BW'
-                        r' *(?P<bandwidth>[0-9]+) *Kbit( *, *DLY'
-                        r' *(?P<delay>[0-9]+) *usec)?,?$')
-
+        p6=r'^MTU *(?P<mtu>[0-9]+) *bytes, *BW'
+           r' *(?P<bandwidth>[0-9]+) *Kbit( *, *DLY'
+           r' *(?P<delay>[0-9]+) *usec)?,?$',
         # MTU 1500 bytes,  BW 40000000 Kbit,, BW 40000000 Kbit, DLY 10 usec
-        p6_1 = re.compile(r'^MTU *(?P<mtu>[0-9]+) *bytes, *BW'
-                          r' *(?P<bandwidth>[0-9]+) *Kbit, *,? *BW'
-                          r' *([0-9]+) *Kbit, *DLY'
-                          r' *(?P<delay>[0-9]+) *usec$')   
-
+        p6_1=r'^MTU *(?P<mtu>[0-9]+) *bytes, *BW'
+             r' *(?P<bandwidth>[0-9]+) *Kbit, *,? *BW'
+             r' *([0-9]+) *Kbit, *DLY'
+             r' *(?P<delay>[0-9]+) *usec$',
         # reliability 255/255, txload 1/255, rxload 1/255
-        p7 = re.compile(r'^reliability *(?P<reliability>[0-9\/]+),'
-                        r' *txload *(?P<txload>[0-9\/]+),'
-                        r' *rxload *(?P<rxload>[0-9\/]+)$')   
-
+        p7=r'^reliability *(?P<reliability>[0-9\/]+),'
+           r' *txload *(?P<txload>[0-9\/]+),'
+           r' *rxload *(?P<rxload>[0-9\/]+)$',
         #Encapsulation 802.1Q Virtual LAN, Vlan ID 10, medium is broadcast
         #Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
         #Encapsulation ARPA, medium is broadcast
-        p8 = re.compile(r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                        r' *medium *is *(?P<medium>[a-zA-Z]+)$')   
-
-        p8_1 = re.compile(r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                          r' *Vlan *ID *(?P<first_dot1q>[0-9]+),'
-                          r' *medium *is *(?P<medium>[a-z0-9]+)$') 
-
+        p8=r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+           r' *medium *is *(?P<medium>[a-zA-Z]+)$',
+        p8_1=r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+             r' *Vlan *ID *(?P<first_dot1q>[0-9]+),'
+             r' *medium *is *(?P<medium>[a-z0-9]+)$',
         # Encapsulation ARPA, loopback not set
-        p8_2 = re.compile(r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                          r' *([\w\s]+)$') 
-
+        p8_2=r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+             r' *([\w\s]+)$',
         #Port mode is routed
-        p9 = re.compile(r'^Port *mode *is *(?P<port_mode>[a-z]+)$')
-
+        p9=r'^Port *mode *is *(?P<port_mode>[a-z]+)$',
         # auto-duplex, auto-speed
-        p10_1 = re.compile(r'^auto-duplex, +auto-speed$')
-
+        p10_1=r'^auto-duplex, +auto-speed$',
         #full-duplex, 1000 Mb/s
         # auto-duplex, auto-speed
         # full-duplex, 1000 Mb/s, media type is 1G
         # auto-duplex, auto-speed, media type is 10G
-        p10 = re.compile(r'^(?P<duplex_mode>[a-z]+)-duplex, *(?P<port_speed>[a-z0-9\-]+)(?: '
-                         r'*[G|M]b/s)?(?:, +media +type +is (?P<media_type>\w+))?$')
-
+        p10=r'^(?P<duplex_mode>[a-z]+)-duplex, *(?P<port_speed>[a-z0-9\-]+)(?: '
+            r'*[G|M]b/s)?(?:, +media +type +is (?P<media_type>\w+))?$',
         #Beacon is turned off
-        p11 = re.compile(r'^Beacon *is *turned *(?P<beacon>[a-z]+)$')
-
+        p11=r'^Beacon *is *turned *(?P<beacon>[a-z]+)$',
         #Auto-Negotiation is turned off
-        p12 = re.compile(r'^Auto-Negotiation *is *turned'
-                         r' *(?P<auto_negotiate>(off))$')
-
+        p12=r'^Auto-Negotiation *is *turned'
+            r' *(?P<auto_negotiate>(off))$',
         #Auto-Negotiation is turned on
-        p12_1 = re.compile(r'^Auto-Negotiation *is *turned'
-                           r' *(?P<auto_negotiate>(on))$')
-
+        p12_1=r'^Auto-Negotiation *is *turned'
+              r' *(?P<auto_negotiate>(on))$',
         #Input flow-control is off, output flow-control is off
-        p13 = re.compile(r'^Input *flow-control *is *(?P<receive>(off)+),'
-                         r' *output *flow-control *is *(?P<send>(off)+)$')
-
+        p13=r'^Input *flow-control *is *(?P<receive>(off)+),'
+            r' *output *flow-control *is *(?P<send>(off)+)$',
         #Input flow-control is off, output flow-control is on
-        p13_1 = re.compile(r'^Input *flow-control *is *(?P<receive>(on)+),'
-                           r' *output *flow-control *is *(?P<send>(on)+)$')
-
+        p13_1=r'^Input *flow-control *is *(?P<receive>(on)+),'
+              r' *output *flow-control *is *(?P<send>(on)+)$',
         #Auto-mdix is turned off
-        p14 = re.compile(r'^Auto-mdix *is *turned *(?P<auto_mdix>[a-z]+)$')
-
-        #Switchport monitor is off 
-        p15 = re.compile(r'^Switchport *monitor *is *(?P<switchport_monitor>[a-z]+)$')
-
-        #EtherType is 0x8100 
-        p16 = re.compile(r'^EtherType *is *(?P<ethertype>[a-z0-9]+)$')
-
+        p14=r'^Auto-mdix *is *turned *(?P<auto_mdix>[a-z]+)$',
+        #Switchport monitor is off
+        p15=r'^Switchport *monitor *is *(?P<switchport_monitor>[a-z]+)$',
+        #EtherType is 0x8100
+        p16=r'^EtherType *is *(?P<ethertype>[a-z0-9]+)$',
         # Members in this channel: Eth1/15, Eth1/16
         # Members in this channel: Eth1/28
-        p38 = re.compile(r'^Members +in +this +channel *: *'
-                         r'(?P<port_channel_member_intfs>[\w\/\.\-\,\s]+)$')
-
+        p38=r'^Members +in +this +channel *: *'
+            r'(?P<port_channel_member_intfs>[\w\/\.\-\,\s]+)$',
         #EEE (efficient-ethernet) : n/a
-        p17 = re.compile(r'^EEE *\(efficient-ethernet\) *:'
-                         r' *(?P<efficient_ethernet>[A-Za-z\/]+)$')
-
+        p17=r'^EEE *\(efficient-ethernet\) *:'
+            r' *(?P<efficient_ethernet>[A-Za-z\/]+)$',
         #Last link flapped 00:07:28
         #Last link flapped 15week(s) 5day(s)
-        p18 = re.compile(r'^Last *link *flapped'
-                         r' *(?P<last_link_flapped>[\S ]+)$')
-
+        p18=r'^Last *link *flapped'
+            r' *(?P<last_link_flapped>[\S ]+)$',
         # Last clearing of "show interface" counters never
-        p19 = re.compile(r'^Last *clearing *of *\"show *interface\"'
-                         r' *counters *(?P<last_clear>[a-z0-9\:]+)$')
-
+        p19=r'^Last *clearing *of *\"show *interface\"'
+            r' *counters *(?P<last_clear>[a-z0-9\:]+)$',
         # Last clearing of "" counters 00:15:42
-        p19_1 = re.compile(r'^Last *clearing *of *\" *\"'
-                           r' *counters *(?P<last_clear>[a-z0-9\:]+)$')
-
+        p19_1=r'^Last *clearing *of *\" *\"'
+              r' *counters *(?P<last_clear>[a-z0-9\:]+)$',
         #1 interface resets
-        p20 = re.compile(r'^(?P<interface_reset>[0-9]+) *interface'
-                         r' *resets$')
-
-        # 1 minute input rate 0 bits/sec, 0 packets/sec  
-        p21 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                         r' *(minute|second|minutes|seconds) *input *rate'
-                         r' *(?P<in_rate>[0-9]+) *bits/sec,'
-                         r' *(?P<in_rate_pkts>[0-9]+) *packets/sec$')
-
+        p20=r'^(?P<interface_reset>[0-9]+) *interface'
+            r' *resets$',
+        # 1 minute input rate 0 bits/sec, 0 packets/sec
+        p21=r'^(?P<load_interval>[0-9\#]+)'
+            r' *(minute|second|minutes|seconds) *input *rate'
+            r' *(?P<in_rate>[0-9]+) *bits/sec,'
+            r' *(?P<in_rate_pkts>[0-9]+) *packets/sec$',
         #1 minute output rate 24 bits/sec, 0 packets/sec
-        p22 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                         r' *(minute|second|minutes|seconds) *output'
-                         r' *rate *(?P<out_rate>[0-9]+)'
-                         r' *bits/sec, *(?P<out_rate_pkts>[0-9]+)'
-                         r' *packets/sec$')
-
+        p22=r'^(?P<load_interval>[0-9\#]+)'
+            r' *(minute|second|minutes|seconds) *output'
+            r' *rate *(?P<out_rate>[0-9]+)'
+            r' *bits/sec, *(?P<out_rate_pkts>[0-9]+)'
+            r' *packets/sec$',
         #input rate 0 bps, 0 pps; output rate 0 bps, 0 pps
-        p23 = re.compile(r'^input *rate *(?P<in_rate_bps>[0-9]+) *bps,'
-                         r' *(?P<in_rate_pps>[0-9]+) *pps; *output *rate'
-                         r' *(?P<out_rate_bps>[0-9]+) *bps,'
-                         r' *(?P<out_rate_pps>[0-9]+) *pps$')
-
+        p23=r'^input *rate *(?P<in_rate_bps>[0-9]+) *bps,'
+            r' *(?P<in_rate_pps>[0-9]+) *pps; *output *rate'
+            r' *(?P<out_rate_bps>[0-9]+) *bps,'
+            r' *(?P<out_rate_pps>[0-9]+) *pps$',
         # RX
         # Rx
-        p23_1 = re.compile(r'^(?P<rx>(RX|Rx))$')
-
+        p23_1=r'^(?P<rx>(RX|Rx))$',
         #0 unicast packets  0 multicast packets  0 broadcast packets
-        p24 = re.compile(r'^(?P<in_unicast_pkts>[0-9]+) +unicast +packets'
-                         r' +(?P<in_multicast_pkts>[0-9]+) +multicast +packets'
-                         r' +(?P<in_broadcast_pkts>[0-9]+) +broadcast +packets$')
-
+        p24=r'^(?P<in_unicast_pkts>[0-9]+) +unicast +packets'
+            r' +(?P<in_multicast_pkts>[0-9]+) +multicast +packets'
+            r' +(?P<in_broadcast_pkts>[0-9]+) +broadcast +packets$',
         # 0 input packets  0 bytes
         # 607382344 input packets 445986207 unicast packets 132485585 multicast packets
-        p25 = re.compile(r'^(?P<in_pkts>[0-9]+) +input +packets(?: '
-                         r'+(?P<in_octets>[0-9]+) +bytes)?(?: +(?P<in_unicast_pkts>[0-9]+) '
-                         r'+unicast +packets +(?P<in_multicast_pkts>[0-9]+) +multicast +packets)?$')
-
+        p25=r'^(?P<in_pkts>[0-9]+) +input +packets(?: '
+            r'+(?P<in_octets>[0-9]+) +bytes)?(?: +(?P<in_unicast_pkts>[0-9]+) '
+            r'+unicast +packets +(?P<in_multicast_pkts>[0-9]+) +multicast +packets)?$',
+        # 28910552 broadcast packets 63295517997 bytes
+        p39=r'^(?P<in_broadcast_pkts>[0-9]+) +broadcast +packets +(?P<in_octets>[0-9]+) +bytes$',
         #0 jumbo packets  0 storm suppression packets
-        p26 = re.compile(r'^(?P<in_jumbo_packets>[0-9]+) +jumbo +packets'
-                         r' *(?P<in_storm_suppression_packets>[0-9]+)'
-                         r' *storm *suppression *packets$')
-
+        p26=r'^(?P<in_jumbo_packets>[0-9]+) +jumbo +packets'
+            r' *(?P<in_storm_suppression_packets>[0-9]+)'
+            r' *storm *suppression *packets$',
         #0 runts  0 giants  0 CRC/FCS  0 no buffer
         #0 runts  0 giants  0 CRC  0 no buffer
-        p27 = re.compile(r'^(?P<in_runts>[0-9]+) *runts'
-                         r' *(?P<in_oversize_frame>[0-9]+) *giants'
-                         r' *(?P<in_crc_errors>[0-9]+) *CRC(/FCS)?'
-                         r' *(?P<in_no_buffer>[0-9]+) *no *buffer$')
-
+        p27=r'^(?P<in_runts>[0-9]+) *runts'
+            r' *(?P<in_oversize_frame>[0-9]+) *giants'
+            r' *(?P<in_crc_errors>[0-9]+) *CRC(/FCS)?'
+            r' *(?P<in_no_buffer>[0-9]+) *no *buffer$',
         #0 input error  0 short frame  0 overrun   0 underrun  0 ignored
-        p28 = re.compile(r'^(?P<in_errors>[0-9]+) *input *error'
-                         r' *(?P<in_short_frame>[0-9]+) *short *frame'
-                         r' *(?P<in_overrun>[0-9]+) *overrun *(?P<in_underrun>[0-9]+)'
-                         r' *underrun *(?P<in_ignored>[0-9]+) *ignored$')
-
+        p28=r'^(?P<in_errors>[0-9]+) *input *error'
+            r' *(?P<in_short_frame>[0-9]+) *short *frame'
+            r' *(?P<in_overrun>[0-9]+) *overrun *(?P<in_underrun>[0-9]+)'
+            r' *underrun *(?P<in_ignored>[0-9]+) *ignored$',
         #0 watchdog  0 bad etype drop  0 bad proto drop  0 if down drop
-        p29 = re.compile(r'^(?P<in_watchdog>[0-9]+) *watchdog'
-                         r' *(?P<in_bad_etype_drop>[0-9]+)'
-                         r' *bad *etype *drop *(?P<in_unknown_protos>[0-9]+)'
-                         r' *bad *proto'
-                         r' *drop *(?P<in_if_down_drop>[0-9]+) *if *down *drop$')
-
+        p29=r'^(?P<in_watchdog>[0-9]+) *watchdog'
+            r' *(?P<in_bad_etype_drop>[0-9]+)'
+            r' *bad *etype *drop *(?P<in_unknown_protos>[0-9]+)'
+            r' *bad *proto'
+            r' *drop *(?P<in_if_down_drop>[0-9]+) *if *down *drop$',
         # 0 input with dribble  0 input discard
-        p30 = re.compile(r'^(?P<in_with_dribble>[0-9]+) *input *with'
-                         r' *dribble *(?P<in_discard>[0-9]+) *input *discard$')
-
+        p30=r'^(?P<in_with_dribble>[0-9]+) *input *with'
+            r' *dribble *(?P<in_discard>[0-9]+) *input *discard$',
         # 0 Rx pause
-        p31 = re.compile(r'^(?P<in_mac_pause_frames>[0-9]+) *Rx *pause$')
-
+        p31=r'^(?P<in_mac_pause_frames>[0-9]+) *Rx *pause$',
         # TX
-        p31_1 = re.compile(r'^(?P<tx>(TX|Tx))$')
-
+        p31_1=r'^(?P<tx>(TX|Tx))$',
         #0 unicast packets  0 multicast packets  0 broadcast packets
-        p32 = re.compile(r'^(?P<out_unicast_pkts>[0-9]+) *unicast *packets'
-                         r' *(?P<out_multicast_pkts>[0-9]+) *multicast *packets'
-                         r' *(?P<out_broadcast_pkts>[0-9]+) *broadcast *packets$')
-
+        p32=r'^(?P<out_unicast_pkts>[0-9]+) *unicast *packets'
+            r' *(?P<out_multicast_pkts>[0-9]+) *multicast *packets'
+            r' *(?P<out_broadcast_pkts>[0-9]+) *broadcast *packets$',
         #0 output packets  0 bytes
-        p33 = re.compile(r'^(?P<out_pkts>[0-9]+) *output *packets'
-                         r' *(?P<out_octets>[0-9]+) *bytes$')
-
+        p33=r'^(?P<out_pkts>[0-9]+) *output *packets'
+            r' *(?P<out_octets>[0-9]+) *bytes$',
         #0 jumbo packets
-        p34 = re.compile(r'^(?P<out_jumbo_packets>[0-9]+) *jumbo *packets$')
-
+        p34=r'^(?P<out_jumbo_packets>[0-9]+) *jumbo *packets$',
         #0 output error  0 collision  0 deferred  0 late collision
-        p35 = re.compile(r'^(?P<out_errors>[0-9]+) *output *error'
-                         r' *(?P<out_collision>[0-9]+) *collision'
-                         r' *(?P<out_deferred>[0-9]+) *deferred'
-                         r' *(?P<out_late_collision>[0-9]+)'
-                         r' *late *collision$')
-
+        p35=r'^(?P<out_errors>[0-9]+) *output *error'
+            r' *(?P<out_collision>[0-9]+) *collision'
+            r' *(?P<out_deferred>[0-9]+) *deferred'
+            r' *(?P<out_late_collision>[0-9]+)'
+            r' *late *collision$',
         #0 lost carrier  0 no carrier  0 babble  0 output discard
-        p36 = re.compile(r'^(?P<out_lost_carrier>[0-9]+) *lost *carrier'
-                         r' *(?P<out_no_carrier>[0-9]+) *no *carrier'
-                         r' *(?P<out_babble>[0-9]+) *babble'
-                         r' *(?P<out_discard>[0-9]+) *output *discard$')
-
+        p36=r'^(?P<out_lost_carrier>[0-9]+) *lost *carrier'
+            r' *(?P<out_no_carrier>[0-9]+) *no *carrier'
+            r' *(?P<out_babble>[0-9]+) *babble'
+            r' *(?P<out_discard>[0-9]+) *output *discard$',
         #0 Tx pause
-        p37 = re.compile(r'^(?P<out_mac_pause_frames>[0-9]+) *Tx *pause$')
+        p37=r'^(?P<out_mac_pause_frames>[0-9]+) *Tx *pause$')
+    dispatcher = LineDispatcher(patterns)
 
-        # Members in this channel: Eth1/15, Eth1/16
-        # Members in this channel: Eth1/28
-        p38 = re.compile(r'^Members +in +this +channel *: *'
-                         r'(?P<port_channel_member_intfs>[\w\/\.\-\,\s]+)$')
+    def cli(self, interface="", output=None):
+        if output is None:
+            if interface:
+                cmd = self.cli_command[1].format(interface=interface)
+            else:
+                cmd = self.cli_command[0]
+            out = self.device.execute(cmd)
+        else:
+            out = output
 
-        # 28910552 broadcast packets 63295517997 bytes
-        p39 = re.compile(r'^(?P<in_broadcast_pkts>[0-9]+) +broadcast +packets +(?P<in_octets>[0-9]+) +bytes$')
+        # only the patterns which can match the line, see LineDispatcher
+        dispatcher = self.dispatcher
 
         interface_dict = {}
 
@@ -463,6 +416,7 @@ class ShowInterface(ShowInterfaceSchema):
         for line in out.splitlines():
             line = line.replace('\t', '    ')
             line = line.strip()
+            patterns = dispatcher.candidates(line)
 
             # Ethernet2/1.10 is down (Administratively down)
             # Vlan1 is down (Administratively down), line protocol is down, autostate enabled
@@ -472,7 +426,7 @@ class ShowInterface(ShowInterfaceSchema):
             # Ethernet1/10 is down (Link not connected)
             # Ethernet1/3 is down (XCVR not inserted)
             # Ethernet1/1 is down (DCX-No ACK in 100 PDUs)
-            m = p1.match(line)
+            m = patterns.p1.match(line)
             if m:
                 group = m.groupdict()
                 interface = group['interface']
@@ -507,7 +461,7 @@ class ShowInterface(ShowInterfaceSchema):
             # admin state is up,
             # admin state is up, Dedicated Interface
             # admin state is up, Dedicated Interface, [parent interface is Ethernet2/1]
-            m = p2.match(line)
+            m = patterns.p2.match(line)
             if m:
                 # admin_state
                 admin_state = m.groupdict()['admin_state']
@@ -524,13 +478,13 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # Dedicated Interface
-            m = p2_1.match(line)
+            m = patterns.p2_1.match(line)
             if m:
                 interface_dict[interface]['dedicated_interface'] = True
                 continue
 
             # Belongs to Po1
-            m = p2_2.match(line)
+            m = patterns.p2_2.match(line)
             if m:
                 port_channel_int = str(m.groupdict()['port_channel_int'])
                 if 'port_channel' not in interface_dict[interface]:
@@ -542,7 +496,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # Hardware: Ethernet, address: 5254.00ff.9c38 (bia 5254.00ff.9c38)
-            m = p3.match(line)
+            m = patterns.p3.match(line)
             if m:
                 types = m.groupdict()['types']
                 mac_address = m.groupdict()['mac_address']
@@ -556,7 +510,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #Description: desc
-            m = p4.match(line)
+            m = patterns.p4.match(line)
             if m:
                 description = m.groupdict()['description']
 
@@ -564,7 +518,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #Internet Address is 10.4.4.4/24 secondary tag 10
-            m = p5.match(line)
+            m = patterns.p5.match(line)
             if m:
                 ip = m.groupdict()['ip']
                 prefix_length = str(m.groupdict()['prefix_length'])
@@ -593,7 +547,7 @@ class ShowInterface(ShowInterfaceSchema):
             # MTU 1600 bytes, BW 768 Kbit, DLY 3330 usec
             # MTU 1500 bytes, BW 1000000 Kbit, DLY 10 usec,
             # MTU 1500 bytes, BW 1000000 Kbit
-            m = p6.match(line)
+            m = patterns.p6.match(line)
             if m:
                 mtu = int(m.groupdict()['mtu'])
                 bandwidth = int(m.groupdict()['bandwidth'])
@@ -605,7 +559,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
             
             # MTU 1500 bytes,  BW 40000000 Kbit,, BW 40000000 Kbit, DLY 10 usec
-            m = p6_1.match(line)
+            m = patterns.p6_1.match(line)
             if m:
                 mtu = int(m.groupdict()['mtu'])
                 bandwidth = int(m.groupdict()['bandwidth'])
@@ -616,7 +570,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # reliability 255/255, txload 1/255, rxload 1/255
-            m = p7.match(line)
+            m = patterns.p7.match(line)
             if m:
                 reliability = m.groupdict()['reliability']
                 txload = m.groupdict()['txload']
@@ -630,7 +584,7 @@ class ShowInterface(ShowInterfaceSchema):
             #Encapsulation 802.1Q Virtual LAN, Vlan ID 10, medium is broadcast
             #Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
             #Encapsulation ARPA, medium is broadcast
-            m = p8.match(line)
+            m = patterns.p8.match(line)
             if m:
                 encapsulation = m.groupdict()['encapsulation'].lower()
                 encapsulation = encapsulation.replace("802.1q virtual lan","dot1q")
@@ -644,7 +598,7 @@ class ShowInterface(ShowInterfaceSchema):
                 interface_dict[interface]['medium'] = medium
                 continue
 
-            m = p8_1.match(line)
+            m = patterns.p8_1.match(line)
             if m:
                 encapsulation = m.groupdict()['encapsulation'].lower()
                 encapsulation = encapsulation.replace("802.1q virtual lan","dot1q")
@@ -662,7 +616,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # Encapsulation ARPA, loopback not set
-            m = p8_2.match(line)
+            m = patterns.p8_2.match(line)
             if m:
                 encapsulation = m.groupdict()['encapsulation'].lower()
 
@@ -674,14 +628,14 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #Port mode is routed
-            m = p9.match(line)
+            m = patterns.p9.match(line)
             if m:
                 port_mode = m.groupdict()['port_mode']
                 interface_dict[interface]['port_mode'] = port_mode
                 continue
 
             # auto-duplex, auto-speed
-            m = p10_1.match(line)
+            m = patterns.p10_1.match(line)
             if m:
                 # not caring for this line
                 continue
@@ -690,7 +644,7 @@ class ShowInterface(ShowInterfaceSchema):
             # auto-duplex, auto-speed
             # full-duplex, 1000 Mb/s, media type is 1G
             # auto-duplex, auto-speed, media type is 10G
-            m = p10.match(line)
+            m = patterns.p10.match(line)
             if m:
                 duplex_mode = m.groupdict()['duplex_mode'].lower()
                 port_speed = m.groupdict()['port_speed']
@@ -704,28 +658,28 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #Beacon is turned off
-            m = p11.match(line)
+            m = patterns.p11.match(line)
             if m:
                 beacon = m.groupdict()['beacon']
                 interface_dict[interface]['beacon'] = beacon
                 continue
 
             #Auto-Negotiation is turned off
-            m = p12.match(line)
+            m = patterns.p12.match(line)
             if m:
                 auto_negotiation = m.groupdict()['auto_negotiate']
                 interface_dict[interface]['auto_negotiate'] = False
                 continue
 
             #Auto-Negotiation is turned on
-            m = p12_1.match(line)
+            m = patterns.p12_1.match(line)
             if m:
                 auto_negotiation = m.groupdict()['auto_negotiate']
                 interface_dict[interface]['auto_negotiate'] = True
                 continue
 
             #Input flow-control is off, output flow-control is off
-            m = p13.match(line)
+            m = patterns.p13.match(line)
             if m:
                 receive = m.groupdict()['receive']
                 send = m.groupdict()['send']
@@ -737,7 +691,7 @@ class ShowInterface(ShowInterfaceSchema):
                 interface_dict[interface]['flow_control']['send'] = False
                 continue
             #Input flow-control is off, output flow-control is on
-            m = p13_1.match(line)
+            m = patterns.p13_1.match(line)
             if m:
                 receive = m.groupdict()['receive']
                 send = m.groupdict()['send']
@@ -750,21 +704,21 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #Auto-mdix is turned off
-            m = p14.match(line)
+            m = patterns.p14.match(line)
             if m:
                 auto_mdix = m.groupdict()['auto_mdix']
                 interface_dict[interface]['auto_mdix'] = auto_mdix
                 continue
 
             #Switchport monitor is off 
-            m = p15.match(line)
+            m = patterns.p15.match(line)
             if m:
                 switchport_monitor = m.groupdict()['switchport_monitor']
                 interface_dict[interface]['switchport_monitor'] = switchport_monitor
                 continue
 
             #EtherType is 0x8100 
-            m = p16.match(line)
+            m = patterns.p16.match(line)
             if m:
                 ethertype = m.groupdict()['ethertype']
                 interface_dict[interface]['ethertype'] = ethertype
@@ -772,7 +726,7 @@ class ShowInterface(ShowInterfaceSchema):
 
             # Members in this channel: Eth1/15, Eth1/16
             # Members in this channel: Eth1/28
-            m = p38.match(line)
+            m = patterns.p38.match(line)
             if m:
                 port_channel_member_intfs = m.groupdict()['port_channel_member_intfs']
                 if port_channel_member_intfs:
@@ -786,14 +740,14 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
             
             #EEE (efficient-ethernet) : n/a
-            m = p17.match(line)
+            m = patterns.p17.match(line)
             if m:
                 efficient_ethernet = m.groupdict()['efficient_ethernet']
                 interface_dict[interface]['efficient_ethernet'] = efficient_ethernet
                 continue
 
             #Last link flapped 00:07:28
-            m = p18.match(line)
+            m = patterns.p18.match(line)
             if m:
                 last_link_flapped = m.groupdict()['last_link_flapped']
                 interface_dict[interface]['last_link_flapped']\
@@ -801,26 +755,26 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # Last clearing of "show interface" counters never
-            m = p19.match(line)
+            m = patterns.p19.match(line)
             if m:
                 last_clear = m.groupdict()['last_clear']
                 continue
 
             # Last clearing of "" counters 00:15:42
-            m = p19_1.match(line)
+            m = patterns.p19_1.match(line)
             if m:
                 last_clear = m.groupdict()['last_clear']
                 continue
 
             #1 interface resets
-            m = p20.match(line)
+            m = patterns.p20.match(line)
             if m:
                 interface_reset = int(m.groupdict()['interface_reset'])
                 interface_dict[interface]['interface_reset'] = interface_reset
                 continue
 
             # 1 minute input rate 0 bits/sec, 0 packets/sec  
-            m = p21.match(line)
+            m = patterns.p21.match(line)
             if m:
 
                 load_interval = int(m.groupdict()['load_interval'])
@@ -841,7 +795,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #1 minute output rate 24 bits/sec, 0 packets/sec
-            m = p22.match(line)
+            m = patterns.p22.match(line)
             if m:
                 load_interval = int(m.groupdict()['load_interval'])
                 out_rate = int(m.groupdict()['out_rate'])
@@ -856,7 +810,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #input rate 0 bps, 0 pps; output rate 0 bps, 0 pps
-            m = p23.match(line)
+            m = patterns.p23.match(line)
             if m:
                 in_rate_bps = int(m.groupdict()['in_rate_bps'])
                 in_rate_pps = int(m.groupdict()['in_rate_pps'])
@@ -879,7 +833,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
             # RX
             # Rx
-            m = p23_1.match(line)
+            m = patterns.p23_1.match(line)
             if m:
                 rx = m.groupdict()['rx']
                 if 'counters' not in interface_dict[interface]:
@@ -890,7 +844,7 @@ class ShowInterface(ShowInterfaceSchema):
 
             if rx:
                 #0 unicast packets  0 multicast packets  0 broadcast packets
-                m = p24.match(line)
+                m = patterns.p24.match(line)
                 if m:
                     in_unicast_pkts = int(m.groupdict()['in_unicast_pkts'])
                     in_multicast_pkts = int(m.groupdict()['in_multicast_pkts'])
@@ -905,10 +859,9 @@ class ShowInterface(ShowInterfaceSchema):
                         pass
                     continue
                     
-
             # 0 input packets  0 bytes
             # 607382344 input packets 445986207 unicast packets 132485585 multicast packets
-            m = p25.match(line)
+            m = patterns.p25.match(line)
             if m:
                 group = m.groupdict()
                 if 'counters' not in interface_dict[interface]:
@@ -923,7 +876,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # 28910552 broadcast packets 63295517997 bytes
-            m = p39.match(line)
+            m = patterns.p39.match(line)
             if m:
                 in_octets = int(m.groupdict()['in_octets'])
                 interface_dict[interface]['counters']['in_octets'] = in_octets
@@ -932,7 +885,7 @@ class ShowInterface(ShowInterfaceSchema):
                 interface_dict[interface]['counters']['in_broadcast_pkts'] = in_broadcast_pkts
 
             #0 jumbo packets  0 storm suppression packets
-            m = p26.match(line)
+            m = patterns.p26.match(line)
             if m:
                 in_jumbo_packets = int(m.groupdict()['in_jumbo_packets'])
                 in_storm_suppression_packets = int(m.groupdict()['in_storm_suppression_packets'])
@@ -944,7 +897,7 @@ class ShowInterface(ShowInterfaceSchema):
 
             #0 runts  0 giants  0 CRC/FCS  0 no buffer
             #0 runts  0 giants  0 CRC  0 no buffer
-            m = p27.match(line)
+            m = patterns.p27.match(line)
             if m:
 
                 interface_dict[interface]['counters']['in_runts'] = int(m.groupdict()['in_runts'])
@@ -954,7 +907,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 input error  0 short frame  0 overrun   0 underrun  0 ignored
-            m = p28.match(line)
+            m = patterns.p28.match(line)
             if m:
 
                 interface_dict[interface]['counters']['in_errors'] = int(m.groupdict()['in_errors'])
@@ -965,7 +918,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 watchdog  0 bad etype drop  0 bad proto drop  0 if down drop
-            m = p29.match(line)
+            m = patterns.p29.match(line)
             if m:
 
                 interface_dict[interface]['counters']['in_watchdog'] = int(m.groupdict()['in_watchdog'])
@@ -975,7 +928,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # 0 input with dribble  0 input discard
-            m = p30.match(line)
+            m = patterns.p30.match(line)
             if m:
                 in_with_dribble = int(m.groupdict()['in_with_dribble'])
                 in_discard = int(m.groupdict()['in_discard'])
@@ -985,7 +938,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # 0 Rx pause
-            m = p31.match(line)
+            m = patterns.p31.match(line)
             if m:
                 in_mac_pause_frames = int(m.groupdict()['in_mac_pause_frames'])
 
@@ -993,7 +946,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
             # TX
             # Tx
-            m = p31_1.match(line)
+            m = patterns.p31_1.match(line)
             if m:
                 rx = False
                 tx = m.groupdict()['tx']
@@ -1004,7 +957,7 @@ class ShowInterface(ShowInterfaceSchema):
                 
             if tx:
                 #0 unicast packets  0 multicast packets  0 broadcast packets
-                m = p32.match(line)
+                m = patterns.p32.match(line)
                 if m :
                     interface_dict[interface]['counters']['out_unicast_pkts'] = int(m.groupdict()['out_unicast_pkts'])
                     interface_dict[interface]['counters']['out_multicast_pkts'] = int(m.groupdict()['out_multicast_pkts'])
@@ -1012,7 +965,7 @@ class ShowInterface(ShowInterfaceSchema):
                     continue
 
             #0 output packets  0 bytes
-            m = p33.match(line)
+            m = patterns.p33.match(line)
             if m:
                 out_pkts = int(m.groupdict()['out_pkts'])
                 out_octets = int(m.groupdict()['out_octets'])
@@ -1022,7 +975,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 jumbo packets
-            m = p34.match(line)
+            m = patterns.p34.match(line)
             if m:
                 out_jumbo_packets = int(m.groupdict()['out_jumbo_packets'])
 
@@ -1030,7 +983,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 output error  0 collision  0 deferred  0 late collision
-            m = p35.match(line)
+            m = patterns.p35.match(line)
             if m:
                 interface_dict[interface]['counters']['out_errors'] = int(m.groupdict()['out_errors'])
                 interface_dict[interface]['counters']['out_collision'] = int(m.groupdict()['out_collision'])
@@ -1039,7 +992,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 lost carrier  0 no carrier  0 babble  0 output discard
-            m = p36.match(line)
+            m = patterns.p36.match(line)
             if m:
 
                 interface_dict[interface]['counters']['out_lost_carrier'] = int(m.groupdict()['out_lost_carrier'])
@@ -1049,7 +1002,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 Tx pause
-            m = p37.match(line)
+            m = patterns.p37.match(line)
             if m:
                 out_mac_pause_frames = int(m.groupdict()['out_mac_pause_frames'])
 
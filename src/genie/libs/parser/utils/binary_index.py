@@ -0,0 +1,462 @@
+'''Binary, memory mappable parser index
+
+`make json` writes the runtime index (see index.py) a third time, as
+parsers_index.bin. The file is mapped in memory with `mmap` instead of
+being decoded, so forked worker processes share a single page cache copy
+of it, and the parsers of a command are only decoded when it is used.
+
+The file is an array of native unsigned 32-bit words, followed by a blob
+of UTF-8 strings:
+
+    * header: magic, version and the (offset, count) of every section
+    * strings: offsets of the interned strings within the blob
+    * commands: (name, first entry, number of entries) in index order
+    * sorted: command numbers sorted by name, for lookups
+    * entries: (first path word, path length, package, module_name, class)
+      where the path is the os and abstraction tokens of the entry
+    * os: (name, first, count) of the commands of each os
+    * trie nodes and edges: the command trie (see command_trie.py)
+'''
+
+# python
+import os
+import mmap
+from array import array
+
+from .command_trie import CommandTrie, SINGLE_TOKEN_ARGUMENTS
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+MAGIC = 0x58444950  # 'PIDX'
+VERSION = 1
+
+# Marker for a missing string
+NONE = 0xffffffff
+
+# Sections of the file, in order, with their number of words per item
+SECTIONS = (
+    ('string_offsets', 1),
+    ('commands', 3),
+    ('sorted', 1),
+    ('entries', 5),
+    ('paths', 1),
+    ('os', 3),
+    ('os_commands', 1),
+    ('tokens', 1),
+    ('nodes', 8),
+    ('literal_edges', 2),
+    ('argument_edges', 2),
+    ('embedded_edges', 4),
+    ('node_commands', 1),
+)
+
+# magic, version, blob offset, blob length, then (offset, count) per section
+HEADER_WORDS = 4 + 2 * len(SECTIONS)
+
+
+class _Writer(object):
+    '''Build the words and string blob of a binary index'''
+
+    def __init__(self):
+        self.strings = {}
+        self.sections = dict((name, array('I')) for name, _ in SECTIONS)
+
+    def intern(self, string):
+        if string is None:
+            return NONE
+        sid = self.strings.get(string)
+        if sid is None:
+            sid = self.strings[string] = len(self.strings)
+        return sid
+
+    def add_entries(self, path, value):
+        '''Add the entries of one os or abstraction token level'''
+
+        if 'class' in value:
+            paths = self.sections['paths']
+            self.sections['entries'].extend([
+                len(paths), len(path),
+                self.intern(value.get('package')),
+                self.intern(value.get('module_name')),
+                self.intern(value.get('class'))])
+            paths.extend(self.intern(token) for token in path)
+
+        for key, child in value.items():
+            if isinstance(child, dict):
+                self.add_entries(path + [key], child)
+
+    def add_trie(self, trie, command_ids):
+        '''Flatten the command trie, breadth first'''
+
+        nodes = [trie.root]
+        node_ids = {id(trie.root): 0}
+
+        def node_id(node):
+            if id(node) not in node_ids:
+                node_ids[id(node)] = len(nodes)
+                nodes.append(node)
+            return node_ids[id(node)]
+
+        s = self.sections
+        index = 0
+        while index < len(nodes):
+            node = nodes[index]
+            index += 1
+
+            literals = sorted(node.literals)
+            s['nodes'].extend([len(s['literal_edges']) // 2, len(literals)])
+            for token in literals:
+                s['literal_edges'].extend([self.intern(token),
+                                           node_id(node.literals[token])])
+
+            s['nodes'].extend([len(s['argument_edges']) // 2,
+                               len(node.arguments)])
+            for key, child in node.arguments.items():
+                s['argument_edges'].extend([self.intern(key),
+                                            node_id(child)])
+
+            s['nodes'].extend([len(s['embedded_edges']) // 4,
+                               len(node.embedded)])
+            for token, (start, end, child) in node.embedded.items():
+                s['embedded_edges'].extend([self.intern(token),
+                    self.intern(start), self.intern(end), node_id(child)])
+
+            s['nodes'].extend([len(s['node_commands']), len(node.commands)])
+            s['node_commands'].extend(command_ids[command]
+                                                for command in node.commands)
+
+    def build(self, index):
+        s = self.sections
+        commands = list(index)
+        command_ids = dict((command, i) for i, command in enumerate(commands))
+        tokens = index.get('tokens', [])
+
+        for command in commands:
+            first = len(s['entries']) // 5
+            if command != 'tokens':
+                for os_name, value in index[command].items():
+                    self.add_entries([os_name], value)
+            s['commands'].extend([self.intern(command), first,
+                                  len(s['entries']) // 5 - first])
+
+        s['sorted'].extend(sorted(range(len(commands)),
+                                  key=commands.__getitem__))
+        s['tokens'].extend(self.intern(token) for token in tokens)
+
+        # Commands of each os, in index order
+        os_commands = {}
+        for command in commands:
+            if command == 'tokens':
+                continue
+            for os_name in index[command]:
+                if os_name not in os_commands:
+                    # 'tokens' is part of the search space of the os it lists
+                    os_commands[os_name] = [command_ids['tokens']] \
+                        if 'tokens' in index and os_name in tokens else []
+                os_commands[os_name].append(command_ids[command])
+        for os_name in sorted(os_commands):
+            s['os'].extend([self.intern(os_name), len(s['os_commands']),
+                            len(os_commands[os_name])])
+            s['os_commands'].extend(os_commands[os_name])
+
+        self.add_trie(CommandTrie(commands), command_ids)
+
+        # String blob, offsets relative to its start
+        blob = bytearray()
+        for string in sorted(self.strings, key=self.strings.__getitem__):
+            s['string_offsets'].append(len(blob))
+            blob.extend(string.encode('utf-8'))
+        s['string_offsets'].append(len(blob))
+        blob.extend(b'\0' * (-len(blob) % 4))
+
+        header = array('I', [MAGIC, VERSION, 0, len(blob)])
+        offset = HEADER_WORDS
+        for name, width in SECTIONS:
+            header.extend([offset, len(s[name]) // width])
+            offset += len(s[name])
+        header[2] = offset * header.itemsize
+
+        data = header.tobytes()
+        for name, _ in SECTIONS:
+            data += s[name].tobytes()
+        return data + bytes(blob)
+
+
+def write_binary_index(index, path):
+    '''Write the runtime index as a binary index file
+
+        Args:
+            index (`dict`): the runtime index (see `split_parser_data`)
+            path (`str`): the file to write
+    '''
+    data = _Writer().build(index)
+
+    # Replace the file atomically, it may be mapped by running processes
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+class BinaryIndex(object):
+    '''Read only view of a binary index file, mapped in memory
+
+    Args:
+        path (`str`): the binary index file
+
+    Raises:
+        ValueError: the file is not a binary index of this version
+    '''
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        words = memoryview(self._mmap)
+        if len(words) < HEADER_WORDS * 4 or len(words) % 4:
+            raise ValueError('{} is not a binary parser index'.format(path))
+        words = self.words = words.cast('I')
+
+        if words[0] != MAGIC or words[1] != VERSION:
+            raise ValueError('{} is not a binary parser index of version '
+                             '{}'.format(path, VERSION))
+
+        self.blob = words[2]
+        self.sections = {}
+        for i, (name, width) in enumerate(SECTIONS):
+            offset, count = words[4 + 2 * i], words[5 + 2 * i]
+            self.sections[name] = (offset, count, width)
+
+        self._strings = {}
+        self._os = None
+        self.tokens = [self.string(sid) for sid in self.section('tokens')]
+
+    def section(self, name, first=0, count=None):
+        '''Return the words of items `first` to `first + count` of a
+           section'''
+        offset, total, width = self.sections[name]
+        if count is None:
+            count = total - first
+        start = offset + first * width
+        return self.words[start:start + count * width]
+
+    def string(self, sid):
+        '''Return an interned string'''
+        if sid == NONE:
+            return None
+
+        string = self._strings.get(sid)
+        if string is None:
+            offsets = self.section('string_offsets', sid, 2)
+            string = self._strings[sid] = bytes(
+                self._mmap[self.blob + offsets[0]:self.blob + offsets[1]]
+            ).decode('utf-8')
+        return string
+
+    def __len__(self):
+        return self.sections['commands'][1]
+
+    def command(self, number):
+        '''Return the name of a command from its number'''
+        return self.string(self.section('commands', number, 1)[0])
+
+    def find(self, command):
+        '''Return the number of a command, or None'''
+
+        ordered = self.section('sorted')
+        low, high = 0, len(ordered)
+        while low < high:
+            middle = (low + high) // 2
+            if self.command(ordered[middle]) < command:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(ordered) and self.command(ordered[low]) == command:
+            return ordered[low]
+        return None
+
+    def value(self, number, os_name=None):
+        '''Decode the parsers of a command, limited to an os if given'''
+
+        _, first, count = self.section('commands', number, 1)
+        if self.command(number) == 'tokens':
+            return list(self.tokens)
+
+        value = {}
+        entries = self.section('entries', first, count)
+        for i in range(0, len(entries), 5):
+            path = [self.string(sid) for sid in
+                                    self.section('paths', entries[i],
+                                                 entries[i + 1])]
+            if os_name is not None and path[0] != os_name:
+                continue
+
+            level = value
+            for token in path:
+                level = level.setdefault(token, {})
+            for field, sid in zip(('package', 'module_name', 'class'),
+                                  entries[i + 2:i + 5]):
+                if sid != NONE:
+                    level[field] = self.string(sid)
+        return value
+
+    def os_commands(self, os_name):
+        '''Return the numbers of the commands of an os, in index order'''
+
+        if self._os is None:
+            self._os = {}
+            items = self.section('os')
+            for i in range(0, len(items), 3):
+                self._os[self.string(items[i])] = (items[i + 1], items[i + 2])
+
+        if os_name not in self._os:
+            return None
+        first, count = self._os[os_name]
+        return self.section('os_commands', first, count)
+
+    def to_dict(self):
+        '''Decode the whole runtime index'''
+        return dict((self.command(number), self.value(number))
+                                            for number in range(len(self)))
+
+    def _literals(self, first, count, token):
+        '''Return the children of the literal edges starting with token'''
+
+        edges = self.section('literal_edges', first, count)
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            if self.string(edges[2 * middle]) < token:
+                low = middle + 1
+            else:
+                high = middle
+
+        while low < count and self.string(edges[2 * low]).startswith(token):
+            yield edges[2 * low + 1]
+            low += 1
+
+    def search(self, tokens):
+        '''Walk the command trie, see `CommandTrie.search`
+
+            Returns:
+                list: numbers of the candidate commands, in index order
+        '''
+        found = set()
+        length = len(tokens)
+        stack = [(0, 0)]
+        visited = set()
+
+        while stack:
+            node, i = stack.pop()
+
+            if (node, i) in visited:
+                continue
+            visited.add((node, i))
+
+            (lit_first, lit_count, arg_first, arg_count, emb_first,
+             emb_count, cmd_first, cmd_count) = self.section('nodes', node, 1)
+
+            if i == length:
+                found.update(self.section('node_commands', cmd_first,
+                                                                cmd_count))
+                continue
+
+            token = tokens[i]
+
+            for child in self._literals(lit_first, lit_count, token):
+                stack.append((child, i + 1))
+
+            edges = self.section('argument_edges', arg_first, arg_count)
+            for j in range(0, len(edges), 2):
+                stack.append((edges[j + 1], i + 1))
+                if i + 2 <= length and \
+                        self.string(edges[j]) not in SINGLE_TOKEN_ARGUMENTS:
+                    stack.append((edges[j + 1], i + 2))
+
+            edges = self.section('embedded_edges', emb_first, emb_count)
+            for j in range(0, len(edges), 4):
+                if token.startswith(self.string(edges[j + 1])) and \
+                        token.endswith(self.string(edges[j + 2])):
+                    stack.append((edges[j + 3], i + 1))
+
+        return sorted(found)
+
+
+class BinaryShard(Mapping):
+    '''Commands of an os in a binary index, decoded on first access
+
+    Behaves as the read only dictionary of the os shard (see
+    `shard_parser_index`). The parsers added at runtime are overlaid by the
+    registry snapshots (see registry.py).
+
+    Args:
+        index (`BinaryIndex`): the binary index
+        os_name (`str`): the os of the shard
+    '''
+
+    def __init__(self, index, os_name):
+        self.index = index
+        self.os_name = os_name
+        numbers = index.os_commands(os_name)
+        if numbers is None:
+            # 'tokens' is part of the search space of the os it lists
+            numbers = [index.find('tokens')] \
+                if os_name in index.tokens else []
+        self.numbers = numbers
+        self.members = set(self.numbers)
+        # decoded commands
+        self._values = {}
+
+    def __len__(self):
+        return len(self.numbers)
+
+    def __iter__(self):
+        for number in self.numbers:
+            yield self.index.command(number)
+
+    def __contains__(self, command):
+        return command in self._values or \
+            self.index.find(command) in self.members
+
+    def __getitem__(self, command):
+        try:
+            return self._values[command]
+        except KeyError:
+            pass
+
+        number = self.index.find(command)
+        if number not in self.members:
+            raise KeyError(command)
+
+        value = self.index.value(number, self.os_name)
+        if not isinstance(value, list):
+            # keep the data of this os only, as in the json shards
+            value = {self.os_name: value.get(self.os_name, {})}
+        # decoding twice from concurrent readers gives the same value
+        return self._values.setdefault(command, value)
+
+
+class BinaryCommandTrie(object):
+    '''Command trie of a binary index, limited to the commands of a shard
+
+    Args:
+        shard (`BinaryShard`): the shard the search is limited to
+    '''
+
+    def __init__(self, shard):
+        self.shard = shard
+
+    def __len__(self):
+        return len(self.shard.numbers)
+
+    def __contains__(self, command):
+        return self.shard.index.find(command) in self.shard.members
+
+    def search(self, tokens):
+        members = self.shard.members
+        index = self.shard.index
+        return [index.command(number) for number in index.search(tokens)
+                                                    if number in members]
@@ -0,0 +1,266 @@
+'''Splitting of outputs made of blocks
+
+Outputs like `show interfaces`, `show bgp all detail`, `show isis database
+detail` or `show spanning-tree detail` are sequences of blocks, each
+starting with a header line naming what it describes: an interface, an
+IS-IS tag, a VLAN. `split_blocks` finds the offsets of these blocks with
+one search of the header expression over the whole output, without
+splitting it into lines; `Blocks` indexes them by the identifier captured
+by the header, so that one block is cut out of the output only when it is
+asked for. Cutting a block copies it, except as a `memoryview` of a `bytes`
+output (`Blocks.view`).
+
+    >>> blocks = Blocks(output, r'^(\\S+) is .*, line protocol is ')
+    >>> blocks.keys()
+    ['GigabitEthernet1', 'GigabitEthernet2', 'Loopback0']
+    >>> blocks['GigabitEthernet2']
+    'GigabitEthernet2 is up, line protocol is up\\n  Hardware is ...'
+
+The parsers of such outputs are `BlockParser`: they parse a single block
+of an output on demand, or all of them one by one, e.g. on the workers of
+a `concurrent.futures` executor. A block is parsed by `cli` as a `str`,
+cut out of the output.
+'''
+
+# python
+import re
+from functools import partial
+
+# Metaparser
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+from genie.metaparser.util.schemaengine import Schema
+
+# Parser utils
+from genie.libs.parser.utils.records import add_record
+from genie.libs.parser.utils.compiled_schema import CompiledSchemaParser
+
+
+def _compile(header):
+    if isinstance(header, (str, bytes)):
+        return re.compile(header, re.MULTILINE)
+    return header
+
+
+def split_blocks(output, header, start=0, end=None):
+    '''Offsets of the blocks of an output
+
+    A block starts at the start of the line of a match of the header
+    expression and ends at the start of the next one, or at the end of the
+    output. What comes before the first header is not a block.
+
+    Args:
+        output (`str` or `bytes`): output of the device
+        header (`str` or `re.Pattern`): expression of the header lines, a
+                                        `str` being compiled with
+                                        `re.MULTILINE` so that `^` is the
+                                        start of a line
+        start (`int`): offset to search from, e.g. the start of a block
+                       to split it further
+        end (`int`): offset to search up to, the end of the output by
+                     default
+
+    Returns:
+        `list` of `tuple`: `(key, start, end)` of each block, in order; the
+                           key is the group captured by the header, a
+                           tuple for several groups, the header itself
+                           without groups
+    '''
+    header = _compile(header)
+    if end is None:
+        end = len(output)
+    newline = '\n' if isinstance(output, str) else b'\n'
+
+    blocks = []
+    for match in header.finditer(output, start, end):
+        groups = match.groups()
+        if not groups:
+            key = match.group().strip()
+        elif len(groups) == 1:
+            key = groups[0]
+        else:
+            key = groups
+        # the header may be matched after the indentation of its line
+        line_start = output.rfind(newline, start, match.start()) + 1 \
+                     or start
+        if blocks:
+            blocks[-1][2] = line_start
+        blocks.append([key, line_start, end])
+    return [tuple(block) for block in blocks]
+
+
+class Blocks(object):
+    '''Blocks of an output, by the identifiers captured by their headers
+
+    Args:
+        output (`str` or `bytes`): output of the device
+        header (`str` or `re.Pattern`): expression of the header lines,
+                                        see `split_blocks`
+        start (`int`): offset to search from
+        end (`int`): offset to search up to
+
+    A block is a slice of the output, cut when it is asked for. The first
+    block of an identifier is the one given for it.
+    '''
+
+    def __init__(self, output, header, start=0, end=None):
+        self.output = output
+        self.blocks = split_blocks(output, header, start, end)
+        self._spans = {}
+        for key, block_start, block_end in self.blocks:
+            self._spans.setdefault(key, (block_start, block_end))
+
+    def __len__(self):
+        return len(self.blocks)
+
+    def __contains__(self, key):
+        return key in self._spans
+
+    def __getitem__(self, key):
+        start, end = self._spans[key]
+        return self.output[start:end]
+
+    def __iter__(self):
+        '''`(key, block)` of each block, in order'''
+        for key, start, end in self.blocks:
+            yield key, self.output[start:end]
+
+    def keys(self):
+        '''Identifiers of the blocks, in order'''
+        return list(self._spans)
+
+    def span(self, key):
+        '''`(start, end)` offsets of the block of an identifier'''
+        return self._spans[key]
+
+    def view(self, key):
+        '''Block of an identifier as a `memoryview`, for a `bytes` output
+
+        Unlike a slice, it shares the memory of the output. A `str` output
+        has no such view: its blocks are always copied.
+        '''
+        start, end = self._spans[key]
+        return memoryview(self.output)[start:end]
+
+
+def _parse_block(parser_class, kwargs, block):
+    # a class and a block are cheap to pickle, unlike a parser and its
+    # device. The block is a copy of its text: cli needs a str. The block
+    # is not checked, parse_blocks checks the merged blocks as parse does
+    return parser_class(device=None).cli(output=block, **kwargs)
+
+
+class BlockParser(object):
+    '''Mixin of the parsers of outputs made of blocks
+
+    The blocks are parsed one by one by `cli`, as whole outputs. A block
+    may add to the parsed output about other ones, as a port-channel
+    about its members: the merged parsed outputs of the blocks are checked
+    against the schema, as `parse` checks them (the compiled schema and the
+    validation policy of a `CompiledSchemaParser`), the parsed output of a
+    single block is not.
+
+    What `cli` carries over from one block to the next, e.g. the address
+    of the interface an unnumbered interface borrows it from, is lost when
+    the blocks are parsed one by one: the parser puts it back in
+    `merge_blocks`, once the blocks are merged. A parser whose blocks
+    depend on each other in other ways is not a `BlockParser`.
+
+    Class attributes:
+        block_header (`re.Pattern`): expression of the header lines of the
+                                     blocks, capturing their identifiers
+    '''
+
+    block_header = None
+
+    def blocks(self, output):
+        '''Blocks of an output of the parser
+
+        Args:
+            output (`str`): output of the device
+
+        Returns:
+            `Blocks`: blocks of the output
+        '''
+        return Blocks(output, self.block_header)
+
+    def parse_block(self, output, key, **kwargs):
+        '''Parse the block of an identifier alone
+
+        Args:
+            output (`str` or `Blocks`): output of the device, or its blocks
+            key: identifier captured by the header of the block
+            kwargs (`dict`): other arguments of `cli`
+
+        Returns:
+            `dict`: parsed output of the block, not checked against the
+                    schema
+
+        Example:
+            >>> ShowInterfaces(device=uut).parse_block(
+            ...     output, 'GigabitEthernet2')
+        '''
+        if not isinstance(output, Blocks):
+            output = self.blocks(output)
+        return self.cli(output=output[key], **kwargs)
+
+    def merge_blocks(self, parsed, blocks):
+        '''Complete the merged parsed outputs of the blocks
+
+        Called by `parse_blocks` before the schema check, to resolve what
+        one block of the output gives about another one.
+
+        Args:
+            parsed (`dict`): parsed outputs of the blocks, merged in order
+            blocks (`list`): `(key, block)` of the parsed blocks, the key
+                             of what comes before the first header being
+                             None
+
+        Returns:
+            `dict`: parsed output of the blocks
+        '''
+        return parsed
+
+    def parse_blocks(self, output, keys=None, map=map, **kwargs):
+        '''Parse the blocks of an output one by one
+
+        What comes before the first header is parsed as a block of its own,
+        so that all the blocks give the parsed output of the whole output.
+
+        Args:
+            output (`str` or `Blocks`): output of the device, or its blocks
+            keys (`list`): identifiers of the blocks to parse, all of them
+                           by default
+            map (`callable`): `map` calling `cli` on each block, e.g. the
+                              `map` of a `ProcessPoolExecutor`
+            kwargs (`dict`): other arguments of `cli`
+
+        Returns:
+            `dict`: parsed outputs of the blocks merged in order, checked
+                    against the schema as `parse` checks them
+
+        Example:
+            >>> with ProcessPoolExecutor() as executor:
+            ...     parsed = ShowInterfaces(device=uut).parse_blocks(
+            ...         output, map=executor.map)
+        '''
+        if not isinstance(output, Blocks):
+            output = self.blocks(output)
+        if keys is None:
+            blocks = list(output)
+            preamble = output.output[:output.blocks[0][1]] \
+                       if output.blocks else output.output
+            if preamble.strip():
+                blocks.insert(0, (None, preamble))
+        else:
+            blocks = [(key, output[key]) for key in keys]
+
+        parsed = {}
+        for block_parsed in map(partial(_parse_block, type(self), kwargs),
+                                [block for _, block in blocks]):
+            add_record(parsed, ((), block_parsed))
+        if not parsed:
+            raise SchemaEmptyParserError(parsed)
+        parsed = self.merge_blocks(parsed, blocks)
+        if isinstance(self, CompiledSchemaParser):
+            return Schema(self.checked_schema()).validate(parsed)
+        return Schema(self.schema).validate(parsed)
@@ -0,0 +1,208 @@
+'''Columnar parsed outputs of the table parsers
+
+Analytics over many devices load the tables of the parsed outputs into
+arrays, walking the nested dicts of each output for each entry.
+`parse(columnar=True)` gives the entries of the table of the parser as
+columns instead: a list or array of values per key of the entries, and a
+column per key of the table leading to them:
+
+    >>> ShowIpNatTranslations(device=uut).parse(columnar=True)
+    {'vrf': ['default', 'default', 'default'],
+     'index': array('q', [1, 2, 3]),
+     'protocol': ['udp', 'tcp', 'tcp'],
+     'inside_global': ['10.1.7.2:1220', '10.1.7.2:11012', '10.1.7.2:1067'],
+     ...
+     'details.use_count': [None, None, None]}
+
+The table of a parser is declared by its `columnar_table`, a field as in
+`ProjectionParser`: the path of keys to the entries, `*` standing for the
+keys of the table, each of them given as the key column of the same rank
+in `columnar_keys`. The columns of the entries are the keys of their schema,
+the keys of their nested dicts joined by dots. A value missing from an
+entry is None in its column.
+
+The columns of numbers, ints or floats without None, are arrays: NumPy
+arrays when NumPy is installed, `array.array` otherwise. The other columns
+are lists.
+'''
+
+# python
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Metaparser
+from genie.metaparser.util.schemaengine import Optional
+
+_wildcard = '*'
+
+
+def _literal(key):
+    '''String of a literal key of a schema, or None'''
+    if type(key) is Optional:
+        key = key.schema
+    return key if isinstance(key, str) else None
+
+
+def _path(table):
+    if isinstance(table, str):
+        return tuple(table.split('.'))
+    return tuple(table)
+
+
+def _entry_schemas(schema, path):
+    '''Schemas of the entries at a path of a schema'''
+    schemas = [schema]
+    for segment in path:
+        found = []
+        for node in schemas:
+            for key, value in node.items():
+                if type(value) is dict and (segment == _wildcard or
+                                            _literal(key) == segment):
+                    found.append(value)
+        schemas = found
+    return schemas
+
+
+def _fields(schema, prefix=()):
+    '''Paths of keys of the values of the entries of a schema'''
+    for key, value in schema.items():
+        literal = _literal(key)
+        if literal is None:
+            continue
+        if type(value) is dict:
+            if all(_literal(nested) is not None for nested in value):
+                yield from _fields(value, prefix + (literal,))
+            # tables in the entries are not columns
+            continue
+        yield prefix + (literal,)
+
+
+def table_fields(schema, table, keys=()):
+    '''Columns of the entries of a table of a schema
+
+    Args:
+        schema (`dict`): schema of the parser
+        table (`str`): path of the entries, see `columnar_table`
+        keys (`tuple`): key columns, left out of the columns
+
+    Returns:
+        `list`: path of keys of each column
+    '''
+    fields = []
+    for entry in _entry_schemas(schema, _path(table)):
+        for field in _fields(entry):
+            if field not in fields and \
+                    not (len(field) == 1 and field[0] in keys):
+                fields.append(field)
+    return fields
+
+
+def _entries(parsed, path):
+    '''(keys, entry) of the entries at a path of a parsed output'''
+    nodes = [((), parsed)]
+    for segment in path:
+        found = []
+        for keys, node in nodes:
+            if type(node) is not dict:
+                continue
+            if segment == _wildcard:
+                found.extend((keys + (key,), value)
+                             for key, value in node.items())
+            elif segment in node:
+                found.append((keys, node[segment]))
+        nodes = found
+    return [(keys, entry) for keys, entry in nodes if type(entry) is dict]
+
+
+def _value(entry, field):
+    for key in field:
+        if type(entry) is not dict:
+            return None
+        entry = entry.get(key)
+    return entry
+
+
+def _column(values):
+    '''Column of values, as an array when they are all numbers'''
+    types = set(map(type, values))
+    if not types or not types <= {int, float}:
+        return values
+    typecode = 'q' if types == {int} else 'd'
+    try:
+        if numpy is not None:
+            return numpy.array(values, dtype=numpy.int64 if typecode == 'q'
+                               else numpy.float64)
+        return array(typecode, values)
+    except OverflowError:
+        return values
+
+
+def columns(parsed, table, keys, fields):
+    '''Columns of the entries of a table of a parsed output
+
+    Args:
+        parsed (`dict`): parsed output
+        table (`str`): path of the entries, see `columnar_table`
+        keys (`tuple`): name of the key column of each `*` of the path
+        fields (`list`): path of keys of each column, see `table_fields`
+
+    Returns:
+        `dict`: column name -> list or array of the values of the entries
+    '''
+    entries = _entries(parsed, _path(table))
+    output = {}
+    for index, name in enumerate(keys):
+        output[name] = _column([entry_keys[index]
+                                for entry_keys, _ in entries])
+    for field in fields:
+        output['.'.join(field)] = _column([_value(entry, field)
+                                           for _, entry in entries])
+    return output
+
+
+class ColumnarParser(object):
+    '''Mixin of the table parsers giving the columns of their entries
+
+    `parse` takes a `columnar` argument: the parsed output, checked against
+    the schema, is given as the `columns` of its table.
+
+    Class attributes:
+        columnar_table (`str`): path of the entries of the table, `*`
+                                standing for the keys of the table
+        columnar_keys (`tuple`): name of the key column of each `*` of
+                                 `columnar_table`
+    '''
+
+    columnar_table = None
+    columnar_keys = ()
+
+    @classmethod
+    def columnar_fields(cls):
+        '''Columns of the entries of the table, from the schema of the
+        class'''
+        fields = cls.__dict__.get('_columnar_fields')
+        if fields is None or fields[0] is not cls.schema:
+            fields = (cls.schema, table_fields(
+                cls.schema, cls.columnar_table, cls.columnar_keys))
+            cls._columnar_fields = fields
+        return fields[1]
+
+    def parse(self, *args, columnar=False, **kwargs):
+        '''Parse the output, as the columns of its table if columnar
+
+        Args:
+            columnar (`bool`): give the columns of the table
+            args, kwargs: arguments of `parse`
+
+        Returns:
+            `dict`: parsed output, or column name -> values
+        '''
+        parsed = super().parse(*args, **kwargs)
+        if not columnar:
+            return parsed
+        return columns(parsed, self.columnar_table, self.columnar_keys,
+                       self.columnar_fields())
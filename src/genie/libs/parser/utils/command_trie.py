@@ -0,0 +1,184 @@
+'''Token trie over the show commands known to genie.libs.parser
+
+The trie is used by `_fuzzy_search_command` to narrow the list of commands
+that need to be compared with the (expensive) `_matches_fuzzy` function.
+Each node holds three kinds of edges:
+
+    * literal tokens, kept sorted so that abbreviated search tokens
+      ('sh', 'ver') can be matched by prefix with a binary search
+    * argument slots ('{interface}'), which can consume one or two
+      search tokens
+    * embedded argument tokens ('/dna/intent/{interface}'), which must
+      start and end with the literal parts around the argument
+'''
+
+# python
+import re
+from bisect import bisect_left
+
+# Arguments which can only span a single search token
+# (must be kept in sync with `_matches_fuzzy`)
+SINGLE_TOKEN_ARGUMENTS = frozenset(['vrf', 'rd', 'instance', 'vrf_type',
+                                    'feature', 'fileA', 'fileB'])
+
+
+class CommandTrieNode(object):
+    '''A single node of the command trie'''
+
+    __slots__ = ('literals', 'sorted_literals', 'arguments', 'embedded',
+                 'commands')
+
+    def __init__(self):
+        # token -> CommandTrieNode
+        self.literals = {}
+        # sorted list of literal tokens, built lazily for prefix lookups
+        self.sorted_literals = None
+        # argument name -> CommandTrieNode
+        self.arguments = {}
+        # command token -> (start, end, CommandTrieNode)
+        self.embedded = {}
+        # commands which end on this node
+        self.commands = []
+
+
+class CommandTrie(object):
+    '''Token trie built from the keys of the parser data
+
+    Args:
+        commands (`iterable`): the commands to insert in the trie
+
+    Example:
+        >>> trie = CommandTrie(['show version', 'show vrf {vrf}'])
+        >>> trie.search(['sh', 'ver'])
+        ['show version']
+    '''
+
+    def __init__(self, commands=()):
+        self.root = CommandTrieNode()
+        # command -> insertion order, used to return results in the same
+        # order as the parser data
+        self.order = {}
+
+        for command in commands:
+            self.insert(command)
+
+    def __len__(self):
+        return len(self.order)
+
+    def __contains__(self, command):
+        return command in self.order
+
+    def insert(self, command):
+        '''Add a command to the trie, if not already present'''
+
+        if command in self.order:
+            return
+
+        self.order[command] = len(self.order)
+        node = self.root
+
+        for command_token in command.split():
+            if '{' not in command_token:
+                child = node.literals.get(command_token)
+                if child is None:
+                    child = node.literals[command_token] = CommandTrieNode()
+                    node.sorted_literals = None
+            elif command_token.startswith('{'):
+                argument_key = re.search('{(.*)}', command_token).groups()[0]
+                child = node.arguments.get(argument_key)
+                if child is None:
+                    child = node.arguments[argument_key] = CommandTrieNode()
+            else:
+                child = node.embedded.get(command_token)
+                if child is None:
+                    start, end = re.match('(.*){.*?}(.*)',
+                                          command_token).groups()
+                    child = CommandTrieNode()
+                    node.embedded[command_token] = (start, end, child)
+                else:
+                    child = child[2]
+            node = child
+
+        node.commands.append(command)
+
+    def _prefixed(self, node, token):
+        '''Return the literal children whose token starts with `token`'''
+
+        if node.sorted_literals is None:
+            node.sorted_literals = sorted(node.literals)
+
+        literals = node.sorted_literals
+        index = bisect_left(literals, token)
+        while index < len(literals) and literals[index].startswith(token):
+            yield node.literals[literals[index]]
+            index += 1
+
+    def search(self, tokens):
+        '''Find the commands which could match the given search tokens
+
+            Only the branches of the trie matching the tokens are walked.
+            The result is a superset of the commands `_matches_fuzzy` would
+            accept for regular (non regex) tokens, sorted in insertion order.
+
+            Args:
+                tokens (`list`): the search tokens
+
+            Returns:
+                list: the candidate commands
+        '''
+        found = set()
+        length = len(tokens)
+        stack = [(self.root, 0)]
+        visited = set()
+
+        while stack:
+            node, i = stack.pop()
+
+            if (id(node), i) in visited:
+                continue
+            visited.add((id(node), i))
+
+            if i == length:
+                found.update(node.commands)
+                continue
+
+            token = tokens[i]
+
+            for child in self._prefixed(node, token):
+                stack.append((child, i + 1))
+
+            for argument_key, child in node.arguments.items():
+                stack.append((child, i + 1))
+                if i + 2 <= length and \
+                        argument_key not in SINGLE_TOKEN_ARGUMENTS:
+                    stack.append((child, i + 2))
+
+            for start, end, child in node.embedded.values():
+                if token.startswith(start) and token.endswith(end):
+                    stack.append((child, i + 1))
+
+        return sorted(found, key=self.order.__getitem__)
+
+
+class OverlayCommandTrie(object):
+    '''Command trie of a registry snapshot: the trie of the index, which is
+    never modified, followed by a trie of the commands added at runtime
+
+    Args:
+        base (`CommandTrie`): trie of the commands of the index
+        commands (`iterable`): commands added at runtime, not in `base`
+    '''
+
+    def __init__(self, base, commands=()):
+        self.base = base
+        self.extra = CommandTrie(command for command in commands
+                                                    if command not in base)
+
+    def __len__(self):
+        return len(self.base) + len(self.extra)
+
+    def __contains__(self, command):
+        return command in self.base or command in self.extra
+
+    def search(self, tokens):
+        return self.base.search(tokens) + self.extra.search(tokens)
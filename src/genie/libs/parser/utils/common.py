@@ -13,34 +13,104 @@ import math
 from genie.libs import parser
 from genie.abstract import Lookup
 
+from .fuzzy_match import (SearchTokens, get_template, match_command,
+                          is_regular_token as _is_regular_token)
+from .lookup_cache import LookupCache
+from .index import ParserIndex, load_parser_index, load_parser_docs
+from .registry import ParserRegistry, CurrentParserData, DataSnapshot
+
 log = logging.getLogger(__name__)
 
 def _load_parser_json():
     '''get all parser data in json file'''
-    try:
-        mod = importlib.import_module('genie.libs.parser')
-        parsers = os.path.join(mod.__path__[0], 'parsers.json')
-    except Exception:
-        parsers = ''
-    if not os.path.isfile(parsers):
-        log.warning('parsers.json does not exist, make sure you '
-                    'are running with latest version of '
-                    'genie.libs.parsers')
-        parser_data = {}
-    else:
-        # Open all the parsers in json file
-        with open(parsers) as f:
-            parser_data = json.load(f)
-    return parser_data
+    return load_parser_index()
+
+def _load_index():
+    # looked up at each load, so that _load_parser_json can be patched
+    return _load_parser_json()
+
+# Parser within Genie, loaded one os at a time
+parser_index = ParserIndex(loader=_load_index)
+
+# Parser within Genie and the ones added by `entry_points.add_parser`
+parser_registry = ParserRegistry(parser_index)
+
+# Parser data of every os, as of the latest snapshot
+parser_data = _registry_parser_data = CurrentParserData(parser_registry)
+
+# Maximum number of resolved parsers kept by get_parser
+PARSER_CACHE_SIZE = 1024
+
+# Resolved (parser class, kwargs) keyed by command, device abstraction and
+# registry version
+parser_cache = LookupCache(maxsize=PARSER_CACHE_SIZE)
+
+def _get_snapshot():
+    '''Return the snapshot of the parsers to search: the latest registry
+       snapshot, or the dict common.parser_data was replaced with'''
+    if parser_data is _registry_parser_data:
+        return parser_registry.snapshot
+
+    warnings.warn('Replacing common.parser_data is deprecated, add the '
+                  'parsers with entry_points.add_parser instead',
+                  DeprecationWarning, stacklevel=3)
+    return DataSnapshot(parser_data)
+
+def _get_parser_data(os=None, snapshot=None):
+    '''Return the parser data of an os, or of every os if os is None'''
+    snapshot = snapshot or _get_snapshot()
+    return snapshot.get(os)
+
+def _get_command_trie(os=None, snapshot=None):
+    '''Return the command trie of an os, or of every os if os is None'''
+    snapshot = snapshot or _get_snapshot()
+    return snapshot.command_trie(os)
+
+def _add_parser_data(command, os_name, entry):
+    '''Add the parser of a command for an os to the parser data'''
+    _add_parsers_data([(command, os_name, entry)])
+
+def _add_parsers_data(entries):
+    '''Add the (command, os, parser location) entries to the parser data,
+       as a single new registry snapshot'''
+
+    parser_registry.add_many(entries)
+
+    # The cache is keyed on the registry version, the entries of the
+    # previous versions cannot be used anymore
+    parser_cache.clear()
+
+# Parser doc, schema, uid and url, loaded on first use
+_parser_docs = None
+
+def get_parser_docs():
+    '''Return the documentation of all the parsers within parser_data
+
+       The docs are not needed to resolve a parser, so they are kept in a
+       separate file which is only loaded the first time this is called.
+    '''
+    global _parser_docs
 
-# Parser within Genie
-parser_data = _load_parser_json()
+    if _parser_docs is None:
+        _parser_docs = load_parser_docs()
+    return _parser_docs
 
-def get_parser_commands(device, data=parser_data):
+def get_parser_cache_info():
+    '''Return the hits, misses, maxsize and currsize of the get_parser cache'''
+    return parser_cache.info()
+
+def clear_parser_cache():
+    '''Remove all the parsers resolved by get_parser from the cache'''
+    parser_cache.clear()
+
+def get_parser_commands(device, data=None):
     '''Remove all commands which contain { as this requires
        extra kwargs which cannot be guessed dynamically
        Remove the ones that arent related to this os'''
 
+    if data is None:
+        data = _get_parser_data(device.os)
+
     commands = []
     for command, values in data.items():
         if '{' in command or command == 'tokens' or device.os not in values:
@@ -69,16 +139,174 @@ def get_parser_exclude(command, device):
     except AttributeError:
         return []
 
-def get_parser(command, device, fuzzy=False):
-    '''From a show command and device, return parser class and kwargs if any'''
-
+def _token_values(value):
+    '''Return the values of an abstraction token, in a hashable form'''
+    if value is None:
+        return ()
+    if isinstance(value, (list, tuple)):
+        return tuple(str(item) for item in value)
+    return (str(value),)
+
+def _abstraction_tokens(device, order_list):
+    '''Return the abstraction token values of the device, as used by
+       Lookup.from_device, in a hashable form
+
+       The tokens are the ones of the abstraction order of the device, and
+       the ones of the abstract parser package (os, platform, model...) that
+       Lookup.from_device takes from any device. Each is taken from all the
+       places Lookup.from_device reads it: the abstraction of the device,
+       of the parser package in it, the device attribute and the abstraction
+       of the testbed.'''
+
+    package = getattr(parser, '__abstract_pkg', None)
+    package_name = getattr(package, 'name', None)
+
+    sources = []
     try:
-        order_list = device.custom.get('abstraction').get('order', [])
+        sources.append(device.custom.get('abstraction') or {})
     except AttributeError:
-        order_list = None
+        pass
+    testbed = getattr(device, 'testbed', None)
+    for owner in (device, testbed):
+        abstraction = getattr(owner, 'abstraction', None)
+        if isinstance(abstraction, dict):
+            sources.append(abstraction)
+    sources.extend([source[package_name] for source in sources
+                    if isinstance(source.get(package_name), dict)])
+
+    attrs = list(order_list or [])
+    attrs.extend(attr for attr in getattr(package, 'order', None) or []
+                 if attr not in attrs)
+
+    tokens = []
+    for attr in attrs:
+        values = _token_values(getattr(device, attr, None))
+        for source in sources:
+            values += _token_values(source.get(attr))
+        tokens.append(values)
+    return tuple(tokens)
+
+def _abstraction_order(device):
+    '''Return the abstraction order list of the device, if any'''
+    try:
+        return device.custom.get('abstraction').get('order', [])
+    except AttributeError:
+        return None
+
+def get_parser(command, device, fuzzy=False):
+    '''From a show command and device, return parser class and kwargs if any
 
-    lookup = Lookup.from_device(device, packages={'parser': parser})
-    results = _fuzzy_search_command(command, fuzzy, device.os, order_list)
+       Resolved parsers are kept in a bounded LRU cache, keyed by the command,
+       the device os and abstraction tokens, the fuzzy flag and the version
+       of the parser registry. The whole lookup uses the same snapshot of the
+       registry, parsers added meanwhile by `entry_points.add_parser` are
+       only used by the next lookups.
+    '''
+
+    order_list = _abstraction_order(device)
+
+    return _get_cached_parser(command, device, fuzzy, order_list,
+                              _abstraction_tokens(device, order_list),
+                              snapshot=_get_snapshot())
+
+def get_parsers(commands, device, fuzzy=False):
+    '''From a list of show commands and a device, return the parser class
+       and kwargs of each command
+
+       The device abstraction, the registry snapshot and the `Lookup` of
+       each parser package are only computed once for the whole batch, and
+       repeated commands are only resolved once.
+
+        Args:
+            commands (`list`): the show commands
+            device (`Device`): the device the commands are for
+            fuzzy (`bool`): whether or not fuzzy mode should be used
+
+        Returns:
+            dict: command -> (parser class, kwargs), or the list of
+                  (command, parser class, kwargs) if fuzzy, as returned by
+                  get_parser. If a command cannot be resolved, the exception
+                  raised is returned instead.
+
+        Example:
+            >>> get_parsers(['show version', 'show xyz'], device)
+            {'show version': (<class 'ShowVersion'>, {}),
+             'show xyz': Exception("Could not find parser for 'show xyz' ...")}
+    '''
+
+    order_list = _abstraction_order(device)
+    tokens = _abstraction_tokens(device, order_list)
+    snapshot = _get_snapshot()
+
+    # Lookup of each parser package, shared by the commands
+    lookups = {}
+    results = {}
+    for command in commands:
+        if command in results:
+            continue
+        try:
+            results[command] = _get_cached_parser(command, device, fuzzy,
+                                                  order_list, tokens, lookups,
+                                                  snapshot)
+        except Exception as e:
+            results[command] = e
+    return results
+
+def _get_cached_parser(command, device, fuzzy, order_list, tokens,
+                                                lookups=None, snapshot=None):
+    '''Return the parser of a command from the cache, resolving it on
+       misses'''
+
+    snapshot = snapshot or _get_snapshot()
+
+    # Non fuzzy searches only depend on the tokens of the command. Exact
+    # commands are kept as is, as perfect matches skip the search
+    if not fuzzy and not snapshot.has_command(command):
+        command = ' '.join(command.split())
+
+    key = (command, device.os, tokens,
+           tuple(order_list) if order_list is not None else None, fuzzy,
+           snapshot.version)
+    if snapshot.version is None:
+        # Parser data without versions, do not cache
+        key, cached = None, parser_cache.MISSING
+    else:
+        try:
+            cached = parser_cache.get(key)
+        except TypeError:
+            # Unhashable device attributes, do not cache
+            key, cached = None, parser_cache.MISSING
+
+    if cached is parser_cache.MISSING:
+        cached = _get_parser(command, device, fuzzy, order_list, lookups,
+                             snapshot)
+        if key is not None:
+            parser_cache.put(key, cached)
+
+    # Return copies so the cached entry cannot be modified by the caller
+    if not fuzzy:
+        return cached[0], dict(cached[1])
+    return [(found_command, cls, dict(kwargs))
+                                    for found_command, cls, kwargs in cached]
+
+def _get_parser(command, device, fuzzy, order_list, lookups=None,
+                                                            snapshot=None):
+    '''Resolve the parser class and kwargs of a show command for a device
+
+       lookups (package name -> Lookup) is shared by the commands of a batch,
+       snapshot is the registry snapshot to search, default to the latest
+    '''
+
+    if lookups is None:
+        lookup = Lookup.from_device(device, packages={'parser': parser})
+    else:
+        lookup = lookups.get(parser.__name__)
+        if lookup is None:
+            lookup = lookups[parser.__name__] = Lookup.from_device(
+                                        device, packages={'parser': parser})
+
+    results = _fuzzy_search_command(command, fuzzy, device.os, order_list,
+                                    snapshot=snapshot)
     valid_results = []
     
     for result in results:
@@ -93,8 +321,11 @@ def get_parser(command, device, fuzzy=False):
                 data = data[token]
 
         try:
-            valid_results.append((found_command, 
-                                        _find_parser_cls(device, data), kwargs))
+            if lookups is None:
+                cls = _find_parser_cls(device, data)
+            else:
+                cls = _find_parser_cls(device, data, lookups)
+            valid_results.append((found_command, cls, kwargs))
         except KeyError:
             # Case when the show command is only found under one of
             # the child level tokens
@@ -110,7 +341,7 @@ def get_parser(command, device, fuzzy=False):
     return valid_results
 
 def _fuzzy_search_command(search, fuzzy, os=None, order_list=None, 
-                                                                device=None):
+                                                device=None, snapshot=None):
     """ Find commands that match the search criteria.
 
         Args: 
@@ -119,15 +350,27 @@ def _fuzzy_search_command(search, fuzzy, os=None, order_list=None,
             os (`str`): the device os that the search space is limited to
             order_list (`list`): the device abstraction order list if any
             device (`Device`): the device instance
+            snapshot (`RegistrySnapshot`): the parsers to search, default to
+                                           the latest registry snapshot
 
         Returns:
             list: the result of the search
     """
 
+    # The whole search uses the same version of the parsers
+    snapshot = snapshot or _get_snapshot()
+
+    # Only load the parsers of the requested os
+    parser_data = snapshot.get(os)
+
     # Perfect match should return 
     if search in parser_data:
         return [(search, parser_data[search], {})]
 
+    # Perfect match of a command which is not available for this os
+    if os and snapshot.has_command(search):
+        return []
+
     # Preprocess if fuzzy
     if fuzzy:
         search = search.lstrip('^').rstrip('$').replace(r'\ ', ' ').replace(
@@ -141,10 +384,11 @@ def _fuzzy_search_command(search, fuzzy, os=None, order_list=None,
     best_score = -math.inf
     result = []
 
-    for command, source in parser_data.items():
-        # Tokens and kwargs parameter must be non reference
-        match_result = _matches_fuzzy(0, 0, tokens.copy(),
-                                                        command, {}, fuzzy)
+    # The search tokens are only analysed once for all the commands
+    search_tokens = SearchTokens(tokens, fuzzy)
+
+    for command, source in _candidate_commands(tokens, fuzzy, os, snapshot):
+        match_result = match_command(get_template(command), search_tokens)
 
         if match_result: 
             kwargs, score = match_result
@@ -191,35 +435,37 @@ def _fuzzy_search_command(search, fuzzy, os=None, order_list=None,
 
     return result
 
-def _is_regular_token(token):
-    """ Checks if a token is regular (does not contain regex symbols).
+def _candidate_commands(tokens, fuzzy, os=None, snapshot=None):
+    """ Find the commands which could match the search tokens.
 
-        Args: 
-            token (`str`): the token to be tested
+        Regular tokens are looked up in the command trie, so that only the
+        matching branches are compared with `_matches_fuzzy`. Regex tokens
+        can span any part of a command, so every command is a candidate.
 
-        Returns:
-            bool: whether or not the token is regular
+        Args:
+            tokens (`list`): the search tokens
+            fuzzy (`bool`): whether or not fuzzy mode should be used
+            os (`str`): the device os that the search space is limited to
+            snapshot (`RegistrySnapshot`): the parsers to search, default to
+                                           the latest registry snapshot
 
+        Returns:
+            list: (command, source) of the candidate commands
     """
-    token_is_regular = True
-
-    if not token.isalnum():
-        # Remove escaped characters
-        candidate = token.replace('/', '')
-        candidate = candidate.replace('"', '')
-        candidate = candidate.replace(r'\^', '')
-        candidate = candidate.replace('\'', '')
-        candidate = candidate.replace('-', '')
-        candidate = candidate.replace('^', '')
-        candidate = candidate.replace('_', '')
-        candidate = candidate.replace(':', '')
-        candidate = candidate.replace(',', '')
-        candidate = candidate.replace(r'\.', '')
-        candidate = candidate.replace(r'\|', '')
-
-        token_is_regular = candidate.isalnum() or candidate == ''
-    
-    return token_is_regular
+    snapshot = snapshot or _get_snapshot()
+    parser_data = snapshot.get(os)
+
+    if fuzzy:
+        if not all(token == '*' or _is_regular_token(token)
+                                                        for token in tokens):
+            return list(parser_data.items())
+
+        # Same special cases as `_matches_fuzzy`
+        tokens = [token.replace(r'\|', '|').replace(r'\.', '.')
+                                                        for token in tokens]
+
+    return [(command, parser_data[command])
+                        for command in snapshot.command_trie(os).search(tokens)]
 
 def _matches_fuzzy(i, j, tokens, command, kwargs, fuzzy, 
                                             required_arguments=None, score=0):
@@ -236,234 +482,21 @@ def _matches_fuzzy(i, j, tokens, command, kwargs, fuzzy,
             score (`int`): the current similarity score between token and command
 
             Returns:
-                bool: whether or not search matches the command
+                tuple: (kwargs, score) if search matches the command, else None
 
     """
-    command_tokens = command.split()
-
-    # Initialize by counting how many arguments this command needs
-    if required_arguments is None:
-        required_arguments = len(re.findall('{.*?}', command))
-
-    while i < len(tokens):
-        # If command token index is greater than its length, stop
-        if j >= len(command_tokens):
-            return None
-
-        token = tokens[i]
-        command_token = command_tokens[j]
-        token_is_regular = True
-
-        if fuzzy:
-            if token == '*':
-                # Special case for `show lldp entry *`
-                token_is_regular = True
-            else:
-                # Check if it is nonregex token
-                token_is_regular = _is_regular_token(token)
-
-            if token_is_regular: 
-                # Special case for `:\|Swap:`
-                token = token.replace(r'\|', '|')
-                
-                # Special case for command `vim-cmd vmsvc/snapshot.get {vmid}`
-                token = token.replace(r'\.', '.')
-
-        if token_is_regular:
-            # Current token might be command or argument
-            if '{' in command_token:
-                # Handle the edge case of argument not being a token
-                # When this is implemented there is only one case:
-                # /dna/intent/api/v1/interface/{interface}
-                if not command_token.startswith('{'):
-                    # Find before and after string
-                    groups = re.match('(.*){.*?}(.*)', command_token).groups()
-                    is_found = False
-
-                    if len(groups) == 2:
-                        start, end = groups
-
-                        # Need to have perfect match with token
-                        if token.startswith(start) and token.endswith(end):
-                            # Escape regex
-                            start = re.escape(start)
-                            end = re.escape(end)
-
-                            # Find the argument using the escaped start and end
-                            kwargs[
-                                re.search('{(.*)}', command_token).groups()[0]
-                            ] = re.match('{}(.*){}'
-                                        .format(start, end), token).groups()[0]
-
-                            is_found = True
-                            score += 103
-                    
-                    if not is_found:
-                        return None
-                else:
-                    argument_key = re.search('{(.*)}', 
-                                                    command_token).groups()[0]
-                    i += 1
-                    j += 1
-                    
-                    # Plus 101 once to favor nongreedy argument fit
-                    score += 100
-
-                    # If argument is any of these, argument can only be 1 token
-                    # Else argument can be up to 2 tokens
-                    endpoint = i + 1 \
-                        if argument_key == 'vrf' \
-                            or argument_key == 'rd' \
-                            or argument_key == 'instance' \
-                            or argument_key == 'vrf_type' \
-                            or argument_key == 'feature' \
-                            or argument_key == 'fileA' \
-                            or argument_key == 'fileB' \
-                        else i + 2
-
-                    # Try out ways we can assign search tokens into argument
-                    for index in range(i, endpoint):
-                        if index > len(tokens):
-                            return None
-
-                        # Make sure not to use regex expression as argument
-                        if index > i: 
-                            if fuzzy and not _is_regular_token(tokens[
-                                                                    index - 1]): 
-                                return None
-
-                        # Currently spanned argument
-                        argument_value = ' '.join(tokens[i - 1:index]).rstrip(
-                                                        '"').replace('\\', '')
-                        
-                        # Delete the extra tokens if spanning more than one
-                        tokens_copy = tokens[:i] + tokens[index:]
-                        tokens_copy[i - 1] = command_token
-                        kwargs_copy = kwargs.copy()
-                        kwargs_copy.setdefault(argument_key, argument_value)
-                        
-                        result = _matches_fuzzy(i, j, tokens_copy, command,
-                                kwargs_copy, fuzzy, required_arguments, score)
-                            
-                        if result:
-                            result_kwargs, score = result
-
-                            if len(result_kwargs) == required_arguments:
-                                    return result_kwargs, score
-
-                    return None
-            elif token == command_token:
-                # Same token, assign higher score
-                score += 102
-            elif not token == command_token:
-                # Not matching, check if prefix
-                if not command_token.startswith(token):
-                    return None
-
-                # The two tokens are similar to each other, replace
-                tokens[i] = command_token
-                score += 100
-
-            # Matches current, go to next token
-            i += 1
-            j += 1
-        else:
-            # Count number of regex tokens that got ate
-            skipped = 1
-
-            # Not a token, should be a regex expression
-            # Keep eating if next token is also regex
-            while i + 1 < len(tokens) and not _is_regular_token(tokens[i + 1]):
-                i += 1
-                skipped += 1
-
-            # Match current span with command
-            test = re.match(' '.join(tokens[:i + 1]), command)
-
-            if test:
-                # Perform command token lookahead
-                _, end = test.span()
-
-                # Expression matches command to end
-                if i + 1 == len(tokens) and end == len(command): 
-                    # Return result if from start to end there are no arguments
-                    if all(not '{' in ct for ct in command_tokens[j:]):
-                        return kwargs, score
-                    else: 
-                        # Else in range we have another unspecified argument
-                        return None
-
-                if end == 0: 
-                    # If regex matched nothing, we stop because
-                    # expression = "d? a b c" search in "a b c"
-                    # expression = "a b d? c" search in "a b c"
-                    return None
-
-                # Span single command token
-                if abs(
-                    end - sum(len(ct) for ct in command_tokens[:j + 1]) - j
-                ) <= 1:
-                    if not '{' in command_token:
-                        # Span single token if it is not argument
-                        i += 1
-                        j += 1
-
-                        continue
-                    else:
-                        # Faulty match
-                        return None
-                else:
-                    # Span multiple command tokens
-                    # Find which command token it spans up to
-                    current_sum = 0
-                    token_end = 0
-
-                    while current_sum + len(command_tokens[token_end]) <= end:
-                        current_sum += len(command_tokens[token_end])
-                        
-                        if current_sum < end:
-                            # Account for space 
-                            current_sum += 1
-                            token_end += 1
-                        else:
-                            break
-
-                    # Incrememt token index
-                    i += 1
-                
-                    # For matched range, perform submatches on next real token
-                    for subindex in range(j + skipped, token_end + 1):
-                        # Make sure items are passed by copies, not by reference
-                        submatch_result = _matches_fuzzy(i, subindex, 
-                            tokens.copy(), command, kwargs.copy(),
-                                            fuzzy, required_arguments, score)
-                        
-                        # If any match is found, return true
-                        if submatch_result:
-                            result_kwargs, score = submatch_result
-
-                            # Result kwargs must match 
-                            # number of arguments this command requires
-                            if required_arguments == len(result_kwargs):
-                                return result_kwargs, score
-
-                    # Fail to match
-                    return None
-            else:
-                # Failed to match fuzzy
-                return None
-
-    # Reached end of tokens
-    if len(command_tokens) == j:
-        # If command pointer is at end then it matches
-        return kwargs, score
-    else: 
-        # It doesn't match
-        return None
-
-
-def _find_parser_cls(device, data):
-    lookup = Lookup.from_device(device, packages={'parser':importlib.import_module(data['package'])})
+    return match_command(get_template(command),
+                         SearchTokens(tokens[i:], fuzzy), j, tokens[:i],
+                         kwargs, score, required_arguments)
+
+
+def _find_parser_cls(device, data, lookups=None):
+    # lookups caches the Lookup of each package, see get_parsers
+    lookup = lookups.get(data['package']) if lookups is not None else None
+    if lookup is None:
+        lookup = Lookup.from_device(device, packages={'parser':importlib.import_module(data['package'])})
+        if lookups is not None:
+            lookups[data['package']] = lookup
 
     return getattr(getattr(lookup.parser, data['module_name']), data['class'])
 
@@ -0,0 +1,247 @@
+'''Parsed outputs made of compact records
+
+The tables of the parsed outputs (MAC addresses, NAT translations, ARP
+entries, routes, ...) hold a dict per entry, each with its own hash table.
+`parse(compact=True)` gives each entry as an instance of a `__slots__`
+record class generated from the schema of the parser instead, a fraction of
+the size of the dict:
+
+    >>> parsed = ShowArp(device=uut).parse(compact=True)
+    >>> entry = parsed['global_static_table']['10.1.7.1']
+    >>> entry.mac_address, entry['mac_address']
+    ('0012.7f57.ac80', '0012.7f57.ac80')
+    >>> entry.to_dict()
+    {'ip_address': '10.1.7.1', 'mac_address': '0012.7f57.ac80', ...}
+    >>> to_dict(parsed) == ShowArp(device=uut).parse()
+    True
+
+The entries are the dicts of the schema under `Any()` keys, or items of the
+lists of `list_of`, and the dicts nested in them; all of their keys must be
+strings. The attributes of a record are its keys, with the characters which
+are not allowed in a name replaced by `_` (`rt-destination` is
+`rt_destination`). The keys of the schema not in the output are not set.
+The other dicts of the output, the containers of the entries, stay dicts.
+'''
+
+# python
+import re
+import keyword
+
+# Metaparser
+from genie.metaparser.util.schemaengine import Any, Optional, Use
+
+
+class Record(object):
+    '''Entry of a parsed output, as a `__slots__` instance
+
+    Class attributes:
+        keys (`tuple`): keys of the entry, in the order of the schema
+        attributes (`dict`): attribute of each key
+    '''
+
+    __slots__ = ()
+    keys = ()
+    attributes = {}
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, self.attributes[key])
+        except (KeyError, AttributeError):
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self.attributes and hasattr(self, self.attributes[key])
+
+    def get(self, key, default=None):
+        '''Value of a key, or default if it is not set'''
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self):
+        '''Dict of the entry, as the parser gives it without `compact`'''
+        data = {}
+        attributes = self.attributes
+        for key in self.keys:
+            try:
+                value = getattr(self, attributes[key])
+            except AttributeError:
+                continue
+            data[key] = to_dict(value)
+        return data
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, ', '.join(
+            '{}={!r}'.format(self.attributes[key], self[key])
+            for key in self.keys if key in self))
+
+
+def to_dict(value):
+    '''Parsed output of a compact one, made of dicts and lists only
+
+    Args:
+        value: compact parsed output, or any value of it
+
+    Returns:
+        the value with its records as dicts
+    '''
+    if isinstance(value, Record):
+        return value.to_dict()
+    if type(value) is dict:
+        return {key: to_dict(item) for key, item in value.items()}
+    if type(value) is list:
+        return [to_dict(item) for item in value]
+    return value
+
+
+def _attribute(key):
+    '''Name of the attribute of a key'''
+    name = re.sub(r'\W', '_', key)
+    if not name or name[0].isdigit():
+        name = '_' + name
+    if keyword.iskeyword(name) or hasattr(Record, name):
+        name += '_'
+    return name
+
+
+def _literal(key):
+    '''String of a literal key of a schema, or None'''
+    if type(key) is Optional:
+        key = key.schema
+    return key if isinstance(key, str) else None
+
+
+def record_class(schema, name='Record'):
+    '''`__slots__` record class of the entries of a schema
+
+    Args:
+        schema (`dict`): schema of the entries
+        name (`str`): name of the class
+
+    Returns:
+        `type`: `Record` subclass, or None when the schema has keys which
+                are not strings, or keys of the same attribute
+    '''
+    keys = tuple(_literal(key) for key in schema)
+    if None in keys:
+        return None
+    attributes = {key: _attribute(key) for key in keys}
+    if len(set(attributes.values())) != len(keys):
+        return None
+    return type(name, (Record,), {'__slots__': tuple(attributes.values()),
+                                  'keys': keys,
+                                  'attributes': attributes})
+
+
+def _items(schema):
+    '''Schema of the items of a `list_of` validator given to `Use`'''
+    if type(schema) is Use:
+        return getattr(schema.schema, 'item_schema', None)
+    return None
+
+
+def _converter(schema, name, entry=False):
+    '''Function giving the compact value of a value of a schema
+
+    Args:
+        schema: schema of the value
+        name (`str`): name of the record classes
+        entry (`bool`): whether the value is an entry, or in an entry
+
+    Returns:
+        `function`: giving the compact value, None to keep the value
+    '''
+    items = _items(schema)
+    if items is not None:
+        convert = _converter(items, name, entry=True)
+        if convert is None:
+            return None
+
+        def convert_list(value):
+            if type(value) is list:
+                return [convert(item) for item in value]
+            # a dict alone is an item, see list_of
+            return convert(value)
+        return convert_list
+
+    if type(schema) is not dict:
+        return None
+
+    # converters of the values, by literal key, and of the other keys
+    converters = {}
+    other = None
+    for key, value in schema.items():
+        literal = _literal(key)
+        if literal is not None:
+            converters[literal] = _converter(value, name, entry)
+        elif type(key) is Any:
+            other = _converter(value, name, entry=True)
+
+    cls = record_class(schema, name) if entry else None
+    if cls is not None:
+        attributes = cls.attributes
+
+        def convert_record(value):
+            if type(value) is not dict:
+                return value
+            record = cls.__new__(cls)
+            for key, item in value.items():
+                attribute = attributes.get(key)
+                if attribute is None:
+                    # not in the schema, the entry stays a dict
+                    return value
+                convert = converters[key]
+                setattr(record, attribute,
+                        item if convert is None else convert(item))
+            return record
+        return convert_record
+
+    if other is None and not any(converters.values()):
+        return None
+
+    def convert_dict(value):
+        if type(value) is not dict:
+            return value
+        compact = {}
+        for key, item in value.items():
+            convert = converters.get(key, other)
+            compact[key] = item if convert is None else convert(item)
+        return compact
+    return convert_dict
+
+
+class CompactParser(object):
+    '''Mixin of the parsers giving their entries as compact records
+
+    `parse` takes a `compact` argument: the entries of the parsed output,
+    checked against the schema, are given as records of the classes
+    generated from the schema, once per parser class.
+    '''
+
+    @classmethod
+    def compact_converter(cls):
+        '''Function giving the compact output of a parsed output, None when
+        the schema has no entries'''
+        compact = cls.__dict__.get('_compact')
+        if compact is None or compact[0] is not cls.schema:
+            compact = (cls.schema, _converter(
+                cls.schema, '{}Record'.format(cls.__name__)))
+            cls._compact = compact
+        return compact[1]
+
+    def parse(self, *args, compact=False, **kwargs):
+        '''Parse the output, with its entries as records if compact
+
+        Args:
+            compact (`bool`): give the entries as `Record` instances
+            args, kwargs: arguments of `parse`
+
+        Returns:
+            `dict`: parsed output
+        '''
+        parsed = super().parse(*args, **kwargs)
+        if not compact:
+            return parsed
+        convert = self.compact_converter()
+        return parsed if convert is None else convert(parsed)
@@ -0,0 +1,226 @@
+'''Schemas compiled into validation functions
+
+`Schema(schema).validate(output)` walks the schema for every key of the
+parsed output: each key is tried against the keys of the schema, and each
+value against a new `Schema` of the expected value. `CompiledSchema`
+walks the schema once instead, into one function per dict of the schema,
+which looks the keys of the output up in a dict of their expected values
+and checks the types of the values with `isinstance`.
+
+    >>> validator = CompiledSchema(ShowInterfacesSchema.schema)
+    >>> validator.validate(parsed) == Schema(
+    ...     ShowInterfacesSchema.schema).validate(parsed)
+    True
+
+An output the compiled schema does not validate, or which holds what it
+does not compile (defaults, `ListOf`, ...), is validated by `Schema`: the
+errors, and the warnings of `warn_unsupported_keys`, are the ones of
+`Schema`.
+
+`CompiledSchemaParser` parsers are checked against their compiled schema,
+compiled once per parser class, as the validation policy decides.
+'''
+
+# python
+from copy import deepcopy
+
+# Metaparser
+from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or
+
+# Parser utils
+from genie.libs.parser.utils.validation_policy import policy_schema
+
+# default of the schema keys and values without one
+_no_default = Optional('').default
+
+# types of the values given as they are
+_immutable = (str, int, float, bool, type(None))
+
+
+class _Mismatch(Exception):
+    '''The output is not one the compiled schema validates'''
+
+
+def _generic(schema):
+    '''Validation of a value by `Schema`'''
+    def validate(value):
+        try:
+            return Schema(schema).validate(value)
+        except Exception:
+            raise _Mismatch()
+    return validate
+
+
+def _type(expected):
+    '''Validation of the type of a value'''
+    if issubclass(expected, _immutable):
+        def validate(value):
+            if isinstance(value, expected):
+                return value
+            raise _Mismatch()
+    else:
+        # Schema gives copies of the lists and dicts
+        def validate(value):
+            if isinstance(value, expected):
+                return deepcopy(value)
+            raise _Mismatch()
+    return validate
+
+
+def _any(value):
+    if isinstance(value, _immutable):
+        return value
+    return deepcopy(value)
+
+
+def _or(validators):
+    '''Validation of a value by the first validator validating it'''
+    def validate(value):
+        for validator in validators:
+            try:
+                return validator(value)
+            except _Mismatch:
+                pass
+        raise _Mismatch()
+    return validate
+
+
+def _dict(schema):
+    '''Validation of a dict, or None when the keys of the schema are not
+    compiled'''
+    # expected values of the literal keys: (type or None, validator,
+    # required)
+    literals = {}
+    # validator of the values of the other keys, any of them
+    other = None
+    required = 0
+    for key, value in schema.items():
+        if isinstance(key, str):
+            is_required = True
+        elif type(key) is Optional and isinstance(key.schema, str) and \
+                key.default == _no_default:
+            is_required = False
+            key = key.schema
+        elif type(key) is Any and key.default == _no_default and \
+                other is None:
+            other = _compile(value)
+            continue
+        else:
+            return None
+        expected = value if isinstance(value, type) and \
+            issubclass(value, _immutable) else None
+        literals[key] = (expected, _compile(value), is_required)
+        required += is_required
+
+    def validate(data):
+        if data.__class__ is not dict:
+            raise _Mismatch()
+        validated = {}
+        found = 0
+        for key, value in data.items():
+            entry = literals.get(key)
+            if entry is None:
+                if other is None:
+                    raise _Mismatch()
+                validated[key] = other(value)
+                continue
+            expected, validator, is_required = entry
+            if expected is not None:
+                if not isinstance(value, expected):
+                    raise _Mismatch()
+                validated[key] = value
+            else:
+                validated[key] = validator(value)
+            found += is_required
+        if found != required:
+            raise _Mismatch()
+        return validated
+    return validate
+
+
+def _compile(schema):
+    '''Validation function of a schema, raising `_Mismatch`'''
+    if type(schema) is dict:
+        validator = _dict(schema)
+        if validator is not None:
+            return validator
+    elif isinstance(schema, type):
+        return _type(schema)
+    elif type(schema) is Any and schema.default == _no_default:
+        return _any
+    elif type(schema) is Or:
+        return _or([_compile(alternative) for alternative in schema.schemas])
+    return _generic(schema)
+
+
+class CompiledSchema(Schema):
+    '''Schema validating with the functions compiled from it
+
+    Args:
+        schema (`dict`): schema of a parser
+
+    Given to `Schema`, as `Schema(CompiledSchema(schema))`, it validates
+    the outputs as the schema would.
+    '''
+
+    def __init__(self, schema):
+        super().__init__(schema)
+        self._validate = _compile(schema)
+
+    def validate(self, data, *args, command='', warn_unsupported_keys=False,
+                 **kwargs):
+        '''Validate data against the schema
+
+        Args:
+            data (`dict`): parsed output
+            command (`str`): command of the output, for the errors
+            warn_unsupported_keys (`bool`): log a warning rather than raise
+                                            an error for the unsupported
+                                            keys
+
+        Returns:
+            `dict`: validated copy of the data
+        '''
+        if data:
+            try:
+                return self._validate(data)
+            except _Mismatch:
+                pass
+        return Schema(self.schema).validate(
+            data, command=command,
+            warn_unsupported_keys=warn_unsupported_keys)
+
+
+class CompiledSchemaParser(object):
+    '''Mixin of the parsers checked against their compiled schema
+
+    The schema of the parser class is compiled by its first `parse`.
+    `schema` stays the schema dict, but for the time of `parse`, during
+    which it is the `checked_schema`: the `CompiledSchema`, checking the
+    outputs as the validation policy decides.
+    '''
+
+    @classmethod
+    def compiled_schema(cls):
+        '''`CompiledSchema` of the schema of the class, compiled once'''
+        compiled = cls.__dict__.get('_compiled_schema')
+        if compiled is None or compiled.schema is not cls.schema:
+            compiled = CompiledSchema(cls.schema)
+            cls._compiled_schema = compiled
+        return compiled
+
+    def checked_schema(self):
+        '''Schema `parse` checks the output against
+
+        Returns:
+            `Schema`: compiled schema of the class, checking the outputs as
+                      the validation policy decides
+        '''
+        return policy_schema(self, self.compiled_schema())
+
+    def parse(self, *args, **kwargs):
+        self.schema = self.checked_schema()
+        try:
+            return super().parse(*args, **kwargs)
+        finally:
+            del self.schema
@@ -31,18 +31,124 @@ example 'nxos', and the value is a list of MetaParser class definitions.
             ]
         }
 
+Entry points are discovered with importlib.metadata when this module is
+imported, but they are not loaded: the user provided functions are only
+called the first time the parser registry is used.
+
+When the environment variable GENIE_PARSER_PLUGIN_CACHE gives the path of a
+cache file (see PLUGIN_CACHE), the commands of each plugin are saved in it
+once loaded, keyed by the name and version of its distribution. As long as
+the distribution is not upgraded, its commands are registered from that
+file: the user provided function is not called at all, and the plugin
+parser modules are only imported when one of their commands is resolved.
+The version is all the cache relies on, so it must not be enabled with
+plugins installed in editable mode, or changed without a new version.
+
+The time taken to register each plugin is available with
+`get_plugin_load_times()`.
 """
 
+import os
 import sys
-import pkg_resources
+import json
+import time
 import logging
 
-from .common import parser_data
+from .common import _add_parsers_data, parser_registry
+
+try:
+    from importlib import metadata
+except ImportError:
+    try:
+        import importlib_metadata as metadata
+    except ImportError:
+        metadata = None
 
 log = logging.getLogger(__name__)
 
 ENTRY_POINT_NAME = 'genie.libs.parser'
 
+# Commands of the plugins, saved after they are loaded. Disabled unless the
+# environment variable gives the path of the cache file.
+PLUGIN_CACHE = os.environ.get('GENIE_PARSER_PLUGIN_CACHE') or None
+
+# Plugin name -> Plugin, for every entry point discovered
+plugins = {}
+
+
+class Plugin(object):
+    '''Parsers of an external package, registered through an entry point
+
+    Args:
+        entry_point (`EntryPoint`): the importlib.metadata entry point
+
+    Attributes:
+        source (`str`): 'cache' or 'entry_point' once registered, else None
+        load_time (`float`): seconds taken to register the parsers
+        commands (`list`): (command, os_name, entry) of each parser
+    '''
+
+    def __init__(self, entry_point):
+        self.entry_point = entry_point
+        self.name = entry_point.name
+        self.source = None
+        self.load_time = None
+        self.commands = []
+
+        dist = getattr(entry_point, 'dist', None)
+        if dist is not None:
+            self.key = '{}={}@{}=={}'.format(self.name, entry_point.value,
+                                             dist.metadata['Name'],
+                                             dist.version)
+        else:
+            # without the version, the cache could be stale
+            self.key = None
+
+    @property
+    def loaded(self):
+        return self.source is not None
+
+    def register_cached(self, cache):
+        '''Register the commands saved in the cache, without importing the
+           plugin. Returns False if they are not in the cache.'''
+
+        if self.key is None or self.key not in cache:
+            return False
+
+        start = time.perf_counter()
+        _add_parsers_data(cache[self.key])
+        self.commands = [tuple(item) for item in cache[self.key]]
+        self.load_time = time.perf_counter() - start
+        self.source = 'cache'
+        return True
+
+    def load(self):
+        '''Import the plugin and add the parsers returned by its function'''
+
+        start = time.perf_counter()
+        try:
+            loader_function = self.entry_point.load()
+            if not callable(loader_function):
+                log.warning('unable to load parsers from entry point '
+                            '{name} as it is not callable.'.format(
+                                                            name=self.name))
+                return
+
+            parser_dict = loader_function()
+            for os_name, parser_list in parser_dict.items():
+                for parser in parser_list:
+                    self.commands.extend(add_parser(parser=parser,
+                                                    os_name=os_name))
+        except Exception as e:
+            log.warning('unable to load parsers from entry point '
+                        '{name}: {e}'.format(name=self.name, e=e))
+            return
+        finally:
+            self.load_time = time.perf_counter() - start
+            self.source = 'entry_point'
+
+        _save_cache(self)
+
 
 def add_parser(parser, os_name):
     """
@@ -61,6 +167,11 @@ def add_parser(parser, os_name):
 
     os_name : str
         The NOS name for which the parser is supported, for example "nxos"
+
+    Returns
+    -------
+    list
+        (command, os_name, entry) of each command added
     """
     mod = sys.modules[parser.__module__]
     package = mod.__package__
@@ -69,29 +180,84 @@ def add_parser(parser, os_name):
     if isinstance(cli_commands, str):
         cli_commands = [cli_commands]
 
+    added = []
     for cmd in cli_commands:
-        if cmd not in parser_data:
-            parser_data[cmd] = {}
-
-        parser_data[cmd][os_name] = {
+        entry = {
             'module_name': mod.__name__.rsplit('.', 1)[-1],
             'package': package,
             'class': parser.__name__
         }
+        added.append((cmd, os_name, entry))
+
+    # all the commands of the parser are published as one snapshot
+    _add_parsers_data(added)
+    return added
+
+
+def _load_cache():
+    if not PLUGIN_CACHE or not os.path.isfile(PLUGIN_CACHE):
+        return {}
+    try:
+        with open(PLUGIN_CACHE) as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        log.debug('unable to read {}: {}'.format(PLUGIN_CACHE, e))
+        return {}
+
+
+def _save_cache(plugin):
+    '''Save the commands of a loaded plugin, dropping the plugins which are
+       no longer installed'''
+
+    if not PLUGIN_CACHE or plugin.key is None:
+        return
+
+    keys = {other.key for other in plugins.values()}
+    cache = {key: value for key, value in _load_cache().items()
+                                                    if key in keys}
+    cache[plugin.key] = plugin.commands
+
+    # The cache is an optimization, never fail because of it
+    try:
+        os.makedirs(os.path.dirname(PLUGIN_CACHE), exist_ok=True)
+        tmp = '{}.{}.tmp'.format(PLUGIN_CACHE, os.getpid())
+        with open(tmp, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp, PLUGIN_CACHE)
+    except OSError as e:
+        log.debug('unable to write {}: {}'.format(PLUGIN_CACHE, e))
+
+
+def iter_entry_points(group=ENTRY_POINT_NAME):
+    '''Return the entry points of a group, without loading them'''
+
+    if metadata is None:
+        return []
+
+    eps = metadata.entry_points()
+    if hasattr(eps, 'select'):
+        return list(eps.select(group=group))
+    # python < 3.10, dictionary of group -> entry points
+    return list(eps.get(group, []))
 
 
 def load_entry_points():
-    for ep in pkg_resources.iter_entry_points(ENTRY_POINT_NAME):
-        loader_function = ep.load()
-        if not callable(loader_function):
-            log.warning('unable to load parsers from entry point '
-                        '{name} as it is not callable.'.format(name=ep.name))
-            continue
+    '''Register the parsers of every plugin
+
+       Plugins whose commands are cached are registered right away, the
+       others are loaded the first time the parser registry is used.
+    '''
+    cache = _load_cache()
+    for ep in iter_entry_points():
+        plugin = plugins[ep.name] = Plugin(ep)
+        if not plugin.register_cached(cache):
+            parser_registry.defer(plugin.load)
+
 
-        parser_dict = loader_function()
-        for os_name, parser_list in parser_dict.items():
-            for parser in parser_list:
-                add_parser(parser=parser, os_name=os_name)
+def get_plugin_load_times():
+    '''Return the seconds taken to register each loaded plugin'''
+    return {name: plugin.load_time for name, plugin in plugins.items()
+                                                    if plugin.loaded}
 
 
 load_entry_points()
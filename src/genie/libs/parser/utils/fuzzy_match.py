@@ -0,0 +1,367 @@
+'''Matching of search tokens with the commands of the parsers
+
+Used by `_fuzzy_search_command` for each candidate command. The commands are
+split and analysed once into a `CommandTemplate`, and the search tokens once
+per search into `SearchTokens`, instead of for every comparison. The match
+itself is a depth first search over the ways arguments and regex tokens can
+span the command tokens, driven by an explicit stack: the state is modified
+in place and restored when backtracking instead of being copied for every
+branch.
+'''
+
+# python
+import re
+
+from .command_trie import SINGLE_TOKEN_ARGUMENTS
+
+# Kinds of command tokens
+LITERAL = 0
+ARGUMENT = 1
+EMBEDDED = 2
+INVALID = 3
+
+# Kinds of choice points
+_ARGUMENT_SPAN = 0
+_REGEX_SPAN = 1
+
+_MISSING = object()
+
+
+def is_regular_token(token):
+    """ Checks if a token is regular (does not contain regex symbols).
+
+        Args:
+            token (`str`): the token to be tested
+
+        Returns:
+            bool: whether or not the token is regular
+
+    """
+    token_is_regular = True
+
+    if not token.isalnum():
+        # Remove escaped characters
+        candidate = token.replace('/', '')
+        candidate = candidate.replace('"', '')
+        candidate = candidate.replace(r'\^', '')
+        candidate = candidate.replace('\'', '')
+        candidate = candidate.replace('-', '')
+        candidate = candidate.replace('^', '')
+        candidate = candidate.replace('_', '')
+        candidate = candidate.replace(':', '')
+        candidate = candidate.replace(',', '')
+        candidate = candidate.replace(r'\.', '')
+        candidate = candidate.replace(r'\|', '')
+
+        token_is_regular = candidate.isalnum() or candidate == ''
+
+    return token_is_regular
+
+
+class CommandTemplate(object):
+    '''A command split into tokens, analysed for `match_command`
+
+    Args:
+        command (`str`): the command, e.g. 'show ip route vrf {vrf}'
+    '''
+
+    __slots__ = ('command', 'tokens', 'lengths', 'offsets', 'kinds', 'keys',
+                 'spans', 'arguments_from', 'required_arguments')
+
+    def __init__(self, command):
+        self.command = command
+        self.tokens = tokens = command.split()
+        self.lengths = [len(token) for token in tokens]
+
+        # offset of the end of each token, as if separated by one space
+        self.offsets = []
+        offset = -1
+        for length in self.lengths:
+            offset += length + 1
+            self.offsets.append(offset)
+
+        # argument key, and the text around embedded arguments
+        self.kinds = []
+        self.keys = []
+        self.spans = []
+        for token in tokens:
+            kind, key, span = LITERAL, None, None
+            if '{' in token:
+                key = re.search('{(.*)}', token)
+                if token.startswith('{'):
+                    kind = ARGUMENT
+                    # Argument can be 1 token for these, else up to 2 tokens
+                    span = 1 if key and key.groups()[0] in \
+                                            SINGLE_TOKEN_ARGUMENTS else 2
+                else:
+                    # /dna/intent/api/v1/interface/{interface}
+                    kind = EMBEDDED
+                    span = re.match('(.*){.*?}(.*)', token)
+                    span = span and span.groups()
+                if key is None or span is None:
+                    kind = INVALID
+                else:
+                    key = key.groups()[0]
+            self.kinds.append(kind)
+            self.keys.append(key)
+            self.spans.append(span)
+
+        # whether there are arguments from each token to the end
+        self.arguments_from = [False] * (len(tokens) + 1)
+        for j in range(len(tokens) - 1, -1, -1):
+            self.arguments_from[j] = self.arguments_from[j + 1] or \
+                                                        '{' in tokens[j]
+
+        self.required_arguments = len(re.findall('{.*?}', command))
+
+    def token_end(self, end):
+        '''Index of the command token a regex match ending at `end` spans
+           up to, or None if the match goes beyond the tokens'''
+        current_sum = 0
+        token_end = 0
+        lengths = self.lengths
+
+        while token_end < len(lengths):
+            if current_sum + lengths[token_end] > end:
+                return token_end
+
+            current_sum += lengths[token_end]
+            if current_sum >= end:
+                return token_end
+
+            # Account for space
+            current_sum += 1
+            token_end += 1
+        return None
+
+
+class SearchTokens(object):
+    '''Search tokens, analysed once for all the commands they are matched
+       with
+
+    Args:
+        tokens (`list`): the search tokens
+        fuzzy (`bool`): whether or not fuzzy mode is used
+    '''
+
+    __slots__ = ('tokens', 'values', 'regular', 'strict', 'fuzzy')
+
+    def __init__(self, tokens, fuzzy):
+        self.tokens = tokens
+        self.fuzzy = fuzzy
+
+        if not fuzzy:
+            self.values = tokens
+            self.regular = self.strict = [True] * len(tokens)
+            return
+
+        # regex tokens are matched as regular expressions, `*` is only
+        # regular when compared with a command token
+        self.strict = [is_regular_token(token) for token in tokens]
+        self.regular = [token == '*' or strict
+                            for token, strict in zip(tokens, self.strict)]
+        # Special cases for `:\|Swap:` and `vim-cmd vmsvc/snapshot.get {vmid}`
+        self.values = [token.replace(r'\|', '|').replace(r'\.', '.')
+                       if regular else token
+                       for token, regular in zip(tokens, self.regular)]
+
+
+# Templates of the commands already matched
+_templates = {}
+
+
+def get_template(command):
+    '''Return the `CommandTemplate` of a command'''
+    template = _templates.get(command)
+    if template is None:
+        template = _templates[command] = CommandTemplate(command)
+    return template
+
+
+def match_command(template, search, j=0, prefix=(), kwargs=None, score=0,
+                                                    required_arguments=None):
+    """ Compares the search tokens with a command to see if they match.
+
+        Args:
+            template (`CommandTemplate`): the command to be compared with
+            search (`SearchTokens`): the search tokens left to match
+            j (`int`): index of the first command token to match
+            prefix (`list`): search tokens already matched
+            kwargs (`dict`): arguments already collected
+            score (`int`): the current similarity score
+            required_arguments (`int`): number of arguments of the command
+
+        Returns:
+            tuple: (kwargs, score) if the search matches the command, else None
+    """
+    command = template.command
+    command_tokens = template.tokens
+    kinds = template.kinds
+    tokens = search.tokens
+    fuzzy = search.fuzzy
+    regular = search.regular
+    strict = search.strict
+    n_tokens = len(tokens)
+    n_command_tokens = len(command_tokens)
+    if required_arguments is None:
+        required_arguments = template.required_arguments
+
+    # Search tokens as they are matched, command tokens for the tokens
+    # expanded from a prefix or an argument
+    matched = list(prefix)
+    kwargs = dict(kwargs) if kwargs else {}
+    # (key, previous value) of the kwargs set, to undo them on backtrack
+    trail = []
+    # choice points: [kind, i, j, score, len(matched), len(trail),
+    #                 next option, last option]
+    stack = []
+
+    i = 0
+    while True:
+        # Match as far as possible from the current state
+        matches = False
+        while True:
+            if i >= n_tokens:
+                # Reached end of tokens, matches if command pointer is at end
+                matches = j == n_command_tokens
+                break
+
+            # If command token index is greater than its length, stop
+            if j >= n_command_tokens:
+                break
+
+            kind = kinds[j]
+            if regular[i]:
+                token = search.values[i]
+                command_token = command_tokens[j]
+
+                if kind == LITERAL:
+                    if token == command_token:
+                        # Same token, assign higher score
+                        matched.append(tokens[i])
+                        score += 102
+                    elif command_token.startswith(token):
+                        # The two tokens are similar to each other, replace
+                        matched.append(command_token)
+                        score += 100
+                    else:
+                        break
+                elif kind == EMBEDDED:
+                    # Need to have perfect match with token
+                    start, end = template.spans[j]
+                    if not token.startswith(start) or \
+                            not token.endswith(end) or \
+                            len(token) < len(start) + len(end):
+                        break
+                    key = template.keys[j]
+                    trail.append((key, kwargs.get(key, _MISSING)))
+                    kwargs[key] = token[len(start):len(token) - len(end)]
+                    matched.append(tokens[i])
+                    score += 103
+                elif kind == ARGUMENT:
+                    # Try out ways we can assign search tokens into argument
+                    stack.append([_ARGUMENT_SPAN, i, j, score + 100,
+                                  len(matched), len(trail), 1,
+                                  template.spans[j]])
+                    break
+                else:
+                    break
+
+                # Matches current, go to next token
+                i += 1
+                j += 1
+                continue
+
+            # Not a token, should be a regex expression
+            # Keep eating if next token is also regex
+            last = i
+            while last + 1 < n_tokens and not strict[last + 1]:
+                last += 1
+            skipped = last - i + 1
+
+            # Match current span with command
+            test = re.match(' '.join(matched + tokens[i:last + 1]), command)
+            if not test:
+                break
+
+            # Perform command token lookahead
+            end = test.end()
+
+            # Expression matches command to end, without unspecified
+            # arguments left
+            if last + 1 == n_tokens and end == len(command):
+                matches = not template.arguments_from[j]
+                break
+
+            # If regex matched nothing, we stop because
+            # expression = "d? a b c" search in "a b c"
+            # expression = "a b d? c" search in "a b c"
+            if end == 0:
+                break
+
+            matched.extend(tokens[i:last + 1])
+            i = last + 1
+
+            if abs(end - template.offsets[j]) <= 1:
+                # Span single token if it is not argument
+                if kind != LITERAL:
+                    break
+                j += 1
+                continue
+
+            # Span multiple command tokens, perform submatches on the next
+            # real token for each command token of the matched range
+            token_end = template.token_end(end)
+            if token_end is None:
+                break
+            stack.append([_REGEX_SPAN, i, None, score, len(matched),
+                          len(trail), j + skipped, token_end])
+            break
+
+        if matches and (not stack or len(kwargs) == required_arguments):
+            # Only branches with all the arguments of the command match
+            return kwargs, score
+
+        # Backtrack to the next option of the last choice point
+        while stack:
+            point = stack[-1]
+            kind, i, j, score, matched_length, trail_length, option, \
+                                                        last_option = point
+
+            del matched[matched_length:]
+            while len(trail) > trail_length:
+                key, previous = trail.pop()
+                if previous is _MISSING:
+                    del kwargs[key]
+                else:
+                    kwargs[key] = previous
+
+            if option > last_option:
+                stack.pop()
+                continue
+            point[6] = option + 1
+
+            if kind == _REGEX_SPAN:
+                j = option
+                break
+
+            # Argument spanning `option` search tokens
+            if i + option > n_tokens:
+                stack.pop()
+                continue
+            # Make sure not to use regex expression as argument
+            if option > 1 and fuzzy and not strict[i + option - 1]:
+                stack.pop()
+                continue
+
+            key = template.keys[j]
+            if key not in kwargs:
+                trail.append((key, _MISSING))
+                kwargs[key] = ' '.join(tokens[i:i + option]).rstrip(
+                                                        '"').replace('\\', '')
+            matched.append(command_tokens[j])
+            i += option
+            j += 1
+            break
+        else:
+            return None
@@ -0,0 +1,382 @@
+'''Runtime index of the parsers within genie.libs.parser
+
+`parsers.json` (generated with `make json`) holds, for every command and os,
+the location of the parser class along with its documentation, schema dump
+and source url. Resolving a parser only needs the location, so `make json`
+splits it into:
+
+    * parsers_index.json: command -> os (-> tokens) -> package, module_name
+      and class. Loaded at import time.
+    * parsers_docs.json: command -> os (-> tokens) -> doc, schema, uid and
+      url. Only loaded when requested.
+    * parsers_index/<os>.json: the runtime index of a single os, along with
+      parsers_index/manifest.json listing the commands and os available.
+      A shard is only loaded the first time its os is requested.
+    * parsers_index.bin: the runtime index and command trie in a binary
+      format, mapped in memory instead of decoded (see binary_index.py).
+      Used first when available, the json files are the fallback.
+'''
+
+# python
+import os
+import json
+import logging
+import threading
+import importlib
+
+from .command_trie import CommandTrie
+from .binary_index import (BinaryIndex, BinaryShard, BinaryCommandTrie,
+                           write_binary_index)
+
+log = logging.getLogger(__name__)
+
+PARSERS_JSON = 'parsers.json'
+INDEX_JSON = 'parsers_index.json'
+DOCS_JSON = 'parsers_docs.json'
+BINARY_INDEX = 'parsers_index.bin'
+SHARDS_DIR = 'parsers_index'
+MANIFEST_JSON = 'manifest.json'
+
+# Fields needed to locate a parser class
+RUNTIME_FIELDS = ('package', 'module_name', 'class')
+
+
+def _package_path(filename):
+    '''Return the path of a file within genie.libs.parser'''
+    try:
+        mod = importlib.import_module('genie.libs.parser')
+        return os.path.join(mod.__path__[0], filename)
+    except Exception:
+        return ''
+
+
+def _is_stale(path, source):
+    '''Whether the generated `path` is older than its `source` file'''
+    try:
+        return os.path.getmtime(source) > os.path.getmtime(path)
+    except OSError:
+        return False
+
+
+def load_binary_index(path=None):
+    '''Map the binary parser index in memory
+
+        Args:
+            path (`str`): the binary index, default to the one within
+                          genie.libs.parser
+
+        Returns:
+            BinaryIndex: the index, or None if it is missing, older than
+                         parsers.json or cannot be read
+    '''
+    path = path or _package_path(BINARY_INDEX)
+    if not os.path.isfile(path) or _is_stale(path,
+                                             _package_path(PARSERS_JSON)):
+        return None
+
+    try:
+        return BinaryIndex(path)
+    except (OSError, ValueError) as e:
+        log.warning('Unable to load the binary parser index, falling back '
+                    'to json: {}'.format(e))
+        return None
+
+
+def _split_entry(entry):
+    '''Split the data of one command into its runtime and docs parts'''
+
+    runtime = {}
+    docs = {}
+    for key, value in entry.items():
+        if isinstance(value, dict):
+            # os or abstraction token level
+            runtime[key], docs[key] = _split_entry(value)
+        elif key in RUNTIME_FIELDS:
+            runtime[key] = value
+        else:
+            docs[key] = value
+    return runtime, docs
+
+
+def split_parser_data(data):
+    '''Split the parsers.json data into the runtime index and the docs
+
+        Args:
+            data (`dict`): content of parsers.json
+
+        Returns:
+            tuple: (index, docs) dictionaries
+    '''
+    index = {}
+    docs = {}
+    for command, entry in data.items():
+        if not isinstance(entry, dict):
+            # 'tokens' list
+            index[command] = entry
+            continue
+        index[command], docs[command] = _split_entry(entry)
+    return index, docs
+
+
+def shard_parser_index(index):
+    '''Split the runtime index per os
+
+        Each shard holds the commands of one os, in the same order as the
+        index, restricted to the data of that os.
+
+        Args:
+            index (`dict`): the runtime index
+
+        Returns:
+            dict: os -> shard
+    '''
+    tokens = index.get('tokens', [])
+    shards = {}
+    for command, entry in index.items():
+        if command == 'tokens':
+            continue
+        for os_name, value in entry.items():
+            shard = shards.get(os_name)
+            if shard is None:
+                shard = shards[os_name] = {}
+                # 'tokens' is part of the search space of the os it lists
+                if os_name in tokens:
+                    shard['tokens'] = tokens
+            shard[command] = {os_name: value}
+    return shards
+
+
+def make_parser_index(source=None, directory=None):
+    '''Generate parsers_index.json, parsers_docs.json, the per os shards
+       of the index and the binary index from parsers.json
+
+        Args:
+            source (`str`): path of parsers.json, default to the one within
+                            genie.libs.parser
+            directory (`str`): where to write the files, default to the
+                               directory of genie.libs.parser
+
+        Returns:
+            tuple: paths of the index and docs files
+    '''
+    source = source or _package_path(PARSERS_JSON)
+    directory = directory or os.path.dirname(_package_path(PARSERS_JSON))
+
+    with open(source) as f:
+        index, docs = split_parser_data(json.load(f))
+
+    index_path = os.path.join(directory, INDEX_JSON)
+    docs_path = os.path.join(directory, DOCS_JSON)
+
+    with open(index_path, 'w') as f:
+        json.dump(index, f, separators=(',', ':'))
+    with open(docs_path, 'w') as f:
+        json.dump(docs, f, separators=(',', ':'))
+
+    shards_dir = os.path.join(directory, SHARDS_DIR)
+    os.makedirs(shards_dir, exist_ok=True)
+    shards = shard_parser_index(index)
+    for os_name, shard in shards.items():
+        with open(os.path.join(shards_dir, os_name + '.json'), 'w') as f:
+            json.dump(shard, f, separators=(',', ':'))
+
+    # Written last, the shards are only used once the manifest is up to date
+    manifest = {'tokens': index.get('tokens', []),
+                'os': sorted(shards),
+                'commands': [command for command in index
+                                                    if command != 'tokens']}
+    with open(os.path.join(shards_dir, MANIFEST_JSON), 'w') as f:
+        json.dump(manifest, f, separators=(',', ':'))
+
+    write_binary_index(index, os.path.join(directory, BINARY_INDEX))
+
+    return index_path, docs_path
+
+
+def load_parser_index():
+    '''Load the runtime parser index
+
+        Decoded from the binary index when available. Falls back to
+        parsers_index.json, then to parsers.json stripped of the docs, when
+        the index has not been generated or is older than parsers.json.
+
+        Returns:
+            dict: command -> os -> parser location
+    '''
+    binary = load_binary_index()
+    if binary is not None:
+        return binary.to_dict()
+
+    index = _package_path(INDEX_JSON)
+    parsers = _package_path(PARSERS_JSON)
+
+    if os.path.isfile(index) and not _is_stale(index, parsers):
+        with open(index) as f:
+            return json.load(f)
+
+    if not os.path.isfile(parsers):
+        log.warning('parsers.json does not exist, make sure you '
+                    'are running with latest version of '
+                    'genie.libs.parsers')
+        return {}
+
+    # Open all the parsers in json file
+    with open(parsers) as f:
+        return split_parser_data(json.load(f))[0]
+
+
+def load_parser_docs():
+    '''Load the parser docs (doc, schema, uid and url)
+
+        Falls back to parsers.json when the docs have not been generated or
+        are older than parsers.json.
+
+        Returns:
+            dict: command -> os -> parser docs
+    '''
+    docs = _package_path(DOCS_JSON)
+    parsers = _package_path(PARSERS_JSON)
+
+    if os.path.isfile(docs) and not _is_stale(docs, parsers):
+        with open(docs) as f:
+            return json.load(f)
+
+    if not os.path.isfile(parsers):
+        return {}
+
+    with open(parsers) as f:
+        return split_parser_data(json.load(f))[1]
+
+
+class ParserIndex(object):
+    '''Runtime parser index, loaded one os at a time
+
+    The shards generated by `make_parser_index` are loaded the first time
+    their os is requested, from the binary index if available or else from
+    the json shards. Without shards (or when they are older than
+    parsers.json), the whole index is loaded and split in memory.
+
+    The index only holds the parsers of genie.libs.parser and is never
+    modified once loaded, the parsers added at runtime are kept by the
+    `ParserRegistry` (see registry.py). It can be read from several threads,
+    each shard is only loaded once.
+
+    Args:
+        loader (`callable`): returns the whole runtime index
+        directory (`str`): directory of the shards
+        binary (`BinaryIndex`): the binary index, default to the one within
+                                genie.libs.parser. False to only use json.
+
+    Example:
+        >>> index = ParserIndex()
+        >>> index.get('iosxe')['show version']
+        {'iosxe': {'module_name': 'show_platform', ...}}
+    '''
+
+    def __init__(self, loader=load_parser_index, directory=None,
+                 binary=None):
+        self.loader = loader
+        self.directory = directory or _package_path(SHARDS_DIR)
+        self._binary = binary
+        self.shards = {}
+        self._full = None
+        self._manifest = None
+        # command trie of each os, None for every os
+        self._tries = {}
+        self._lock = threading.RLock()
+
+    @property
+    def manifest(self):
+        '''The shards manifest, or an empty dict if there are no shards'''
+
+        if self._manifest is None:
+            with self._lock:
+                if self._manifest is None:
+                    self._manifest = self._load_manifest()
+        return self._manifest
+
+    @property
+    def binary(self):
+        '''The binary index, or None if it is not available'''
+
+        if self._binary is None:
+            with self._lock:
+                if self._binary is None:
+                    self._binary = load_binary_index() or False
+        return self._binary or None
+
+    @property
+    def loaded(self):
+        '''Names of the os whose shard has been loaded'''
+        return sorted(self.shards)
+
+    def get(self, os_name=None):
+        '''Return the index of the os, or the whole index if os is None'''
+
+        if os_name is None:
+            return self._get_full()
+
+        shard = self.shards.get(os_name)
+        if shard is None:
+            with self._lock:
+                shard = self.shards.get(os_name)
+                if shard is None:
+                    shard = self.shards[os_name] = self._load_shard(os_name)
+        return shard
+
+    def has_command(self, command):
+        '''Whether the command has a parser for any os'''
+
+        if self._full is None:
+            if self.binary:
+                return self.binary.find(command) is not None
+            elif self.manifest:
+                return command in self.manifest['commands']
+        return command in self._get_full()
+
+    def command_trie(self, os_name=None):
+        '''Return the command trie of an os, or of every os if os is None'''
+
+        trie = self._tries.get(os_name)
+        if trie is None:
+            data = self.get(os_name)
+            if isinstance(data, BinaryShard):
+                # use the trie of the binary index instead of building one
+                trie = BinaryCommandTrie(data)
+            else:
+                trie = CommandTrie(data)
+            trie = self._tries.setdefault(os_name, trie)
+        return trie
+
+    def _get_full(self):
+        if self._full is None:
+            with self._lock:
+                if self._full is None:
+                    self._full = self.loader()
+        return self._full
+
+    def _load_manifest(self):
+        manifest = os.path.join(self.directory, MANIFEST_JSON)
+        if not os.path.isfile(manifest) or \
+                _is_stale(manifest, _package_path(PARSERS_JSON)):
+            return {}
+        with open(manifest) as f:
+            manifest = json.load(f)
+        manifest['commands'] = set(manifest['commands'])
+        return manifest
+
+    def _load_shard(self, os_name):
+        manifest = self.manifest
+
+        if self.binary:
+            return BinaryShard(self.binary, os_name)
+        elif not manifest:
+            return shard_parser_index(self._get_full()).get(os_name, {})
+        elif os_name in manifest['os']:
+            with open(os.path.join(self.directory, os_name + '.json')) as f:
+                return json.load(f)
+
+        shard = {}
+        if os_name in manifest['tokens']:
+            shard['tokens'] = manifest['tokens']
+        return shard
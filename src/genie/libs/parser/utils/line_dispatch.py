@@ -0,0 +1,380 @@
+'''Dispatch of the output lines to the regular expressions able to match them
+
+The large parsers try every line of the output against all of their regular
+expressions, one after the other, while most expressions start with a
+keyword which tells at once whether the line can match: a line starting with
+'Last input' is not worth trying against '^Encapsulation +...'.
+
+`LineDispatcher` indexes the expressions of a `Patterns` table by their
+literal leading keyword. The keyword of a line is its leading run of word
+characters; the candidates of a line are the expressions indexed by that
+keyword or by one of its prefixes, and the expressions without a usable
+keyword (catch-all) which can start with the first character of the line.
+'''
+
+# python
+import re
+
+try:
+    from re import _parser as sre_parse
+    from re import _constants as sre_constants
+except ImportError:
+    import sre_parse
+    import sre_constants
+
+_word = re.compile(r'\w*')
+# builtin returning None for any line, much cheaper than a failing match;
+# the set stays empty
+_no_match = set().discard
+
+# expressions whose keyword can not be trusted
+_unsafe_flags = re.IGNORECASE | re.ASCII | re.LOCALE
+
+_repeats = {sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT}
+if hasattr(sre_constants, 'POSSESSIVE_REPEAT'):
+    _repeats.add(sre_constants.POSSESSIVE_REPEAT)
+
+_groups = {sre_constants.SUBPATTERN}
+if hasattr(sre_constants, 'ATOMIC_GROUP'):
+    _groups.add(sre_constants.ATOMIC_GROUP)
+
+# first characters are tracked among the ascii ones, any other character is
+# a single flag
+_ascii = frozenset(map(chr, range(128)))
+_ascii_word = frozenset(c for c in _ascii if _word.match(c).group())
+
+_categories = {
+    sre_constants.CATEGORY_DIGIT: re.compile(r'\d'),
+    sre_constants.CATEGORY_NOT_DIGIT: re.compile(r'\D'),
+    sre_constants.CATEGORY_SPACE: re.compile(r'\s'),
+    sre_constants.CATEGORY_NOT_SPACE: re.compile(r'\S'),
+    sre_constants.CATEGORY_WORD: re.compile(r'\w'),
+    sre_constants.CATEGORY_NOT_WORD: re.compile(r'\W'),
+}
+_categories = {category: frozenset(c for c in _ascii if expression.match(c))
+               for category, expression in _categories.items()}
+_categories[sre_constants.CATEGORY_LINEBREAK] = frozenset('\n')
+_categories[sre_constants.CATEGORY_NOT_LINEBREAK] = _ascii - {'\n'}
+
+# anything can start
+_anything = (_ascii, True, True)
+
+_max_cache = 1024
+
+
+def _set_start(items):
+    chars = set()
+    other = False
+    negate = False
+    for op, av in items:
+        if op is sre_constants.NEGATE:
+            negate = True
+        elif op is sre_constants.LITERAL:
+            if av < 128:
+                chars.add(chr(av))
+            else:
+                other = True
+        elif op is sre_constants.RANGE:
+            low, high = av
+            chars.update(map(chr, range(low, min(high, 127) + 1)))
+            other = other or high >= 128
+        elif op is sre_constants.CATEGORY and av in _categories:
+            chars.update(_categories[av])
+            other = other or av is not sre_constants.CATEGORY_LINEBREAK
+        else:
+            return _ascii, True
+    if negate:
+        return _ascii - chars, True
+    return frozenset(chars), other
+
+
+def _first(ops):
+    '''Tells how the sequence of parsed operations can start
+
+    Args:
+        ops (`list`): operations from the sre parser
+
+    Returns:
+        (`frozenset`, `bool`, `bool`): ascii characters the sequence can
+                                       start with, whether it can start with
+                                       another character, and whether it can
+                                       be empty
+    '''
+    chars = frozenset()
+    other = False
+    for op, av in ops:
+        if op is sre_constants.LITERAL:
+            if av < 128:
+                start = frozenset(chr(av)), False, False
+            else:
+                start = frozenset(), True, False
+        elif op is sre_constants.NOT_LITERAL or op is sre_constants.ANY:
+            start = _ascii, True, False
+        elif op is sre_constants.IN:
+            start = _set_start(av) + (False,)
+        elif op in _repeats:
+            low, high, sub = av
+            if high == 0:
+                start = frozenset(), False, True
+            else:
+                start = _first(sub)
+                start = start[0], start[1], start[2] or low == 0
+        elif op is sre_constants.SUBPATTERN:
+            # (group, add_flags, del_flags, pattern)
+            if av[1] & _unsafe_flags:
+                start = _anything
+            else:
+                start = _first(av[-1])
+        elif op in _groups:
+            start = _first(av)
+        elif op is sre_constants.BRANCH:
+            branches = [_first(sub) for sub in av[1]]
+            start = (frozenset().union(*(b[0] for b in branches)),
+                     any(b[1] for b in branches),
+                     any(b[2] for b in branches))
+        elif op in (sre_constants.AT, sre_constants.ASSERT,
+                    sre_constants.ASSERT_NOT):
+            # zero width
+            start = frozenset(), False, True
+        else:
+            # back references...
+            start = _anything
+
+        chars = chars | start[0]
+        other = other or start[1]
+        if not start[2]:
+            return chars, other, False
+    return chars, other, True
+
+
+def _parse(pattern):
+    if isinstance(pattern, str):
+        pattern = re.compile(pattern)
+    if pattern.flags & _unsafe_flags:
+        return None
+    return list(sre_parse.parse(pattern.pattern, pattern.flags))
+
+
+def leading_keyword(pattern):
+    '''Literal keyword which starts every line matched by an expression
+
+    Args:
+        pattern (`str` or compiled expression): expression used with `match`
+
+    Returns:
+        (`str`, `bool`) or None: the keyword, and True when it is the whole
+                                 leading run of word characters of the
+                                 matched lines, False when it is only a
+                                 prefix of it. None when the expression can
+                                 match lines starting with anything.
+    '''
+    ops = _parse(pattern)
+    if ops is None:
+        return None
+
+    position = 0
+    while position < len(ops) and ops[position] == \
+            (sre_constants.AT, sre_constants.AT_BEGINNING):
+        position += 1
+
+    literal = []
+    while position < len(ops) and ops[position][0] is sre_constants.LITERAL:
+        literal.append(chr(ops[position][1]))
+        position += 1
+    literal = ''.join(literal)
+
+    keyword = _word.match(literal).group()
+    if len(keyword) < len(literal):
+        # a non word character ends the keyword
+        return keyword, True
+    chars, other, _ = _first(ops[position:])
+    if not (chars & _ascii_word or other):
+        return keyword, True
+    if keyword:
+        return keyword, False
+    return None
+
+
+def _accepts_first(pattern):
+    '''Test on the first character of the lines an expression can match'''
+    ops = _parse(pattern)
+    if ops is None:
+        return lambda first: True
+    chars, other, empty = _first(ops)
+
+    def accepts(first):
+        if not first:
+            return empty
+        if first in _ascii:
+            return first in chars
+        return other
+    return accepts
+
+
+class CandidatePatterns(object):
+    '''Patterns of a table, for the lines of one keyword
+
+    The candidates are the compiled expressions; the other names are
+    expressions which can not match such lines: their `match` and
+    `fullmatch` return None at once, everything else (`search`...) is the
+    one of the real expression.
+    '''
+
+    def __init__(self, patterns, names):
+        self.names = tuple(name for name in patterns if name in names)
+        for name in patterns:
+            pattern = patterns[name]
+            setattr(self, name, pattern if name in names
+                    else _Excluded(pattern))
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, ', '.join(self.names))
+
+
+class _Excluded(object):
+    '''Expression which can not match the line from its first character'''
+
+    def __init__(self, pattern):
+        self._pattern = pattern
+        # takes the line only, fails loudly if given a position
+        self.match = _no_match
+        self.fullmatch = _no_match
+
+    def __getattr__(self, name):
+        return getattr(self._pattern, name)
+
+
+class LineDispatcher(object):
+    '''Dispatch the lines of an output to their candidate expressions
+
+    Indexes the expressions of a `Patterns` table by their literal leading
+    keyword (see `leading_keyword`), the first time it is used. Expressions
+    are expected to be used with `match` on the line, from its first
+    character (usually, the stripped line).
+
+    Args:
+        patterns (`Patterns`): table of the parser
+        exclude (`list`): names of the table never given as candidates
+
+    Example:
+        >>> class ShowInterfaces(ShowInterfacesSchema):
+        ...     patterns = Patterns(...)
+        ...     dispatcher = LineDispatcher(patterns)
+        ...
+        ...     def cli(self, output=None):
+        ...         dispatcher = self.dispatcher
+        ...         for line in output.splitlines():
+        ...             line = line.strip()
+        ...             # same names as the table, only for this line
+        ...             patterns = dispatcher.candidates(line)
+        ...             m = patterns.p1.match(line)
+    '''
+
+    def __init__(self, patterns, exclude=()):
+        self.patterns = patterns
+        self.exclude = frozenset(exclude)
+        self._index = None
+        self._without = {}
+
+    def without(self, names):
+        '''Dispatcher of the same table, never giving some expressions
+
+        Args:
+            names (iterable): names of the expressions to leave out, e.g.
+                              the rules of keys which are not wanted
+
+        Returns:
+            `LineDispatcher`: the same one for the same names
+        '''
+        names = frozenset(names) | self.exclude
+        if names == self.exclude:
+            return self
+        dispatcher = self._without.get(names)
+        if dispatcher is None:
+            dispatcher = self._without.setdefault(
+                names, LineDispatcher(self.patterns, exclude=names))
+        return dispatcher
+
+    def _build(self):
+        patterns = self.patterns.compile_all()
+        exact = {}
+        prefixes = {}
+        catch_all = []
+        for name in patterns:
+            if name in self.exclude:
+                continue
+            key = leading_keyword(patterns[name])
+            if key is None:
+                catch_all.append((name, _accepts_first(patterns[name])))
+            elif key[1]:
+                exact.setdefault(key[0], set()).add(name)
+            else:
+                prefixes.setdefault(key[0], set()).add(name)
+
+        self._index = (exact, prefixes, catch_all, {}, {})
+        return self._index
+
+    def candidates(self, line):
+        '''Patterns of the table to use for a line
+
+        Args:
+            line (`str`): the line, as given to `match`
+
+        Returns:
+            `CandidatePatterns`: only valid for that line
+        '''
+        keyword = _word.match(line).group()
+        # the first character tells apart the lines without keyword
+        cache_key = keyword or line[:1]
+        index = self._index or self._build()
+        try:
+            return index[3][cache_key]
+        except KeyError:
+            pass
+
+        exact, prefixes, catch_all, views, shared = index
+        first = line[:1]
+        names = set(exact.get(keyword, ()))
+        for prefix, rules in prefixes.items():
+            if keyword.startswith(prefix):
+                names.update(rules)
+        names.update(name for name, accepts in catch_all if accepts(first))
+        names = frozenset(names)
+
+        view = shared.get(names)
+        if view is None:
+            view = shared.setdefault(names,
+                                     CandidatePatterns(self.patterns, names))
+        if len(views) >= _max_cache:
+            views.clear()
+        views[cache_key] = view
+        return view
+
+    def iter_matches(self, line):
+        '''Match a line against its candidates, in the order of the table
+
+        Args:
+            line (`str`): line to match
+
+        Returns:
+            iterator of (`str`, match object): name of each matching
+                                               expression and its match
+        '''
+        patterns = self.patterns
+        for name in self.candidates(line).names:
+            m = patterns[name].match(line)
+            if m:
+                yield name, m
+
+    def match(self, line):
+        '''First candidate matching a line, in the order of the table
+
+        Args:
+            line (`str`): line to match
+
+        Returns:
+            (`str`, match object) or (None, None)
+        '''
+        for name, m in self.iter_matches(line):
+            return name, m
+        return None, None
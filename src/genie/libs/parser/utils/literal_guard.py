@@ -0,0 +1,238 @@
+'''Literal guards: skip the regular expressions which can not match a line
+
+Most expressions of the parsers hold mandatory literal text ('packets
+input', 'destinations,', 'via '...): a line without that text can not
+match, whatever the rest of the expression. The required literals are
+extracted from the compiled expression, and the line is checked with `in`
+before the expression is run. Checking a substring is much cheaper than
+running an expression which starts with `(?P<name>\\S+) +...` and has to
+backtrack before failing.
+
+Only the expressions which would scan the line are guarded, the guard
+costs a Python call on every line. Expressions starting with a literal
+prefix are left as they are: the regular expression engine already rejects
+the lines without that prefix at once, as `str.startswith` would. So are
+the ones starting with digits or blanks, which fail on the first
+characters of most lines.
+'''
+
+# python
+import re
+
+try:
+    from re import _parser as sre_parse
+    from re import _constants as sre_constants
+except ImportError:
+    import sre_parse
+    import sre_constants
+
+_repeats = {sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT}
+if hasattr(sre_constants, 'POSSESSIVE_REPEAT'):
+    _repeats.add(sre_constants.POSSESSIVE_REPEAT)
+
+# shortest literal worth checking, blanks excluded
+_min_length = 2
+
+# categories of characters holding letters
+_letter_categories = {sre_constants.CATEGORY_WORD,
+                      sre_constants.CATEGORY_NOT_SPACE,
+                      sre_constants.CATEGORY_NOT_DIGIT,
+                      sre_constants.CATEGORY_NOT_LINEBREAK}
+
+
+def _text(ops):
+    '''Text matched by a sequence of literals, None for anything else'''
+    chars = []
+    for op, av in ops:
+        if op is sre_constants.LITERAL:
+            chars.append(chr(av))
+        elif op is sre_constants.SUBPATTERN and \
+                not av[1] & re.IGNORECASE:
+            text = _text(av[-1])
+            if text is None:
+                return None
+            chars.append(text)
+        else:
+            return None
+    return ''.join(chars)
+
+
+def _walk(ops, runs, current):
+    '''Collect the runs of text every match of the sequence holds
+
+    Args:
+        ops (`list`): operations from the sre parser
+        runs (`list`): closed runs of text, extended in place
+        current (`str`): text of the run going on before the sequence
+
+    Returns:
+        `str`: text of the run going on after the sequence
+    '''
+    for op, av in ops:
+        if op is sre_constants.LITERAL:
+            current += chr(av)
+        elif op is sre_constants.AT:
+            # zero width
+            continue
+        elif op is sre_constants.SUBPATTERN and \
+                not av[1] & re.IGNORECASE:
+            # (group, add_flags, del_flags, pattern), always matched
+            current = _walk(av[-1], runs, current)
+        elif op in _repeats and av[0] >= 1:
+            low, high, sub = av
+            text = _text(sub)
+            if text is None:
+                # the content is there at least once, on its own
+                runs.append(current)
+                runs.append(_walk(sub, runs, ''))
+                current = ''
+            elif low == high:
+                current += text * low
+            else:
+                # the last repetition goes on with what follows
+                runs.append(current + text * low)
+                current = text
+        else:
+            # optional, alternatives, sets...
+            runs.append(current)
+            current = ''
+    return current
+
+
+def _parse(pattern):
+    if isinstance(pattern, str):
+        pattern = re.compile(pattern)
+    if pattern.flags & re.IGNORECASE:
+        return None
+    ops = list(sre_parse.parse(pattern.pattern, pattern.flags))
+    while ops and ops[0][0] is sre_constants.AT:
+        ops.pop(0)
+    return ops
+
+
+def _takes_letters(items):
+    '''Whether a set of characters holds letters'''
+    for op, av in items:
+        if op is sre_constants.NEGATE:
+            return True
+        elif op is sre_constants.LITERAL:
+            if chr(av).isalpha():
+                return True
+        elif op is sre_constants.RANGE:
+            low, high = av
+            if low <= ord('z') and high >= ord('A'):
+                return True
+        elif op is sre_constants.CATEGORY:
+            if av in _letter_categories:
+                return True
+    return False
+
+
+def _scans(ops):
+    '''Whether the expression starts by repeating a class which takes words
+
+    Such expressions (`(?P<interface>\\S+) +is`...) run along the line and
+    backtrack before failing, where a literal or a digit fails at once.
+    '''
+    while ops and ops[0][0] is sre_constants.SUBPATTERN:
+        ops = list(ops[0][1][-1])
+    if not ops or ops[0][0] not in _repeats:
+        return False
+    low, high, sub = ops[0][1]
+    if high == 1 or len(sub) != 1:
+        return False
+    op, av = sub[0]
+    if op is sre_constants.ANY:
+        return True
+    if op is not sre_constants.IN:
+        return False
+    return _takes_letters(av)
+
+
+def required_literals(pattern):
+    '''Literal texts held by every string an expression matches
+
+    Args:
+        pattern (`str` or compiled expression): regular expression
+
+    Returns:
+        (`str`, `list`): literal prefix of the matches ('' when they start
+                         with anything), and the other required texts, the
+                         longest first
+    '''
+    ops = _parse(pattern)
+    if ops is None:
+        return '', []
+    starts_with_literal = bool(ops) and ops[0][0] is sre_constants.LITERAL
+
+    runs = []
+    runs.append(_walk(ops, runs, ''))
+    runs = [run for run in runs if run]
+    prefix = runs.pop(0) if starts_with_literal else ''
+    return prefix, sorted(set(runs), key=len, reverse=True)
+
+
+class LiteralGuard(object):
+    '''Compiled expression, run only on the strings holding its literal
+
+    Same interface as the compiled expression: `match`, `fullmatch` and
+    `search` return None at once when the string misses the literal and
+    count it in `skipped`, everything else is the one of the expression.
+    The count is not locked, it can miss some skips from concurrent threads.
+
+    Args:
+        pattern (compiled expression): expression to guard
+        literal (`str`): text every match holds
+    '''
+
+    def __init__(self, pattern, literal):
+        self._pattern = pattern
+        self._skips = [0]
+        self.literal = literal
+        # closures rather than methods, they are called for every line
+        self.match = self._guarded(pattern.match)
+        self.fullmatch = self._guarded(pattern.fullmatch)
+        self.search = self._guarded(pattern.search)
+
+    def _guarded(self, method):
+        literal = self.literal
+        skips = self._skips
+
+        def guarded(string, *args):
+            if literal in string:
+                return method(string, *args)
+            skips[0] += 1
+            return None
+        return guarded
+
+    def __getattr__(self, name):
+        return getattr(self._pattern, name)
+
+    def __repr__(self):
+        return 'LiteralGuard({!r}, {!r})'.format(self._pattern, self.literal)
+
+    @property
+    def skipped(self):
+        '''Number of strings skipped without running the expression'''
+        return self._skips[0]
+
+
+def guard(pattern):
+    '''Expression guarded by its longest required literal, when worth it
+
+    Args:
+        pattern (compiled expression): expression to guard
+
+    Returns:
+        `LiteralGuard`, or the expression itself when it fails fast
+        anyway (literal prefix, digits...) or has no literal long enough
+        to check
+    '''
+    ops = _parse(pattern)
+    if ops is None or not _scans(ops):
+        return pattern
+    _, literals = required_literals(pattern)
+    for literal in literals:
+        if len(literal.strip()) >= _min_length:
+            return LiteralGuard(pattern, literal)
+    return pattern
@@ -0,0 +1,76 @@
+'''Bounded LRU cache used to memoize parser lookups'''
+
+# python
+import threading
+from collections import OrderedDict, namedtuple
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class LookupCache(object):
+    '''Least recently used cache with hit/miss statistics
+
+    Args:
+        maxsize (`int`): maximum number of entries kept in the cache
+
+    Example:
+        >>> cache = LookupCache(maxsize=2)
+        >>> cache.put('a', 1)
+        >>> cache.get('a')
+        1
+        >>> cache.info()
+        CacheInfo(hits=1, misses=0, maxsize=2, currsize=1)
+    '''
+
+    # sentinel returned by get() on misses
+    MISSING = object()
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key):
+        '''Return the cached value of `key`, or `LookupCache.MISSING`'''
+
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return self.MISSING
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        '''Store `value` under `key`, evicting the least recently used entry
+           when the cache is full'''
+
+        if not self.maxsize:
+            return
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        '''Remove all the entries and reset the statistics'''
+
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        '''Return the cache statistics'''
+
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
@@ -0,0 +1,113 @@
+'''Regular expressions of the parsers, declared once per class
+
+Most parsers compile the same 20 to 50 regular expressions on every call of
+`cli`, some of them for every line of the output. `Patterns` declares them
+once, as a class attribute of the parser: each expression is compiled the
+first time it is used, then shared by every instance of the parser class and
+of its subclasses. The compiled expressions are kept by the table itself, so
+they do not depend on the (small) internal cache of the `re` module.
+'''
+
+# python
+import re
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+# parser utils
+from genie.libs.parser.utils.literal_guard import LiteralGuard, guard
+
+
+class Patterns(Mapping):
+    '''Table of the regular expressions of a parser, compiled on first use
+
+    The compiled expressions are attributes of the table (or items, by
+    name). Names must not start with an underscore, nor be the name of a
+    Mapping method (keys, items, get...) or of a property of the table.
+
+    Args:
+        flags (`int`): re flags used to compile every expression
+        guards (`bool`): check the required literals of each expression on
+                         the string before running it, see LiteralGuard.
+                         Default to False
+        **patterns: name -> regular expression, in the order they are tried
+
+    Example:
+        >>> class ShowClock(ShowClockSchema):
+        ...     patterns = Patterns(
+        ...         # *12:00:00.000 UTC Mon Oct 19 2026
+        ...         p1=r'^\\*?(?P<time>[\\d:.]+) +(?P<timezone>\\w+) +'
+        ...            r'(?P<day_of_week>\\w+) +(?P<month>\\w+) +'
+        ...            r'(?P<day>\\d+) +(?P<year>\\d+)$')
+        ...
+        ...     def cli(self, output=None):
+        ...         patterns = self.patterns
+        ...         for line in output.splitlines():
+        ...             m = patterns.p1.match(line.strip())
+    '''
+
+    def __init__(self, flags=0, guards=False, **patterns):
+        self._flags = flags
+        self._guards = guards
+        self._sources = patterns
+
+    def __getattr__(self, name):
+        # Only called for the expressions which are not compiled yet
+        try:
+            source = self._sources[name]
+        except (KeyError, AttributeError):
+            raise AttributeError('no pattern named {!r}'.format(name)) \
+                                                                    from None
+
+        # compiling twice from concurrent threads gives the same expression
+        compiled = re.compile(source, self._flags)
+        if self._guards:
+            compiled = guard(compiled)
+        return self.__dict__.setdefault(name, compiled)
+
+    def __getitem__(self, name):
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def __iter__(self):
+        return iter(self._sources)
+
+    def __len__(self):
+        return len(self._sources)
+
+    def __contains__(self, name):
+        return name in self._sources
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, ', '.join(self._sources))
+
+    @property
+    def flags(self):
+        '''re flags used to compile every expression'''
+        return self._flags
+
+    @property
+    def skip_counts(self):
+        '''name -> number of strings skipped by the guard of the expression,
+        for the guarded expressions compiled so far'''
+        counts = {}
+        for name in self._sources:
+            compiled = self.__dict__.get(name)
+            if isinstance(compiled, LiteralGuard):
+                counts[name] = compiled.skipped
+        return counts
+
+    @property
+    def sources(self):
+        '''name -> regular expression, not compiled'''
+        return dict(self._sources)
+
+    def compile_all(self):
+        '''Compile every expression of the table, e.g. before forking'''
+        for name in self._sources:
+            getattr(self, name)
+        return self
@@ -0,0 +1,296 @@
+'''Parsing of the requested keys of an output only
+
+A dashboard polling `show interfaces` for the status and rates of the
+interfaces pays for the parsing and the schema checking of the dozens of
+other keys of each interface. `parse(fields=[...])` gives the subtrees of
+the parsed output at these fields only:
+
+    >>> ShowInterfaces(device=uut).parse(
+    ...     fields=['*.oper_status', '*.counters.rate'])
+    {'GigabitEthernet1': {'oper_status': 'up',
+                          'counters': {'rate': {'in_rate': 1000, ...}}},
+     ...}
+
+A field is the path of keys to a subtree of the parsed output, as a string
+of keys joined by dots, or as a list of keys when a key holds a dot
+(`('GigabitEthernet0/0.100', 'oper_status')`); `*` is any key. Only the
+subtrees of the parsed output at the fields are checked against the
+schema. The parsers also leave out the rules which give none of them,
+declared in their `rule_fields`, and the blocks of the keys which are not
+wanted (see `BlockParser`).
+'''
+
+# Metaparser
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+from genie.metaparser.util.schemaengine import Schema, Any, Optional
+
+# Parser utils
+from genie.libs.parser.utils.compiled_schema import CompiledSchema, \
+    CompiledSchemaParser
+from genie.libs.parser.utils.lookup_cache import LookupCache
+from genie.libs.parser.utils.validation_policy import policy_schema
+
+_wildcard = '*'
+
+# Maximum number of compiled schemas of the fields kept
+PROJECTION_CACHE_SIZE = 256
+
+# compiled schemas of the fields, by parser class and fields
+projection_schemas = LookupCache(maxsize=PROJECTION_CACHE_SIZE)
+
+
+def _path(field):
+    if isinstance(field, str):
+        return tuple(field.split('.'))
+    return tuple(field)
+
+
+def _matches(segment, key):
+    '''Whether a key of the parsed output is at a segment of a field'''
+    return segment == _wildcard or segment == key or segment == str(key)
+
+
+def _schema_matches(segment, key):
+    '''Whether a key of a schema can be at a segment of a field'''
+    if segment == _wildcard or isinstance(key, Any):
+        return True
+    if isinstance(key, Optional):
+        key = key.schema
+    if isinstance(key, (str, int)):
+        return _matches(segment, key)
+    # Or, Use... as keys
+    return True
+
+
+def _project(data, paths, matches):
+    if () in paths:
+        # the whole subtree is wanted
+        return data
+    if not isinstance(data, dict):
+        # lists are kept whole
+        return data
+    projected = {}
+    for key, value in data.items():
+        sub_paths = {path[1:] for path in paths if matches(path[0], key)}
+        if sub_paths:
+            projected[key] = _project(value, sub_paths, matches)
+    return projected
+
+
+class Projection(object):
+    '''Fields of the parsed output to parse
+
+    Args:
+        fields (`list`): paths of the subtrees to parse, each a string of
+                         keys joined by dots or a list of keys, `*` being
+                         any key
+
+    A field going through a list of the parsed output keeps the whole
+    list.
+    '''
+
+    def __init__(self, fields):
+        if isinstance(fields, str):
+            fields = [fields]
+        self.fields = tuple(sorted({_path(field) for field in fields}))
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, [
+            '.'.join(map(str, path)) for path in self.fields])
+
+    def project(self, parsed):
+        '''Subtrees of a parsed output at the fields
+
+        The dicts on the way to the fields are kept, empty or not.
+
+        Args:
+            parsed (`dict`): parsed output
+
+        Returns:
+            `dict`: parsed output of the fields only
+        '''
+        return _project(parsed, set(self.fields), _matches)
+
+    def project_schema(self, schema):
+        '''Schema of the subtrees of a parsed output at the fields
+
+        Args:
+            schema (`dict`): schema of the parsed output
+
+        Returns:
+            `dict`: schema of the parsed output of the fields, the keys on
+                    the way to them keeping whether they are optional
+        '''
+        return _project(schema, set(self.fields), _schema_matches)
+
+    def wants(self, path):
+        '''Whether keys at a path of the parsed output may be projected
+
+        Args:
+            path (`str` or `list`): path of keys, `*` being any key
+
+        Returns:
+            `bool`: True when a field leads to the path, goes through it or
+                    is under it
+        '''
+        path = _path(path)
+        for field in self.fields:
+            if all(a == _wildcard or b == _wildcard or a == b
+                   for a, b in zip(field, path)):
+                return True
+        return False
+
+    def skipped_rules(self, rule_fields):
+        '''Rules giving none of the fields
+
+        Args:
+            rule_fields (`dict`): fields each rule gives a value to, by rule
+                                  name
+
+        Returns:
+            `frozenset`: names of the rules giving no wanted field
+        '''
+        return frozenset(name for name, paths in rule_fields.items()
+                         if not any(self.wants(path) for path in paths))
+
+    def top_keys(self):
+        '''Keys at the top of the parsed output of the fields
+
+        Returns:
+            `set` or None: None when a field holds any key at the top
+        '''
+        keys = {field[0] for field in self.fields}
+        if _wildcard in keys:
+            return None
+        return keys
+
+
+class _ProjectedSchema(Schema):
+    '''Schema projecting the parsed outputs on fields before checking them
+
+    Args:
+        projection (`Projection`): fields
+        schema (`Schema`): schema of the parsed output of the fields
+    '''
+
+    def __init__(self, projection, schema):
+        super().__init__(schema)
+        self.projection = projection
+
+    def validate(self, data, *args, command='', warn_unsupported_keys=False,
+                 **kwargs):
+        projected = self.projection.project(data)
+        if not projected:
+            # none of the fields is in the output
+            raise SchemaEmptyParserError(projected, command=command)
+        return self.schema.validate(
+            projected, command=command,
+            warn_unsupported_keys=warn_unsupported_keys)
+
+
+class ProjectionParser(CompiledSchemaParser):
+    '''Mixin of the parsers giving the parsed output of some fields only
+
+    `parse` takes a `fields` argument: the parsed output is projected on
+    them, and only this projected output is checked against the projected
+    schema, compiled, as the validation policy decides. While `parse`
+    runs, `self.projection` is the `Projection` of the fields, None for a
+    whole parse.
+
+    Class attributes:
+        rule_fields (`dict`): fields given by each rule of the `patterns`
+                              of the parser, by rule name; a rule is left
+                              out when none of its fields is wanted, see
+                              `rules`
+        always_rules (`list`): names of the rules used whatever the
+                               fields, e.g. the rules of the header lines
+                               giving the keys of the entries. Each rule of
+                               the `patterns` is in `rule_fields` or in
+                               `always_rules`
+        cross_block_fields (`list`): for a `BlockParser` whose parsed
+                                     output is keyed at its top by the
+                                     identifiers of its blocks, the fields
+                                     one block gives for others (e.g. the
+                                     members of a port-channel). Only the
+                                     blocks of the wanted keys are parsed
+                                     when none of these fields is wanted.
+                                     None when the parsed output is not
+                                     keyed by the blocks
+    '''
+
+    projection = None
+    rule_fields = {}
+    always_rules = ()
+    cross_block_fields = None
+
+    def rules(self, dispatcher):
+        '''Dispatcher of the rules giving the wanted fields
+
+        Args:
+            dispatcher (`LineDispatcher`): dispatcher of all the rules
+
+        Returns:
+            `LineDispatcher`: without the rules of unwanted fields
+        '''
+        if self.projection is None:
+            return dispatcher
+        return dispatcher.without(
+            self.projection.skipped_rules(self.rule_fields))
+
+    def checked_schema(self):
+        '''Schema `parse` checks the output against
+
+        Returns:
+            `Schema`: for a parse of some fields, the schema projecting the
+                      output on them and checking the projected output
+                      against the compiled projected schema
+        '''
+        if self.projection is None:
+            return super().checked_schema()
+        key = type(self), self.projection.fields
+        schema = projection_schemas.get(key)
+        if schema is projection_schemas.MISSING:
+            schema = CompiledSchema(self.projection.project_schema(self.schema))
+            projection_schemas.put(key, schema)
+        return _ProjectedSchema(self.projection, policy_schema(self, schema))
+
+    def parse(self, *args, fields=None, **kwargs):
+        '''Parse the output, or the given fields of it only
+
+        Args:
+            fields (`list`): paths of the subtrees of the parsed output to
+                             parse, see `Projection`. Default to the whole
+                             output
+            args, kwargs: arguments of `parse`
+
+        Returns:
+            `dict`: parsed output, projected on the fields
+
+        Raises:
+            SchemaEmptyParserError: none of the fields is in the output
+        '''
+        if fields is None:
+            return super().parse(*args, **kwargs)
+
+        projection = Projection(fields)
+        context = getattr(self, 'context', 'cli')
+        if not isinstance(context, str):
+            # contexts tried in turn
+            context = context[0]
+        output = kwargs.get('output')
+        keys = projection.top_keys()
+        if context == 'cli' and keys is not None and \
+                isinstance(output, str) and \
+                self.cross_block_fields is not None and \
+                not any(projection.wants(field)
+                        for field in self.cross_block_fields):
+            # only the blocks of the wanted keys
+            blocks = self.blocks(output)
+            kwargs['output'] = ''.join(blocks[key] for key in blocks.keys()
+                                       if key in keys)
+
+        self.projection = projection
+        try:
+            return super().parse(*args, **kwargs)
+        finally:
+            self.projection = None
@@ -0,0 +1,121 @@
+'''Parsing of tabular outputs one record at a time
+
+The table parsers (routes, MAC addresses, NAT translations...) give their
+output one record at a time from `iter_records`, a generator taking the same
+arguments as `cli`: each route, entry or translation is yielded as soon as
+its last line is read, so an exporter can push it downstream without
+building the whole parsed output. `cli` builds the parsed output from the
+same records with `build_output`.
+
+A record is a `(path, data)` pair: `data` is the dict of one entry and
+`path` its place in the parsed output, the keys leading to it from the top
+of the output. `Position` keys are indexes in a list. Records sharing a
+place are merged, as the parsers used to `setdefault` and `update` their
+nested dicts.
+
+    >>> for path, data in ShowIpNatTranslations(device=uut).iter_records():
+    ...     vrf, index = path[1], path[3]
+'''
+
+
+class Position(int):
+    '''Index in a list of the parsed output, as a key of a record path
+
+    The list is extended when the index is its length.
+    '''
+
+    def __repr__(self):
+        return 'Position({})'.format(int(self))
+
+
+def _merge(target, data):
+    for key, value in data.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        else:
+            target[key] = value
+
+
+def _container(key):
+    return [] if isinstance(key, Position) else {}
+
+
+def _parent(parsed, path):
+    '''Container of the last key of a path, created when missing'''
+    node = parsed
+    for index in range(len(path) - 1):
+        key = path[index]
+        if type(node) is list:
+            if key == len(node):
+                node.append(_container(path[index + 1]))
+            node = node[key]
+        else:
+            if key not in node:
+                node[key] = _container(path[index + 1])
+            node = node[key]
+    return node
+
+
+def _place(node, key, data):
+    '''Store a record at a key of its container
+
+    Returns:
+        `bool`: whether it was merged into the dict already there
+    '''
+    if type(node) is list:
+        if key == len(node):
+            node.append(data)
+            return False
+    elif key not in node:
+        node[key] = data
+        return False
+    _merge(node[key], data)
+    return True
+
+
+def add_record(parsed, record):
+    '''Place a record in a parsed output
+
+    The dict of the record is stored as it is at a new place, so that the
+    parsed output holds what the parser added to it after yielding it. It
+    is merged into the dict already there otherwise.
+
+    Args:
+        parsed (`dict`): parsed output, updated in place
+        record (`tuple`): `(path, data)` record to place
+    '''
+    path, data = record
+    if path:
+        _place(_parent(parsed, path), path[-1], data)
+    else:
+        _merge(parsed, data)
+
+
+def build_output(records):
+    '''Parsed output made of records, same as `add_record` for each of them
+
+    Args:
+        records (iterable): `(path, data)` records of the output, as
+                            `iter_records` gives them
+
+    Returns:
+        `dict`: parsed output
+    '''
+    parsed = {}
+    # consecutive records mostly share their container
+    parent_path = parent = None
+    for path, data in records:
+        if not path:
+            _merge(parsed, data)
+            parent_path = None
+            continue
+        if path[:-1] != parent_path:
+            parent = _parent(parsed, path)
+            parent_path = path[:-1]
+        key = path[-1]
+        if type(parent) is dict and key not in parent:
+            parent[key] = data
+        elif _place(parent, key, data):
+            # a merge may replace the containers on the way
+            parent_path = None
+    return parsed
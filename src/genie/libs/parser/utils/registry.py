@@ -0,0 +1,249 @@
+'''Versioned registry of the parsers
+
+The parsers of genie.libs.parser are loaded from the generated index
+(`ParserIndex`) and never change. The parsers added at runtime by
+`entry_points.add_parser` are kept by a `ParserRegistry` as immutable
+snapshots:
+
+    * readers take the current `RegistrySnapshot` once and use it for a whole
+      lookup. A snapshot never changes, so it is a consistent view of the
+      parsers without any lock.
+    * writers serialize on the registry lock, build the next snapshot from
+      the current one and publish it with a single assignment. Readers using
+      the previous snapshot are not affected.
+
+Everything derived from the parser data (views, command tries, resolved
+parsers) is either stored on its snapshot or keyed on its version, so it can
+never be used with the data of another version.
+'''
+
+# python
+import threading
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+from .command_trie import CommandTrie, OverlayCommandTrie
+
+
+class ParserDataView(Mapping):
+    '''Read only view of the parser data of a snapshot
+
+    The commands added at runtime are overlaid on the data of the index:
+    they come after the commands of the index, except the ones replacing the
+    parser of an existing command, which keep their position.
+
+    Args:
+        base (`Mapping`): command -> os -> parser location, from the index
+        overlay (`dict`): command -> os -> parser location, added at runtime
+    '''
+
+    def __init__(self, base, overlay):
+        self.base = base
+        self.overlay = overlay
+        self._added = [command for command in overlay if command not in base]
+        self._merged = {}
+
+    def __len__(self):
+        return len(self.base) + len(self._added)
+
+    def __iter__(self):
+        yield from self.base
+        yield from self._added
+
+    def __contains__(self, command):
+        return command in self.overlay or command in self.base
+
+    def __getitem__(self, command):
+        added = self.overlay.get(command)
+        if added is None:
+            return self.base[command]
+
+        value = self._merged.get(command)
+        if value is None:
+            value = dict(self.base.get(command, {}))
+            value.update(added)
+            value = self._merged.setdefault(command, value)
+        return value
+
+    @property
+    def added(self):
+        '''Commands which are not part of the index'''
+        return self._added
+
+
+class RegistrySnapshot(object):
+    '''Immutable state of the parsers at one version
+
+    Args:
+        index (`ParserIndex`): the parsers of genie.libs.parser
+        version (`int`): version of the snapshot
+        additions (`tuple`): (command, os, parser location) added at runtime,
+                             in order
+    '''
+
+    def __init__(self, index, version=0, additions=()):
+        self.index = index
+        self.version = version
+        self.additions = additions
+        self._commands = frozenset(command for command, _, _ in additions)
+        # views and tries of each os, None for every os
+        self._views = {}
+        self._tries = {}
+
+    def get(self, os_name=None):
+        '''Return the parser data of an os, or of every os if os is None'''
+
+        view = self._views.get(os_name)
+        if view is None:
+            overlay = {}
+            for command, added_os, entry in self.additions:
+                if os_name is None or added_os == os_name:
+                    overlay.setdefault(command, {})[added_os] = entry
+            view = self._views.setdefault(
+                os_name, ParserDataView(self.index.get(os_name), overlay))
+        return view
+
+    def has_command(self, command):
+        '''Whether the command has a parser for any os'''
+        return command in self._commands or self.index.has_command(command)
+
+    def command_trie(self, os_name=None):
+        '''Return the command trie of an os, or of every os if os is None'''
+
+        trie = self._tries.get(os_name)
+        if trie is None:
+            view = self.get(os_name)
+            trie = self._tries.setdefault(os_name, OverlayCommandTrie(
+                            self.index.command_trie(os_name), view.added))
+        return trie
+
+    def add(self, entries):
+        '''Return the next snapshot, with the given parsers added
+
+            Args:
+                entries (`list`): (command, os, parser location) to add
+        '''
+        return RegistrySnapshot(self.index, self.version + 1,
+                                self.additions + tuple(entries))
+
+
+class DataSnapshot(object):
+    '''Snapshot of a plain parser data dict
+
+    `common.parser_data` used to be the dict of parsers.json, which callers
+    and tests replace with their own parsers. Such a dict is searched as it
+    is, with every os: it has no version, so the parsers resolved from it
+    are not cached.
+
+    Args:
+        data (`dict`): command -> os -> parser location
+    '''
+
+    version = None
+
+    def __init__(self, data):
+        self.data = data
+
+    def get(self, os_name=None):
+        '''Return the parser data, of every os'''
+        return self.data
+
+    def has_command(self, command):
+        '''Whether the command has a parser for any os'''
+        return command in self.data
+
+    def command_trie(self, os_name=None):
+        '''Return the command trie of the parser data'''
+        return CommandTrie(self.data)
+
+
+class ParserRegistry(object):
+    '''Parsers of genie.libs.parser and the ones added at runtime
+
+    Args:
+        index (`ParserIndex`): the parsers of genie.libs.parser
+
+    Example:
+        >>> registry = ParserRegistry(ParserIndex())
+        >>> snapshot = registry.snapshot
+        >>> registry.add('show clock', 'linux', {...})
+        >>> snapshot.version, registry.snapshot.version
+        (0, 1)
+    '''
+
+    def __init__(self, index):
+        self.index = index
+        self._lock = threading.RLock()
+        self._snapshot = RegistrySnapshot(index)
+        # callables adding parsers, run before the registry is first used
+        self._deferred = []
+        self._running = False
+
+    @property
+    def snapshot(self):
+        '''The current snapshot, running the deferred loaders first'''
+        if self._deferred:
+            self._run_deferred()
+        return self._snapshot
+
+    @property
+    def version(self):
+        return self.snapshot.version
+
+    def defer(self, loader):
+        '''Run `loader` the first time the registry is used. Used to add the
+           parsers of plugins only when needed.'''
+        with self._lock:
+            self._deferred.append(loader)
+
+    def _run_deferred(self):
+        with self._lock:
+            # the loaders add parsers to the registry themselves
+            if self._running:
+                return
+            self._running = True
+            try:
+                # a loader is only removed once it has run, so that other
+                # threads wait for it on the lock
+                while self._deferred:
+                    try:
+                        self._deferred[0]()
+                    finally:
+                        del self._deferred[0]
+            finally:
+                self._running = False
+
+    def add(self, command, os_name, entry):
+        '''Add (or replace) the parser of a command for an os'''
+        self.add_many([(command, os_name, entry)])
+
+    def add_many(self, entries):
+        '''Add the (command, os, parser location) entries, publishing a
+           single new snapshot'''
+        entries = [tuple(entry) for entry in entries]
+        with self._lock:
+            self._snapshot = self._snapshot.add(entries)
+
+
+class CurrentParserData(Mapping):
+    '''Parser data of every os, always read from the current snapshot of a
+       registry. Kept for the code reading `common.parser_data`; lookups
+       should use a single snapshot instead.'''
+
+    def __init__(self, registry):
+        self.registry = registry
+
+    def __len__(self):
+        return len(self.registry.snapshot.get())
+
+    def __iter__(self):
+        return iter(self.registry.snapshot.get())
+
+    def __contains__(self, command):
+        return command in self.registry.snapshot.get()
+
+    def __getitem__(self, command):
+        return self.registry.snapshot.get()[command]
@@ -0,0 +1,287 @@
+'''Match a line against a whole table of regular expressions in one call
+
+Parsers whose rules are all anchored line patterns try them one after the
+other and keep the first one matching. `LineScanner` fuses such a rule set
+into one compiled alternation, one branch per rule in the same order, as
+`re.Scanner` does: each line costs one regular expression call, and the
+branch which matched tells the rule. Only the expression of that rule is
+then run again on the line, to get its own groups.
+
+Expressions which can not be fused safely (back references, conditional
+groups, their own global flags...) are kept apart and tried on their own,
+at their place in the order.
+
+The order of the rules is the one of the table, as the author wrote them.
+With a `warmup`, the scanner counts how many lines each rule matches over
+its first lines, then tries the rules matching the most lines first, in an
+order frozen from then on. As the scanner is a class attribute of its
+parser, the warm-up is the one of all the instances of the class, in any
+thread. A rule is only moved before another one when no line of the
+warm-up matched both, and never across a `pinned` rule: the rules which
+must be tried before or after others, for lines the warm-up may not have
+seen. The learned order is `names`, to be given as the `names` of the
+scanner of the parser class.
+
+    >>> scanner = LineScanner(ShowLogging.patterns, warmup=len(lines))
+    >>> for line in lines:
+    ...     name, m = scanner.match(line)
+    >>> scanner.names
+    ('p4', 'p3', 'p2', 'p1', 'p6', ...)
+'''
+
+# python
+import re
+from threading import Lock
+
+_unsafe_flags = re.VERBOSE
+
+
+def _uncaptured(source):
+    '''Expression with its capturing groups turned into non capturing ones
+
+    Args:
+        source (`str`): regular expression
+
+    Returns:
+        `str` or None: None when the groups are referred to inside the
+                       expression itself
+    '''
+    parts = []
+    position = 0
+    length = len(source)
+    while position < length:
+        char = source[position]
+        if char == '\\':
+            escaped = source[position + 1:position + 2]
+            if escaped.isdigit() and escaped != '0':
+                # back reference
+                return None
+            parts.append(source[position:position + 2])
+            position += 2
+        elif char == '[':
+            # character set, up to its closing bracket
+            end = position + 1
+            if source.startswith('^', end):
+                end += 1
+            if source.startswith(']', end):
+                end += 1
+            while end < length and source[end] != ']':
+                end += 2 if source[end] == '\\' else 1
+            parts.append(source[position:end + 1])
+            position = end + 1
+        elif char == '(':
+            if source.startswith('(?P<', position):
+                parts.append('(?:')
+                position = source.index('>', position) + 1
+            elif source.startswith('(?P=', position) or \
+                    source.startswith('(?(', position):
+                # named back reference, conditional group
+                return None
+            elif source.startswith('(?', position):
+                parts.append('(?')
+                position += 2
+            else:
+                parts.append('(?:')
+                position += 1
+        else:
+            parts.append(char)
+            position += 1
+    return ''.join(parts)
+
+
+def _fusable(pattern, flags):
+    '''Branch of the alternation for a compiled expression, or None'''
+    if pattern.flags != flags or pattern.flags & _unsafe_flags:
+        # global flags of its own
+        return None
+    branch = _uncaptured(pattern.pattern)
+    if branch is None:
+        return None
+    try:
+        if re.compile(branch, flags).groups:
+            return None
+    except re.error:
+        return None
+    return branch
+
+
+class LineScanner(object):
+    '''First rule of a table matching a line, in one regular expression call
+
+    The table is fused the first time it is used. The rules are the names of
+    the table, in their order, or the given ones.
+
+    Args:
+        patterns (`Patterns`): table of the parser
+        names (`list`): names of the rules, in the order they are tried.
+                        Default to all the names of the table
+        exclude (`list`): names of the table which are not rules
+        warmup (`int`): number of lines matched rule by rule, counting the
+                        lines each rule matches, before ordering the rules
+                        by these counts. Default to the given order
+        pinned (`list`): names of the rules keeping their place, the other
+                         rules being only reordered between them
+
+    Example:
+        >>> class ShowLogging(ShowLoggingSchema):
+        ...     patterns = Patterns(...)
+        ...     scanner = LineScanner(patterns)
+        ...
+        ...     def cli(self, output=None):
+        ...         scanner = self.scanner
+        ...         for line in output.splitlines():
+        ...             name, m = scanner.match(line.strip())
+        ...             if name == 'p1':
+        ...                 group = m.groupdict()
+    '''
+
+    def __init__(self, patterns, names=None, exclude=(), warmup=None,
+                 pinned=()):
+        self.patterns = patterns
+        if names is None:
+            names = list(patterns)
+        self.names = tuple(name for name in names if name not in exclude)
+        self._segments = None
+
+        self.pinned = frozenset(pinned)
+        self.hits = dict.fromkeys(self.names, 0)
+        # (first, other) rules both matching a line of the warm-up
+        self._before = set()
+        # lines left to the warm-up, None once the order is frozen
+        self._warmup = warmup or None
+        # the scanner is shared by the instances of the parser, in any
+        # thread: the warm-up and the order are changed under the lock
+        self._lock = Lock()
+
+    def _build(self):
+        with self._lock:
+            if self._segments is None:
+                self._segments = self._fuse(self.names)
+            return self._segments
+
+    def _fuse(self, names):
+        patterns = self.patterns
+        flags = re.compile('', patterns.flags).flags
+
+        # consecutive fusable rules share one expression
+        segments = []
+        branches = []
+        for name in names:
+            pattern = patterns[name]
+            branch = _fusable(pattern, flags)
+            if branch is None:
+                segments.append(self._segment(branches, flags))
+                segments.append((pattern, ((name, pattern),), False))
+                branches = []
+            else:
+                branches.append((name, pattern, branch))
+        segments.append(self._segment(branches, flags))
+        return tuple(segment for segment in segments if segment)
+
+    def _segment(self, branches, flags):
+        if not branches:
+            return None
+        rules = tuple((name, pattern) for name, pattern, _ in branches)
+        if len(branches) == 1:
+            return rules[0][1], rules, False
+
+        expression = re.compile('|'.join('({})'.format(branch)
+                                         for _, _, branch in branches), flags)
+        assert expression.groups == len(rules)
+        return expression, rules, True
+
+    @property
+    def fused(self):
+        '''Names of the rules fused in an alternation with other rules'''
+        segments = self._segments or self._build()
+        return tuple(name for _, rules, fused in segments if fused
+                     for name, _ in rules)
+
+    def match(self, line):
+        '''First rule matching a line
+
+        Args:
+            line (`str`): line to match, from its first character
+
+        Returns:
+            (`str`, match object) or (None, None): name of the rule and
+                                                   match of its expression
+        '''
+        if self._warmup is not None:
+            return self._learn(line)
+        for expression, rules, fused in self._segments or self._build():
+            m = expression.match(line)
+            if m:
+                if not fused:
+                    return rules[0][0], m
+                # each branch is the only capturing group of its rule
+                name, pattern = rules[m.lastindex - 1]
+                return name, pattern.match(line)
+        return None, None
+
+    def _learn(self, line):
+        '''`match` of the warm-up, trying every rule on its own'''
+        patterns = self.patterns
+        first = None
+        others = []
+        for name in self.names:
+            m = patterns[name].match(line)
+            if m:
+                if first is None:
+                    first = name, m
+                else:
+                    others.append(name)
+
+        with self._lock:
+            if self._warmup is not None:
+                if first:
+                    self.hits[first[0]] += 1
+                    self._before.update((first[0], name) for name in others)
+                self._warmup -= 1
+                if self._warmup <= 0:
+                    self._reorder()
+        return first or (None, None)
+
+    def reorder(self):
+        '''Order the rules by the number of lines they matched
+
+        The rules matching the most lines come first, between the pinned
+        rules. A rule stays after the ones which matched its lines first.
+        The warm-up is over, the order is frozen.
+
+        Returns:
+            `tuple`: names of the rules, in their new order
+        '''
+        with self._lock:
+            return self._reorder()
+
+    def _reorder(self):
+        names = []
+        segment = []
+        for name in self.names + (None,):
+            if name is None or name in self.pinned:
+                names.extend(self._by_hits(segment))
+                segment = []
+                if name is not None:
+                    names.append(name)
+            else:
+                segment.append(name)
+
+        self.names = tuple(names)
+        self._segments = None
+        self._warmup = None
+        return self.names
+
+    def _by_hits(self, names):
+        ordered = []
+        names = list(names)
+        while names:
+            # rules no other remaining rule has to be tried before
+            ready = [name for name in names
+                     if not any((other, name) in self._before
+                                for other in names)]
+            # the earlier of the rules with as many hits
+            name = max(ready, key=self.hits.get)
+            ordered.append(name)
+            names.remove(name)
+        return ordered
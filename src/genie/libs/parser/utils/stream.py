@@ -0,0 +1,63 @@
+'''Parsing of outputs given line by line
+
+The parsers take the output of the device as one string and split it into
+a list of lines, which keeps the whole output twice in memory: a few
+hundred MB for a full table `show ip bgp` or `show route extensive`
+capture. The parsers reading their output line by line, once, accept any
+iterable of lines instead: a file, a socket reader, a generator... Only
+the line being parsed is then held in memory, next to the parsed data.
+'''
+
+
+def iter_lines(output):
+    '''Lines of an output, given as a string or as an iterable of lines
+
+    Args:
+        output (`str` or iterable): whole output, or its lines (`str` or
+                                    `bytes`, with or without their end of
+                                    line)
+
+    Returns:
+        iterable of `str`: lines without their end of line, as given by
+                           `str.splitlines` for a string
+    '''
+    if isinstance(output, str):
+        return output.splitlines()
+    return _iter_lines(output)
+
+
+def _iter_lines(lines):
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode('utf-8', 'replace')
+        yield line.rstrip('\r\n')
+
+
+class StreamParser(object):
+    '''Mixin of the parsers reading their output line by line
+
+    The `cli` of such parsers gets its lines from `iter_lines(output)`
+    rather than `output.splitlines()`, so `output` can be any iterable of
+    lines.
+    '''
+
+    def parse_stream(self, lines, **kwargs):
+        '''Parse an output given as an iterable of lines
+
+        Same as `parse(output=...)`, schema checking included, without ever
+        holding the whole output in memory. The lines are consumed once.
+
+        Args:
+            lines (iterable): lines of the output, `str` or `bytes`, e.g.
+                              an open file
+            kwargs (`dict`): other arguments of `parse` and `cli`
+
+        Returns:
+            `dict`: parsed output
+
+        Example:
+            >>> with open('show_ip_route.txt') as f:
+            ...     parsed = ShowIpRoute(device=uut).parse_stream(f)
+        '''
+        # an iterator is never empty for `if not output`, unlike a list
+        return self.parse(output=iter_lines(iter(lines)), **kwargs)
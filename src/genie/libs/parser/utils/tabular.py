@@ -0,0 +1,254 @@
+'''Parsing of fixed-width column tables
+
+`genie.parsergen.oper_fill_tabular` finds the header of a table with
+regular expressions built from the header fields on every call, then
+matches every line of the output against them. `FixedWidthTable` builds
+its expressions once, when the parser class is defined, finds the column
+boundaries once per table from its header line, and slices each row at
+these offsets.
+
+The entries are the ones of `oper_fill_tabular` for the same arguments:
+keyed by the values of the `index` columns, each a dict of the stripped
+values keyed by label.
+
+    >>> table = FixedWidthTable(
+    ...     header_fields=['Interface', 'IP-Address', r'OK\\?', 'Method',
+    ...                    'Status', 'Protocol'],
+    ...     table_terminal_pattern=r'^\\n')
+    >>> table.entries(output)['GigabitEthernet1']['Status']
+    'up'
+'''
+
+# python
+import re
+from operator import itemgetter
+
+# Parser utils
+from genie.libs.parser.utils.stream import iter_lines
+from genie.libs.parser.utils.literal_guard import required_literals
+
+# separators ('-----', '=====', '+---+') and blank lines are not rows
+_data = re.compile(r'[A-Za-z0-9]')
+
+
+class _Header(str):
+    '''First line of a header of several lines, with the column labels'''
+
+
+class FixedWidthTable(object):
+    '''Table with its columns at fixed offsets, given by its header
+
+    Args:
+        header_fields (`list`): expressions of the column headings, in
+                                order; a list of such lists for a header
+                                spanning several lines, the offsets being
+                                the ones of the first line
+        label_fields (`list`): keys of the values in the entries, the
+                               headings by default (the texts they match,
+                               joined with spaces, for a header of several
+                               lines)
+        index (`int` or `list`): columns keying the entries, a nested
+                                 dict per column
+        right_justified (`bool`): headings aligned on the right of their
+                                  column rather than on its left
+        table_terminal_pattern (`str`): expression of the line ending the
+                                        table, searched in the line and its
+                                        end of line; the next header starts
+                                        a new table
+        skip_line (`str`): expression of the lines which are not rows
+        wrapped (`bool`): rows without their index values continue the
+                          entry above, their values are appended to the
+                          ones of the entry
+    '''
+
+    def __init__(self, header_fields, label_fields=None, index=0,
+                 right_justified=False, table_terminal_pattern=None,
+                 skip_line=None, wrapped=False):
+        if isinstance(header_fields[0], str):
+            header_fields = [header_fields]
+        self.headers = [re.compile(
+                            r'\s*' + r'\s*'.join('({})'.format(field)
+                                                 for field in fields)
+                            + r'\s*$')
+                        for fields in header_fields]
+        # header lines hold every heading, cheaper to check than to search
+        literals = required_literals(self.headers[0])[1]
+        self._literal = literals[0] if literals else ''
+        self.labels = label_fields or (header_fields[0]
+                                       if len(header_fields) == 1 else None)
+        self.index = [index] if isinstance(index, int) else list(index)
+        self.right_justified = right_justified
+        self.terminal = re.compile(table_terminal_pattern) \
+                        if table_terminal_pattern else None
+        self.skip_line = re.compile(skip_line) if skip_line else None
+        self.wrapped = wrapped
+
+    def columns(self, match):
+        '''Slices of the columns of a table, from its header line
+
+        Args:
+            match (`re.Match`): match of the first header expression
+
+        Returns:
+            `list` of `slice`: one per column, the first starting at the
+                               start of the line and the last one ending at
+                               its end
+        '''
+        start = match.start()
+        if self.right_justified:
+            # a column ends with its heading
+            bounds = [match.end(group) - start
+                      for group in range(1, match.re.groups)]
+        else:
+            # a column starts with its heading
+            bounds = [match.start(group) - start
+                      for group in range(2, match.re.groups + 1)]
+        bounds = [0] + bounds + [None]
+        return [slice(bounds[i], bounds[i + 1])
+                for i in range(len(bounds) - 1)]
+
+    def _join_headers(self, lines):
+        '''Lines of an output, each header of several lines as one `_Header`
+
+        The lines of a header are consecutive, a line matching the first
+        line of the header alone is a row.
+        '''
+        headers = self.headers
+        literal = self._literal
+        pending = []
+        for line in lines:
+            if '\t' in line:
+                line = line.expandtabs()
+            if pending:
+                match = headers[len(pending)].search(line)
+                if match:
+                    pending.append((line, match.groups()))
+                    if len(pending) == len(headers):
+                        first = _Header(pending[0][0])
+                        first.labels = [' '.join(texts) for texts in
+                                        zip(*[texts for _, texts in pending])]
+                        pending = []
+                        yield first
+                    continue
+                for pending_line, _ in pending:
+                    yield pending_line
+                pending = []
+            if literal in line:
+                match = headers[0].search(line)
+                if match:
+                    pending.append((line, match.groups()))
+                    continue
+            yield line
+        for pending_line, _ in pending:
+            yield pending_line
+
+    def entries(self, output):
+        '''Entries of the tables of an output
+
+        Args:
+            output (`str` or iterable): output, or its lines
+
+        Returns:
+            `dict`: entries keyed by their index values, one nested dict
+                    per index column; a later row with the same index
+                    values replaces the earlier one
+        '''
+        entries = {}
+        header = self.headers[0]
+        literal = self._literal
+        labels = self.labels
+        index = self.index
+        terminal = self.terminal
+        skip_line = self.skip_line
+        wrapped = self.wrapped
+        data = _data.search
+
+        lines = iter_lines(output)
+        joined = len(self.headers) > 1
+        if joined:
+            lines = self._join_headers(lines)
+
+        columns = None
+        # empty lines right below the header do not end the table
+        below_header = False
+        # values of the last entry, and the lines ending each of them
+        previous = None
+        width = 0
+        for line in lines:
+            if '\t' in line:
+                line = line.expandtabs()
+
+            if literal in line:
+                match = header.search(line)
+                if match and (not joined or line.__class__ is _Header):
+                    columns = self.columns(match)
+                    cut = _slicer(columns)
+                    if joined:
+                        labels = self.labels or line.labels
+                    below_header = True
+                    previous = None
+                    width = len(line)
+                    continue
+
+            if columns is None:
+                continue
+            if below_header:
+                if not line:
+                    continue
+                below_header = False
+            if terminal and terminal.search(line + '\n'):
+                columns = None
+                continue
+            if not data(line) or skip_line and skip_line.search(line):
+                continue
+
+            values = [value.strip() for value in cut(line)]
+            keys = [values[i] for i in index]
+
+            if wrapped:
+                width = max(width, len(line))
+                if previous and not any(keys):
+                    # continuation of the values of the entry above
+                    for i, value in enumerate(values):
+                        if value:
+                            if _cut_word(previous_lines[i], columns[i], width):
+                                previous[i] += value
+                            else:
+                                previous[i] += ' ' + value
+                            previous_lines[i] = line
+                    values = previous
+                    keys = previous_keys
+                else:
+                    previous = values
+                    previous_keys = keys
+                    previous_lines = [line] * len(values)
+
+            node = entries
+            for key in keys[:-1]:
+                node = node.setdefault(key, {})
+            node[keys[-1]] = dict(zip(labels, values))
+
+        return entries
+
+
+def _slicer(columns):
+    '''Function giving the texts of the columns of a line, as a tuple'''
+    if len(columns) == 1:
+        column = columns[0]
+        return lambda line: (line[column],)
+    return itemgetter(*columns)
+
+
+def _cut_word(line, column, width):
+    '''Whether the value of a column in a line is cut in the middle of a word
+
+    The device cuts a value at the end of its column, or of the line for the
+    last column: '21 seconds ag' then 'o' is '21 seconds ago'. A value which
+    ends before is continued on the next line after a blank.
+    '''
+    text = line[column]
+    if not text or text[-1].isspace():
+        return False
+    if column.stop is None:
+        return len(line) >= width
+    return len(line) >= column.stop
@@ -0,0 +1,190 @@
+import os
+import json
+import glob
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import Mock, patch
+
+from genie.libs.parser.utils.blocks import Blocks, BlockParser, split_blocks
+from genie.libs.parser.utils.validation_policy import Offline, \
+    set_validation_policy
+
+
+class TestSplitBlocks(unittest.TestCase):
+
+    output = '\n'.join([
+        'R1#show spanning-tree detail',
+        '',
+        ' VLAN0001 is executing the rstp compatible Spanning Tree protocol',
+        '  Bridge Identifier has priority 24576, sysid 1',
+        '',
+        ' Port 1671 (Port-channel220) of VLAN0001 is designated forwarding',
+        '   Port path cost 1, Port priority 128',
+        ' VLAN0115 is executing the rstp compatible Spanning Tree protocol',
+        '  Bridge Identifier has priority 24576, sysid 115',
+        ''])
+
+    header = r'^ *(VLAN\w+) +is +executing +the '
+
+    def test_offsets(self):
+        blocks = split_blocks(self.output, self.header)
+        self.assertEqual([key for key, _, _ in blocks],
+                         ['VLAN0001', 'VLAN0115'])
+        # blocks start at the start of the line of their header
+        self.assertEqual(blocks[0][1], self.output.index(' VLAN0001'))
+        self.assertEqual(blocks[0][2], self.output.index(' VLAN0115'))
+        self.assertEqual(blocks[1][2], len(self.output))
+
+    def test_keys(self):
+        self.assertEqual(
+            [key for key, _, _ in
+             split_blocks(self.output, r'^ *(VLAN)(\d+) +is ')],
+            [('VLAN', '0001'), ('VLAN', '0115')])
+        self.assertEqual(
+            [key for key, _, _ in split_blocks(self.output, r'^ *Port \d+')],
+            ['Port 1671'])
+        self.assertEqual(split_blocks(self.output, r'^Tag +(\w+):$'), [])
+
+    def test_nested(self):
+        _, start, end = split_blocks(self.output, self.header)[0]
+        self.assertEqual(
+            split_blocks(self.output, r'^ *Port +\d+ +\((\S+)\)', start, end),
+            [('Port-channel220', self.output.index(' Port 1671'), end)])
+
+    def test_blocks(self):
+        blocks = Blocks(self.output, self.header)
+        self.assertEqual(len(blocks), 2)
+        self.assertEqual(blocks.keys(), ['VLAN0001', 'VLAN0115'])
+        self.assertIn('VLAN0115', blocks)
+        self.assertTrue(blocks['VLAN0115'].startswith(' VLAN0115 is'))
+        self.assertTrue(blocks['VLAN0001'].endswith('priority 128\n'))
+        self.assertEqual([key for key, _ in blocks], blocks.keys())
+
+        start, end = blocks.span('VLAN0115')
+        self.assertEqual(self.output[start:end], blocks['VLAN0115'])
+
+    def test_bytes(self):
+        output = self.output.encode()
+        blocks = Blocks(output, self.header.encode())
+        self.assertEqual(blocks.keys(), [b'VLAN0001', b'VLAN0115'])
+        view = blocks.view(b'VLAN0115')
+        self.assertIsInstance(view, memoryview)
+        self.assertEqual(view.tobytes(), blocks[b'VLAN0115'])
+
+
+class TestBlockParser(unittest.TestCase):
+
+    def assertSameParse(self, parser_class, output, **kwargs):
+        device = Mock()
+        parser = parser_class(device=device)
+        self.assertEqual(parser.parse_blocks(output, **kwargs),
+                         parser.parse(output=output, **kwargs))
+        device.execute.assert_not_called()
+
+    def test_golden_outputs(self):
+        from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+        from genie.libs.parser.iosxe.show_isis import ShowIsisDatabaseDetail
+        from genie.libs.parser.iosxe.show_spanning_tree import \
+            ShowSpanningTreeDetail
+
+        parser_folder = os.path.join(os.path.dirname(__file__), '..', '..')
+        for parser in (ShowInterfaces, ShowIsisDatabaseDetail,
+                       ShowSpanningTreeDetail):
+            self.assertTrue(issubclass(parser, BlockParser))
+            folder = os.path.join(parser_folder, 'iosxe', 'tests',
+                                  parser.__name__, 'cli', 'equal')
+            outputs = glob.glob(os.path.join(folder, '*_output.txt'))
+            self.assertTrue(outputs)
+            for path in outputs:
+                kwargs = {}
+                arguments = path.replace('_output.txt', '_arguments.json')
+                if os.path.exists(arguments):
+                    with open(arguments) as f:
+                        kwargs = json.load(f)
+                with open(path) as f:
+                    self.assertSameParse(parser, f.read(), **kwargs)
+
+    def test_parse_block(self):
+        from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+
+        with open(os.path.join(os.path.dirname(__file__), '..', '..', 'iosxe',
+                               'tests', 'ShowInterfaces', 'cli', 'equal',
+                               'golden_output2_output.txt')) as f:
+            output = f.read()
+        parser = ShowInterfaces(device=Mock())
+        blocks = parser.blocks(output)
+        self.assertEqual(blocks.keys()[:2], ['Vlan1', 'Vlan15'])
+        self.assertEqual(parser.parse_block(blocks, 'Vlan15'),
+                         {'Vlan15': parser.parse(output=output)['Vlan15']})
+
+    def test_merge_blocks(self):
+        from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+
+        with open(os.path.join(os.path.dirname(__file__), '..', '..', 'iosxe',
+                               'tests', 'ShowInterfaces', 'cli', 'equal',
+                               'golden_output_output.txt')) as f:
+            output = f.read()
+        parser = ShowInterfaces(device=Mock())
+        # GigabitEthernet3 borrows the address of Loopback0, a later block
+        parsed = parser.parse_blocks(output,
+                                     keys=['GigabitEthernet3', 'Loopback0'])
+        self.assertEqual(parsed['GigabitEthernet3']['ipv4'],
+                         parser.parse(output=output)
+                         ['GigabitEthernet3']['ipv4'])
+        self.assertEqual(parsed['GigabitEthernet3']['ipv4']['unnumbered'],
+                         {'interface_ref': 'Loopback0'})
+        self.assertNotIn(
+            'ipv4', parser.parse_block(output, 'GigabitEthernet3')
+                    ['GigabitEthernet3'])
+
+    def test_checked_schema(self):
+        from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+
+        self.addCleanup(set_validation_policy)
+        with open(os.path.join(os.path.dirname(__file__), '..', '..', 'iosxe',
+                               'tests', 'ShowInterfaces', 'cli', 'equal',
+                               'golden_output_output.txt')) as f:
+            output = f.read()
+        parser = ShowInterfaces(device=Mock())
+        expected = parser.parse(output=output)
+
+        # checked against the compiled schema, as parse does
+        with patch.object(ShowInterfaces, 'compiled_schema',
+                          wraps=ShowInterfaces.compiled_schema) as compiled:
+            self.assertEqual(parser.parse_blocks(output), expected)
+        compiled.assert_called_once_with()
+
+        # and as the validation policy decides
+        policy = set_validation_policy(Offline())
+        self.assertEqual(parser.parse_blocks(output), expected)
+        (parser_class, pending, schema), = policy.pending
+        self.assertIs(parser_class, ShowInterfaces)
+        self.assertIs(schema, ShowInterfaces.compiled_schema())
+        self.assertEqual(policy.validate_pending(), 0)
+
+    def test_dependent_blocks(self):
+        from genie.libs.parser.iosxe.show_bgp import ShowBgpAllDetail
+
+        # an address family without a route distinguisher is given the one
+        # of the address family above it
+        self.assertFalse(issubclass(ShowBgpAllDetail, BlockParser))
+
+    def test_workers(self):
+        from genie.libs.parser.iosxe.show_spanning_tree import \
+            ShowSpanningTreeDetail
+
+        with open(os.path.join(os.path.dirname(__file__), '..', '..', 'iosxe',
+                               'tests', 'ShowSpanningTreeDetail', 'cli',
+                               'equal', 'golden_output_1_output.txt')) as f:
+            output = f.read()
+        parser = ShowSpanningTreeDetail(device=Mock())
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            parsed = parser.parse_blocks(output, map=executor.map)
+        self.assertEqual(parsed, parser.parse(output=output))
+        self.assertEqual(
+            list(parser.parse_blocks(output, keys=['VLAN0115'])
+                 ['rapid_pvst']['vlans']), [115])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import os
+import glob
+import unittest
+from array import array
+from unittest.mock import Mock, patch
+
+from genie.metaparser.util.schemaengine import Any, Optional
+
+from genie.libs.parser.utils import columnar
+from genie.libs.parser.utils.columnar import columns, table_fields
+
+
+class TestColumns(unittest.TestCase):
+
+    schema = {
+        'vrf': {
+            Any(): {
+                'index': {
+                    Any(): {
+                        'protocol': str,
+                        Optional('group_id'): int,
+                        Optional('details'): {'use': str, 'use_count': int},
+                        Optional('ports'): {Any(): str},
+                    },
+                },
+                Optional('number_of_translations'): int,
+            },
+        },
+    }
+
+    parsed = {
+        'vrf': {
+            'default': {
+                'index': {
+                    1: {'protocol': 'tcp', 'group_id': 1,
+                        'details': {'use': '00:01', 'use_count': 2}},
+                    2: {'protocol': 'udp', 'group_id': 2},
+                },
+                'number_of_translations': 2,
+            },
+            'red': {'index': {1: {'protocol': 'udp', 'group_id': 3}}},
+        },
+    }
+
+    def test_table_fields(self):
+        self.assertEqual(table_fields(self.schema, 'vrf.*.index.*'),
+                         [('protocol',), ('group_id',), ('details', 'use'),
+                          ('details', 'use_count')])
+        self.assertEqual(table_fields(self.schema, 'vrf.*.index.*',
+                                      ('protocol',)),
+                         [('group_id',), ('details', 'use'),
+                          ('details', 'use_count')])
+        self.assertEqual(table_fields(self.schema, 'vrf.*.unknown.*'), [])
+
+    def test_columns(self):
+        fields = table_fields(self.schema, 'vrf.*.index.*')
+        with patch.object(columnar, 'numpy', None):
+            output = columns(self.parsed, 'vrf.*.index.*', ('vrf', 'index'),
+                             fields)
+        self.assertEqual(output, {
+            'vrf': ['default', 'default', 'red'],
+            'index': array('q', [1, 2, 1]),
+            'protocol': ['tcp', 'udp', 'udp'],
+            'group_id': array('q', [1, 2, 3]),
+            'details.use': ['00:01', None, None],
+            'details.use_count': [2, None, None]})
+
+    def test_no_entries(self):
+        output = columns({'vrf': {}}, 'vrf.*.index.*', ('vrf', 'index'),
+                         [('protocol',)])
+        self.assertEqual(output, {'vrf': [], 'index': [], 'protocol': []})
+
+    def test_numbers(self):
+        with patch.object(columnar, 'numpy', None):
+            self.assertEqual(columnar._column([1, 2.5]),
+                             array('d', [1, 2.5]))
+            self.assertEqual(columnar._column([True, False]), [True, False])
+            self.assertEqual(columnar._column([2 ** 64]), [2 ** 64])
+
+    @unittest.skipIf(columnar.numpy is None, 'NumPy is not installed')
+    def test_numpy(self):
+        column = columnar._column([1, 2, 3])
+        self.assertIsInstance(column, columnar.numpy.ndarray)
+        self.assertEqual(column.dtype, columnar.numpy.int64)
+        self.assertEqual(column.sum(), 6)
+
+
+class TestColumnarParser(unittest.TestCase):
+
+    def test_golden_outputs(self):
+        from genie.libs.parser.iosxe.show_fdb import ShowMacAddressTable
+        from genie.libs.parser.iosxe.show_ip_nat import ShowIpNatTranslations
+        from genie.libs.parser.iosxe.show_wireless import \
+            ShowWirelessClientSummary
+
+        parser_folder = os.path.join(os.path.dirname(__file__), '..', '..')
+        for parser in (ShowMacAddressTable, ShowIpNatTranslations,
+                       ShowWirelessClientSummary):
+            outputs = glob.glob(os.path.join(parser_folder, 'iosxe', 'tests',
+                                             parser.__name__, 'cli', 'equal',
+                                             '*_output.txt'))
+            self.assertTrue(outputs)
+            for path in outputs:
+                with open(path) as f:
+                    output = f.read()
+                parsed = parser(device=Mock()).parse(output=output)
+                output = parser(device=Mock()).parse(output=output,
+                                                     columnar=True)
+                rows = len(output[parser.columnar_keys[0]])
+                self.assertTrue(rows, path)
+                for index in range(rows):
+                    keys = iter([output[key][index]
+                                 for key in parser.columnar_keys])
+                    entry = parsed
+                    for segment in parser.columnar_table.split('.'):
+                        entry = entry[next(keys) if segment == '*'
+                                      else segment]
+                    for field in parser.columnar_fields():
+                        value = entry
+                        for key in field:
+                            value = value.get(key) \
+                                if isinstance(value, dict) else None
+                        self.assertEqual(output['.'.join(field)][index],
+                                         value, path)
+
+    def test_ip_interface_brief(self):
+        from genie.libs.parser.iosxe.show_interface import \
+            ShowIpInterfaceBrief
+
+        output = '''\
+Interface              IP-Address      OK? Method Status                Protocol
+GigabitEthernet0/0     10.1.18.80      YES manual up                    up
+Vlan100                201.0.12.1      YES NVRAM  down                  down
+'''
+        self.assertEqual(
+            ShowIpInterfaceBrief(device=Mock()).parse(output=output,
+                                                      columnar=True),
+            {'interface': ['GigabitEthernet0/0', 'Vlan100'],
+             'ip_address': ['10.1.18.80', '201.0.12.1'],
+             'interface_is_ok': ['YES', 'YES'],
+             'method': ['manual', 'NVRAM'],
+             'status': ['up', 'down'],
+             'protocol': ['up', 'down']})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+from genie.libs.parser.utils.command_trie import CommandTrie
+from genie.libs.parser.utils.common import (
+    _matches_fuzzy,
+    _get_command_trie,
+    parser_data
+)
+
+
+class TestCommandTrie(unittest.TestCase):
+
+    def setUp(self):
+        self.trie = CommandTrie([
+            'show version',
+            'show vrf {vrf}',
+            'show vlan {vlan}',
+            'show ip route',
+            'show ip route vrf {vrf}',
+            'show interfaces {interface} counters',
+            '/dna/intent/api/v1/interface/{interface}',
+        ])
+
+    def test_literal_prefix(self):
+        self.assertEqual(self.trie.search('sh ver'.split()), ['show version'])
+        self.assertEqual(self.trie.search('show ip route'.split()),
+                         ['show ip route'])
+        self.assertEqual(self.trie.search('sh xyz'.split()), [])
+
+    def test_argument_slots(self):
+        self.assertEqual(self.trie.search('sh v abc'.split()),
+                         ['show vrf {vrf}', 'show vlan {vlan}'])
+        # interface can span two tokens, vrf only one
+        self.assertEqual(
+            self.trie.search('sh int Gig 1/0/1 count'.split()),
+            ['show interfaces {interface} counters'])
+        self.assertEqual(self.trie.search('sh ip ro vrf a b'.split()), [])
+
+    def test_embedded_argument(self):
+        self.assertEqual(
+            self.trie.search('/dna/intent/api/v1/interface/x'.split()),
+            ['/dna/intent/api/v1/interface/{interface}'])
+
+    def test_insert_keeps_order(self):
+        self.trie.insert('show aaa')
+        self.trie.insert('show version')
+        self.assertEqual(len(self.trie), 8)
+        self.assertEqual(self.trie.search('sh'.split()), [])
+        self.assertEqual(self.trie.search('sh a'.split()), ['show aaa'])
+
+    def test_superset_of_matches_fuzzy(self):
+        trie = _get_command_trie()
+        self.assertEqual(len(trie), len(parser_data))
+
+        for command in parser_data:
+            tokens = [token[:1] if '{' not in token else 'argument'
+                      for token in command.split()]
+            if _matches_fuzzy(0, 0, tokens.copy(), command, {}, False):
+                self.assertIn(command, trie.search(tokens), tokens)
+
+
+if __name__ == '__main__':
+    unittest.main()
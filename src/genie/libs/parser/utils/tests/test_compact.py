@@ -0,0 +1,143 @@
+import os
+import sys
+import glob
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser.util.schemaengine import Any, Optional, Use
+
+from genie.libs.parser.utils.compact import Record, record_class, to_dict, \
+                                           _converter
+from genie.libs.parser.utils.validators import list_of
+
+
+class TestRecordClass(unittest.TestCase):
+
+    def test_record(self):
+        cls = record_class({'ip-address': str, Optional('age'): int,
+                            Optional('keys'): list}, 'ArpRecord')
+        self.assertTrue(issubclass(cls, Record))
+        self.assertEqual(cls.__slots__, ('ip_address', 'age', 'keys_'))
+
+        record = cls()
+        record.ip_address = '10.1.1.1'
+        self.assertFalse(hasattr(record, '__dict__'))
+        self.assertEqual(record['ip-address'], '10.1.1.1')
+        self.assertIn('ip-address', record)
+        self.assertNotIn('age', record)
+        self.assertIsNone(record.get('age'))
+        with self.assertRaises(KeyError):
+            record['age']
+        with self.assertRaises(KeyError):
+            record['unknown']
+        self.assertEqual(record.to_dict(), {'ip-address': '10.1.1.1'})
+        self.assertEqual(repr(record), "ArpRecord(ip_address='10.1.1.1')")
+
+    def test_not_a_record(self):
+        self.assertIsNone(record_class({Any(): str}))
+        self.assertIsNone(record_class({'a-b': str, 'a_b': str}))
+
+
+class TestConverter(unittest.TestCase):
+
+    validate_nh_list = list_of({Optional('to'): str, Optional('via'): str},
+                               'nh is not a list', single=True)
+
+    schema = {
+        'vrf': {
+            Any(): {
+                'index': {
+                    Any(): {
+                        'protocol': str,
+                        Optional('details'): {'use': str},
+                        Optional('nh'): Use(validate_nh_list),
+                    },
+                },
+                Optional('number_of_translations'): int,
+            },
+        },
+    }
+
+    parsed = {
+        'vrf': {
+            'default': {
+                'index': {
+                    1: {'protocol': 'tcp', 'details': {'use': '00:01'},
+                        'nh': [{'to': '10.0.0.1'}, {'via': 'ge-0/0/0'}]},
+                    2: {'protocol': 'udp', 'nh': {'to': '10.0.0.2'}},
+                },
+                'number_of_translations': 2,
+            },
+        },
+    }
+
+    def test_compact(self):
+        compact = _converter(self.schema, 'NatRecord')(self.parsed)
+        default = compact['vrf']['default']
+        self.assertIsInstance(default, Record)
+        self.assertIs(type(default['index']), dict)
+        entry = default['index'][1]
+        self.assertIsInstance(entry, Record)
+        self.assertEqual(entry.protocol, 'tcp')
+        self.assertIsInstance(entry.details, Record)
+        self.assertEqual(entry.nh[1].via, 'ge-0/0/0')
+        self.assertEqual(default['index'][2].nh.to, '10.0.0.2')
+        self.assertEqual(to_dict(compact), self.parsed)
+
+    def test_unknown_keys(self):
+        parsed = {'vrf': {'default': {'index': {1: {'protocol': 'tcp',
+                                                    'unknown': 1}}}}}
+        compact = _converter(self.schema, 'NatRecord')(parsed)
+        self.assertIs(compact['vrf']['default']['index'][1],
+                      parsed['vrf']['default']['index'][1])
+        self.assertEqual(to_dict(compact), parsed)
+
+    def test_no_entries(self):
+        self.assertIsNone(_converter({'version': {'os': str}}, 'Record'))
+
+
+class TestCompactParser(unittest.TestCase):
+
+    def test_golden_outputs(self):
+        from genie.libs.parser.iosxe.show_fdb import ShowMacAddressTable
+        from genie.libs.parser.iosxe.show_ip_nat import ShowIpNatTranslations
+        from genie.libs.parser.iosxe.show_arp import ShowArp
+
+        parser_folder = os.path.join(os.path.dirname(__file__), '..', '..')
+        for parser in (ShowMacAddressTable, ShowIpNatTranslations, ShowArp):
+            outputs = glob.glob(os.path.join(parser_folder, 'iosxe', 'tests',
+                                             parser.__name__, 'cli', 'equal',
+                                             '*_output.txt'))
+            self.assertTrue(outputs)
+            for path in outputs:
+                with open(path) as f:
+                    output = f.read()
+                parsed = parser(device=Mock()).parse(output=output)
+                compact = parser(device=Mock()).parse(output=output,
+                                                      compact=True)
+                self.assertEqual(to_dict(compact), parsed, path)
+
+    def test_smaller(self):
+        from genie.libs.parser.iosxe.show_fdb import ShowMacAddressTable
+
+        output = ''.join(
+            ' {:>4}    0000.0000.{:04x}    DYNAMIC     Gi1/0/{}\n'.format(
+                100 + i % 10, i, i % 48) for i in range(1000))
+        parsed = ShowMacAddressTable(device=Mock()).parse(output=output)
+        compact = ShowMacAddressTable(device=Mock()).parse(output=output,
+                                                           compact=True)
+        self.assertEqual(to_dict(compact), parsed)
+
+        def size(value):
+            if isinstance(value, Record):
+                return sys.getsizeof(value) + sum(
+                    size(value[key]) for key in value.keys if key in value)
+            if isinstance(value, dict):
+                return sys.getsizeof(value) + sum(
+                    size(item) for item in value.values())
+            return 0
+        self.assertLess(size(compact), size(parsed) * 0.7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import os
+import glob
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, \
+                                               Use
+
+from genie.libs.parser.utils.compiled_schema import CompiledSchema, \
+                                                   CompiledSchemaParser
+
+
+class TestCompiledSchema(unittest.TestCase):
+
+    schema = {
+        'interface': {
+            Any(): {
+                'oper_status': str,
+                Optional('mtu'): int,
+                Optional('enabled'): bool,
+                Optional('speed'): Or(int, str),
+                Optional('members'): list,
+                Optional('counters'): {
+                    Optional('in_pkts'): int,
+                    Optional('rate'): {'in_rate': int},
+                },
+                Optional('delay'): Use(int),
+            },
+        },
+        Optional('vrf'): Any(),
+    }
+
+    data = {
+        'interface': {
+            'GigabitEthernet1': {
+                'oper_status': 'up', 'mtu': 1500, 'enabled': True,
+                'speed': 'auto', 'members': ['Gi2', 'Gi3'],
+                'counters': {'in_pkts': 5, 'rate': {'in_rate': 10}},
+                'delay': '10'},
+            'Loopback0': {'oper_status': 'up', 'speed': 1000},
+        },
+        'vrf': {'default': [1, 2]},
+    }
+
+    def assertSameValidation(self, data, **kwargs):
+        def validate(schema):
+            try:
+                return schema.validate(data, **kwargs)
+            except Exception as e:
+                return type(e), str(e)
+        self.assertEqual(validate(CompiledSchema(self.schema)),
+                         validate(Schema(self.schema)))
+
+    def test_valid(self):
+        validated = CompiledSchema(self.schema).validate(self.data)
+        self.assertEqual(validated, Schema(self.schema).validate(self.data))
+        self.assertEqual(validated['interface']['GigabitEthernet1']['delay'],
+                         10)
+        # copies, as Schema gives
+        self.assertIsNot(validated['vrf'], self.data['vrf'])
+        self.assertIsNot(validated['interface']['GigabitEthernet1']['members'],
+                         self.data['interface']['GigabitEthernet1']['members'])
+
+    def test_same_errors(self):
+        gi1 = self.data['interface']['GigabitEthernet1']
+        for interface in ({'mtu': 1500},
+                          dict(gi1, mtu='1500'),
+                          dict(gi1, enabled=1),
+                          dict(gi1, speed=1.5),
+                          dict(gi1, members=('Gi2',)),
+                          dict(gi1, counters={'rate': {}}),
+                          dict(gi1, delay='fast'),
+                          dict(gi1, unknown=1),
+                          ['up']):
+            self.assertSameValidation(
+                {'interface': {'GigabitEthernet1': interface}})
+        self.assertSameValidation({})
+        self.assertSameValidation({'vrf': {}})
+        self.assertSameValidation({'interface': {}, 'unknown': 1},
+                                  warn_unsupported_keys=True)
+        self.assertSameValidation({'interface': {}, 'unknown': 1},
+                                  command='show interfaces')
+
+    def test_golden_outputs(self):
+        from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+        from genie.libs.parser.iosxe.show_isis import ShowIsisDatabaseDetail
+
+        parser_folder = os.path.join(os.path.dirname(__file__), '..', '..')
+        for parser in (ShowInterfaces, ShowIsisDatabaseDetail):
+            self.assertTrue(issubclass(parser, CompiledSchemaParser))
+            outputs = glob.glob(os.path.join(parser_folder, 'iosxe', 'tests',
+                                             parser.__name__, 'cli', 'equal',
+                                             '*_output.txt'))
+            self.assertTrue(outputs)
+            for path in outputs:
+                with open(path) as f:
+                    parsed = parser(device=Mock()).cli(output=f.read())
+                self.assertEqual(parser.compiled_schema().validate(parsed),
+                                 Schema(parser.schema).validate(parsed),
+                                 path)
+
+    def test_parser(self):
+        from genie.libs.parser.iosxe.show_isis import ShowIsisDatabaseDetail
+
+        compiled = ShowIsisDatabaseDetail.compiled_schema()
+        self.assertIs(ShowIsisDatabaseDetail.compiled_schema(), compiled)
+        self.assertIs(compiled.schema, ShowIsisDatabaseDetail.schema)
+
+        parser = ShowIsisDatabaseDetail(device=Mock())
+        with self.assertRaises(Exception):
+            parser.parse(output='')
+        self.assertIs(parser.schema, ShowIsisDatabaseDetail.schema)
+
+
+if __name__ == '__main__':
+    unittest.main()
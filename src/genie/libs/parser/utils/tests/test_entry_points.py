@@ -0,0 +1,114 @@
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.libs.parser.utils import entry_points
+from genie.libs.parser.utils.common import parser_registry
+from genie.libs.parser.utils.entry_points import (
+    Plugin,
+    load_entry_points,
+    get_plugin_load_times
+)
+
+
+class MockParser(object):
+    cli_command = ['show test_entry_points plugin',
+                   'show test_entry_points plugin {name}']
+
+
+def _entry_point(name='mock_plugin', version='1.0'):
+    ep = Mock(value='mock_plugin.parsers:add_parsers')
+    ep.name = name
+    ep.dist.metadata = {'Name': 'mock-plugin'}
+    ep.dist.version = version
+    ep.load.return_value = lambda: {'iosxe': [MockParser]}
+    return ep
+
+
+class TestEntryPoints(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.cache = os.path.join(directory.name, 'parser_plugins.json')
+        patch.object(entry_points, 'PLUGIN_CACHE', self.cache).start()
+        patch.object(entry_points, 'plugins', {}).start()
+        self.addCleanup(patch.stopall)
+
+    def _load(self, ep):
+        with patch.object(entry_points, 'iter_entry_points',
+                          return_value=[ep]):
+            load_entry_points()
+        return entry_points.plugins[ep.name]
+
+    def test_deferred_load(self):
+        ep = _entry_point()
+        plugin = self._load(ep)
+
+        # nothing is imported until the index is used
+        self.assertFalse(ep.load.called)
+        self.assertFalse(plugin.loaded)
+        self.assertEqual(get_plugin_load_times(), {})
+
+        self.assertIn('show test_entry_points plugin',
+                      parser_registry.snapshot.get('iosxe'))
+        ep.load.assert_called_once_with()
+        self.assertEqual(plugin.source, 'entry_point')
+        self.assertEqual(len(plugin.commands), 2)
+        self.assertEqual(list(get_plugin_load_times()), ['mock_plugin'])
+
+        with open(self.cache) as f:
+            cache = json.load(f)
+        self.assertEqual(list(cache),
+                         ['mock_plugin=mock_plugin.parsers:add_parsers'
+                          '@mock-plugin==1.0'])
+
+    def test_cached_commands(self):
+        self._load(_entry_point())
+        parser_registry.snapshot.get('iosxe')
+
+        # same distribution version, registered without loading it
+        ep = _entry_point()
+        plugin = self._load(ep)
+        self.assertEqual(plugin.source, 'cache')
+        self.assertFalse(ep.load.called)
+        self.assertEqual(parser_registry.snapshot.get('iosxe')[
+                            'show test_entry_points plugin {name}']['iosxe'],
+                         {'module_name': 'test_entry_points',
+                          'package': MockParser.__module__.rpartition('.')[0],
+                          'class': 'MockParser'})
+
+        # upgraded distribution, loaded again
+        ep = _entry_point(version='2.0')
+        plugin = self._load(ep)
+        self.assertFalse(plugin.loaded)
+        parser_registry.snapshot.get('iosxe')
+        self.assertEqual(plugin.source, 'entry_point')
+
+    def test_cache_disabled(self):
+        entry_points.PLUGIN_CACHE = None
+        self._load(_entry_point())
+        parser_registry.snapshot.get('iosxe')
+
+        # loaded again, the plugin function is called by every run
+        ep = _entry_point()
+        plugin = self._load(ep)
+        parser_registry.snapshot.get('iosxe')
+        ep.load.assert_called_once_with()
+        self.assertEqual(plugin.source, 'entry_point')
+        self.assertFalse(os.path.exists(self.cache))
+
+    def test_not_callable(self):
+        ep = _entry_point()
+        ep.load.return_value = None
+        plugin = self._load(ep)
+        with self.assertLogs(entry_points.log, level='WARNING'):
+            parser_registry.snapshot.get('iosxe')
+        self.assertEqual(plugin.commands, [])
+        self.assertFalse(os.path.exists(self.cache))
+
+
+if __name__ == '__main__':
+    unittest.main()
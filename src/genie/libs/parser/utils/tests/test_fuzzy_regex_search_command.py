@@ -7,6 +7,11 @@ from genie.libs.parser.utils.common import (
     _fuzzy_search_command,
     parser_data
 )
+from genie.libs.parser.utils.fuzzy_match import (
+    SearchTokens,
+    get_template,
+    match_command
+)
 
 class TestFuzzyRegexSearchCommand(unittest.TestCase):
     def test_search_normal_arguments(self):
@@ -449,5 +454,53 @@ class TestFuzzyRegexSearchCommand(unittest.TestCase):
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0][0], 'show ipv6 prefix-list detail')
 
+
+class TestMatchCommand(unittest.TestCase):
+
+    # (search, command, result), as given by the recursive implementation
+    # of _matches_fuzzy that match_command replaced
+    CASES = [
+        ('sh .* vrf abc', 'show access-lists {acl}',
+         ({'acl': 'vrf abc'}, 200)),
+        ('sh .* vrf abc', 'show archive config differences {fileA} {fileB}',
+         ({'fileA': 'vrf', 'fileB': 'abc'}, 300)),
+        ('sh .* vrf abc', 'show ip msdp summary vrf {vrf}',
+         ({'vrf': 'abc'}, 302)),
+        ('sh .* vrf abc',
+         'show platform hardware qfp {status} bqs {slot} opm mapping', None),
+        ('show ip .* summary', 'show ip access-lists {acl}',
+         ({'acl': 'summary'}, 304)),
+        ('show ip .* summary', 'show ip cef vrf {vrf}',
+         ({'vrf': 'summary'}, 304)),
+        ('show ip .* summary', 'show ipv6 eigrp vrf {vrf} neighbors', None),
+        ('sh ip ro vrf abc', 'show ip route vrf {vrf}',
+         ({'vrf': 'abc'}, 504)),
+        ('sh ip ro vrf abc', 'show ip route {protocol}',
+         ({'protocol': 'vrf abc'}, 402)),
+        ('sh ip ro vrf abc', 'show ipv6 route {route} {protocol}',
+         ({'route': 'vrf', 'protocol': 'abc'}, 500)),
+        ('sh ip ro vrf abc', 'show ipv6 pim neighbor detail', None),
+        ('show ip bgp .*', 'show ip bgp all dampening parameters',
+         ({}, 306)),
+        ('show ip bgp .*', 'show {af} pim neighbor',
+         ({'af': 'ip bgp'}, 202)),
+        ('show ip bgp .*', 'show ip static route', None),
+        ('sh int Gig1/0/1 .*', 'show interface {interface} brief',
+         ({'interface': 'Gig1/0/1'}, 300)),
+        ('sh int Gig1/0/1 .*', 'show lacp internal', None),
+        ('sh .* detail', 'show archive config differences {fileA}',
+         ({'fileA': 'detail'}, 200)),
+        ('sh .* detail', 'show module', None),
+    ]
+
+    def test_results(self):
+        for search, command, result in self.CASES:
+            with self.subTest(search=search, command=command):
+                self.assertEqual(
+                    match_command(get_template(command),
+                                  SearchTokens(search.split(), True)),
+                    result)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,153 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.common import (
+    get_parser,
+    get_parsers,
+    get_parser_cache_info,
+    clear_parser_cache
+)
+from genie.libs.parser.utils.entry_points import add_parser
+from genie.libs.parser.utils.lookup_cache import LookupCache
+
+
+class TestLookupCache(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = LookupCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+        self.assertIs(cache.get('b'), LookupCache.MISSING)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(tuple(cache.info()), (3, 1, 2, 2))
+
+        cache.clear()
+        self.assertEqual(tuple(cache.info()), (0, 0, 2, 0))
+
+
+class TestGetParserCache(unittest.TestCase):
+
+    def setUp(self):
+        clear_parser_cache()
+        self.from_device = patch.object(
+            common.Lookup, 'from_device',
+            side_effect=lambda device, packages: Mock(_tokens=[device.os])
+        ).start()
+        self.find_parser_cls = patch.object(
+            common, '_find_parser_cls',
+            side_effect=lambda device, data: data['class']).start()
+        self.addCleanup(patch.stopall)
+
+    def _device(self, os='iosxe', platform=None, custom=None):
+        if custom is None:
+            custom = {'abstraction': {'order': ['os']}}
+        return Mock(os=os, platform=platform, model=None, testbed=None,
+                    abstraction={}, custom=custom)
+
+    def test_cache_hit(self):
+        device = self._device()
+        result = get_parser('show version', device)
+        self.assertEqual(result, ('ShowVersion', {}))
+        self.assertEqual(get_parser_cache_info().misses, 1)
+
+        # Same command spelled differently, another device of the same os
+        self.assertEqual(get_parser('show   version', self._device()), result)
+        self.assertEqual(get_parser_cache_info().hits, 1)
+        self.assertEqual(self.from_device.call_count, 1)
+        self.assertEqual(self.find_parser_cls.call_count, 1)
+
+    def test_cache_key(self):
+        get_parser('show version', self._device())
+        get_parser('show version', self._device(os='nxos'))
+        get_parser('show version', self._device(), fuzzy=True)
+        self.assertEqual(get_parser_cache_info().misses, 3)
+        self.assertEqual(get_parser_cache_info().currsize, 3)
+
+    def test_cache_key_platform(self):
+        # the platform is a token of Lookup.from_device, with or without
+        # an abstraction order of the device
+        for custom in ({}, None):
+            clear_parser_cache()
+            get_parser('show version', self._device(platform='cat9k',
+                                                     custom=custom))
+            get_parser('show version', self._device(platform='asr1k',
+                                                     custom=custom))
+            self.assertEqual(get_parser_cache_info().misses, 2)
+            get_parser('show version', self._device(platform='cat9k',
+                                                     custom=custom))
+            self.assertEqual(get_parser_cache_info().hits, 1)
+
+        # or given by the abstraction of the device
+        clear_parser_cache()
+        get_parser('show version', self._device(
+            custom={'abstraction': {'platform': 'cat9k'}}))
+        get_parser('show version', self._device(
+            custom={'abstraction': {'platform': 'asr1k'}}))
+        self.assertEqual(get_parser_cache_info().misses, 2)
+
+    def test_kwargs_copy(self):
+        device = self._device()
+        cls, kwargs = get_parser('show vrf detail abc', device)
+        kwargs['vrf'] = 'modified'
+        self.assertEqual(get_parser('show vrf detail abc', device)[1],
+                         {'vrf': 'abc'})
+
+    def test_add_parser_invalidates(self):
+        get_parser('show version', self._device())
+        self.assertEqual(get_parser_cache_info().currsize, 1)
+
+        mock_parser = Mock(cli_command='show test_get_parser_cache')
+        mock_parser.__name__ = 'MockParser'
+        add_parser(parser=mock_parser, os_name='iosxe')
+        self.assertEqual(get_parser_cache_info().currsize, 0)
+
+
+class TestGetParsers(unittest.TestCase):
+
+    def setUp(self):
+        clear_parser_cache()
+        self.from_device = patch.object(
+            common.Lookup, 'from_device',
+            side_effect=lambda device, packages: Mock(_tokens=[device.os])
+        ).start()
+        self.addCleanup(patch.stopall)
+
+    def _find_parser_cls(self, device, data, lookups=None):
+        # same as _find_parser_cls, without importing the parser
+        if data['package'] not in lookups:
+            lookups[data['package']] = common.Lookup.from_device(
+                                                        device, packages={})
+        return data['class']
+
+    def test_batch(self):
+        patch.object(common, '_find_parser_cls',
+                     side_effect=self._find_parser_cls).start()
+        device = Mock(os='iosxe', custom={'abstraction': {'order': ['os']}})
+
+        results = get_parsers(['show version', 'show vrf detail abc',
+                               'show  version', 'show xyz abc',
+                               'show version'], device)
+
+        self.assertEqual(list(results), ['show version', 'show vrf detail abc',
+                                         'show  version', 'show xyz abc'])
+        self.assertEqual(results['show version'], ('ShowVersion', {}))
+        self.assertEqual(results['show  version'], ('ShowVersion', {}))
+        self.assertEqual(results['show vrf detail abc'][1], {'vrf': 'abc'})
+        self.assertIsInstance(results['show xyz abc'], Exception)
+
+        # one Lookup for the device, shared by the whole batch
+        self.assertEqual(self.from_device.call_count, 1)
+        self.assertEqual(get_parser_cache_info().hits, 1)
+
+        # the batch shares the cache with get_parser
+        self.assertEqual(get_parser('show version', device),
+                         ('ShowVersion', {}))
+        self.assertEqual(get_parser_cache_info().hits, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,207 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+from genie.libs.parser.utils.index import (
+    split_parser_data,
+    shard_parser_index,
+    make_parser_index,
+    ParserIndex,
+    load_binary_index,
+    INDEX_JSON,
+    DOCS_JSON,
+    SHARDS_DIR,
+    BINARY_INDEX
+)
+from genie.libs.parser.utils.binary_index import (
+    BinaryShard,
+    BinaryCommandTrie
+)
+
+PARSER_DATA = {
+    'tokens': ['iosxe', 'c9300'],
+    'show version': {
+        'iosxe': {
+            'module_name': 'show_platform',
+            'package': 'genie.libs.parser',
+            'class': 'ShowVersion',
+            'doc': 'Parser for show version',
+            'schema': "{'version': <class 'dict'>}",
+            'uid': 'show_version',
+            'url': 'https://example.com/show_platform.py#1',
+            'c9300': {
+                'module_name': 'show_platform',
+                'package': 'genie.libs.parser',
+                'class': 'ShowVersion',
+                'doc': 'Parser for show version on c9300',
+                'uid': 'show_version',
+            },
+        },
+        'nxos': {
+            'module_name': 'show_platform',
+            'package': 'genie.libs.parser',
+            'class': 'ShowVersion',
+        },
+    },
+    'show vrf': {
+        'nxos': {
+            'module_name': 'show_vrf',
+            'package': 'genie.libs.parser',
+            'class': 'ShowVrf',
+        },
+    },
+}
+
+
+class TestParserIndex(unittest.TestCase):
+
+    def test_split_parser_data(self):
+        index, docs = split_parser_data(PARSER_DATA)
+
+        self.assertEqual(index['tokens'], ['iosxe', 'c9300'])
+        self.assertNotIn('tokens', docs)
+        self.assertEqual(index['show version'], {
+            'iosxe': {
+                'module_name': 'show_platform',
+                'package': 'genie.libs.parser',
+                'class': 'ShowVersion',
+                'c9300': {
+                    'module_name': 'show_platform',
+                    'package': 'genie.libs.parser',
+                    'class': 'ShowVersion',
+                },
+            },
+            'nxos': {
+                'module_name': 'show_platform',
+                'package': 'genie.libs.parser',
+                'class': 'ShowVersion',
+            },
+        })
+        self.assertEqual(docs['show version']['iosxe']['c9300'], {
+            'doc': 'Parser for show version on c9300',
+            'uid': 'show_version',
+        })
+        self.assertEqual(docs['show version']['iosxe']['schema'],
+                         "{'version': <class 'dict'>}")
+
+    def test_make_parser_index(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        source = os.path.join(directory, 'parsers.json')
+        with open(source, 'w') as f:
+            json.dump(PARSER_DATA, f)
+
+        index_path, docs_path = make_parser_index(source=source,
+                                                  directory=directory)
+        self.assertEqual(index_path, os.path.join(directory, INDEX_JSON))
+        self.assertEqual(docs_path, os.path.join(directory, DOCS_JSON))
+
+        with open(index_path) as f:
+            index = json.load(f)
+        with open(docs_path) as f:
+            docs = json.load(f)
+        self.assertEqual((index, docs), split_parser_data(PARSER_DATA))
+
+
+class TestParserIndexShards(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        source = os.path.join(self.directory, 'parsers.json')
+        with open(source, 'w') as f:
+            json.dump(PARSER_DATA, f)
+        make_parser_index(source=source, directory=self.directory)
+        self.index = split_parser_data(PARSER_DATA)[0]
+
+    def test_shard_parser_index(self):
+        shards = shard_parser_index(self.index)
+        self.assertEqual(sorted(shards), ['iosxe', 'nxos'])
+        self.assertEqual(list(shards['iosxe']), ['tokens', 'show version'])
+        self.assertEqual(list(shards['nxos']), ['show version', 'show vrf'])
+        self.assertEqual(shards['nxos']['show vrf'],
+                         self.index['show vrf'])
+        self.assertEqual(list(shards['nxos']['show version']), ['nxos'])
+
+    def test_lazy_shards(self):
+        loader_calls = []
+        def loader():
+            loader_calls.append(True)
+            return split_parser_data(PARSER_DATA)[0]
+
+        index = ParserIndex(loader=loader, binary=False,
+                    directory=os.path.join(self.directory, SHARDS_DIR))
+        self.assertEqual(index.loaded, [])
+
+        self.assertEqual(list(index.get('nxos')), ['show version', 'show vrf'])
+        self.assertEqual(index.loaded, ['nxos'])
+        self.assertTrue(index.has_command('show version'))
+        self.assertFalse(index.has_command('show clock'))
+        self.assertEqual(index.get('linux'), {})
+        self.assertEqual(loader_calls, [])
+
+        self.assertEqual(index.get(), self.index)
+        self.assertEqual(loader_calls, [True])
+
+
+class TestBinaryIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        source = os.path.join(self.directory, 'parsers.json')
+        with open(source, 'w') as f:
+            json.dump(PARSER_DATA, f)
+        make_parser_index(source=source, directory=self.directory)
+        self.index = split_parser_data(PARSER_DATA)[0]
+        self.binary = load_binary_index(os.path.join(self.directory,
+                                                     BINARY_INDEX))
+
+    def test_to_dict(self):
+        self.assertIsNotNone(self.binary)
+        self.assertEqual(self.binary.to_dict(), self.index)
+        self.assertEqual(list(self.binary.to_dict()), list(self.index))
+
+    def test_find(self):
+        self.assertEqual(self.binary.find('show version'), 1)
+        self.assertEqual(self.binary.command(2), 'show vrf')
+        self.assertIsNone(self.binary.find('show clock'))
+
+    def test_shards(self):
+        shards = shard_parser_index(self.index)
+        for os_name in ('iosxe', 'nxos', 'linux'):
+            shard = BinaryShard(self.binary, os_name)
+            self.assertEqual(list(shard), list(shards.get(os_name, {})))
+            self.assertEqual(dict(shard), shards.get(os_name, {}))
+
+        # tokens only
+        self.assertEqual(dict(BinaryShard(self.binary, 'c9300')),
+                         {'tokens': ['iosxe', 'c9300']})
+
+    def test_shard_read_only(self):
+        shard = BinaryShard(self.binary, 'nxos')
+        with self.assertRaises(TypeError):
+            shard['show clock'] = {}
+        self.assertEqual(list(shard), ['show version', 'show vrf'])
+
+    def test_command_trie(self):
+        trie = BinaryCommandTrie(BinaryShard(self.binary, 'nxos'))
+        self.assertEqual(len(trie), 2)
+        self.assertEqual(trie.search('sh v'.split()),
+                         ['show version', 'show vrf'])
+
+        trie = BinaryCommandTrie(BinaryShard(self.binary, 'iosxe'))
+        self.assertEqual(trie.search('sh v'.split()), ['show version'])
+        self.assertEqual(trie.search('t'.split()), ['tokens'])
+
+    def test_invalid_file(self):
+        path = os.path.join(self.directory, 'invalid.bin')
+        with open(path, 'wb') as f:
+            f.write(b'not an index')
+        self.assertIsNone(load_binary_index(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import os
+import glob
+import unittest
+
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.line_dispatch import LineDispatcher, \
+                                                 leading_keyword
+
+
+class TestLeadingKeyword(unittest.TestCase):
+
+    def test_keyword(self):
+        self.assertEqual(leading_keyword(r'^Last +input +(?P<x>\S+)$'),
+                         ('Last', True))
+        self.assertEqual(leading_keyword(r'Hardware +is'), ('Hardware', True))
+        self.assertEqual(leading_keyword(r'^No\. +of +members'),
+                         ('No', True))
+        self.assertEqual(leading_keyword(r'^Last$'), ('Last', True))
+        self.assertEqual(leading_keyword(r'^Encapsulation(\(s\):)? +\w+'),
+                         ('Encapsulation', True))
+        self.assertEqual(leading_keyword(r'^\*(?P<time>[\d:.]+)'), ('', True))
+
+    def test_prefix(self):
+        self.assertEqual(leading_keyword(r'^MTU *(?P<mtu>\d+) +bytes'),
+                         ('MTU', False))
+        self.assertEqual(leading_keyword(r'^Ethernet(?P<port>\d+)'),
+                         ('Ethernet', False))
+
+    def test_catch_all(self):
+        self.assertIsNone(leading_keyword(r'^(?P<intf>\S+) +is +up$'))
+        self.assertIsNone(leading_keyword(r'^(?P<in_pkts>\d+) +packets'))
+        self.assertIsNone(leading_keyword(r'(?i)^last +input'))
+        self.assertIsNone(leading_keyword(r'^.*$'))
+
+
+class TestLineDispatcher(unittest.TestCase):
+
+    patterns = Patterns(
+        p1=r'^(?P<interface>\S+) +is +(?P<status>\w+)$',
+        p2=r'^Last +input +(?P<last_input>\S+)$',
+        p3=r'^Last +clearing +(?P<last_clear>\S+)$',
+        p4=r'^(?P<in_pkts>\d+) +packets +input$',
+        p5=r'^MTU *(?P<mtu>\d+) +bytes$',
+        p6=r'^(input|output) +flow-control +is +(?P<flow>\w+)$')
+
+    lines = ['GigabitEthernet1 is up', 'Last input never',
+             'Last clearing never', '10 packets input', 'MTU1500 bytes',
+             'MTU 1500 bytes', 'input flow-control is off', 'is is is', '',
+             '* star', 'Éthernet0 is up']
+
+    def test_candidates(self):
+        dispatcher = LineDispatcher(self.patterns)
+
+        self.assertEqual(dispatcher.candidates('Last input never').names,
+                         ('p1', 'p2', 'p3'))
+        self.assertEqual(dispatcher.candidates('10 packets input').names,
+                         ('p1', 'p4'))
+        self.assertEqual(dispatcher.candidates('MTU1500 bytes').names,
+                         ('p1', 'p5'))
+        self.assertEqual(dispatcher.candidates('output flow-control').names,
+                         ('p1', 'p6'))
+        self.assertEqual(dispatcher.candidates('').names, ())
+
+    def test_same_matches(self):
+        dispatcher = LineDispatcher(self.patterns)
+        for line in self.lines:
+            candidates = dispatcher.candidates(line)
+            for name in self.patterns:
+                expected = self.patterns[name].match(line)
+                m = getattr(candidates, name).match(line)
+                self.assertEqual(bool(m), bool(expected), (line, name))
+
+    def test_excluded_search(self):
+        dispatcher = LineDispatcher(self.patterns)
+        candidates = dispatcher.candidates('Last input never')
+        self.assertIsNone(candidates.p5.match('Last input never'))
+        self.assertEqual(candidates.p5.pattern, self.patterns.p5.pattern)
+        # only the lines of the keyword are excluded from match
+        self.assertIsNone(candidates.p5.match('MTU 1500 bytes'))
+        self.assertTrue(candidates.p5.search('MTU 1500 bytes'))
+
+    def test_match(self):
+        dispatcher = LineDispatcher(self.patterns)
+        name, m = dispatcher.match('Last clearing never')
+        self.assertEqual(name, 'p3')
+        self.assertEqual(m.groupdict(), {'last_clear': 'never'})
+        self.assertEqual(dispatcher.match('Unknown line'), (None, None))
+        self.assertEqual([name for name, _ in
+                          dispatcher.iter_matches('is is is')], ['p1'])
+
+    def test_without(self):
+        dispatcher = LineDispatcher(self.patterns)
+        without = dispatcher.without(['p2', 'p3'])
+        self.assertIs(dispatcher.without(['p3', 'p2']), without)
+        self.assertIs(dispatcher.without([]), dispatcher)
+        self.assertEqual(without.candidates('Last input never').names,
+                         ('p1',))
+        self.assertEqual(without.match('Last clearing never'), (None, None))
+        self.assertEqual(without.without(['p4']).exclude,
+                         frozenset(['p2', 'p3', 'p4']))
+
+    def test_parsers(self):
+        from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+        from genie.libs.parser.nxos.show_interface import ShowInterface
+
+        folder = os.path.join(os.path.dirname(__file__), '..', '..', 'iosxe',
+                              'tests', 'ShowInterfaces', 'cli', 'equal')
+        lines = {line.strip() for path in glob.glob(
+                    os.path.join(folder, '*_output.txt'))
+                 for line in open(path).read().splitlines()}
+        lines.update(self.lines)
+
+        for parser in (ShowInterfaces, ShowInterface):
+            patterns = parser.patterns
+            for line in lines:
+                candidates = parser.dispatcher.candidates(line)
+                for name in patterns:
+                    if patterns[name].match(line):
+                        self.assertIn(name, candidates.names, line)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import re
+import unittest
+
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.literal_guard import LiteralGuard, guard, \
+                                                 required_literals
+
+
+class TestRequiredLiterals(unittest.TestCase):
+
+    def test_literals(self):
+        self.assertEqual(
+            required_literals(r'^(?P<in_pkts>\d+) +packets +input, +'
+                              r'(?P<in_octets>\d+) +bytes$'),
+            ('', [' packets ', ' input, ', ' bytes', ' ']))
+        self.assertEqual(
+            required_literals(r'^Routing +entry +for +(?P<entry>\S+)'),
+            ('Routing ', [' entry ', ' for ', ' ']))
+        self.assertEqual(
+            required_literals(r'^(?P<intf>\S+) is (up|down)(, line)?$'),
+            ('', [' is ']))
+        self.assertEqual(required_literals(r'^(ab){2}(?P<x>cd)+ef'),
+                         ('', ['ababcd', 'cdef']))
+
+    def test_ignore_case(self):
+        self.assertEqual(required_literals(r'(?i)^\S+ +routes'), ('', []))
+
+
+class TestGuard(unittest.TestCase):
+
+    def test_guarded(self):
+        pattern = re.compile(r'^(?P<table>\S+): +(?P<count>\d+) +'
+                             r'destinations, +(?P<routes>\d+) +routes$')
+        guarded = guard(pattern)
+        self.assertIsInstance(guarded, LiteralGuard)
+        self.assertEqual(guarded.literal, ' destinations, ')
+        self.assertEqual(guarded.pattern, pattern.pattern)
+        self.assertEqual(guarded.groupindex, pattern.groupindex)
+
+        line = 'inet.0: 932 destinations, 1618 routes'
+        self.assertEqual(guarded.match(line).groupdict(),
+                         pattern.match(line).groupdict())
+        self.assertIsNone(guarded.match('10.1.1.0/24 *[Static/5] 1w0d'))
+        self.assertIsNone(guarded.search('inet.0: 932 routes'))
+        self.assertEqual(guarded.skipped, 2)
+
+    def test_not_guarded(self):
+        # the engine rejects these at once
+        for source in (r'^Routing +entry +for +(?P<entry>\S+)$',
+                       r'^(?P<in_pkts>\d+) +packets +input$',
+                       r'^(?P<key>\S+)$',
+                       r'(?i)^(?P<key>\S+) +routes$'):
+            pattern = re.compile(source)
+            self.assertIs(guard(pattern), pattern, source)
+
+    def test_patterns(self):
+        table = Patterns(
+            guards=True,
+            p1=r'^(?P<interface>\S+) +is +(?P<status>\w+), +line +'
+               r'protocol +is +(?P<protocol>\w+)$',
+            p2=r'^Hardware +is +(?P<type>.+)$')
+        self.assertIsInstance(table.p1, LiteralGuard)
+        self.assertIsInstance(table.p2, re.Pattern)
+
+        for line in ('GigabitEthernet1 is up, line protocol is up',
+                     'Hardware is CSR vNIC', 'Last input never'):
+            table.p1.match(line)
+            table.p2.match(line)
+        self.assertEqual(table.skip_counts, {'p1': 2})
+
+    def test_parsers(self):
+        from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+        from genie.libs.parser.junos.show_route import ShowRoute
+
+        self.assertIsInstance(ShowInterfaces.patterns.p1, LiteralGuard)
+        self.assertIsInstance(ShowRoute.patterns.p1, LiteralGuard)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import re
+import unittest
+
+from genie.libs.parser.utils.patterns import Patterns
+
+
+class MockParser(object):
+    patterns = Patterns(
+        # Routing Table: VRF1
+        p1=r'^Routing Table: +(?P<vrf>\S+)$',
+        # Gateway of last resort is not set
+        p2=r'^Gateway +of +last +resort +is +(?P<gateway>.+)$')
+
+    def cli(self, output):
+        patterns = self.patterns
+        parsed = {}
+        for line in output.splitlines():
+            m = patterns.p1.match(line.strip())
+            if m:
+                parsed['vrf'] = m.groupdict()['vrf']
+        return parsed
+
+
+class MockChildParser(MockParser):
+    pass
+
+
+class TestPatterns(unittest.TestCase):
+
+    def test_lazy_compile(self):
+        table = Patterns(p1=r'^a$', p2=r'^b$')
+        self.assertNotIn('p1', vars(table))
+
+        p1 = table.p1
+        self.assertIsInstance(p1, re.Pattern)
+        self.assertIs(vars(table)['p1'], p1)
+        self.assertNotIn('p2', vars(table))
+        self.assertIs(table['p1'], p1)
+
+    def test_shared(self):
+        self.assertEqual(MockParser().cli('Routing Table: VRF1'),
+                         {'vrf': 'VRF1'})
+        self.assertIs(MockParser().patterns.p1, MockChildParser.patterns.p1)
+
+    def test_mapping(self):
+        table = Patterns(flags=re.IGNORECASE, p2=r'^b$', p1=r'^a$')
+        self.assertEqual(list(table), ['p2', 'p1'])
+        self.assertEqual(len(table), 2)
+        self.assertIn('p1', table)
+        self.assertEqual(table.sources, {'p2': r'^b$', 'p1': r'^a$'})
+        self.assertTrue(table.compile_all().p1.match('A'))
+
+    def test_missing(self):
+        table = Patterns(p1=r'^a$')
+        with self.assertRaises(AttributeError):
+            table.p2
+        with self.assertRaises(KeyError):
+            table['p2']
+
+    def test_parsers(self):
+        from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+        from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+        from genie.libs.parser.iosxe.show_bgp import ShowBgpAllDetail
+        from genie.libs.parser.junos.show_route import ShowRoute
+
+        for parser in (ShowIpRoute, ShowInterfaces, ShowBgpAllDetail,
+                       ShowRoute):
+            table = parser.patterns.compile_all()
+            for name in table:
+                self.assertIn(name, vars(table))
+
+
+if __name__ == '__main__':
+    unittest.main()
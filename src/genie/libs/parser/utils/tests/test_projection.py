@@ -0,0 +1,180 @@
+import os
+import glob
+import json
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+from genie.metaparser.util.schemaengine import Any, Optional
+
+from genie.libs.parser.utils.projection import Projection, ProjectionParser
+from genie.libs.parser.utils.validation_policy import EveryNth, Offline, \
+    set_validation_policy
+
+
+class TestProjection(unittest.TestCase):
+
+    parsed = {
+        'GigabitEthernet1': {
+            'oper_status': 'up',
+            'counters': {'rate': {'in_rate': 10}, 'in_pkts': 5},
+            'ipv4': {'10.1.1.1/24': {'ip': '10.1.1.1'}}},
+        'GigabitEthernet0/0.100': {
+            'oper_status': 'down',
+            'counters': {'in_pkts': 0},
+            'encapsulations': ['dot1q']}}
+
+    def test_project(self):
+        projection = Projection(['*.oper_status', '*.counters.rate'])
+        self.assertEqual(projection.project(self.parsed), {
+            'GigabitEthernet1': {'oper_status': 'up',
+                                 'counters': {'rate': {'in_rate': 10}}},
+            'GigabitEthernet0/0.100': {'oper_status': 'down',
+                                       'counters': {}}})
+        # a key holding a dot, lists kept whole
+        projection = Projection([('GigabitEthernet0/0.100', 'encapsulations',
+                                  'x')])
+        self.assertEqual(projection.project(self.parsed), {
+            'GigabitEthernet0/0.100': {'encapsulations': ['dot1q']}})
+        self.assertEqual(Projection('Loopback0').project(self.parsed), {})
+
+    def test_project_schema(self):
+        schema = {
+            Any(): {
+                'oper_status': str,
+                Optional('counters'): {
+                    Optional('rate'): {'in_rate': int},
+                    Optional('in_pkts'): int}}}
+        projected = Projection('*.counters.rate').project_schema(schema)
+        (key, value), = projected.items()
+        self.assertIsInstance(key, Any)
+        (key, value), = value.items()
+        self.assertIsInstance(key, Optional)
+        self.assertEqual(key.schema, 'counters')
+        self.assertEqual(list(value.values()), [{'in_rate': int}])
+
+    def test_wants(self):
+        projection = Projection(['*.counters.rate', 'Vlan1.ipv4'])
+        self.assertTrue(projection.wants('*.counters'))
+        self.assertTrue(projection.wants('*.counters.rate.in_rate'))
+        self.assertTrue(projection.wants('*.ipv4'))
+        self.assertFalse(projection.wants('*.counters.in_pkts'))
+        self.assertFalse(projection.wants('*.oper_status'))
+        self.assertEqual(
+            projection.skipped_rules({'p1': ['*.counters'],
+                                      'p2': ['*.counters.in_pkts'],
+                                      'p3': ['*.mtu', '*.ipv4']}),
+            frozenset(['p2']))
+
+    def test_top_keys(self):
+        self.assertEqual(Projection(['Vlan1.ipv4', 'Vlan2']).top_keys(),
+                         {'Vlan1', 'Vlan2'})
+        self.assertIsNone(Projection(['Vlan1', '*.mtu']).top_keys())
+
+
+class TestProjectionParser(unittest.TestCase):
+
+    fields = [
+        ['*.oper_status', '*.counters.rate'],
+        ['*.counters.in_errors', '*.description'],
+        ['*.ipv4'],
+        ['*.port_channel'],
+        ['GigabitEthernet1.oper_status'],
+        ['Vlan1'],
+    ]
+
+    def test_golden_outputs(self):
+        from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+
+        self.assertTrue(issubclass(ShowInterfaces, ProjectionParser))
+        folder = os.path.join(os.path.dirname(__file__), '..', '..', 'iosxe',
+                              'tests', 'ShowInterfaces', 'cli', 'equal')
+        outputs = glob.glob(os.path.join(folder, '*_output.txt'))
+        self.assertTrue(outputs)
+        for path in outputs:
+            kwargs = {}
+            arguments = path.replace('_output.txt', '_arguments.json')
+            if os.path.exists(arguments):
+                with open(arguments) as f:
+                    kwargs = json.load(f)
+            with open(path) as f:
+                output = f.read()
+            parser = ShowInterfaces(device=Mock())
+            parsed = parser.parse(output=output, **kwargs)
+            for fields in self.fields:
+                projected = Projection(fields).project(parsed)
+                if projected:
+                    self.assertEqual(
+                        parser.parse(output=output, fields=fields, **kwargs),
+                        projected, (path, fields))
+                else:
+                    # as parse of an empty output
+                    with self.assertRaises(SchemaEmptyParserError):
+                        parser.parse(output=output, fields=fields, **kwargs)
+                self.assertIsNone(parser.projection)
+                self.assertNotIn('schema', vars(parser))
+
+    def test_validation_policy(self):
+        from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+
+        self.addCleanup(set_validation_policy)
+        policy = set_validation_policy(EveryNth(2))
+        output = self._output('golden_output_output.txt')
+        parser = ShowInterfaces(device=Mock())
+        fields = ['*.oper_status']
+        expected = parser.parse(output=output, fields=fields)
+        self.assertEqual(parser.parse(output=output, fields=fields), expected)
+        self.assertEqual(
+            policy.calls['{}.ShowInterfaces'.format(ShowInterfaces.__module__)],
+            2)
+
+        # kept projected, to be checked against the projected schema
+        policy = set_validation_policy(Offline())
+        self.assertEqual(parser.parse(output=output, fields=fields), expected)
+        (_, pending, _), = policy.pending
+        self.assertEqual(pending, expected)
+        self.assertEqual(policy.validate_pending(), 0)
+
+    def _output(self, name):
+        path = os.path.join(os.path.dirname(__file__), '..', '..', 'iosxe',
+                            'tests', 'ShowInterfaces', 'cli', 'equal', name)
+        with open(path) as f:
+            return f.read()
+
+    def test_empty(self):
+        from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+
+        output = self._output('golden_output_output.txt')
+        parser = ShowInterfaces(device=Mock())
+        # no block of the key
+        with self.assertRaises(SchemaEmptyParserError):
+            parser.parse(output=output, fields=['Loopback1234.oper_status'])
+        # the whole output parsed, none of the keys in it
+        with self.assertRaises(SchemaEmptyParserError):
+            parser.parse(output=output, fields=['Loopback1234.ipv4'])
+
+    def test_rule_fields(self):
+        from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+
+        # a rule missing from both would be used for any fields, silently
+        self.assertEqual(set(ShowInterfaces.patterns),
+                         set(ShowInterfaces.rule_fields) |
+                         set(ShowInterfaces.always_rules))
+        self.assertFalse(set(ShowInterfaces.rule_fields) &
+                         set(ShowInterfaces.always_rules))
+
+    def test_rules(self):
+        from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+
+        parser = ShowInterfaces(device=Mock())
+        self.assertIs(parser.rules(parser.dispatcher), parser.dispatcher)
+        parser.projection = Projection('*.counters.rate')
+        dispatcher = parser.rules(parser.dispatcher)
+        self.assertIn('p21', parser.rule_fields)
+        self.assertNotIn('p21', dispatcher.exclude)
+        self.assertIn('p3', dispatcher.exclude)
+        self.assertIn('p25', dispatcher.exclude)
+
+
+if __name__ == '__main__':
+    unittest.main()
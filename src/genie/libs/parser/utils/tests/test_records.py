@@ -0,0 +1,162 @@
+import os
+import json
+import glob
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.records import Position, add_record, \
+                                           build_output
+
+
+class TestBuildOutput(unittest.TestCase):
+
+    def test_merge(self):
+        records = [
+            (('vrf', 'default', 'index', 1), {'protocol': 'tcp'}),
+            (('vrf', 'default', 'index', 1),
+             {'details': {'create': '11:38:01'}}),
+            (('vrf', 'default', 'index', 1),
+             {'details': {'use': '11:39:02'}}),
+            (('vrf',), {'number_of_translations': 1}),
+            ((), {'total': 1})]
+        self.assertEqual(build_output(records), {
+            'vrf': {
+                'default': {'index': {1: {
+                    'protocol': 'tcp',
+                    'details': {'create': '11:38:01', 'use': '11:39:02'}}}},
+                'number_of_translations': 1},
+            'total': 1})
+
+    def test_lists(self):
+        table = ('route-information', 'route-table')
+        records = [
+            (table + (Position(0),), {'table-name': 'inet.0'}),
+            (table + (Position(0), 'rt', Position(0)), {'rt': 1}),
+            (table + (Position(0), 'rt', Position(1)), {'rt': 2}),
+            (table + (Position(1),), {'table-name': 'inet.3'}),
+            (table + (Position(1), 'rt', Position(0)), {'rt': 3}),
+            (table + (Position(0), 'rt', Position(1)), {'age': 4})]
+        self.assertEqual(build_output(records), {'route-information': {
+            'route-table': [
+                {'table-name': 'inet.0', 'rt': [{'rt': 1},
+                                                {'rt': 2, 'age': 4}]},
+                {'table-name': 'inet.3', 'rt': [{'rt': 3}]}]}})
+
+    def test_reference(self):
+        parsed = {}
+        data = {'mac_address': 'aaaa.bbff.8888'}
+        add_record(parsed, (('mac_addresses', 'aaaa.bbff.8888'), data))
+        data['interfaces'] = {'Gi1/0/8': {}}
+        self.assertIs(parsed['mac_addresses']['aaaa.bbff.8888'], data)
+
+
+class TestIterRecords(unittest.TestCase):
+
+    junos_output = '''
+        show route protocol static
+
+        inet.0: 932 destinations, 1618 routes (932 active, 0 holddown, 0 hidden)
+        + = Active Route, - = Last Active, * = Both
+
+        10.169.14.240/32  *[Static/5] 5w2d 15:42:25
+                            >  to 10.169.14.121 via ge-0/0/1.0
+        10.169.14.241/32  *[Static/5] 5w2d 15:42:25
+                            >  to 10.169.14.121 via ge-0/0/1.0
+
+        inet.3: 12 destinations, 12 routes (12 active, 0 holddown, 0 hidden)
+    '''
+
+    nxos_output = '''
+        BGP routing table information for VRF VRF1, address family IPv4 Unicast
+        BGP table version is 35, local router ID is 10.229.11.11
+
+           Network            Next Hop            Metric     LocPrf     Weight Path
+        *>a10.121.0.0/8         0.0.0.0                           100      32768 i
+                              10.64.4.4                  0        100      32768 e
+                              10.144.6.6                  0        100      32768 e
+        *>r10.229.11.11/32     0.0.0.0                  0        100      32768 ?
+
+        BGP routing table information for VRF default, address family VPNv4 Unicast
+        BGP table version is 48, local router ID is 10.4.1.1
+
+           Network            Next Hop            Metric     LocPrf     Weight Path
+        Route Distinguisher: 100:100     (VRF VRF1)
+        *>i10.21.33.33/32     10.36.3.3                  0        100          0 ?
+    '''
+
+    def assertSameOutput(self, parser_class, output, **kwargs):
+        device = Mock()
+        parsed = parser_class(device=device).parse(output=output, **kwargs)
+        records = list(parser_class(device=device).iter_records(
+            output=output, **kwargs))
+        self.assertTrue(records)
+        for path, data in records:
+            self.assertIsInstance(path, tuple)
+            self.assertIsInstance(data, dict)
+        self.assertEqual(build_output(records), parsed)
+        device.execute.assert_not_called()
+        return records
+
+    def test_golden_outputs(self):
+        from genie.libs.parser.iosxe.show_fdb import ShowMacAddressTable
+        from genie.libs.parser.iosxe.show_ip_nat import ShowIpNatTranslations
+
+        parser_folder = os.path.join(os.path.dirname(__file__), '..', '..')
+        for parser in (ShowMacAddressTable, ShowIpNatTranslations):
+            folder = os.path.join(parser_folder, 'iosxe', 'tests',
+                                  parser.__name__, 'cli', 'equal')
+            outputs = glob.glob(os.path.join(folder, '*_output.txt'))
+            self.assertTrue(outputs)
+            for path in outputs:
+                kwargs = {}
+                arguments = path.replace('_output.txt', '_arguments.json')
+                if os.path.exists(arguments):
+                    with open(arguments) as f:
+                        kwargs = json.load(f)
+                with open(path) as f:
+                    self.assertSameOutput(parser, f.read(), **kwargs)
+
+    def test_junos_show_route(self):
+        from genie.libs.parser.junos.show_route import ShowRoute
+
+        records = self.assertSameOutput(ShowRoute, self.junos_output)
+        self.assertEqual([path[-1] for path, _ in records], [0, 0, 1, 1])
+        self.assertEqual(records[2][1]['rt-destination'], '10.169.14.241/32')
+
+    def test_nxos_show_bgp(self):
+        from genie.libs.parser.nxos.show_bgp import ShowBgpVrfAllAll
+
+        records = self.assertSameOutput(ShowBgpVrfAllAll, self.nxos_output)
+        prefixes = [(path, data) for path, data in records
+                    if 'prefixes' in path]
+        self.assertEqual([path[-1] for path, _ in prefixes],
+                         ['10.121.0.0/8', '10.229.11.11/32', '10.21.33.33/32'])
+        # paths ordered by next hop
+        self.assertEqual(
+            [index['next_hop'] for index in
+             prefixes[0][1]['index'].values()],
+            ['0.0.0.0', '10.144.6.6', '10.64.4.4'])
+        self.assertEqual(prefixes[2][0][:4],
+                         ('vrf', 'default', 'address_family',
+                          'vpnv4 unicast RD 100:100'))
+
+    def test_lazy(self):
+        from genie.libs.parser.junos.show_route import ShowRoute
+
+        read = []
+
+        def lines():
+            for line in self.junos_output.splitlines():
+                read.append(line)
+                yield line
+
+        records = ShowRoute(device=Mock()).iter_records(output=lines())
+        # the first route is complete once the second one starts
+        next(records)
+        next(records)
+        self.assertIn('10.169.14.241/32', read[-1])
+        self.assertLess(len(read), len(self.junos_output.splitlines()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,220 @@
+import os
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.libs.parser.utils import common
+
+from genie.libs.parser.utils.index import (
+    make_parser_index,
+    split_parser_data,
+    load_binary_index,
+    ParserIndex,
+    SHARDS_DIR,
+    BINARY_INDEX
+)
+from genie.libs.parser.utils.registry import (
+    ParserRegistry,
+    CurrentParserData
+)
+
+PARSER_DATA = {
+    'tokens': ['iosxe', 'c9300'],
+    'show version': {
+        'iosxe': {
+            'module_name': 'show_platform',
+            'package': 'genie.libs.parser',
+            'class': 'ShowVersion',
+        },
+        'nxos': {
+            'module_name': 'show_platform',
+            'package': 'genie.libs.parser',
+            'class': 'ShowVersion',
+        },
+    },
+    'show vrf': {
+        'nxos': {
+            'module_name': 'show_vrf',
+            'package': 'genie.libs.parser',
+            'class': 'ShowVrf',
+        },
+    },
+}
+
+ENTRY = {'module_name': 'show_clock', 'package': 'my.parsers',
+         'class': 'ShowClock'}
+
+
+class TestParserRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        source = os.path.join(self.directory, 'parsers.json')
+        with open(source, 'w') as f:
+            json.dump(PARSER_DATA, f)
+        make_parser_index(source=source, directory=self.directory)
+
+    def _registry(self, binary=False):
+        if binary:
+            binary = load_binary_index(os.path.join(self.directory,
+                                                    BINARY_INDEX))
+        index = ParserIndex(loader=lambda: split_parser_data(PARSER_DATA)[0],
+                    binary=binary,
+                    directory=os.path.join(self.directory, SHARDS_DIR))
+        return ParserRegistry(index)
+
+    def test_add(self):
+        registry = self._registry()
+        registry.snapshot.get('nxos')
+        registry.add('show clock', 'nxos', ENTRY)
+        registry.add('show clock', 'linux', ENTRY)
+
+        snapshot = registry.snapshot
+        self.assertEqual(snapshot.version, 2)
+        self.assertEqual(snapshot.get('nxos')['show clock'], {'nxos': ENTRY})
+        self.assertEqual(list(snapshot.get('nxos')),
+                         ['show version', 'show vrf', 'show clock'])
+        # added before the shard or the whole index were loaded
+        self.assertEqual(dict(snapshot.get('linux')),
+                         {'show clock': {'linux': ENTRY}})
+        self.assertEqual(snapshot.get()['show clock'],
+                         {'nxos': ENTRY, 'linux': ENTRY})
+        self.assertTrue(snapshot.has_command('show clock'))
+
+        # the index itself is not modified
+        self.assertNotIn('show clock', registry.index.get('nxos'))
+        self.assertNotIn('show clock', registry.index.get())
+
+    def test_replace(self):
+        registry = self._registry()
+        registry.add('show vrf', 'nxos', ENTRY)
+
+        data = registry.snapshot.get('nxos')
+        self.assertEqual(list(data), ['show version', 'show vrf'])
+        self.assertEqual(data['show vrf'], {'nxos': ENTRY})
+        self.assertEqual(registry.snapshot.get()['show vrf'], {'nxos': ENTRY})
+
+    def test_snapshots_are_immutable(self):
+        registry = self._registry(binary=True)
+        before = registry.snapshot
+        trie = before.command_trie('nxos')
+
+        registry.add_many([('show vlan', 'nxos', ENTRY),
+                           ('show clock', 'nxos', ENTRY)])
+        after = registry.snapshot
+
+        self.assertEqual(after.version, before.version + 1)
+        self.assertNotIn('show vlan', before.get('nxos'))
+        self.assertFalse(before.has_command('show vlan'))
+        self.assertIs(before.command_trie('nxos'), trie)
+        self.assertEqual(trie.search('sh v'.split()),
+                         ['show version', 'show vrf'])
+
+        self.assertIn('show vlan', after.get('nxos'))
+        self.assertEqual(after.command_trie('nxos').search('sh v'.split()),
+                         ['show version', 'show vrf', 'show vlan'])
+        self.assertEqual(len(after.command_trie('nxos')),
+                         len(after.get('nxos')))
+        # the trie of the index is shared by the snapshots
+        self.assertIs(after.command_trie('nxos').base, trie.base)
+
+    def test_deferred(self):
+        registry = self._registry()
+        calls = []
+
+        def loader():
+            calls.append(True)
+            registry.add('show clock', 'nxos', ENTRY)
+            # the registry can be used from a loader
+            self.assertIn('show clock', registry.snapshot.get('nxos'))
+
+        registry.defer(loader)
+        self.assertEqual(calls, [])
+        self.assertEqual(registry.version, 1)
+        self.assertEqual(registry.version, 1)
+        self.assertEqual(calls, [True])
+
+    def test_current_parser_data(self):
+        registry = self._registry()
+        data = CurrentParserData(registry)
+        self.assertNotIn('show clock', data)
+
+        registry.add('show clock', 'linux', ENTRY)
+        self.assertIn('show clock', data)
+        self.assertEqual(data['show clock'], {'linux': ENTRY})
+        self.assertEqual(len(data), len(PARSER_DATA) + 1)
+
+    def test_concurrent_readers(self):
+        registry = self._registry(binary=True)
+        errors = []
+        start = threading.Barrier(5)
+
+        def writer():
+            start.wait()
+            for number in range(200):
+                registry.add('show test{}'.format(number), 'nxos', ENTRY)
+
+        def reader():
+            start.wait()
+            for _ in range(200):
+                snapshot = registry.snapshot
+                data = snapshot.get('nxos')
+                commands = snapshot.command_trie('nxos').search(
+                                                        ['show', 'test'])
+                # every view of a snapshot is consistent with its version
+                if len(commands) != snapshot.version or \
+                        len(data) != snapshot.version + 2 or \
+                        any(command not in data for command in commands):
+                    errors.append(snapshot.version)
+
+        threads = [threading.Thread(target=writer)] + \
+                  [threading.Thread(target=reader) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(registry.version, 200)
+
+
+class TestParserDataCompatibility(unittest.TestCase):
+
+    def setUp(self):
+        common.clear_parser_cache()
+        patch.object(
+            common.Lookup, 'from_device',
+            side_effect=lambda device, packages: Mock(_tokens=[device.os])
+        ).start()
+        patch.object(common, '_find_parser_cls',
+                     side_effect=lambda device, data: data['class']).start()
+        self.addCleanup(patch.stopall)
+
+    def test_patched_parser_data(self):
+        device = Mock(os='linux', custom={})
+        data = dict(PARSER_DATA, **{'show clock': {'linux': ENTRY}})
+        with patch.object(common, 'parser_data', data):
+            with self.assertWarns(DeprecationWarning):
+                self.assertEqual(common.get_parser('show clock', device),
+                                 ('ShowClock', {}))
+            with self.assertWarns(DeprecationWarning):
+                self.assertEqual(common.get_parser('sh clo', device,
+                                                   fuzzy=True),
+                                 [('show clock', 'ShowClock', {})])
+        # a replaced parser data has no version, nothing was cached
+        self.assertEqual(common.get_parser_cache_info().currsize, 0)
+        with self.assertRaises(Exception):
+            common.get_parser('show clock', device)
+
+    def test_patched_loader(self):
+        with patch.object(common, '_load_parser_json',
+                          return_value=PARSER_DATA):
+            self.assertIs(common.parser_index.loader(), PARSER_DATA)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+import os
+import glob
+import unittest
+import threading
+
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.scanner import LineScanner
+
+
+def first_match(patterns, names, line):
+    for name in names:
+        m = patterns[name].match(line)
+        if m:
+            return name, m
+    return None, None
+
+
+class TestLineScanner(unittest.TestCase):
+
+    patterns = Patterns(
+        p1=r'^Routing Table: +(?P<vrf>[\w?-]+)$',
+        p2=r'^(?P<tag>\S+) +logging: +(?P<status>\S+)$',
+        p3=r'^(?P<tag>\S+) +logging: +level +(?P<level>\S+)(, +(\d+) +'
+           r'messages)?$',
+        p4=r'^(?P<word>\w+) +(?P=word)$',
+        p5=r'^link +(?P<link>\S+)\),$',
+        p6=r'(?i)^LINK +(?P<link>\S+)$',
+        p7=r'^[(\]] +(?P<value>\d+)$',
+        p8=r'^(?P<nexthop>[\w\.]+)(, +from +(?P<from>[\w\.]+))?$')
+
+    lines = ['Routing Table: VRF1', 'Console logging: disabled',
+             'Trap logging: level informational, 10 messages',
+             'Trap logging: level informational', 'up up', 'up down',
+             'link down),', 'link up', ') 10', '( 10', '10.1.1.1',
+             '10.1.1.1, from 10.2.2.2', 'no match here', '']
+
+    def test_same_matches(self):
+        scanner = LineScanner(self.patterns)
+        for line in self.lines:
+            name, m = scanner.match(line)
+            expected_name, expected = first_match(self.patterns,
+                                                  scanner.names, line)
+            self.assertEqual(name, expected_name, line)
+            if m:
+                self.assertIs(m.re, expected.re)
+                self.assertEqual(m.groups(), expected.groups())
+                self.assertEqual(m.groupdict(), expected.groupdict())
+
+    def test_fallback(self):
+        scanner = LineScanner(self.patterns)
+        # back reference and flags of its own are not fused, p5 is left
+        # alone between them
+        self.assertEqual(scanner.fused, ('p1', 'p2', 'p3', 'p7', 'p8'))
+        self.assertEqual(scanner.match('link down),')[0], 'p5')
+        self.assertEqual(scanner.match('up up')[0], 'p4')
+        self.assertEqual(scanner.match('link up')[0], 'p6')
+        self.assertEqual(scanner.match('( 10')[1].groupdict(),
+                         {'value': '10'})
+
+    def test_names(self):
+        scanner = LineScanner(self.patterns, names=['p3', 'p2'])
+        self.assertEqual(scanner.match('Trap logging: level info')[0], 'p3')
+        self.assertEqual(scanner.match('Routing Table: VRF1'), (None, None))
+
+        scanner = LineScanner(self.patterns, exclude=['p2'])
+        self.assertEqual(scanner.match('Console logging: disabled'),
+                         (None, None))
+
+    warmup_patterns = Patterns(
+        p1=r'^Routing Table: +(?P<vrf>\S+)$',
+        p2=r'^(?P<number>\d+)$',
+        p3=r'^(?P<word>\w+)$',
+        p4=r'^(?P<prefix>[\d\.]+)/(?P<length>\d+)$')
+
+    warmup_lines = ['Routing Table: VRF1'] + ['10.0.0.0/8'] * 3 + \
+                   ['abc', 'def', '10'] + ['10.1.0.0/16'] * 2
+
+    def test_warmup(self):
+        patterns = self.warmup_patterns
+        lines = self.warmup_lines
+        scanner = LineScanner(patterns, warmup=len(lines), pinned=['p1'])
+
+        for line in lines + ['20', 'xyz', 'no match here']:
+            name, m = scanner.match(line)
+            expected_name, expected = first_match(patterns, list(patterns),
+                                                  line)
+            self.assertEqual(name, expected_name, line)
+            if m:
+                self.assertEqual(m.groupdict(), expected.groupdict())
+
+        self.assertEqual(scanner.hits, {'p1': 1, 'p2': 1, 'p3': 2, 'p4': 5})
+        # p3 matches the numbers of p2, p1 keeps its place
+        self.assertEqual(scanner.names, ('p1', 'p4', 'p2', 'p3'))
+        self.assertEqual(scanner.fused, scanner.names)
+
+        # frozen, the counts are not updated anymore
+        scanner.match('10.2.0.0/16')
+        self.assertEqual(scanner.hits['p4'], 5)
+        self.assertEqual(scanner.reorder(), ('p1', 'p4', 'p2', 'p3'))
+
+        # the learned order, frozen into a scanner
+        scanner = LineScanner(patterns, names=scanner.names)
+        self.assertEqual(scanner.match('10')[0], 'p2')
+
+    def test_warmup_threads(self):
+        patterns = self.warmup_patterns
+        lines = self.warmup_lines * 50
+        # shared by the threads, as by the instances of a parser class
+        scanner = LineScanner(patterns, warmup=len(lines) * 2, pinned=['p1'])
+        start = threading.Barrier(4)
+        errors = []
+
+        def match():
+            start.wait()
+            for line in lines:
+                if scanner.match(line)[0] != first_match(
+                        patterns, list(patterns), line)[0]:
+                    errors.append(line)
+
+        threads = [threading.Thread(target=match) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(sum(scanner.hits.values()), len(lines) * 2)
+        self.assertEqual(scanner.names, ('p1', 'p4', 'p2', 'p3'))
+
+    def test_parsers(self):
+        from genie.libs.parser.iosxe.show_logging import ShowLogging
+        from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+
+        parser_folder = os.path.join(os.path.dirname(__file__), '..', '..')
+        for parser, scanners in ((ShowLogging, ['scanner']),
+                                 (ShowIpRoute, ['scanner', 'scanner_ipv6'])):
+            folder = os.path.join(parser_folder, 'iosxe', 'tests',
+                                  parser.__name__, 'cli', 'equal')
+            lines = {line.strip() for path in glob.glob(
+                        os.path.join(folder, '*_output.txt'))
+                     for line in open(path).read().splitlines()}
+            self.assertTrue(lines)
+
+            for attribute in scanners:
+                scanner = getattr(parser, attribute)
+                self.assertEqual(scanner.fused, scanner.names)
+                for line in lines:
+                    self.assertEqual(
+                        scanner.match(line)[0],
+                        first_match(parser.patterns, scanner.names, line)[0],
+                        line)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import io
+import os
+import json
+import glob
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.utils.stream import StreamParser, iter_lines
+
+
+class TestIterLines(unittest.TestCase):
+
+    def test_string(self):
+        output = 'line 1\r\nline 2\n\nline 3'
+        self.assertEqual(iter_lines(output), output.splitlines())
+
+    def test_iterables(self):
+        expected = ['line 1', 'line 2', '', '  line 3']
+        for lines in (['line 1\n', 'line 2\r\n', '\n', '  line 3'],
+                      io.StringIO('line 1\nline 2\n\n  line 3\n'),
+                      io.BytesIO(b'line 1\nline 2\r\n\n  line 3'),
+                      (line for line in expected)):
+            self.assertEqual(list(iter_lines(lines)), expected)
+
+    def test_lazy(self):
+        def lines():
+            yield 'line 1'
+            raise AssertionError('read too far')
+        self.assertEqual(next(iter(iter_lines(lines()))), 'line 1')
+
+
+class TestParseStream(unittest.TestCase):
+
+    junos_output = '''
+        show route protocol static 10.169.14.240/32
+
+        inet.0: 932 destinations, 1618 routes (932 active, 0 holddown, 0 hidden)
+        + = Active Route, - = Last Active, * = Both
+
+        10.169.14.240/32  *[Static/5] 5w2d 15:42:25
+                            >  to 10.169.14.121 via ge-0/0/1.0
+
+        inet.3: 12 destinations, 12 routes (12 active, 0 holddown, 0 hidden)
+    '''
+
+    def assertSameParse(self, parser_class, output, **kwargs):
+        device = Mock()
+        expected = parser_class(device=device).parse(output=output, **kwargs)
+
+        parser = parser_class(device=device)
+        self.assertEqual(
+            parser.parse_stream(iter(output.splitlines()), **kwargs),
+            expected)
+        self.assertEqual(
+            parser.parse_stream(io.StringIO(output), **kwargs), expected)
+        self.assertEqual(
+            parser.parse_stream(io.BytesIO(output.encode()), **kwargs),
+            expected)
+        device.execute.assert_not_called()
+
+    def test_parsers(self):
+        from genie.libs.parser.iosxe.show_routing import ShowIpRoute, \
+                                                         ShowIpv6Route
+        from genie.libs.parser.iosxe.show_bgp import ShowBgpAll
+        from genie.libs.parser.junos.show_route import ShowRoute, \
+                                                       ShowRouteProtocolExtensive
+
+        for parser in (ShowIpRoute, ShowIpv6Route, ShowBgpAll, ShowRoute,
+                       ShowRouteProtocolExtensive):
+            self.assertTrue(issubclass(parser, StreamParser))
+
+        parser_folder = os.path.join(os.path.dirname(__file__), '..', '..')
+        for parser in (ShowIpRoute, ShowIpv6Route, ShowBgpAll):
+            folder = os.path.join(parser_folder, 'iosxe', 'tests',
+                                  parser.__name__, 'cli', 'equal')
+            outputs = glob.glob(os.path.join(folder, '*_output.txt'))
+            self.assertTrue(outputs)
+            for path in outputs:
+                kwargs = {}
+                arguments = path.replace('_output.txt', '_arguments.json')
+                if os.path.exists(arguments):
+                    with open(arguments) as f:
+                        kwargs = json.load(f)
+                with open(path) as f:
+                    self.assertSameParse(parser, f.read(), **kwargs)
+
+        self.assertSameParse(ShowRoute, self.junos_output)
+
+    def test_empty(self):
+        from genie.libs.parser.junos.show_route import ShowRoute
+
+        # an empty stream is an empty output, not a missing one
+        device = Mock()
+        with self.assertRaises(SchemaEmptyParserError):
+            ShowRoute(device=device).parse_stream([])
+        device.execute.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
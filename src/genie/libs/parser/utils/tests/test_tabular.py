@@ -0,0 +1,206 @@
+import os
+import glob
+import unittest
+from unittest.mock import Mock
+
+from genie.parsergen import oper_fill_tabular
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.utils.tabular import FixedWidthTable
+
+
+class TestFixedWidthTable(unittest.TestCase):
+
+    brief_output = '''
+        R1#show ip interface brief
+        Interface              IP-Address      OK? Method Status                Protocol
+        ---------              ----------      --- ------ ------                --------
+        GigabitEthernet0/0     10.1.10.20      YES NVRAM  up                    up
+        GigabitEthernet1/0/1   unassigned      YES unset  administratively down down
+
+        Loopback0              10.4.1.1        YES manual up                    up
+    '''
+
+    brief_fields = ['Interface', 'IP-Address', r'OK\?', 'Method', 'Status',
+                    'Protocol']
+
+    switch_output = '\n'.join([
+        'Switch Ports Model              SW Version        SW Image              Mode   ',
+        '------ ----- -----              ----------        ----------            ----   ',
+        '*    1 32    WS-C3850-24P       16.4.2            CAT3K_CAA-UNIVERSALK9 BUNDLE ',
+        '     2 32    WS-C3850-24P       16.4.2            CAT3K_CAA-UNIVERSALK9 INSTALL'])
+
+    sla_output = '''
+        ID           Type        Destination       Stats       Return      Last
+                                                               Code        Run
+        -----------------------------------------------------------------------
+        *1           tcp-connect 123.23.213.32     RTT=44      OK          21 seconds ag
+                                                                           o
+        *2           dns         11.121.2.123      -           Timeout     7 seconds ago
+    '''
+
+    def test_left_justified(self):
+        table = FixedWidthTable(header_fields=self.brief_fields,
+                                table_terminal_pattern=r'^\n')
+        self.assertEqual(table.entries(self.brief_output), {
+            'GigabitEthernet0/0': {
+                'Interface': 'GigabitEthernet0/0', 'IP-Address': '10.1.10.20',
+                r'OK\?': 'YES', 'Method': 'NVRAM', 'Status': 'up',
+                'Protocol': 'up'},
+            'GigabitEthernet1/0/1': {
+                'Interface': 'GigabitEthernet1/0/1',
+                'IP-Address': 'unassigned', r'OK\?': 'YES',
+                'Method': 'unset', 'Status': 'administratively down',
+                'Protocol': 'down'}})
+
+    def test_right_justified(self):
+        table = FixedWidthTable(
+            right_justified=True,
+            header_fields=['Switch', 'Ports', 'Model             ',
+                           'SW Version       ', 'SW Image              ',
+                           'Mode   '],
+            label_fields=['switch_num', 'ports', 'model', 'sw_ver',
+                          'sw_image', 'mode'])
+        entries = table.entries(self.switch_output)
+        self.assertEqual(list(entries), ['*    1', '2'])
+        self.assertEqual(entries['2'], {
+            'switch_num': '2', 'ports': '32', 'model': 'WS-C3850-24P',
+            'sw_ver': '16.4.2', 'sw_image': 'CAT3K_CAA-UNIVERSALK9',
+            'mode': 'INSTALL'})
+
+    def test_index(self):
+        table = FixedWidthTable(header_fields=['System Id', 'Metric',
+                                               'Interface'],
+                                index=[0, 2])
+        entries = table.entries([
+            'System Id       Metric  Interface',
+            'one             --',
+            'two             10      Gi0/0/0/0',
+            'two             10      Gi0/0/0/1',
+            'two             20      Gi0/0/0/1'])
+        self.assertEqual(entries['one'], {'': {
+            'System Id': 'one', 'Metric': '--', 'Interface': ''}})
+        self.assertEqual(list(entries['two']), ['Gi0/0/0/0', 'Gi0/0/0/1'])
+        # a later row replaces the earlier one
+        self.assertEqual(entries['two']['Gi0/0/0/1']['Metric'], '20')
+
+    def test_tables(self):
+        table = FixedWidthTable(header_fields=['Name', 'State'],
+                                table_terminal_pattern=r'^\n')
+        entries = table.entries('\n'.join([
+            'Name   State',
+            '',
+            'a      up',
+            '',
+            'b      up',
+            '  Name   State',
+            'c        down']))
+        # empty lines right below the header are not the end of the table
+        self.assertEqual(entries, {
+            'a': {'Name': 'a', 'State': 'up'},
+            'c': {'Name': 'c', 'State': 'down'}})
+
+    def test_header_lines(self):
+        labels = ['id', 'type', 'destination', 'rtt_stats_mseconds',
+                  'return_code', 'last_run_seconds_ago']
+        headers = [['ID', 'Type', 'Destination', 'Stats', 'Return', 'Last'],
+                   ['', '', '', '', 'Code', 'Run']]
+
+        table = FixedWidthTable(header_fields=headers)
+        entries = table.entries(self.sla_output)
+        self.assertEqual(entries['*1']['Return Code'], 'OK')
+        self.assertEqual(entries['*1']['Last Run'], '21 seconds ag')
+        self.assertEqual(entries['']['Last Run'], 'o')
+
+        table = FixedWidthTable(header_fields=headers, label_fields=labels,
+                                wrapped=True)
+        entries = table.entries(self.sla_output)
+        self.assertEqual(list(entries), ['*1', '*2'])
+        self.assertEqual(entries['*1']['last_run_seconds_ago'],
+                         '21 seconds ago')
+        self.assertEqual(entries['*2']['return_code'], 'Timeout')
+
+    def test_wrapped_words(self):
+        table = FixedWidthTable(header_fields=['Port', 'Description',
+                                               'Status'],
+                                wrapped=True)
+        entries = table.entries([
+            'Port  Description     Status',
+            'Gi1   link to core    up',
+            '      router',
+            'Gi2   uplink-to-distriup',
+            '      bution'])
+        self.assertEqual(entries['Gi1']['Description'], 'link to core router')
+        self.assertEqual(entries['Gi2']['Description'],
+                         'uplink-to-distribution')
+
+    def test_same_as_parsergen(self):
+        from genie.libs.parser.iosxe.show_platform import ShowVersion
+        from genie.libs.parser.iosxe.show_session import ShowUsers
+        from genie.libs.parser.iosxe.show_interface import \
+            ShowIpInterfaceBrief
+
+        tables = {
+            ShowVersion.switch_table: dict(
+                right_justified=True,
+                header_fields=['Switch', 'Ports', 'Model             ',
+                               'SW Version       ', 'SW Image              ',
+                               'Mode   '],
+                label_fields=['switch_num', 'ports', 'model', 'sw_ver',
+                              'sw_image', 'mode'],
+                index=[0],
+                table_terminal_pattern=r'(^\n|^\s*$)'),
+            ShowVersion.license_table: dict(
+                right_justified=True,
+                header_fields=['Current            ', 'Type            ',
+                               'Next reboot  '],
+                label_fields=['license_level', 'license_type',
+                              'next_reload_license_level'],
+                table_terminal_pattern=r'(^\n|^\s*$)'),
+            ShowUsers.line_table: dict(
+                index=[1],
+                header_fields=[' ', ' Line', 'User', r'Host\(s\)', 'Idle',
+                               '  Location'],
+                label_fields=['busy', 'line', 'user', 'host', 'idle',
+                              'location'],
+                table_terminal_pattern=r'Interface\s+User\s+Mode\s+Idle\s+'
+                                       r'Peer\s+Address'),
+            ShowUsers.interface_table: dict(
+                index=[0, 1],
+                header_fields=['Interface', 'User', 'Mode', 'Idle',
+                               'Peer Address']),
+            ShowIpInterfaceBrief.table: dict(
+                header_fields=self.brief_fields,
+                label_fields=['Interface', 'ip_address', 'interface_is_ok',
+                              'method', 'status', 'protocol'],
+                index=[0],
+                table_terminal_pattern=r'^\n'),
+        }
+
+        parser_folder = os.path.join(os.path.dirname(__file__), '..', '..')
+        outputs = [self.brief_output, self.switch_output]
+        for folder in ('ShowVersion', 'ShowUsers'):
+            for path in glob.glob(os.path.join(parser_folder, '*', 'tests',
+                                               folder, 'cli', 'equal',
+                                               '*_output.txt')):
+                with open(path) as f:
+                    outputs.append(f.read())
+
+        for output in outputs:
+            for table, kwargs in tables.items():
+                self.assertEqual(
+                    table.entries(output),
+                    oper_fill_tabular(device_output=output, **kwargs).entries)
+
+    def test_empty_output(self):
+        from genie.libs.parser.iosxe.show_platform import ShowVersion
+        from genie.libs.parser.iosxe.show_session import ShowUsers
+
+        # oper_fill_tabular raised AttributeError on an empty output
+        for parser in (ShowVersion, ShowUsers):
+            with self.assertRaises(SchemaEmptyParserError):
+                parser(device=Mock()).parse(output='')
+
+
+if __name__ == '__main__':
+    unittest.main()
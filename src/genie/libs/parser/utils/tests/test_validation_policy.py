@@ -0,0 +1,183 @@
+import os
+import glob
+import unittest
+import threading
+from unittest.mock import Mock, patch
+
+from genie.metaparser import MetaParser
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.common import get_parser, clear_parser_cache
+from genie.libs.parser.utils.compiled_schema import CompiledSchemaParser
+from genie.libs.parser.utils.validation_policy import ValidationPolicy, \
+    EveryNth, FirstK, Offline, get_validation_policy, set_validation_policy
+
+
+class ShowCounterSchema(MetaParser):
+    schema = {'counter': int}
+
+
+class ShowCounter(CompiledSchemaParser, ShowCounterSchema):
+    cli_command = 'show counter'
+
+    def cli(self, output=None):
+        return output
+
+
+class ShowCounterUnchecked(ShowCounterSchema):
+    cli_command = 'show counter'
+
+    def cli(self, output=None):
+        return output
+
+
+class TestValidationPolicy(unittest.TestCase):
+
+    def setUp(self):
+        self.addCleanup(set_validation_policy)
+
+    def parse(self, output, device=None):
+        parser = ShowCounter(device=device or Mock())
+        return parser.parse(output=output)
+
+    def test_default(self):
+        self.assertIs(get_validation_policy(), set_validation_policy())
+        with self.assertRaisesRegex(Exception, 'schema checking failed'):
+            self.parse({'counter': '1'})
+
+    def test_parser(self):
+        set_validation_policy(EveryNth(2))
+        parser = ShowCounter(device=Mock())
+        self.assertEqual(parser.parse(output={'counter': 1}), {'counter': 1})
+        self.assertEqual(parser.parse(output={'counter': '1'}),
+                         {'counter': '1'})
+        # the parser and its class are left as they are
+        self.assertNotIn('schema', vars(parser))
+        self.assertIs(type(parser), ShowCounter)
+
+    def test_other_parsers(self):
+        policy = set_validation_policy(EveryNth(2))
+        parser = ShowCounterUnchecked(device=Mock())
+        for _ in range(2):
+            with self.assertRaisesRegex(Exception, 'schema checking failed'):
+                parser.parse(output={'counter': '1'})
+        self.assertFalse(policy.calls)
+
+    def test_every_nth(self):
+        policy = set_validation_policy(EveryNth(3))
+        for _ in range(7):
+            with self.assertRaisesRegex(Exception, 'schema checking failed'):
+                self.parse({'counter': '1'})
+            self.assertEqual(self.parse({'counter': '1'}), {'counter': '1'})
+            self.assertEqual(self.parse({'counter': '1'}), {'counter': '1'})
+        self.assertEqual(policy.failures,
+                         {'{}.ShowCounter'.format(__name__): 7})
+
+    def test_first_k(self):
+        set_validation_policy(FirstK(2))
+        first, second = Mock(), Mock()
+        for device in (first, second, first, second):
+            with self.assertRaisesRegex(Exception, 'schema checking failed'):
+                self.parse({'counter': '1'}, device)
+        for device in (first, second):
+            self.assertEqual(self.parse({'counter': '1'}, device),
+                             {'counter': '1'})
+
+    def test_threads(self):
+        policy = set_validation_policy(EveryNth(10, raise_errors=False))
+        start = threading.Barrier(4)
+
+        def parse():
+            start.wait()
+            for _ in range(500):
+                self.parse({'counter': '1'})
+
+        threads = [threading.Thread(target=parse) for _ in range(4)]
+        with self.assertLogs('genie.libs.parser.utils.validation_policy',
+                             'WARNING'):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        name = '{}.ShowCounter'.format(__name__)
+        self.assertEqual(policy.calls[name], 2000)
+        self.assertEqual(policy.failures[name], 200)
+
+    def test_record_errors(self):
+        policy = set_validation_policy(ValidationPolicy(raise_errors=False))
+        with self.assertLogs('genie.libs.parser.utils.validation_policy',
+                             'WARNING'):
+            self.assertEqual(self.parse({'counter': '1'}), {'counter': '1'})
+        self.assertEqual(self.parse({'counter': 1}), {'counter': 1})
+        self.assertEqual(sum(policy.failures.values()), 1)
+
+    def test_empty(self):
+        for policy in (EveryNth(1), EveryNth(2), FirstK(0), Offline()):
+            set_validation_policy(policy)
+            with self.assertRaises(SchemaEmptyParserError):
+                self.parse({})
+            self.assertFalse(policy.failures)
+
+    def test_offline(self):
+        policy = set_validation_policy(Offline(maxlen=2))
+        for counter in ('1', 2, 3):
+            self.assertEqual(self.parse({'counter': counter}),
+                             {'counter': counter})
+        self.assertEqual(len(policy.pending), 2)
+        self.assertEqual(policy.dropped, 1)
+        self.assertEqual(policy.validate_pending(), 0)
+
+        self.parse({'counter': '4'})
+        # checked against the compiled schema, as parse would
+        self.assertIs(policy.pending[0][2], ShowCounter.compiled_schema())
+        with self.assertLogs('genie.libs.parser.utils.validation_policy',
+                             'WARNING'):
+            self.assertEqual(policy.validate_pending(), 1)
+        self.assertFalse(policy.pending)
+
+    def test_compiled_schema(self):
+        from genie.libs.parser.iosxe.show_isis import ShowIsisDatabaseDetail
+
+        policy = set_validation_policy(EveryNth(2))
+        folder = os.path.join(os.path.dirname(__file__), '..', '..', 'iosxe',
+                              'tests', 'ShowIsisDatabaseDetail', 'cli',
+                              'equal')
+        outputs = glob.glob(os.path.join(folder, '*_output.txt'))
+        for path in outputs:
+            with open(path) as f:
+                output = f.read()
+            expected = ShowIsisDatabaseDetail(device=Mock()).parse(
+                output=output)
+            for _ in range(2):
+                self.assertEqual(
+                    ShowIsisDatabaseDetail(device=Mock()).parse(output=output),
+                    expected)
+        # the parses of the expected outputs included
+        self.assertEqual(sum(policy.calls.values()), 3 * len(outputs))
+        self.assertFalse(policy.failures)
+
+
+class TestGetParser(unittest.TestCase):
+
+    def setUp(self):
+        clear_parser_cache()
+        self.addCleanup(clear_parser_cache)
+        self.addCleanup(set_validation_policy)
+        patch.object(common, '_get_parser',
+                     return_value=(ShowCounter, {})).start()
+        self.addCleanup(patch.stopall)
+
+    def test_get_parser(self):
+        device = Mock(os='iosxe', custom={})
+        self.assertIs(get_parser('show counter', device)[0], ShowCounter)
+        policy = set_validation_policy(Offline())
+        cls, kwargs = get_parser('show counter', device)
+        self.assertIs(cls, ShowCounter)
+        self.assertEqual(kwargs, {})
+        cls(device=device).parse(output={'counter': '1'})
+        self.assertEqual(len(policy.pending), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import ast
+import glob
+import unittest
+
+from pyats.utils.exceptions import SchemaError
+from genie.metaparser.util.schemaengine import Schema, Optional, Use
+
+from genie.libs.parser.utils.validators import list_of
+
+
+validate_nh_list = list_of({Optional('to'): str, Optional('via'): str},
+                           'nh is not a list', single=True)
+
+
+class TestListOf(unittest.TestCase):
+
+    schema = Schema({
+        'route-table': Use(list_of({
+            'table-name': str,
+            Optional('nh'): Use(validate_nh_list)},
+            'route-table is not a list'))})
+
+    def test_list(self):
+        data = {'route-table': [{'table-name': 'inet.0',
+                                 'nh': [{'to': '10.0.0.1'},
+                                        {'via': 'ge-0/0/0'}]},
+                                {'table-name': 'inet.3'}]}
+        self.assertEqual(self.schema.validate(data), data)
+
+    def test_not_a_list(self):
+        with self.assertRaises(Exception):
+            self.schema.validate({'route-table': {'table-name': 'inet.0'}})
+        with self.assertRaisesRegex(SchemaError, 'route-table is not a list'):
+            list_of({'table-name': str}, 'route-table is not a list')(
+                {'table-name': 'inet.0'})
+        with self.assertRaises(TypeError):
+            list_of({}, 'not a list', error=TypeError)('x')
+
+    def test_single(self):
+        self.assertEqual(validate_nh_list({'to': '10.0.0.1'}),
+                         [{'to': '10.0.0.1'}])
+        with self.assertRaises(Exception):
+            validate_nh_list([{'to': 1}])
+
+    def test_no_schema_built_in_validators(self):
+        # the schemas of the items are built once, by list_of
+        parser_folder = os.path.join(os.path.dirname(__file__), '..', '..')
+        for os_name in ('junos', 'iosxr', 'nxos'):
+            for path in glob.glob(os.path.join(parser_folder, os_name,
+                                               '*.py')):
+                with open(path) as f:
+                    tree = ast.parse(f.read())
+                for function in ast.walk(tree):
+                    if not isinstance(function, ast.FunctionDef):
+                        continue
+                    for node in ast.walk(function):
+                        self.assertFalse(
+                            isinstance(node, ast.Call) and
+                            getattr(node.func, 'id', None) == 'Schema',
+                            (path, function.name))
+
+
+if __name__ == '__main__':
+    unittest.main()
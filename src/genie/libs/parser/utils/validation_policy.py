@@ -0,0 +1,259 @@
+'''Policies of the schema checks of the parsed outputs
+
+`parse` checks every parsed output against the schema of its parser. Once
+the parsers are trusted, a poller parsing the same commands of the same
+devices over and over can check less of them, with a policy:
+
+    >>> set_validation_policy(EveryNth(100))   # 1st, 101st, ... of a parser
+    >>> set_validation_policy(FirstK(3))       # first 3 of a parser, per
+    ...                                        # device
+    >>> policy = set_validation_policy(Offline())
+    >>> device.parse('show interfaces')        # not checked, queued
+    >>> policy.validate_pending()              # checked, later
+
+The default policy, `ValidationPolicy()`, checks every output as `parse`
+always did. The outputs a policy does not check are given as parsed,
+unless empty, which still raises `SchemaEmptyParserError`.
+
+The failures of the checks are counted per parser in the `failures` of the
+policy, and logged. They are raised, unless `raise_errors` is False, in
+which case the parsed output is given unchecked.
+
+The policies apply to the parsers checked against their compiled schema,
+the `CompiledSchemaParser`, however they are made (`get_parser`,
+`device.parse` or the parser class itself): their `parse` checks the
+outputs with `policy_schema`. The other parsers check every output.
+'''
+
+# python
+import logging
+from threading import Lock
+from collections import Counter, deque
+
+# Metaparser
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+from genie.metaparser.util.schemaengine import Schema
+
+log = logging.getLogger(__name__)
+
+
+def _parser_name(parser_class):
+    '''Name of a parser class in the counters and the logs'''
+    return '{}.{}'.format(parser_class.__module__, parser_class.__qualname__)
+
+
+class ValidationPolicy(object):
+    '''Policy checking every parsed output, the default
+
+    Args:
+        raise_errors (`bool`): raise the failures of the checks, rather
+                               than give the output unchecked
+    '''
+
+    def __init__(self, raise_errors=True):
+        self.raise_errors = raise_errors
+        self.failures = Counter()
+        # the counters are updated by the parsers of any thread
+        self._lock = Lock()
+
+    def validates(self, parser):
+        '''Whether the output of a parser is to be checked now
+
+        Args:
+            parser (`MetaParser`): parser of the output
+
+        Returns:
+            `bool`: check the output
+        '''
+        return True
+
+    def skipped(self, parser, output, schema):
+        '''Output of a parser given unchecked
+
+        Args:
+            parser (`MetaParser`): parser of the output
+            output (`dict`): parsed output
+            schema (`Schema`): schema `parse` would have checked it against
+        '''
+
+    def failed(self, parser_class, error):
+        '''Record the failure of the check of an output of a parser class'''
+        name = _parser_name(parser_class)
+        with self._lock:
+            self.failures[name] += 1
+        log.warning('Schema check of {} failed: {}'.format(name, error))
+
+
+class EveryNth(ValidationPolicy):
+    '''Policy checking the 1st, n+1th, 2n+1th, ... outputs of each parser
+    class
+
+    Args:
+        n (`int`): one output checked every n outputs of a parser class
+        raise_errors (`bool`): raise the failures of the checks
+    '''
+
+    def __init__(self, n, raise_errors=True):
+        super().__init__(raise_errors)
+        self.n = n
+        self.calls = Counter()
+
+    def validates(self, parser):
+        name = _parser_name(type(parser))
+        with self._lock:
+            calls = self.calls[name]
+            self.calls[name] = calls + 1
+        return calls % self.n == 0
+
+
+class FirstK(ValidationPolicy):
+    '''Policy checking the first k outputs of each parser class on each
+    device
+
+    Args:
+        k (`int`): outputs checked per parser class and device
+        raise_errors (`bool`): raise the failures of the checks
+    '''
+
+    def __init__(self, k, raise_errors=True):
+        super().__init__(raise_errors)
+        self.k = k
+        self.calls = Counter()
+
+    def validates(self, parser):
+        device = getattr(parser, 'device', None)
+        key = (getattr(device, 'name', None) or id(device),
+               _parser_name(type(parser)))
+        with self._lock:
+            calls = self.calls[key]
+            if calls >= self.k:
+                return False
+            self.calls[key] = calls + 1
+        return True
+
+
+class Offline(ValidationPolicy):
+    '''Policy checking the outputs later, by `validate_pending`
+
+    Args:
+        maxlen (`int`): outputs kept until checked, the oldest ones are
+                        dropped beyond, counted in `dropped`
+    '''
+
+    def __init__(self, maxlen=1000):
+        super().__init__(raise_errors=False)
+        self.pending = deque(maxlen=maxlen)
+        self.dropped = 0
+
+    def validates(self, parser):
+        return False
+
+    def skipped(self, parser, output, schema):
+        with self._lock:
+            dropped = len(self.pending) == self.pending.maxlen
+            if dropped:
+                self.dropped += 1
+            self.pending.append((type(parser), output, schema))
+        if dropped and self.dropped == 1:
+            log.warning('More than {} outputs to check, the oldest ones '
+                        'are dropped unchecked'.format(self.pending.maxlen))
+
+    def validate_pending(self):
+        '''Check the outputs kept, recording the failures
+
+        The outputs are checked against the schema `parse` would have
+        checked them against, the compiled schema of their parser class.
+
+        Returns:
+            `int`: number of failures
+        '''
+        failures = 0
+        while True:
+            try:
+                parser_class, output, schema = self.pending.popleft()
+            except IndexError:
+                return failures
+            try:
+                Schema(schema).validate(output)
+            except Exception as e:
+                self.failed(parser_class, e)
+                failures += 1
+
+
+_default_policy = ValidationPolicy()
+_policy = _default_policy
+_policy_lock = Lock()
+
+
+def get_validation_policy():
+    '''Policy of the schema checks of the parsed outputs'''
+    return _policy
+
+
+def set_validation_policy(policy=None):
+    '''Set the policy of the schema checks of the parsed outputs
+
+    The parses running keep the policy they started with.
+
+    Args:
+        policy (`ValidationPolicy`): policy, the default one if None
+
+    Returns:
+        `ValidationPolicy`: the policy set
+    '''
+    global _policy
+    with _policy_lock:
+        _policy = policy if policy is not None else _default_policy
+        return _policy
+
+
+def policy_schema(parser, schema):
+    '''Schema checking the outputs of a parser as the current policy decides
+
+    Args:
+        parser (`MetaParser`): parser of the outputs
+        schema (`Schema`): schema of the outputs
+
+    Returns:
+        `Schema`: the schema itself under the default policy, else a schema
+                  checking with it the outputs the policy checks
+    '''
+    policy = _policy
+    if policy is _default_policy:
+        return schema
+    return _PolicySchema(schema, policy, parser)
+
+
+class _PolicySchema(Schema):
+    '''Schema checking the outputs of a parser as a policy decides
+
+    Args:
+        schema (`Schema`): schema of the outputs
+        policy (`ValidationPolicy`): policy of the checks
+        parser (`MetaParser`): parser of the outputs
+    '''
+
+    def __init__(self, schema, policy, parser):
+        super().__init__(schema)
+        self.policy = policy
+        self.parser = parser
+
+    def validate(self, data, *args, command='', warn_unsupported_keys=False,
+                 **kwargs):
+        policy = self.policy
+        if not policy.validates(self.parser):
+            if not data:
+                raise SchemaEmptyParserError(data, command=command)
+            policy.skipped(self.parser, data, self.schema)
+            return data
+        try:
+            return Schema(self.schema).validate(
+                data, command=command,
+                warn_unsupported_keys=warn_unsupported_keys)
+        except SchemaEmptyParserError:
+            raise
+        except Exception as e:
+            policy.failed(type(self.parser), e)
+            if policy.raise_errors:
+                raise
+            return data
@@ -0,0 +1,56 @@
+'''Validators of the lists of a parsed output
+
+The schemas of the Junos parsers give the lists of their outputs (routes,
+next hops, neighbors, ...) to a validator function through `Use`. Written
+as a function building a `Schema` of the items and validating each item
+with it, the schema is built again for every list, and for every route of
+a `show route` when the lists are nested. `list_of` builds it once, when
+the schema class is defined:
+
+    >>> class ShowRouteSchema(MetaParser):
+    ...     validate_nh_list = list_of({
+    ...         Optional('to'): str,
+    ...         Optional('via'): str}, 'nh list is not a list')
+    ...     validate_rt_list = list_of({
+    ...         'rt-destination': str,
+    ...         Optional('nh'): Use(validate_nh_list)}, 'rt is not a list')
+    ...     schema = {'route-table': {'rt': Use(validate_rt_list)}}
+'''
+
+# pyATS
+from pyats.utils.exceptions import SchemaError
+
+# Metaparser
+from genie.metaparser.util.schemaengine import Schema
+
+
+def list_of(schema, message, single=False, error=SchemaError):
+    '''Validator of a list of items, each against a schema, for `Use`
+
+    Args:
+        schema (`dict` or `Schema`): schema of each item of the list
+        message (`str`): message of the error raised when the value is not
+                         a list
+        single (`bool`): a dict alone is a list of one item, and is given
+                         as such
+        error (`type`): exception raised when the value is not a list
+
+    Returns:
+        `function`: validator of the lists, giving the validated list. Its
+                    `item_schema` is the schema of the items
+    '''
+    if not isinstance(schema, Schema):
+        schema = Schema(schema)
+    validate = schema.validate
+
+    def validate_list(value):
+        if single and isinstance(value, dict):
+            value = [value]
+        if not isinstance(value, list):
+            raise error(message)
+        for item in value:
+            validate(item)
+        return value
+
+    validate_list.item_schema = schema.schema
+    return validate_list
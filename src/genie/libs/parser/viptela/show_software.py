@@ -4,9 +4,11 @@
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Any, Or, Optional
-import genie.parsergen as pg
 import re
 
+# import parser utils
+from genie.libs.parser.utils.tabular import FixedWidthTable
+
 # ===========================================
 # Schema for 'show software | tab'
 # ===========================================
@@ -35,6 +37,10 @@ class ShowSoftwaretab(ShowSoftwaretabSchema):
 
     cli_command = "show software | tab"
 
+    table = FixedWidthTable(header_fields=["VERSION", "ACTIVE", "DEFAULT", "PREVIOUS", "CONFIRMED", "TIMESTAMP"],
+                            label_fields=["version", "active", "default", "previous", "confirmed", "timestamp"],
+                            index=[0])
+
     def cli(self, output=None):
         parsed_dict = {}
         if output is None:
@@ -47,11 +53,7 @@ class ShowSoftwaretab(ShowSoftwaretabSchema):
         # 99.99.999-4542  false   false    false     -          2020-06-18T06:30:30-00:00
         # 99.99.999-4567  true    true     false     auto       2020-07-06T01:51:18-00:00
         if out:
-            out = pg.oper_fill_tabular(device_output=out,
-                                    header_fields=["VERSION", "ACTIVE", "DEFAULT", "PREVIOUS", "CONFIRMED", "TIMESTAMP"],
-                                    label_fields=["version", "active", "default", "previous", "confirmed", "timestamp"],
-                                    index=[0])
-            return_dict = out.entries
+            return_dict = self.table.entries(out)
             version_dict ={}
             for keys in return_dict.keys() :
                 dict1={}
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+'''Latency of the fuzzy matching of the parser commands
+
+Times `match_command` over every command of parsers.json for a few regex
+searches, and the whole `_fuzzy_search_command`.
+
+    python tools/benchmark_fuzzy_match.py [--repeat N]
+'''
+
+import time
+import argparse
+
+from genie.libs.parser.utils.common import _fuzzy_search_command, parser_data
+from genie.libs.parser.utils.fuzzy_match import SearchTokens, get_template, \
+                                                match_command
+
+QUERIES = ['sh .* vrf abc', r'show ip .* summary', 'sh ip ro vrf abc',
+           r'show ip bgp .*', r'sh int Gig1/0/1 .*', r'sh .* detail']
+
+
+def main():
+    argparser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    argparser.add_argument('--repeat', type=int, default=5)
+    args = argparser.parse_args()
+
+    commands = [command for command in parser_data if command != 'tokens']
+    templates = [get_template(command) for command in commands]
+
+    match = search = 0
+    for _ in range(args.repeat):
+        for query in QUERIES:
+            start = time.perf_counter()
+            tokens = SearchTokens(query.split(), True)
+            for template in templates:
+                match_command(template, tokens)
+            match += time.perf_counter() - start
+
+            start = time.perf_counter()
+            _fuzzy_search_command(query, True)
+            search += time.perf_counter() - start
+
+    runs = args.repeat * len(QUERIES)
+    print('match_command over {} commands: {:.1f} ms per search'.format(
+        len(commands), match / runs * 1e3))
+    print('_fuzzy_search_command: {:.1f} ms per search'.format(
+        search / runs * 1e3))
+
+
+if __name__ == '__main__':
+    main()